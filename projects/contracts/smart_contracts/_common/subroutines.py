@@ -0,0 +1,81 @@
+"""
+Subroutines shared by several contracts. The folder starts with "_" so the build
+skips it; each contract that imports these gets its own compiled copy.
+"""
+
+from algopy import *
+from algopy.arc4 import Address, DynamicArray
+
+# Address index boxes: key_prefix + itob(chunk) -> up to 32 addresses (1 KB), where
+# index i lives in chunk i // 32 at offset (i % 32) * 32. Chunks grow one address at a time.
+ADDRESS_CHUNK_SIZE = 32
+
+
+@subroutine
+def popcount(mask: UInt64) -> UInt64:
+    """Number of set bits (clears the lowest set bit until none remain)"""
+    remaining = mask
+    count = UInt64(0)
+    while remaining != UInt64(0):
+        remaining = remaining & (remaining - UInt64(1))
+        count += UInt64(1)
+    return count
+
+
+@subroutine
+def assert_unique_approvers(approvers: DynamicArray[Address]) -> None:
+    """Reject duplicates so every approval bit belongs to a distinct signer"""
+    count = approvers.length
+    ensure_budget(count * count * UInt64(20), fee_source=OpUpFeeSource.GroupCredit)
+    for i in urange(count):
+        for j in urange(i):
+            assert approvers[i] != approvers[j], "Duplicate approver"
+
+
+@subroutine
+def approver_index(approvers_key: Bytes, approver_count: UInt64, account: Account) -> UInt64:
+    """Position of account in an approver box of 32-byte addresses (approver_count if not found)"""
+    approvers_bytes, exists = op.Box.get(approvers_key)
+    if exists:
+        for i in urange(approver_count):
+            if op.extract(approvers_bytes, i * UInt64(32), 32) == account.bytes:
+                return i
+    return approver_count
+
+
+@subroutine
+def append_address(key_prefix: Bytes, count: UInt64, address: Account) -> None:
+    """Store address at position count of an address index holding count entries"""
+    chunk_key = key_prefix + op.itob(count // UInt64(ADDRESS_CHUNK_SIZE))
+    slot = count % UInt64(ADDRESS_CHUNK_SIZE)
+    if slot == UInt64(0):
+        assert op.Box.create(chunk_key, 32), "Failed to create address index chunk"
+    else:
+        op.Box.resize(chunk_key, (slot + UInt64(1)) * UInt64(32))
+    op.Box.replace(chunk_key, slot * UInt64(32), address.bytes)
+
+
+@subroutine
+def address_at(key_prefix: Bytes, index: UInt64) -> Account:
+    """Look up an address by dense index"""
+    chunk_key = key_prefix + op.itob(index // UInt64(ADDRESS_CHUNK_SIZE))
+    return Account(op.Box.extract(chunk_key, (index % UInt64(ADDRESS_CHUNK_SIZE)) * UInt64(32), 32))
+
+
+@subroutine
+def replace_address(key_prefix: Bytes, index: UInt64, address: Account) -> None:
+    """Overwrite the address stored at a dense index"""
+    chunk_key = key_prefix + op.itob(index // UInt64(ADDRESS_CHUNK_SIZE))
+    op.Box.replace(chunk_key, (index % UInt64(ADDRESS_CHUNK_SIZE)) * UInt64(32), address.bytes)
+
+
+@subroutine
+def pop_address(key_prefix: Bytes, count: UInt64) -> None:
+    """Drop the last address of an index holding count entries, deleting its chunk once empty"""
+    last = count - UInt64(1)
+    chunk_key = key_prefix + op.itob(last // UInt64(ADDRESS_CHUNK_SIZE))
+    slot = last % UInt64(ADDRESS_CHUNK_SIZE)
+    if slot == UInt64(0):
+        op.Box.delete(chunk_key)
+    else:
+        op.Box.resize(chunk_key, slot * UInt64(32))
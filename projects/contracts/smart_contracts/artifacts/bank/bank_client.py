@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "memo"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit", "returns": {"type": "uint64"}, "desc": "Accepts a payment into the app escrow and records sender's deposited balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Sends ALGO back to the caller from their recorded balance", "events": [], "readonly": false, "recommendations": {}}], "name": "Bank", "state": {"keys": {"box": {}, "global": {"total_deposit": {"key": "dG90YWxfZGVwb3NpdA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deposits": {"keyType": "address", "valueType": "uint64", "prefix": ""}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiACAQAmAg10b3RhbF9kZXBvc2l0BBUffHUxGEAAAygjZzEbQQBNggIEn1l8MgQxIUF2NhoAjgIAFwACI0MxGRREMRhENhoBF4gAeBYpTFCwIkMxGRREMRhENhoBVwIAMRYiCUk4ECISRIgAEhYpTFCwIkMxGUD/wzEYFEQiQ4oCAYv/OAcyChJEi/84CElEi/84AEm+TBdMQQAeiwKLAAgWiwFMvyMoZUSLAAgoTGeLAb5MF0xEjACJiwAWiwFMv0L/4ooBATEAvkwXTESL/0SL/0sBDkSxMQCL/7IIsgcishAjsgGzi/8JSUAACDEAvEiLAEyJMQCLABa/Qv/z", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDEgMAogICAgYnl0ZWNibG9jayAidG90YWxfZGVwb3NpdCIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTEKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAidG90YWxfZGVwb3NpdCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdANwogICAgcHVzaGJ5dGVzcyAweDlmNTk3YzMyIDB4MzEyMTQxNzYgLy8gbWV0aG9kICJkZXBvc2l0KHN0cmluZyxwYXkpdWludDY0IiwgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9kZXBvc2l0X3JvdXRlQDUgbWFpbl93aXRoZHJhd19yb3V0ZUA2CgptYWluX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIGludGNfMSAvLyAwCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZXBvc2l0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZGVwb3NpdAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAOQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmRlcG9zaXQobWVtbzogYnl0ZXMsIHBheV90eG46IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMtMTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGRlcG9zaXQoc2VsZiwgbWVtbzogU3RyaW5nLCBwYXlfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNgogICAgLy8gYXNzZXJ0IHBheV90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlJlY2VpdmVyIG11c3QgYmUgdGhlIGNvbnRyYWN0IGFkZHJlc3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNwogICAgLy8gYXNzZXJ0IHBheV90eG4uYW1vdW50ID4gMCwgIkRlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gRGVwb3NpdCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTkKICAgIC8vIGFtb3VudCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShwYXlfdHhuLnNlbmRlcikKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBkZXBvc2l0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMQogICAgLy8gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0gPSBhbW91bnQgKyBwYXlfdHhuLmFtb3VudAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgYm94X3B1dAoKZGVwb3NpdF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNQogICAgLy8gc2VsZi50b3RhbF9kZXBvc2l0ICs9IHBheV90eG4uYW1vdW50CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfZGVwb3NpdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9kZXBvc2l0IGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjYKICAgIC8vIHJldHVybiBzZWxmLmRlcG9zaXRzW3BheV90eG4uc2VuZGVyXQogICAgZnJhbWVfZGlnIDEKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRzIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmRlcG9zaXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMwogICAgLy8gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0gPSBwYXlfdHhuLmFtb3VudAogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBiIGRlcG9zaXRfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay53aXRoZHJhdyhhbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI4LTI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB3aXRoZHJhdyhzZWxmLCBhbW91bnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozMQogICAgLy8gY3VycmVudCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzIKICAgIC8vIGFzc2VydCBleGlzdHMsICJObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50IgogICAgc3dhcAogICAgYXNzZXJ0IC8vIE5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIldpdGhkcmF3YWwgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IGFtb3VudCA8PSBjdXJyZW50LCAiV2l0aGRyYXdhbCBhbW91bnQgZXhjZWVkcyBiYWxhbmNlIgogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBleGNlZWRzIGJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PWFtb3VudCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozOAogICAgLy8gcmVtYWluaW5nID0gY3VycmVudCAtIGFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBpZiByZW1haW5pbmcgPT0gVUludDY0KDApOgogICAgYm56IHdpdGhkcmF3X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MAogICAgLy8gZGVsIHNlbGYuZGVwb3NpdHNbVHhuLnNlbmRlcl0KICAgIHR4biBTZW5kZXIKICAgIGJveF9kZWwKICAgIHBvcAoKd2l0aGRyYXdfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDQKICAgIC8vIHJldHVybiByZW1haW5pbmcKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCndpdGhkcmF3X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYuZGVwb3NpdHNbVHhuLnNlbmRlcl0gPSByZW1haW5pbmcKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICBiIHdpdGhkcmF3X2FmdGVyX2lmX2Vsc2VANAo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [143], "errorMessage": "Deposit amount must be greater than zero"}, {"pc": [205], "errorMessage": "No deposits found for this account"}, {"pc": [65, 86], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [137], "errorMessage": "Receiver must be the contract address"}, {"pc": [214], "errorMessage": "Withdrawal amount exceeds balance"}, {"pc": [208], "errorMessage": "Withdrawal amount must be greater than zero"}, {"pc": [124], "errorMessage": "can only call when creating"}, {"pc": [68, 89], "errorMessage": "can only call when not creating"}, {"pc": [182], "errorMessage": "check self.deposits entry exists"}, {"pc": [169], "errorMessage": "check self.total_deposit exists"}, {"pc": [105], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "memo"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit", "returns": {"type": "uint64"}, "desc": "Accepts a payment into the app escrow and records sender's deposited balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Sends ALGO back to the caller from their recorded balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "accounts"}, {"type": "uint64[]", "name": "amounts"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit_batch", "returns": {"type": "uint64"}, "desc": "Custodian credits many accounts from one payment; amounts[i] goes to accounts[i]\nand the payment must equal their sum. Returns the number of accounts credited.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "accounts"}, {"type": "uint64[]", "name": "amounts"}], "name": "withdraw_batch", "returns": {"type": "uint64"}, "desc": "Custodian withdraws amounts[i] from accounts[i]'s balance. Funds are always\npaid to the account itself. Returns the total paid out.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "pay_txn"}], "name": "distribute_yield", "returns": {"type": "uint64"}, "desc": "Spreads a payment across all depositors pro rata by raising the exchange index", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "custodian"}, {"type": "bool", "name": "enabled"}], "name": "set_custodian", "returns": {"type": "void"}, "desc": "Admin allows or revokes a custodian for the batch entry points", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "accounts"}], "name": "get_balances", "returns": {"type": "uint64[]"}, "desc": "Current balance of each account in input order (0 for non-depositors), up to 64 per call", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "offset"}, {"type": "uint64", "name": "limit"}], "name": "get_depositors_page", "returns": {"type": "(address,uint64)[]"}, "desc": "Returns up to `limit` depositors with their balances, starting at index `offset`.\nCapped at 25 rows per call; page with offset up to depositor_count.", "events": [], "readonly": true, "recommendations": {}}], "name": "Bank", "state": {"keys": {"box": {}, "global": {"total_deposit": {"key": "dG90YWxfZGVwb3NpdA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_shares": {"key": "dG90YWxfc2hhcmVz", "keyType": "AVMString", "valueType": "AVMUint64"}, "exchange_index": {"key": "ZXhjaGFuZ2VfaW5kZXg=", "keyType": "AVMString", "valueType": "AVMUint64"}, "admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "address"}, "depositor_count": {"key": "ZGVwb3NpdG9yX2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deposits": {"keyType": "address", "valueType": "DepositRecord", "prefix": "ZF8="}, "custodians": {"keyType": "address", "valueType": "uint64", "prefix": "Y3Vf"}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"DepositRecord": [{"name": "index", "type": "uint64"}, {"name": "shares", "type": "uint64"}]}, "byteCode": {"approval": "CiAEAAEggJTr3AMmCQ9kZXBvc2l0b3JfY291bnQOZXhjaGFuZ2VfaW5kZXgNdG90YWxfZGVwb3NpdAx0b3RhbF9zaGFyZXMEFR98dQJkXwNkeF8DY3VfBWFkbWluMRhAABEqImcrImcpJWcnCDEAZygiZzEbQQETgggEn1l8MgQxIUF2BIqPtu0EjHZ/ewQPeMWlBIJGvMwEq1Zk5AQHSl9JNhoAjggAsgCcAHoAYgBGAC8AGwACIkMxGRREMRhENhoBFzYaAheIApEnBExQsCNDMRkURDEYRDYaAYgCNScETFCwI0MxGRREMRhENhoBF8AcNhoCIlOIAesjQzEZFEQxGEQxFiMJSTgQIxJEiAGcFicETFCwI0MxGRREMRhENhoBNhoCiAEhFicETFCwI0MxGRREMRhENhoBNhoCMRYjCUk4ECMSRIgAmxYnBExQsCNDMRkURDEYRDYaAReIAG4WJwRMULAjQzEZFEQxGEQ2GgFXAgAxFiMJSTgQIxJEiAAtFicETFCwI0MxGUD/JzEYFEQjQ4oCAYv/JAoWi/5MUIv/JBgkCyS6SRUkEkSJigIBi/84BzIKEkSL/zgISUSL/zgASU8CiAIQiAPIiYoBAScFMQBQvUUBRIv/RDEAi/+IAoGJigMBJwcxAFC9RQFEi/0iWUmL/iJZSwESRIEQDkSL/zgHMgoSRCJJiwKLAAxBACyL/lcCAIsCSU4CgQgLW0lEi/1XAgBLAiQLJFhLAYgBposBCIwBIwiMAkL/zIv/OAiLARJEiYoCAScHMQBQvUUBRIv+IllJi/8iWUsBEkSBEA5EIkmLAosADEEAN4v+VwIAiwJJTgIkCyRYi/9XAgBLAoEIC1snBUsCUL1FAURJRExLAYgBy0iLAQiMASMIjAJC/8GLAYwAiYoBAYv/OAcyChJEi/84CElEIitlRERJJR0iKWVEIitlRE8DTwNPApcIKUxnIiplRAgqTGciKWVEiYoCACIxACInCGVEEkSL/0EACScHi/5QIxa/iScHi/5QSYwAvUUBQf/xiwC8SImKAQGL/yJZSYFADkSAACKLAosADEEAH4v/VwIAiwJJTgIkCyRYiAJaFosBTFCMASMIjAJC/9mLABZJk4EQDkRXBgKLAVCMAImKAgEigABHAiIoZUSL/g5BAAeAAgAAjACJIihlRIv+CUmMAov/DUEABIv/jAKLAoEZDUEABIEZjAKAAIwAi/6LAgiMA4v+jAGLAYsDDEEAHScGiwFJTgKI/eBJiAHcFlCLAExQjAAjCIwBQv/biwIWSZOBEA5EVwYCiwBQjACJigIAIoAAi/8lHSIpZUSXSUQnBYv+UEm9RQFBACZJvkRJVwAITIEIW4sCCBZQvyIrZUSLAggrTGciKmVEi/8IKkxniSIoZUQWiwIWUL8iKGVESSQKFicGTFCMACQYSYwBQAAbiwAkuUSLASQLiwBMi/67IihlRCMIKExnQv+wiwEjCCQLiwBM00L/3YoCASJJgABHBYv/JR1JTwIiKWVESwFPA08Cl0lOAiIpZUQdTgITQAAMiwqLCBOLCYwGQQAGiwkjCIwGiwZJjAknBYv+UEmMAb5MSU4CjABEgQhbSg5EsYv/sgiL/rIHI7IQIrIBs0sBCUlOAowEjAZJjAVBABqLBEmIANKLCYwGTIwFQAAKiwmLBAgijAWMBosGjAmLBUmMBEAAhIsBvEiLACJbSYwCIihlRCMJSYwDE0EAKycGiwOI/HWLAkkkChYnBkxQSwEkGCQLSwO7FicFTwJQSb5EVwgITwJMUL8iKGVEIwlJJAoWJwZMUEwkGEmMB0AAIrxIKIsDZyIrZUSLCQkrTGciKmVEi/8JKkxniwSIADmMAImLByQL00L/2IsAVwAIiwQWUIsBTL9C/8yKAQEnBYv/UEm9RQFAAAMiTImLAL5EgQhbiAACTImKAQEiKWVEi/8dJZeJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSAzMiAxMDAwMDAwMDAwCiAgICBieXRlY2Jsb2NrICJkZXBvc2l0b3JfY291bnQiICJleGNoYW5nZV9pbmRleCIgInRvdGFsX2RlcG9zaXQiICJ0b3RhbF9zaGFyZXMiIDB4MTUxZjdjNzUgMHg2NDVmIDB4NjQ3ODVmIDB4NjM3NTVmICJhZG1pbiIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBzZWxmLnRvdGFsX2RlcG9zaXQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLnRvdGFsX3NoYXJlcyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMyAvLyAidG90YWxfc2hhcmVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1OAogICAgLy8gc2VsZi5leGNoYW5nZV9pbmRleCA9IFVJbnQ2NChJTkRFWF9TQ0FMRSkKICAgIGJ5dGVjXzEgLy8gImV4Y2hhbmdlX2luZGV4IgogICAgaW50Y18zIC8vIDEwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1OQogICAgLy8gc2VsZi5hZG1pbiA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjIDggLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjYwCiAgICAvLyBzZWxmLmRlcG9zaXRvcl9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdG9yX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTMKICAgIHB1c2hieXRlc3MgMHg5ZjU5N2MzMiAweDMxMjE0MTc2IDB4OGE4ZmI2ZWQgMHg4Yzc2N2Y3YiAweDBmNzhjNWE1IDB4ODI0NmJjY2MgMHhhYjU2NjRlNCAweDA3NGE1ZjQ5IC8vIG1ldGhvZCAiZGVwb3NpdChzdHJpbmcscGF5KXVpbnQ2NCIsIG1ldGhvZCAid2l0aGRyYXcodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZGVwb3NpdF9iYXRjaChhZGRyZXNzW10sdWludDY0W10scGF5KXVpbnQ2NCIsIG1ldGhvZCAid2l0aGRyYXdfYmF0Y2goYWRkcmVzc1tdLHVpbnQ2NFtdKXVpbnQ2NCIsIG1ldGhvZCAiZGlzdHJpYnV0ZV95aWVsZChwYXkpdWludDY0IiwgbWV0aG9kICJzZXRfY3VzdG9kaWFuKGFjY291bnQsYm9vbCl2b2lkIiwgbWV0aG9kICJnZXRfYmFsYW5jZXMoYWRkcmVzc1tdKXVpbnQ2NFtdIiwgbWV0aG9kICJnZXRfZGVwb3NpdG9yc19wYWdlKHVpbnQ2NCx1aW50NjQpKGFkZHJlc3MsdWludDY0KVtdIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9kZXBvc2l0X3JvdXRlQDUgbWFpbl93aXRoZHJhd19yb3V0ZUA2IG1haW5fZGVwb3NpdF9iYXRjaF9yb3V0ZUA3IG1haW5fd2l0aGRyYXdfYmF0Y2hfcm91dGVAOCBtYWluX2Rpc3RyaWJ1dGVfeWllbGRfcm91dGVAOSBtYWluX3NldF9jdXN0b2RpYW5fcm91dGVAMTAgbWFpbl9nZXRfYmFsYW5jZXNfcm91dGVAMTEgbWFpbl9nZXRfZGVwb3NpdG9yc19wYWdlX3JvdXRlQDEyCgptYWluX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfZGVwb3NpdG9yc19wYWdlX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTYxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNjEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2RlcG9zaXRvcnNfcGFnZQogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYmFsYW5jZXNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNTEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDMKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYmFsYW5jZXMKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0X2N1c3RvZGlhbl9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X2N1c3RvZGlhbgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kaXN0cmlidXRlX3lpZWxkX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzAKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBkaXN0cmlidXRlX3lpZWxkCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X2JhdGNoX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMDUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgd2l0aGRyYXdfYmF0Y2gKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZGVwb3NpdF9iYXRjaF9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGRlcG9zaXRfYmF0Y2gKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjcxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDMKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjcxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgd2l0aGRyYXcKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZGVwb3NpdF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MwogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBkZXBvc2l0CiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDE1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5fY29tbW9uLnN1YnJvdXRpbmVzLmFkZHJlc3NfYXQoa2V5X3ByZWZpeDogYnl0ZXMsIGluZGV4OiB1aW50NjQpIC0+IGJ5dGVzOgphZGRyZXNzX2F0OgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NTgtNTkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYWRkcmVzc19hdChrZXlfcHJlZml4OiBCeXRlcywgaW5kZXg6IFVJbnQ2NCkgLT4gQWNjb3VudDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NjEKICAgIC8vIGNodW5rX2tleSA9IGtleV9wcmVmaXggKyBvcC5pdG9iKGluZGV4IC8vIFVJbnQ2NChBRERSRVNTX0NIVU5LX1NJWkUpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTo2MgogICAgLy8gcmV0dXJuIEFjY291bnQob3AuQm94LmV4dHJhY3QoY2h1bmtfa2V5LCAoaW5kZXggJSBVSW50NjQoQUREUkVTU19DSFVOS19TSVpFKSkgKiBVSW50NjQoMzIpLCAzMikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAzMgogICAgJQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmRlcG9zaXQobWVtbzogYnl0ZXMsIHBheV90eG46IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjItNjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGRlcG9zaXQoc2VsZiwgbWVtbzogU3RyaW5nLCBwYXlfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo2NQogICAgLy8gYXNzZXJ0IHBheV90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlJlY2VpdmVyIG11c3QgYmUgdGhlIGNvbnRyYWN0IGFkZHJlc3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo2NgogICAgLy8gYXNzZXJ0IHBheV90eG4uYW1vdW50ID4gMCwgIkRlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gRGVwb3NpdCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjgKICAgIC8vIHNlbGYuX2NyZWRpdChwYXlfdHhuLnNlbmRlciwgcGF5X3R4bi5hbW91bnQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2NyZWRpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjkKICAgIC8vIHJldHVybiBzZWxmLl9iYWxhbmNlX29mKHBheV90eG4uc2VuZGVyKQogICAgY2FsbHN1YiBfYmFsYW5jZV9vZgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay53aXRoZHJhdyhhbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjcxLTcyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB3aXRoZHJhdyhzZWxmLCBhbW91bnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3NAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgaW4gc2VsZi5kZXBvc2l0cywgIk5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQiCiAgICBieXRlYyA1IC8vIDB4NjQ1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3NQogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NzcKICAgIC8vIHJldHVybiBzZWxmLl9kZWJpdF9hbmRfcGF5KFR4bi5zZW5kZXIsIGFtb3VudCkKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZGViaXRfYW5kX3BheQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5kZXBvc2l0X2JhdGNoKGFjY291bnRzOiBieXRlcywgYW1vdW50czogYnl0ZXMsIHBheV90eG46IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0X2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NzktODUKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGRlcG9zaXRfYmF0Y2goCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBhY2NvdW50czogRHluYW1pY0FycmF5W0FkZHJlc3NdLAogICAgLy8gICAgIGFtb3VudHM6IER5bmFtaWNBcnJheVtBUkM0VUludDY0XSwKICAgIC8vICAgICBwYXlfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgaW4gc2VsZi5jdXN0b2RpYW5zLCAiT25seSBjdXN0b2RpYW5zIgogICAgYnl0ZWMgNyAvLyAweDYzNzU1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBPbmx5IGN1c3RvZGlhbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBhc3NlcnQgYWNjb3VudHMubGVuZ3RoID09IGFtb3VudHMubGVuZ3RoLCAiTGVuZ3RoIG1pc21hdGNoIgogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIExlbmd0aCBtaXNtYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTIKICAgIC8vIGFzc2VydCBhY2NvdW50cy5sZW5ndGggPD0gVUludDY0KE1BWF9CQVRDSCksICJCYXRjaCB0b28gbGFyZ2UiCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIEJhdGNoIHRvbyBsYXJnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTMKICAgIC8vIGFzc2VydCBwYXlfdHhuLnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgbXVzdCBiZSB0aGUgY29udHJhY3QgYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTUKICAgIC8vIHRvdGFsID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTYKICAgIC8vIGZvciBpIGluIHVyYW5nZShhY2NvdW50cy5sZW5ndGgpOgogICAgZHVwCgpkZXBvc2l0X2JhdGNoX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWNjb3VudHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogZGVwb3NpdF9iYXRjaF9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTcKICAgIC8vIGFtb3VudCA9IGFtb3VudHNbaV0ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkRlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBEZXBvc2l0IGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5OQogICAgLy8gc2VsZi5fY3JlZGl0KGFjY291bnRzW2ldLm5hdGl2ZSwgYW1vdW50KQogICAgZnJhbWVfZGlnIC0zCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAxCiAgICBjYWxsc3ViIF9jcmVkaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwMAogICAgLy8gdG90YWwgKz0gYW1vdW50CiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5NgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFjY291bnRzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGRlcG9zaXRfYmF0Y2hfZm9yX2hlYWRlckAxCgpkZXBvc2l0X2JhdGNoX2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTAxCiAgICAvLyBhc3NlcnQgcGF5X3R4bi5hbW91bnQgPT0gdG90YWwsICJQYXltZW50IG11c3QgZXF1YWwgdGhlIGJhdGNoIHRvdGFsIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBlcXVhbCB0aGUgYmF0Y2ggdG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gcmV0dXJuIGFjY291bnRzLmxlbmd0aAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay53aXRoZHJhd19iYXRjaChhY2NvdW50czogYnl0ZXMsIGFtb3VudHM6IGJ5dGVzKSAtPiB1aW50NjQ6CndpdGhkcmF3X2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA1LTExMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgd2l0aGRyYXdfYmF0Y2goCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBhY2NvdW50czogRHluYW1pY0FycmF5W0FkZHJlc3NdLAogICAgLy8gICAgIGFtb3VudHM6IER5bmFtaWNBcnJheVtBUkM0VUludDY0XSwKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyIGluIHNlbGYuY3VzdG9kaWFucywgIk9ubHkgY3VzdG9kaWFucyIKICAgIGJ5dGVjIDcgLy8gMHg2Mzc1NWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gT25seSBjdXN0b2RpYW5zCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTYKICAgIC8vIGFzc2VydCBhY2NvdW50cy5sZW5ndGggPT0gYW1vdW50cy5sZW5ndGgsICJMZW5ndGggbWlzbWF0Y2giCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gTGVuZ3RoIG1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2VydCBhY2NvdW50cy5sZW5ndGggPD0gVUludDY0KE1BWF9CQVRDSCksICJCYXRjaCB0b28gbGFyZ2UiCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIEJhdGNoIHRvbyBsYXJnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTE5CiAgICAvLyB0b3RhbCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFjY291bnRzLmxlbmd0aCk6CiAgICBkdXAKCndpdGhkcmF3X2JhdGNoX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFjY291bnRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IHdpdGhkcmF3X2JhdGNoX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjEKICAgIC8vIGFjY291bnQgPSBhY2NvdW50c1tpXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gYW1vdW50ID0gYW1vdW50c1tpXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAyCiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gYXNzZXJ0IGFjY291bnQgaW4gc2VsZi5kZXBvc2l0cywgIk5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQiCiAgICBieXRlYyA1IC8vIDB4NjQ1ZgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gZGVwb3NpdHMgZm91bmQgZm9yIHRoaXMgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTI0CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIldpdGhkcmF3YWwgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBkdXAKICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjUKICAgIC8vIHNlbGYuX2RlYml0X2FuZF9wYXkoYWNjb3VudCwgYW1vdW50KQogICAgc3dhcAogICAgZGlnIDEKICAgIGNhbGxzdWIgX2RlYml0X2FuZF9wYXkKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTI2CiAgICAvLyB0b3RhbCArPSBhbW91bnQKICAgIGZyYW1lX2RpZyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFjY291bnRzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHdpdGhkcmF3X2JhdGNoX2Zvcl9oZWFkZXJAMQoKd2l0aGRyYXdfYmF0Y2hfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjgKICAgIC8vIHJldHVybiB0b3RhbAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5kaXN0cmlidXRlX3lpZWxkKHBheV90eG46IHVpbnQ2NCkgLT4gdWludDY0OgpkaXN0cmlidXRlX3lpZWxkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMwLTEzMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZGlzdHJpYnV0ZV95aWVsZChzZWxmLCBwYXlfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzMKICAgIC8vIGFzc2VydCBwYXlfdHhuLnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUmVjZWl2ZXIgbXVzdCBiZSB0aGUgY29udHJhY3QgYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTM0CiAgICAvLyBhc3NlcnQgcGF5X3R4bi5hbW91bnQgPiAwLCAiWWllbGQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gWWllbGQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEzNQogICAgLy8gYXNzZXJ0IHNlbGYudG90YWxfc2hhcmVzID4gMCwgIk5vIGRlcG9zaXRvcnMiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidG90YWxfc2hhcmVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3NoYXJlcyBleGlzdHMKICAgIGFzc2VydCAvLyBObyBkZXBvc2l0b3JzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzcKICAgIC8vIGhpZ2gsIGxvdyA9IG9wLm11bHcocGF5X3R4bi5hbW91bnQsIFVJbnQ2NChJTkRFWF9TQ0FMRSkpCiAgICBkdXAKICAgIGludGNfMyAvLyAxMDAwMDAwMDAwCiAgICBtdWx3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzgKICAgIC8vIHNlbGYuZXhjaGFuZ2VfaW5kZXggKz0gb3AuZGl2dyhoaWdoLCBsb3csIHNlbGYudG90YWxfc2hhcmVzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImV4Y2hhbmdlX2luZGV4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV4Y2hhbmdlX2luZGV4IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3NoYXJlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zaGFyZXMgZXhpc3RzCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBkaXZ3CiAgICArCiAgICBieXRlY18xIC8vICJleGNoYW5nZV9pbmRleCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzkKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCArPSBwYXlfdHhuLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZGVwb3NpdCBleGlzdHMKICAgICsKICAgIGJ5dGVjXzIgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQwCiAgICAvLyByZXR1cm4gc2VsZi5leGNoYW5nZV9pbmRleAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImV4Y2hhbmdlX2luZGV4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV4Y2hhbmdlX2luZGV4IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5zZXRfY3VzdG9kaWFuKGN1c3RvZGlhbjogYnl0ZXMsIGVuYWJsZWQ6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X2N1c3RvZGlhbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE0Mi0xNDMKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNldF9jdXN0b2RpYW4oc2VsZiwgY3VzdG9kaWFuOiBBY2NvdW50LCBlbmFibGVkOiBib29sKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQ1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLCAiT25seSBhZG1pbiIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBhZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQ2CiAgICAvLyBpZiBlbmFibGVkOgogICAgZnJhbWVfZGlnIC0xCiAgICBieiBzZXRfY3VzdG9kaWFuX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNDcKICAgIC8vIHNlbGYuY3VzdG9kaWFuc1tjdXN0b2RpYW5dID0gVUludDY0KDEpCiAgICBieXRlYyA3IC8vIDB4NjM3NTVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgaW50Y18xIC8vIDEKICAgIGl0b2IKICAgIGJveF9wdXQKCnNldF9jdXN0b2RpYW5fYWZ0ZXJfaWZfZWxzZUA1OgogICAgcmV0c3ViCgpzZXRfY3VzdG9kaWFuX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQ4CiAgICAvLyBlbGlmIGN1c3RvZGlhbiBpbiBzZWxmLmN1c3RvZGlhbnM6CiAgICBieXRlYyA3IC8vIDB4NjM3NTVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogc2V0X2N1c3RvZGlhbl9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gZGVsIHNlbGYuY3VzdG9kaWFuc1tjdXN0b2RpYW5dCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2RlbAogICAgcG9wCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmdldF9iYWxhbmNlcyhhY2NvdW50czogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfYmFsYW5jZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNTEtMTUyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2JhbGFuY2VzKHNlbGYsIGFjY291bnRzOiBEeW5hbWljQXJyYXlbQWRkcmVzc10pIC0+IER5bmFtaWNBcnJheVtBUkM0VUludDY0XToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTU0CiAgICAvLyBhc3NlcnQgYWNjb3VudHMubGVuZ3RoIDw9IFVJbnQ2NChNQVhfQkFMQU5DRV9MT09LVVApLCAiVG9vIG1hbnkgYWNjb3VudHMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICA8PQogICAgYXNzZXJ0IC8vIFRvbyBtYW55IGFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNTYKICAgIC8vIHBhY2tlZCA9IEJ5dGVzKCkKICAgIHB1c2hieXRlcyAweAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTU3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWNjb3VudHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCgpnZXRfYmFsYW5jZXNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTU3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWNjb3VudHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogZ2V0X2JhbGFuY2VzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNTgKICAgIC8vIHBhY2tlZCArPSBvcC5pdG9iKHNlbGYuX2JhbGFuY2Vfb2YoYWNjb3VudHNbaV0ubmF0aXZlKSkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNhbGxzdWIgX2JhbGFuY2Vfb2YKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTU3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYWNjb3VudHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZ2V0X2JhbGFuY2VzX2Zvcl9oZWFkZXJAMQoKZ2V0X2JhbGFuY2VzX2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTU5CiAgICAvLyByZXR1cm4gRHluYW1pY0FycmF5W0FSQzRVSW50NjRdLmZyb21fYnl0ZXMoQVJDNFVJbnQxNihhY2NvdW50cy5sZW5ndGgpLmJ5dGVzICsgcGFja2VkKQogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmdldF9kZXBvc2l0b3JzX3BhZ2Uob2Zmc2V0OiB1aW50NjQsIGxpbWl0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfZGVwb3NpdG9yc19wYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTYxLTE2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9kZXBvc2l0b3JzX3BhZ2Uoc2VsZiwgb2Zmc2V0OiBVSW50NjQsIGxpbWl0OiBVSW50NjQpIC0+IER5bmFtaWNBcnJheVtEZXBvc2l0b3JFbnRyeV06CiAgICBwcm90byAyIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTY3CiAgICAvLyBpZiBvZmZzZXQgPj0gc2VsZi5kZXBvc2l0b3JfY291bnQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdG9yX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRvcl9jb3VudCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgPD0KICAgIGJ6IGdldF9kZXBvc2l0b3JzX3BhZ2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNjgKICAgIC8vIHJldHVybiBEeW5hbWljQXJyYXlbRGVwb3NpdG9yRW50cnldKCkKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfZGVwb3NpdG9yc19wYWdlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gcGFnZV9zaXplID0gc2VsZi5kZXBvc2l0b3JfY291bnQgLSBvZmZzZXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJkZXBvc2l0b3JfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdG9yX2NvdW50IGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTcxCiAgICAvLyBpZiBsaW1pdCA8IHBhZ2Vfc2l6ZToKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgYnogZ2V0X2RlcG9zaXRvcnNfcGFnZV9hZnRlcl9pZl9lbHNlQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAyCgpnZXRfZGVwb3NpdG9yc19wYWdlX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gaWYgcGFnZV9zaXplID4gTUFYX0RFUE9TSVRPUl9QQUdFOgogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgMjUgLy8gMjUKICAgID4KICAgIGJ6IGdldF9kZXBvc2l0b3JzX3BhZ2VfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzQKICAgIC8vIHBhZ2Vfc2l6ZSA9IFVJbnQ2NChNQVhfREVQT1NJVE9SX1BBR0UpCiAgICBwdXNoaW50IDI1IC8vIDI1CiAgICBmcmFtZV9idXJ5IDIKCmdldF9kZXBvc2l0b3JzX3BhZ2VfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTc2CiAgICAvLyBwYWNrZWQgPSBCeXRlcygpCiAgICBwdXNoYnl0ZXMgMHgKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTc3CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKG9mZnNldCwgb2Zmc2V0ICsgcGFnZV9zaXplKToKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9idXJ5IDEKCmdldF9kZXBvc2l0b3JzX3BhZ2VfZm9yX2hlYWRlckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTc3CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKG9mZnNldCwgb2Zmc2V0ICsgcGFnZV9zaXplKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogZ2V0X2RlcG9zaXRvcnNfcGFnZV9hZnRlcl9mb3JAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE3OAogICAgLy8gZGVwb3NpdG9yID0gYWRkcmVzc19hdChCeXRlcyhERVBPU0lUT1JfSU5ERVhfUFJFRklYKSwgaW5kZXgpCiAgICBieXRlYyA2IC8vIDB4NjQ3ODVmCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIGFkZHJlc3NfYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE3OQogICAgLy8gcGFja2VkICs9IGRlcG9zaXRvci5ieXRlcyArIG9wLml0b2Ioc2VsZi5fYmFsYW5jZV9vZihkZXBvc2l0b3IpKQogICAgZHVwCiAgICBjYWxsc3ViIF9iYWxhbmNlX29mCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTc3CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKG9mZnNldCwgb2Zmc2V0ICsgcGFnZV9zaXplKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2RlcG9zaXRvcnNfcGFnZV9mb3JfaGVhZGVyQDcKCmdldF9kZXBvc2l0b3JzX3BhZ2VfYWZ0ZXJfZm9yQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTgwCiAgICAvLyByZXR1cm4gRHluYW1pY0FycmF5W0RlcG9zaXRvckVudHJ5XS5mcm9tX2J5dGVzKEFSQzRVSW50MTYocGFnZV9zaXplKS5ieXRlcyArIHBhY2tlZCkKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5fY3JlZGl0KGFjY291bnQ6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKX2NyZWRpdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE4Mi0xODMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NyZWRpdChzZWxmLCBhY2NvdW50OiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTg1CiAgICAvLyBoaWdoLCBsb3cgPSBvcC5tdWx3KGFtb3VudCwgVUludDY0KElOREVYX1NDQUxFKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18zIC8vIDEwMDAwMDAwMDAKICAgIG11bHcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gc2hhcmVzID0gb3AuZGl2dyhoaWdoLCBsb3csIHNlbGYuZXhjaGFuZ2VfaW5kZXgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiZXhjaGFuZ2VfaW5kZXgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXhjaGFuZ2VfaW5kZXggZXhpc3RzCiAgICBkaXZ3CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE4NwogICAgLy8gYXNzZXJ0IHNoYXJlcyA+IDAsICJEZXBvc2l0IHRvbyBzbWFsbCIKICAgIGFzc2VydCAvLyBEZXBvc2l0IHRvbyBzbWFsbAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTg5CiAgICAvLyBpZiBhY2NvdW50IGluIHNlbGYuZGVwb3NpdHM6CiAgICBieXRlYyA1IC8vIDB4NjQ1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfY3JlZGl0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTAKICAgIC8vIGN1cnJlbnQgPSBzZWxmLmRlcG9zaXRzW2FjY291bnRdLmNvcHkoKQogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gaW5kZXg9Y3VycmVudC5pbmRleCwgc2hhcmVzPUFSQzRVSW50NjQoY3VycmVudC5zaGFyZXMubmF0aXZlICsgc2hhcmVzKQogICAgZHVwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE5MS0xOTMKICAgIC8vIHNlbGYuZGVwb3NpdHNbYWNjb3VudF0gPSBEZXBvc2l0UmVjb3JkKAogICAgLy8gICAgIGluZGV4PWN1cnJlbnQuaW5kZXgsIHNoYXJlcz1BUkM0VUludDY0KGN1cnJlbnQuc2hhcmVzLm5hdGl2ZSArIHNoYXJlcykKICAgIC8vICkKICAgIGNvbmNhdAogICAgYm94X3B1dAoKX2NyZWRpdF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMDEKICAgIC8vIHNlbGYudG90YWxfc2hhcmVzICs9IHNoYXJlcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3NoYXJlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9zaGFyZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgYnl0ZWNfMyAvLyAidG90YWxfc2hhcmVzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gc2VsZi50b3RhbF9kZXBvc2l0ICs9IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZGVwb3NpdCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgYnl0ZWNfMiAvLyAidG90YWxfZGVwb3NpdCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCl9jcmVkaXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTYKICAgIC8vIGluZGV4PUFSQzRVSW50NjQoc2VsZi5kZXBvc2l0b3JfY291bnQpLCBzaGFyZXM9QVJDNFVJbnQ2NChzaGFyZXMpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdG9yX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRvcl9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTUtMTk3CiAgICAvLyBzZWxmLmRlcG9zaXRzW2FjY291bnRdID0gRGVwb3NpdFJlY29yZCgKICAgIC8vICAgICBpbmRleD1BUkM0VUludDY0KHNlbGYuZGVwb3NpdG9yX2NvdW50KSwgc2hhcmVzPUFSQzRVSW50NjQoc2hhcmVzKQogICAgLy8gKQogICAgY29uY2F0CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTgKICAgIC8vIGFwcGVuZF9hZGRyZXNzKEJ5dGVzKERFUE9TSVRPUl9JTkRFWF9QUkVGSVgpLCBzZWxmLmRlcG9zaXRvcl9jb3VudCwgYWNjb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJkZXBvc2l0b3JfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdG9yX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NDkKICAgIC8vIGNodW5rX2tleSA9IGtleV9wcmVmaXggKyBvcC5pdG9iKGNvdW50IC8vIFVJbnQ2NChBRERSRVNTX0NIVU5LX1NJWkUpKQogICAgZHVwCiAgICBpbnRjXzIgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE5OAogICAgLy8gYXBwZW5kX2FkZHJlc3MoQnl0ZXMoREVQT1NJVE9SX0lOREVYX1BSRUZJWCksIHNlbGYuZGVwb3NpdG9yX2NvdW50LCBhY2NvdW50KQogICAgYnl0ZWMgNiAvLyAweDY0Nzg1ZgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NDkKICAgIC8vIGNodW5rX2tleSA9IGtleV9wcmVmaXggKyBvcC5pdG9iKGNvdW50IC8vIFVJbnQ2NChBRERSRVNTX0NIVU5LX1NJWkUpKQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjUwCiAgICAvLyBzbG90ID0gY291bnQgJSBVSW50NjQoQUREUkVTU19DSFVOS19TSVpFKQogICAgaW50Y18yIC8vIDMyCiAgICAlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NTEKICAgIC8vIGlmIHNsb3QgPT0gVUludDY0KDApOgogICAgYm56IF9jcmVkaXRfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjUyCiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShjaHVua19rZXksIDMyKSwgIkZhaWxlZCB0byBjcmVhdGUgYWRkcmVzcyBpbmRleCBjaHVuayIKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzIgLy8gMzIKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBGYWlsZWQgdG8gY3JlYXRlIGFkZHJlc3MgaW5kZXggY2h1bmsKCl9jcmVkaXRfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NTUKICAgIC8vIG9wLkJveC5yZXBsYWNlKGNodW5rX2tleSwgc2xvdCAqIFVJbnQ2NCgzMiksIGFkZHJlc3MuYnl0ZXMpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTk5CiAgICAvLyBzZWxmLmRlcG9zaXRvcl9jb3VudCArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJkZXBvc2l0b3JfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdG9yX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRvcl9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIF9jcmVkaXRfYWZ0ZXJfaWZfZWxzZUAzCgpfY3JlZGl0X2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NTQKICAgIC8vIG9wLkJveC5yZXNpemUoY2h1bmtfa2V5LCAoc2xvdCArIFVJbnQ2NCgxKSkgKiBVSW50NjQoMzIpKQogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBib3hfcmVzaXplCiAgICBiIF9jcmVkaXRfYWZ0ZXJfaWZfZWxzZUA3CgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5fZGViaXRfYW5kX3BheShhY2NvdW50OiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IHVpbnQ2NDoKX2RlYml0X2FuZF9wYXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMDQtMjA1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9kZWJpdF9hbmRfcGF5KHNlbGYsIGFjY291bnQ6IEFjY291bnQsIGFtb3VudDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMTAKICAgIC8vIGhpZ2gsIGxvdyA9IG9wLm11bHcoYW1vdW50LCBVSW50NjQoSU5ERVhfU0NBTEUpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzMgLy8gMTAwMDAwMDAwMAogICAgbXVsdwogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gc2hhcmVzID0gb3AuZGl2dyhoaWdoLCBsb3csIHNlbGYuZXhjaGFuZ2VfaW5kZXgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiZXhjaGFuZ2VfaW5kZXgiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXhjaGFuZ2VfaW5kZXggZXhpc3RzCiAgICBkaWcgMQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIGRpdncKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjEyCiAgICAvLyBjaGVja19oaWdoLCBjaGVja19sb3cgPSBvcC5tdWx3KHNoYXJlcywgc2VsZi5leGNoYW5nZV9pbmRleCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJleGNoYW5nZV9pbmRleCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5leGNoYW5nZV9pbmRleCBleGlzdHMKICAgIG11bHcKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIxMwogICAgLy8gaWYgY2hlY2tfaGlnaCAhPSBoaWdoIG9yIGNoZWNrX2xvdyAhPSBsb3c6CiAgICAhPQogICAgYm56IF9kZWJpdF9hbmRfcGF5X2lmX2JvZHlAMgogICAgZnJhbWVfZGlnIDEwCiAgICBmcmFtZV9kaWcgOAogICAgIT0KICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9idXJ5IDYKICAgIGJ6IF9kZWJpdF9hbmRfcGF5X2FmdGVyX2lmX2Vsc2VAMwoKX2RlYml0X2FuZF9wYXlfaWZfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjE0CiAgICAvLyBzaGFyZXMgKz0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgOQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNgoKX2RlYml0X2FuZF9wYXlfYWZ0ZXJfaWZfZWxzZUAzOgogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgZnJhbWVfYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMTUKICAgIC8vIGN1cnJlbnQgPSBzZWxmLmRlcG9zaXRzW2FjY291bnRdLmNvcHkoKQogICAgYnl0ZWMgNSAvLyAweDY0NWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjE2CiAgICAvLyBhc3NlcnQgc2hhcmVzIDw9IGN1cnJlbnQuc2hhcmVzLm5hdGl2ZSwgIldpdGhkcmF3YWwgYW1vdW50IGV4Y2VlZHMgYmFsYW5jZSIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwMgogICAgPD0KICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBleGNlZWRzIGJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPWFjY291bnQsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMjAKICAgIC8vIHJlbWFpbmluZyA9IGN1cnJlbnQuc2hhcmVzLm5hdGl2ZSAtIHNoYXJlcwogICAgZGlnIDEKICAgIC0KICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSA0CiAgICBmcmFtZV9idXJ5IDYKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMjEKICAgIC8vIGlmIHJlbWFpbmluZyA+IFVJbnQ2NCgwKSBhbmQgc2VsZi5fc2hhcmVzX3RvX2Ftb3VudChyZW1haW5pbmcpID09IFVJbnQ2NCgwKToKICAgIGJ6IF9kZWJpdF9hbmRfcGF5X2FmdGVyX2lmX2Vsc2VANwogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY2FsbHN1YiBfc2hhcmVzX3RvX2Ftb3VudAogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2J1cnkgNgogICAgc3dhcAogICAgZnJhbWVfYnVyeSA1CiAgICBibnogX2RlYml0X2FuZF9wYXlfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMjIKICAgIC8vIHNoYXJlcyArPSByZW1haW5pbmcKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgNAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjIzCiAgICAvLyByZW1haW5pbmcgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDUKICAgIGZyYW1lX2J1cnkgNgoKX2RlYml0X2FuZF9wYXlfYWZ0ZXJfaWZfZWxzZUA3OgogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2J1cnkgOQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMjQKICAgIC8vIGlmIHJlbWFpbmluZyA9PSBVSW50NjQoMCk6CiAgICBibnogX2RlYml0X2FuZF9wYXlfZWxzZV9ib2R5QDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gZGVsIHNlbGYuZGVwb3NpdHNbYWNjb3VudF0KICAgIGZyYW1lX2RpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gc2VsZi5fcmVtb3ZlX2RlcG9zaXRvcihjdXJyZW50LmluZGV4Lm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNDgKICAgIC8vIGxhc3QgPSBzZWxmLmRlcG9zaXRvcl9jb3VudCAtIFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImRlcG9zaXRvcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0b3JfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI0OQogICAgLy8gaWYgaW5kZXggIT0gbGFzdDoKICAgICE9CiAgICBieiBfZGViaXRfYW5kX3BheV9hZnRlcl9pZl9lbHNlQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNTAKICAgIC8vIG1vdmVkID0gYWRkcmVzc19hdChCeXRlcyhERVBPU0lUT1JfSU5ERVhfUFJFRklYKSwgbGFzdCkKICAgIGJ5dGVjIDYgLy8gMHg2NDc4NWYKICAgIGZyYW1lX2RpZyAzCiAgICBjYWxsc3ViIGFkZHJlc3NfYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjY4CiAgICAvLyBjaHVua19rZXkgPSBrZXlfcHJlZml4ICsgb3AuaXRvYihpbmRleCAvLyBVSW50NjQoQUREUkVTU19DSFVOS19TSVpFKSkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGludGNfMiAvLyAzMgogICAgLwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjUxCiAgICAvLyByZXBsYWNlX2FkZHJlc3MoQnl0ZXMoREVQT1NJVE9SX0lOREVYX1BSRUZJWCksIGluZGV4LCBtb3ZlZCkKICAgIGJ5dGVjIDYgLy8gMHg2NDc4NWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjY4CiAgICAvLyBjaHVua19rZXkgPSBrZXlfcHJlZml4ICsgb3AuaXRvYihpbmRleCAvLyBVSW50NjQoQUREUkVTU19DSFVOS19TSVpFKSkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NjkKICAgIC8vIG9wLkJveC5yZXBsYWNlKGNodW5rX2tleSwgKGluZGV4ICUgVUludDY0KEFERFJFU1NfQ0hVTktfU0laRSkpICogVUludDY0KDMyKSwgYWRkcmVzcy5ieXRlcykKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gMzIKICAgICUKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgZGlnIDMKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNTIKICAgIC8vIHNlbGYuZGVwb3NpdHNbbW92ZWRdID0gRGVwb3NpdFJlY29yZChpbmRleD1BUkM0VUludDY0KGluZGV4KSwgc2hhcmVzPXNlbGYuZGVwb3NpdHNbbW92ZWRdLnNoYXJlcykKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg2NDVmCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0cyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9wdXQKCl9kZWJpdF9hbmRfcGF5X2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNTQKICAgIC8vIHBvcF9hZGRyZXNzKEJ5dGVzKERFUE9TSVRPUl9JTkRFWF9QUkVGSVgpLCBzZWxmLmRlcG9zaXRvcl9jb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJkZXBvc2l0b3JfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVwb3NpdG9yX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NzUKICAgIC8vIGxhc3QgPSBjb3VudCAtIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5Ojc2CiAgICAvLyBjaHVua19rZXkgPSBrZXlfcHJlZml4ICsgb3AuaXRvYihsYXN0IC8vIFVJbnQ2NChBRERSRVNTX0NIVU5LX1NJWkUpKQogICAgZHVwCiAgICBpbnRjXzIgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI1NAogICAgLy8gcG9wX2FkZHJlc3MoQnl0ZXMoREVQT1NJVE9SX0lOREVYX1BSRUZJWCksIHNlbGYuZGVwb3NpdG9yX2NvdW50KQogICAgYnl0ZWMgNiAvLyAweDY0Nzg1ZgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6NzYKICAgIC8vIGNodW5rX2tleSA9IGtleV9wcmVmaXggKyBvcC5pdG9iKGxhc3QgLy8gVUludDY0KEFERFJFU1NfQ0hVTktfU0laRSkpCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5Ojc3CiAgICAvLyBzbG90ID0gbGFzdCAlIFVJbnQ2NChBRERSRVNTX0NIVU5LX1NJWkUpCiAgICBpbnRjXzIgLy8gMzIKICAgICUKICAgIGR1cAogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTo3OAogICAgLy8gaWYgc2xvdCA9PSBVSW50NjQoMCk6CiAgICBibnogX2RlYml0X2FuZF9wYXlfZWxzZV9ib2R5QDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTo3OQogICAgLy8gb3AuQm94LmRlbGV0ZShjaHVua19rZXkpCiAgICBib3hfZGVsCiAgICBwb3AKCl9kZWJpdF9hbmRfcGF5X2FmdGVyX2lmX2Vsc2VAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNTUKICAgIC8vIHNlbGYuZGVwb3NpdG9yX2NvdW50ID0gbGFzdAogICAgYnl0ZWNfMCAvLyAiZGVwb3NpdG9yX2NvdW50IgogICAgZnJhbWVfZGlnIDMKICAgIGFwcF9nbG9iYWxfcHV0CgpfZGViaXRfYW5kX3BheV9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjMwCiAgICAvLyBzZWxmLnRvdGFsX3NoYXJlcyAtPSBzaGFyZXMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9zaGFyZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfc2hhcmVzIGV4aXN0cwogICAgZnJhbWVfZGlnIDkKICAgIC0KICAgIGJ5dGVjXzMgLy8gInRvdGFsX3NoYXJlcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMzEKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCAtPSBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJ0b3RhbF9kZXBvc2l0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2RlcG9zaXQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGJ5dGVjXzIgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjMyCiAgICAvLyByZXR1cm4gc2VsZi5fc2hhcmVzX3RvX2Ftb3VudChyZW1haW5pbmcpCiAgICBmcmFtZV9kaWcgNAogICAgY2FsbHN1YiBfc2hhcmVzX3RvX2Ftb3VudAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9kZWJpdF9hbmRfcGF5X2Vsc2VfYm9keUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjgxCiAgICAvLyBvcC5Cb3gucmVzaXplKGNodW5rX2tleSwgc2xvdCAqIFVJbnQ2NCgzMikpCiAgICBmcmFtZV9kaWcgNwogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBib3hfcmVzaXplCiAgICBiIF9kZWJpdF9hbmRfcGF5X2FmdGVyX2lmX2Vsc2VAMTcKCl9kZWJpdF9hbmRfcGF5X2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjI4CiAgICAvLyBzZWxmLmRlcG9zaXRzW2FjY291bnRdID0gRGVwb3NpdFJlY29yZChpbmRleD1jdXJyZW50LmluZGV4LCBzaGFyZXM9QVJDNFVJbnQ2NChyZW1haW5pbmcpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIDQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGIgX2RlYml0X2FuZF9wYXlfYWZ0ZXJfaWZfZWxzZUAxMAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYW5rLmNvbnRyYWN0LkJhbmsuX2JhbGFuY2Vfb2YoYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKX2JhbGFuY2Vfb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMzQtMjM1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9iYWxhbmNlX29mKHNlbGYsIGFjY291bnQ6IEFjY291bnQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjM2CiAgICAvLyBpZiBhY2NvdW50IG5vdCBpbiBzZWxmLmRlcG9zaXRzOgogICAgYnl0ZWMgNSAvLyAweDY0NWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IF9iYWxhbmNlX29mX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjM3CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgcmV0c3ViCgpfYmFsYW5jZV9vZl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMzgKICAgIC8vIHJldHVybiBzZWxmLl9zaGFyZXNfdG9fYW1vdW50KHNlbGYuZGVwb3NpdHNbYWNjb3VudF0uc2hhcmVzLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZXBvc2l0cyBlbnRyeSBleGlzdHMKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgY2FsbHN1YiBfc2hhcmVzX3RvX2Ftb3VudAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5fc2hhcmVzX3RvX2Ftb3VudChzaGFyZXM6IHVpbnQ2NCkgLT4gdWludDY0Ogpfc2hhcmVzX3RvX2Ftb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI0MC0yNDEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3NoYXJlc190b19hbW91bnQoc2VsZiwgc2hhcmVzOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjQyCiAgICAvLyBoaWdoLCBsb3cgPSBvcC5tdWx3KHNoYXJlcywgc2VsZi5leGNoYW5nZV9pbmRleCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJleGNoYW5nZV9pbmRleCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5leGNoYW5nZV9pbmRleCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjQzCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaWdoLCBsb3csIFVJbnQ2NChJTkRFWF9TQ0FMRSkpCiAgICBpbnRjXzMgLy8gMTAwMDAwMDAwMAogICAgZGl2dwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [430], "errorMessage": "Address length is 32 bytes"}, {"pc": [514, 614], "errorMessage": "Batch too large"}, {"pc": [448, 548], "errorMessage": "Deposit amount must be greater than zero"}, {"pc": [1003], "errorMessage": "Deposit too small"}, {"pc": [1090], "errorMessage": "Failed to create address index chunk"}, {"pc": [559, 638, 824, 1020, 1341, 1416], "errorMessage": "Index access is out of bounds"}, {"pc": [510, 610], "errorMessage": "Length mismatch"}, {"pc": [706], "errorMessage": "No depositors"}, {"pc": [474, 658], "errorMessage": "No deposits found for this account"}, {"pc": [188, 213, 233, 256, 284, 308, 342, 364], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [754], "errorMessage": "Only admin"}, {"pc": [497, 597], "errorMessage": "Only custodians"}, {"pc": [584], "errorMessage": "Payment must equal the batch total"}, {"pc": [442, 522, 695], "errorMessage": "Receiver must be the contract address"}, {"pc": [799], "errorMessage": "Too many accounts"}, {"pc": [1211], "errorMessage": "Withdrawal amount exceeds balance"}, {"pc": [477, 660], "errorMessage": "Withdrawal amount must be greater than zero"}, {"pc": [701], "errorMessage": "Yield amount must be greater than zero"}, {"pc": [403], "errorMessage": "can only call when creating"}, {"pc": [191, 216, 236, 259, 287, 311, 345, 367], "errorMessage": "can only call when not creating"}, {"pc": [752], "errorMessage": "check self.admin exists"}, {"pc": [871, 888, 1057, 1067, 1104, 1296, 1352], "errorMessage": "check self.depositor_count exists"}, {"pc": [1018, 1205, 1340, 1451], "errorMessage": "check self.deposits entry exists"}, {"pc": [713, 740, 1000, 1145, 1159, 1466], "errorMessage": "check self.exchange_index exists"}, {"pc": [732, 1046, 1391], "errorMessage": "check self.total_deposit exists"}, {"pc": [705, 717, 1036, 1381], "errorMessage": "check self.total_shares exists"}, {"pc": [850, 977], "errorMessage": "overflow"}, {"pc": [269, 327, 383], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,13 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class DepositRecord:
+    """Struct for DepositRecord"""
+    index: int
+    shares: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class DepositArgs:
     """Dataclass for deposit arguments"""
@@ -83,6 +90,65 @@ class WithdrawArgs:
     def abi_method_signature(self) -> str:
         return "withdraw(uint64)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DepositBatchArgs:
+    """Dataclass for deposit_batch arguments"""
+    accounts: list[str]
+    amounts: list[int]
+    pay_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "deposit_batch(address[],uint64[],pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class WithdrawBatchArgs:
+    """Dataclass for withdraw_batch arguments"""
+    accounts: list[str]
+    amounts: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "withdraw_batch(address[],uint64[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DistributeYieldArgs:
+    """Dataclass for distribute_yield arguments"""
+    pay_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "distribute_yield(pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetCustodianArgs:
+    """Dataclass for set_custodian arguments"""
+    custodian: str | bytes
+    enabled: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_custodian(account,bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBalancesArgs:
+    """Dataclass for get_balances arguments"""
+    accounts: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_balances(address[])uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetDepositorsPageArgs:
+    """Dataclass for get_depositors_page arguments"""
+    offset: int
+    limit: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_depositors_page(uint64,uint64)(address,uint64)[]"
+
 
 class BankParams:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -114,6 +180,84 @@ class BankParams:
             "args": method_args,
         }))
 
+    def deposit_batch(
+        self,
+        args: tuple[list[str], list[int], algokit_utils.AppMethodCallTransactionArgument] | DepositBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_batch(address[],uint64[],pay)uint64",
+            "args": method_args,
+        }))
+
+    def withdraw_batch(
+        self,
+        args: tuple[list[str], list[int]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_batch(address[],uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def distribute_yield(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DistributeYieldArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_yield(pay)uint64",
+            "args": method_args,
+        }))
+
+    def set_custodian(
+        self,
+        args: tuple[str | bytes, bool] | SetCustodianArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_custodian(account,bool)void",
+            "args": method_args,
+        }))
+
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balances(address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def get_depositors_page(
+        self,
+        args: tuple[int, int] | GetDepositorsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_depositors_page(uint64,uint64)(address,uint64)[]",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -155,6 +299,84 @@ class BankCreateTransactionParams:
             "args": method_args,
         }))
 
+    def deposit_batch(
+        self,
+        args: tuple[list[str], list[int], algokit_utils.AppMethodCallTransactionArgument] | DepositBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_batch(address[],uint64[],pay)uint64",
+            "args": method_args,
+        }))
+
+    def withdraw_batch(
+        self,
+        args: tuple[list[str], list[int]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_batch(address[],uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def distribute_yield(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DistributeYieldArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_yield(pay)uint64",
+            "args": method_args,
+        }))
+
+    def set_custodian(
+        self,
+        args: tuple[str | bytes, bool] | SetCustodianArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_custodian(account,bool)void",
+            "args": method_args,
+        }))
+
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balances(address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def get_depositors_page(
+        self,
+        args: tuple[int, int] | GetDepositorsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_depositors_page(uint64,uint64)(address,uint64)[]",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -202,6 +424,102 @@ class BankSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def deposit_batch(
+        self,
+        args: tuple[list[str], list[int], algokit_utils.AppMethodCallTransactionArgument] | DepositBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_batch(address[],uint64[],pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def withdraw_batch(
+        self,
+        args: tuple[list[str], list[int]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_batch(address[],uint64[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def distribute_yield(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DistributeYieldArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_yield(pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def set_custodian(
+        self,
+        args: tuple[str | bytes, bool] | SetCustodianArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_custodian(account,bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balances(address[])uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def get_depositors_page(
+        self,
+        args: tuple[int, int] | GetDepositorsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[str, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_depositors_page(uint64,uint64)(address,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[str, int]]], parsed_response)
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -216,6 +534,10 @@ class BankSend:
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     total_deposit: int
+    total_shares: int
+    exchange_index: int
+    admin: str
+    depositor_count: int
 
 class BankState:
     """Methods to access state for the current Bank app"""
@@ -268,12 +590,46 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def total_shares(self) -> int:
+        """Get the current value of the total_shares key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_shares")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def exchange_index(self) -> int:
+        """Get the current value of the exchange_index key in global_state state"""
+        value = self.app_client.state.global_state.get_value("exchange_index")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def admin(self) -> str:
+        """Get the current value of the admin key in global_state state"""
+        value = self.app_client.state.global_state.get_value("admin")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def depositor_count(self) -> int:
+        """Get the current value of the depositor_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("depositor_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _BoxState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
         
         # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "DepositRecord": DepositRecord
+        }
 
     def get_all(self) -> dict[str, typing.Any]:
         """Get all current keyed values from box state"""
@@ -292,11 +648,20 @@ class _BoxState:
         return converted
 
     @property
-    def deposits(self) -> "_MapState[str, int]":
+    def deposits(self) -> "_MapState[str, DepositRecord]":
         """Get values from the deposits map in box state"""
         return _MapState(
             self.app_client.state.box,
             "deposits",
+            self._struct_classes.get("DepositRecord")
+        )
+
+    @property
+    def custodians(self) -> "_MapState[str, int]":
+        """Get values from the custodians map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "custodians",
             None
         )
 
@@ -491,6 +856,42 @@ class BankClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["deposit_batch(address[],uint64[],pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw_batch(address[],uint64[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["distribute_yield(pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_custodian(account,bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_balances(address[])uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_depositors_page(uint64,uint64)(address,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[str, int]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -501,7 +902,7 @@ class BankClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | list[int] | list[tuple[str, int]]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -712,6 +1113,126 @@ class BankFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def deposit_batch(
+        self,
+        args: tuple[list[str], list[int], algokit_utils.AppMethodCallTransactionArgument] | DepositBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the deposit_batch(address[],uint64[],pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "deposit_batch(address[],uint64[],pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def withdraw_batch(
+        self,
+        args: tuple[list[str], list[int]] | WithdrawBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw_batch(address[],uint64[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw_batch(address[],uint64[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def distribute_yield(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DistributeYieldArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the distribute_yield(pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "distribute_yield(pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_custodian(
+        self,
+        args: tuple[str | bytes, bool] | SetCustodianArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_custodian(account,bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_custodian(account,bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_balances(address[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_balances(address[])uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_depositors_page(
+        self,
+        args: tuple[int, int] | GetDepositorsPageArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_depositors_page(uint64,uint64)(address,uint64)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_depositors_page(uint64,uint64)(address,uint64)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class BankFactoryUpdateParams:
     """Parameters for 'update' operations of Bank contract"""
 
@@ -849,6 +1370,114 @@ class BankComposer:
         )
         return self
 
+    def deposit_batch(
+        self,
+        args: tuple[list[str], list[int], algokit_utils.AppMethodCallTransactionArgument] | DepositBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.deposit_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "deposit_batch(address[],uint64[],pay)uint64", v
+            )
+        )
+        return self
+
+    def withdraw_batch(
+        self,
+        args: tuple[list[str], list[int]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw_batch(address[],uint64[])uint64", v
+            )
+        )
+        return self
+
+    def distribute_yield(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DistributeYieldArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.distribute_yield(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "distribute_yield(pay)uint64", v
+            )
+        )
+        return self
+
+    def set_custodian(
+        self,
+        args: tuple[str | bytes, bool] | SetCustodianArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_custodian(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_custodian(account,bool)void", v
+            )
+        )
+        return self
+
+    def get_balances(
+        self,
+        args: tuple[list[str]] | GetBalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_balances(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_balances(address[])uint64[]", v
+            )
+        )
+        return self
+
+    def get_depositors_page(
+        self,
+        args: tuple[int, int] | GetDepositorsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_depositors_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_depositors_page(uint64,uint64)(address,uint64)[]", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "name": "goal"}, {"type": "uint64", "name": "milestones"}, {"type": "uint64", "name": "deadline"}, {"type": "address", "name": "approver1"}, {"type": "address", "name": "approver2"}, {"type": "address", "name": "approver3"}], "name": "create_campaign", "returns": {"type": "uint64"}, "desc": "Create campaign with 3 mandatory approvers\nAll 3 must approve each milestone before funds can be released", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "donate", "returns": {"type": "uint64"}, "desc": "Donate to the campaign", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "cid"}], "name": "set_media_cid", "returns": {"type": "uint64"}, "desc": "Store IPFS CID for campaign media (image/video)\nCreator only, can be called once Requires box MBR funding: 2500 + 400 * (5 + cid_length) microAlgos Max CID length: 64 characters", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_media_cid", "returns": {"type": "byte[]"}, "desc": "Retrieve IPFS CID for campaign media\nReturns empty bytes if no media set", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "approve_milestone", "returns": {"type": "uint64"}, "desc": "\ud83d\udd10 DECENTRALIZED ON-CHAIN APPROVAL\nApprovers call this to approve the current milestone Replaces Firebase - all approvals stored on blockchain! Returns: number of approvals received (1, 2, or 3)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "release_milestone", "returns": {"type": "uint64"}, "desc": "Release funds for current milestone (creator only)\n\ud83d\udd12 REQUIRES ALL 3 APPROVERS TO HAVE APPROVED FIRST This ensures multi-signature security on-chain!", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_status", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,bool,bool)"}, "desc": "Get campaign status", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_creator", "returns": {"type": "address"}, "desc": "Get campaign creator address", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_deadline", "returns": {"type": "uint64"}, "desc": "Get campaign deadline", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approvers", "returns": {"type": "(address,address,address)"}, "desc": "Get all approver addresses (on-chain query)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approval_status", "returns": {"type": "(bool,bool,bool)"}, "desc": "Get current approval status for each approver\nReturns (approver1_approved, approver2_approved, approver3_approved) Frontend can use this instead of Firebase!", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "approver_address"}], "name": "has_approved", "returns": {"type": "bool"}, "desc": "Check if a specific address has approved the current milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approval_count", "returns": {"type": "uint64"}, "desc": "Get number of approvals for current milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "address"}], "name": "is_approver", "returns": {"type": "bool"}, "desc": "Check if an address is one of the approvers", "events": [], "readonly": true, "recommendations": {}}], "name": "Fundraiser", "state": {"keys": {"box": {}, "global": {"goal_amount": {"key": "Z29hbF9hbW91bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "raised_amount": {"key": "cmFpc2VkX2Ftb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "milestone_count": {"key": "bWlsZXN0b25lX2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "current_milestone": {"key": "Y3VycmVudF9taWxlc3RvbmU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "deadline": {"key": "ZGVhZGxpbmU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_active": {"key": "aXNfYWN0aXZl", "keyType": "AVMString", "valueType": "AVMUint64"}, "creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "contributor_count": {"key": "Y29udHJpYnV0b3JfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "goal_reached": {"key": "Z29hbF9yZWFjaGVk", "keyType": "AVMString", "valueType": "AVMUint64"}, "media_cid_length": {"key": "bWVkaWFfY2lkX2xlbmd0aA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "approver1": {"key": "YXBwcm92ZXIx", "keyType": "AVMString", "valueType": "address"}, "approver2": {"key": "YXBwcm92ZXIy", "keyType": "AVMString", "valueType": "address"}, "approver3": {"key": "YXBwcm92ZXIz", "keyType": "AVMString", "valueType": "address"}, "approver1_approved": {"key": "YXBwcm92ZXIxX2FwcHJvdmVk", "keyType": "AVMString", "valueType": "AVMUint64"}, "approver2_approved": {"key": "YXBwcm92ZXIyX2FwcHJvdmVk", "keyType": "AVMString", "valueType": "AVMUint64"}, "approver3_approved": {"key": "YXBwcm92ZXIzX2FwcHJvdmVk", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 4, "ints": 12}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiADAAGgjQYmEwQVH3x1EmFwcHJvdmVyMV9hcHByb3ZlZBJhcHByb3ZlcjJfYXBwcm92ZWQSYXBwcm92ZXIzX2FwcHJvdmVkAQANcmFpc2VkX2Ftb3VudBFjdXJyZW50X21pbGVzdG9uZQdjcmVhdG9yC2dvYWxfYW1vdW50D21pbGVzdG9uZV9jb3VudAxnb2FsX3JlYWNoZWQJYXBwcm92ZXIxCWFwcHJvdmVyMglhcHByb3ZlcjMRY29udHJpYnV0b3JfY291bnQQbWVkaWFfY2lkX2xlbmd0aAhkZWFkbGluZQlpc19hY3RpdmUFbWVkaWExG0EAaYIOBO+l1q4E5MPgEARg/0B9BFEQjfgENT7uEgTCIcBRBK9Fad0EICoOGQRl94dXBMl9gQUE66YTKgQPvHT8BDKksBgEgCHfiDYaAI4OAV0BQgErARMBAgDxAK0AnQCMAHcARQAsABsAAiJDMRkURDEYRDYaAYgECicEIk8CVChMULAjQzEZFEQxGESIA70WKExQsCNDMRkURDEYRDYaAYgDdCcEIk8CVChMULAjQzEZFEQxGESIA1EnBCJPBFQnBCJPBFQnBCJPBFRMIlNPAiNPAlRMIlOBAkxUKExQsCNDMRkURDEYRIgDD04CUExQKExQsCNDMRkURDEYRIgC9BYoTFCwI0MxGRREMRhEiALdKExQsCNDMRkURDEYRIgCqU8GFk8GFk8GFk8GFk8GFicEIk8IVCcEIk8IVE8GTwZQTwVQTwRQTwNQTwJQTCJTgcECTFQoTFCwI0MxGRREMRhEiAH6FihMULAjQzEZFEQxGESIAVgWKExQsCNDMRkURDEYRIgBN0kVFlcGAkxQKExQsCNDMRkURDEYRDYaAVcCAIgA7RYoTFCwI0MxGRREMRhEMRYjCUk4ECMSRIgAdxYoTFCwI0MxGRREMRgURDYaARc2GgIXNhoDFzYaBDYaBTYaBogABxYoTFCwI0OKBgEnCIv6ZycFImcnCYv7ZycGImcnEIv8ZycRI2cnBzEAZycOImcnCiJnJwuL/WcnDIv+ZycNi/9nKSJnKiJnKyJnJw8iZyOJigEBIicRZUREMgciJxBlRA5EIicFZUQiJwhlRAxEi/84BzIKEkSL/zgISSQPRCInBWVECCcFTGciJw5lRCMIJw5MZyInBWVEIicIZUQPQQAEJwojZyInBWVEiYoBATEAIicHZUQSRCInD2VEFESL/xVJgUAORCcSSwG5RCcSi/+/Jw9LAWeJIicPZURAAAOAAIknEr5EiYoAAYAASSInCmVERCInBmVEIicJZUQMRDEASSInC2VEEkEAQSIpZUQURCkjZyKMACIpZURBAAMjjAAiKmVEiwCMAUEABosAIwiMAYsBSYwAIitlREyMAUEABosAIwiMAYsBjACJIicMZUSLAhJBAAwiKmVEFEQqI2dC/7EiJw1lRIsCEkQiK2VEFEQrI2dC/5wxACInB2VEEkQiJwZlRCInCWVEDEQiJwplREQiKWVERCIqZUREIitlREQiJwhlRCInCWVECjIKcwBESwEkCA9EsSInB2VEsgeyCCOyECKyAbMiJwZlRCMIJwZMZykiZyoiZysiZyInBmVEiSInCGVEIicFZUQiJwZlRCInCWVEIicOZUQiJxFlRCInCmVEiSInB2VEiSInEGVEiSInC2VEIicMZUQiJw1lRIkiKWVEIiplRCIrZUSJigEBIicLZUSL/xJBAAUiKWVEiSInDGVEi/8SQQAFIiplRIkiJw1lRIv/EkEABSIrZUSJIomKAAGAACJJKWVEQQADI4wBIiplRIsBjABBAAaLASMIjACLAEmMASIrZURMjABBAAaLASMIjACJigEBIicHZUSL/xJBAAIjiSInC2VEi/8SQQACI4kiJwxlRIv/EkEAAiOJIicNZUSL/xJBAAIjiSKJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    CampusChain Multi-Signature Fundraiser Contract\n    Milestone-based crowdfunding with ON-CHAIN decentralized approvals\n    Requires ALL 3 approvers to sign before milestone release\n    100% DECENTRALIZED - No Firebase or centralized database!\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMTAwMDAwCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgImFwcHJvdmVyMV9hcHByb3ZlZCIgImFwcHJvdmVyMl9hcHByb3ZlZCIgImFwcHJvdmVyM19hcHByb3ZlZCIgMHgwMCAicmFpc2VkX2Ftb3VudCIgImN1cnJlbnRfbWlsZXN0b25lIiAiY3JlYXRvciIgImdvYWxfYW1vdW50IiAibWlsZXN0b25lX2NvdW50IiAiZ29hbF9yZWFjaGVkIiAiYXBwcm92ZXIxIiAiYXBwcm92ZXIyIiAiYXBwcm92ZXIzIiAiY29udHJpYnV0b3JfY291bnQiICJtZWRpYV9jaWRfbGVuZ3RoIiAiZGVhZGxpbmUiICJpc19hY3RpdmUiIDB4NmQ2NTY0Njk2MQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgRnVuZHJhaXNlcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYWZ0ZXJfaWZfZWxzZUAyMAogICAgcHVzaGJ5dGVzcyAweGVmYTVkNmFlIDB4ZTRjM2UwMTAgMHg2MGZmNDA3ZCAweDUxMTA4ZGY4IDB4MzUzZWVlMTIgMHhjMjIxYzA1MSAweGFmNDU2OWRkIDB4MjAyYTBlMTkgMHg2NWY3ODc1NyAweGM5N2Q4MTA1IDB4ZWJhNjEzMmEgMHgwZmJjNzRmYyAweDMyYTRiMDE4IDB4ODAyMWRmODggLy8gbWV0aG9kICJjcmVhdGVfY2FtcGFpZ24odWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJkb25hdGUocGF5KXVpbnQ2NCIsIG1ldGhvZCAic2V0X21lZGlhX2NpZChieXRlW10pdWludDY0IiwgbWV0aG9kICJnZXRfbWVkaWFfY2lkKClieXRlW10iLCBtZXRob2QgImFwcHJvdmVfbWlsZXN0b25lKCl1aW50NjQiLCBtZXRob2QgInJlbGVhc2VfbWlsZXN0b25lKCl1aW50NjQiLCBtZXRob2QgImdldF9zdGF0dXMoKSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGJvb2wsYm9vbCkiLCBtZXRob2QgImdldF9jcmVhdG9yKClhZGRyZXNzIiwgbWV0aG9kICJnZXRfZGVhZGxpbmUoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2FwcHJvdmVycygpKGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzKSIsIG1ldGhvZCAiZ2V0X2FwcHJvdmFsX3N0YXR1cygpKGJvb2wsYm9vbCxib29sKSIsIG1ldGhvZCAiaGFzX2FwcHJvdmVkKGFkZHJlc3MpYm9vbCIsIG1ldGhvZCAiZ2V0X2FwcHJvdmFsX2NvdW50KCl1aW50NjQiLCBtZXRob2QgImlzX2FwcHJvdmVyKGFkZHJlc3MpYm9vbCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2NhbXBhaWduX3JvdXRlQDMgbWFpbl9kb25hdGVfcm91dGVANCBtYWluX3NldF9tZWRpYV9jaWRfcm91dGVANSBtYWluX2dldF9tZWRpYV9jaWRfcm91dGVANiBtYWluX2FwcHJvdmVfbWlsZXN0b25lX3JvdXRlQDcgbWFpbl9yZWxlYXNlX21pbGVzdG9uZV9yb3V0ZUA4IG1haW5fZ2V0X3N0YXR1c19yb3V0ZUA5IG1haW5fZ2V0X2NyZWF0b3Jfcm91dGVAMTAgbWFpbl9nZXRfZGVhZGxpbmVfcm91dGVAMTEgbWFpbl9nZXRfYXBwcm92ZXJzX3JvdXRlQDEyIG1haW5fZ2V0X2FwcHJvdmFsX3N0YXR1c19yb3V0ZUAxMyBtYWluX2hhc19hcHByb3ZlZF9yb3V0ZUAxNCBtYWluX2dldF9hcHByb3ZhbF9jb3VudF9yb3V0ZUAxNSBtYWluX2lzX2FwcHJvdmVyX3JvdXRlQDE2CgptYWluX2FmdGVyX2lmX2Vsc2VAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBGdW5kcmFpc2VyKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2lzX2FwcHJvdmVyX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6Mjc4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEZ1bmRyYWlzZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBpc19hcHByb3ZlcgogICAgYnl0ZWMgNCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2FwcHJvdmFsX2NvdW50X3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjY2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2FwcHJvdmFsX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2hhc19hcHByb3ZlZF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI1MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBGdW5kcmFpc2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgaGFzX2FwcHJvdmVkCiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXBwcm92YWxfc3RhdHVzX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjM5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2FwcHJvdmFsX3N0YXR1cwogICAgYnl0ZWMgNCAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciA0CiAgICBzZXRiaXQKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgNAogICAgc2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDQKICAgIHNldGJpdAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgdW5jb3ZlciAyCiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIHB1c2hpbnQgMiAvLyAyCiAgICBzd2FwCiAgICBzZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2FwcHJvdmVyc19yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9hcHByb3ZlcnMKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9kZWFkbGluZV9yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9kZWFkbGluZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY3JlYXRvcl9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIyMAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9jcmVhdG9yCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9zdGF0dXNfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3N0YXR1cwogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgOAogICAgc2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDgKICAgIHNldGJpdAogICAgdW5jb3ZlciA2CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIHB1c2hpbnQgMzIxIC8vIDMyMQogICAgc3dhcAogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlbGVhc2VfbWlsZXN0b25lX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHJlbGVhc2VfbWlsZXN0b25lCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfbWlsZXN0b25lX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGFwcHJvdmVfbWlsZXN0b25lCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9tZWRpYV9jaWRfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjExMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X21lZGlhX2NpZAogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0X21lZGlhX2NpZF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6OTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBGdW5kcmFpc2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6OTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfbWVkaWFfY2lkCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RvbmF0ZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBGdW5kcmFpc2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZG9uYXRlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9jYW1wYWlnbl9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MzUKICAgIC8vIEBhYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bJ05vT3AnXSwgY3JlYXRlPSdyZXF1aXJlJykKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBGdW5kcmFpc2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTozNQogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsnTm9PcCddLCBjcmVhdGU9J3JlcXVpcmUnKQogICAgY2FsbHN1YiBjcmVhdGVfY2FtcGFpZ24KICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmNyZWF0ZV9jYW1wYWlnbihnb2FsOiB1aW50NjQsIG1pbGVzdG9uZXM6IHVpbnQ2NCwgZGVhZGxpbmU6IHVpbnQ2NCwgYXBwcm92ZXIxOiBieXRlcywgYXBwcm92ZXIyOiBieXRlcywgYXBwcm92ZXIzOiBieXRlcykgLT4gdWludDY0OgpjcmVhdGVfY2FtcGFpZ246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTozNS00NAogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsnTm9PcCddLCBjcmVhdGU9J3JlcXVpcmUnKQogICAgLy8gZGVmIGNyZWF0ZV9jYW1wYWlnbigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGdvYWw6IFVJbnQ2NCwKICAgIC8vICAgICBtaWxlc3RvbmVzOiBVSW50NjQsCiAgICAvLyAgICAgZGVhZGxpbmU6IFVJbnQ2NCwKICAgIC8vICAgICBhcHByb3ZlcjE6IEFkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92ZXIyOiBBZGRyZXNzLAogICAgLy8gICAgIGFwcHJvdmVyMzogQWRkcmVzcwogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA2IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBzZWxmLmdvYWxfYW1vdW50ID0gZ29hbAogICAgYnl0ZWMgOCAvLyAiZ29hbF9hbW91bnQiCiAgICBmcmFtZV9kaWcgLTYKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1MAogICAgLy8gc2VsZi5yYWlzZWRfYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlYyA1IC8vICJyYWlzZWRfYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1MQogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnQgPSBtaWxlc3RvbmVzCiAgICBieXRlYyA5IC8vICJtaWxlc3RvbmVfY291bnQiCiAgICBmcmFtZV9kaWcgLTUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1MgogICAgLy8gc2VsZi5jdXJyZW50X21pbGVzdG9uZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNiAvLyAiY3VycmVudF9taWxlc3RvbmUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBzZWxmLmRlYWRsaW5lID0gZGVhZGxpbmUKICAgIGJ5dGVjIDE2IC8vICJkZWFkbGluZSIKICAgIGZyYW1lX2RpZyAtNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBzZWxmLmlzX2FjdGl2ZSA9IFRydWUKICAgIGJ5dGVjIDE3IC8vICJpc19hY3RpdmUiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjU1CiAgICAvLyBzZWxmLmNyZWF0b3IgPSBUeG4uc2VuZGVyCiAgICBieXRlYyA3IC8vICJjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBzZWxmLmNvbnRyaWJ1dG9yX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlYyAxNCAvLyAiY29udHJpYnV0b3JfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLmdvYWxfcmVhY2hlZCA9IEZhbHNlCiAgICBieXRlYyAxMCAvLyAiZ29hbF9yZWFjaGVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo1OS02MAogICAgLy8gIyBTdG9yZSBhcHByb3ZlciBhZGRyZXNzZXMgKGNvbnZlcnQgQVJDNCBBZGRyZXNzIHRvIG5hdGl2ZSBBY2NvdW50KQogICAgLy8gc2VsZi5hcHByb3ZlcjEgPSBhcHByb3ZlcjEubmF0aXZlCiAgICBieXRlYyAxMSAvLyAiYXBwcm92ZXIxIgogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NjEKICAgIC8vIHNlbGYuYXBwcm92ZXIyID0gYXBwcm92ZXIyLm5hdGl2ZQogICAgYnl0ZWMgMTIgLy8gImFwcHJvdmVyMiIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLmFwcHJvdmVyMyA9IGFwcHJvdmVyMy5uYXRpdmUKICAgIGJ5dGVjIDEzIC8vICJhcHByb3ZlcjMiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo2NC02NQogICAgLy8gIyBJbml0aWFsaXplIGFsbCBhcHByb3ZhbHMgdG8gZmFsc2UKICAgIC8vIHNlbGYuYXBwcm92ZXIxX2FwcHJvdmVkID0gRmFsc2UKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmVyMV9hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NjYKICAgIC8vIHNlbGYuYXBwcm92ZXIyX2FwcHJvdmVkID0gRmFsc2UKICAgIGJ5dGVjXzIgLy8gImFwcHJvdmVyMl9hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NjcKICAgIC8vIHNlbGYuYXBwcm92ZXIzX2FwcHJvdmVkID0gRmFsc2UKICAgIGJ5dGVjXzMgLy8gImFwcHJvdmVyM19hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NjgKICAgIC8vIHNlbGYubWVkaWFfY2lkX2xlbmd0aCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTUgLy8gIm1lZGlhX2NpZF9sZW5ndGgiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjcwCiAgICAvLyByZXR1cm4gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5kb25hdGUocGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CmRvbmF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjcyLTczCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBkb25hdGUoc2VsZiwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NzUKICAgIC8vIGFzc2VydCBzZWxmLmlzX2FjdGl2ZSwgIkNhbXBhaWduIG5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gImlzX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19hY3RpdmUgZXhpc3RzCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2VydCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLmRlYWRsaW5lLCAiQ2FtcGFpZ24gZW5kZWQiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gImRlYWRsaW5lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlYWRsaW5lIGV4aXN0cwogICAgPD0KICAgIGFzc2VydCAvLyBDYW1wYWlnbiBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6NzcKICAgIC8vIGFzc2VydCBzZWxmLnJhaXNlZF9hbW91bnQgPCBzZWxmLmdvYWxfYW1vdW50LCAiR29hbCBhbHJlYWR5IHJlYWNoZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImdvYWxfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfYW1vdW50IGV4aXN0cwogICAgPAogICAgYXNzZXJ0IC8vIEdvYWwgYWxyZWFkeSByZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo3OAogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gVUludDY0KDEwMDAwMCksICJNaW5pbXVtIDAuMSBBTEdPIGRvbmF0aW9uIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgaW50Y18yIC8vIDEwMDAwMAogICAgPj0KICAgIGFzc2VydCAvLyBNaW5pbXVtIDAuMSBBTEdPIGRvbmF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo4MQogICAgLy8gc2VsZi5yYWlzZWRfYW1vdW50ICs9IHBheW1lbnQuYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgKwogICAgYnl0ZWMgNSAvLyAicmFpc2VkX2Ftb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo4MgogICAgLy8gc2VsZi5jb250cmlidXRvcl9jb3VudCArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAiY29udHJpYnV0b3JfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29udHJpYnV0b3JfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTQgLy8gImNvbnRyaWJ1dG9yX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg0LTg1CiAgICAvLyAjIENoZWNrIGlmIGdvYWwgaXMgcmVhY2hlZAogICAgLy8gaWYgc2VsZi5yYWlzZWRfYW1vdW50ID49IHNlbGYuZ29hbF9hbW91bnQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImdvYWxfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfYW1vdW50IGV4aXN0cwogICAgPj0KICAgIGJ6IGRvbmF0ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBzZWxmLmdvYWxfcmVhY2hlZCA9IFRydWUKICAgIGJ5dGVjIDEwIC8vICJnb2FsX3JlYWNoZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKCmRvbmF0ZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo4OAogICAgLy8gcmV0dXJuIHNlbGYucmFpc2VkX2Ftb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInJhaXNlZF9hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmFpc2VkX2Ftb3VudCBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuc2V0X21lZGlhX2NpZChjaWQ6IGJ5dGVzKSAtPiB1aW50NjQ6CnNldF9tZWRpYV9jaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo5MC05MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc2V0X21lZGlhX2NpZChzZWxmLCBjaWQ6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IsICJPbmx5IGNyZWF0b3IgY2FuIHNldCBtZWRpYSIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBjYW4gc2V0IG1lZGlhCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo5OQogICAgLy8gYXNzZXJ0IHNlbGYubWVkaWFfY2lkX2xlbmd0aCA9PSBVSW50NjQoMCksICJNZWRpYSBhbHJlYWR5IHNldCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAibWVkaWFfY2lkX2xlbmd0aCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tZWRpYV9jaWRfbGVuZ3RoIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIE1lZGlhIGFscmVhZHkgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMDEKICAgIC8vIGNpZF9sZW4gPSBjaWQubGVuZ3RoCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTAyCiAgICAvLyBhc3NlcnQgY2lkX2xlbiA8PSBVSW50NjQoNjQpLCAiQ0lEIHRvbyBsb25nIChtYXggNjQgY2hhcnMpIgogICAgZHVwCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICA8PQogICAgYXNzZXJ0IC8vIENJRCB0b28gbG9uZyAobWF4IDY0IGNoYXJzKQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTA0LTEwNgogICAgLy8gIyBDcmVhdGUgYm94IHRvIHN0b3JlIHRoZSBDSUQKICAgIC8vICMgQm94IE1CUjogMjUwMCArIDQwMCAqICg1ICsgbGVuKGNpZCkpCiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShCeXRlcyhiIm1lZGlhIiksIGNpZF9sZW4pLCAiRmFpbGVkIHRvIGNyZWF0ZSBtZWRpYSBib3giCiAgICBieXRlYyAxOCAvLyAweDZkNjU2NDY5NjEKICAgIGRpZyAxCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gRmFpbGVkIHRvIGNyZWF0ZSBtZWRpYSBib3gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gb3AuQm94LnB1dChCeXRlcyhiIm1lZGlhIiksIGNpZCkKICAgIGJ5dGVjIDE4IC8vIDB4NmQ2NTY0Njk2MQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMDkKICAgIC8vIHNlbGYubWVkaWFfY2lkX2xlbmd0aCA9IGNpZF9sZW4KICAgIGJ5dGVjIDE1IC8vICJtZWRpYV9jaWRfbGVuZ3RoIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMTAKICAgIC8vIHJldHVybiBjaWRfbGVuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmdldF9tZWRpYV9jaWQoKSAtPiBieXRlczoKZ2V0X21lZGlhX2NpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjExOAogICAgLy8gaWYgc2VsZi5tZWRpYV9jaWRfbGVuZ3RoID09IFVJbnQ2NCgwKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAibWVkaWFfY2lkX2xlbmd0aCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tZWRpYV9jaWRfbGVuZ3RoIGV4aXN0cwogICAgYm56IGdldF9tZWRpYV9jaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMTkKICAgIC8vIHJldHVybiBCeXRlcyhiIiIpCiAgICBwdXNoYnl0ZXMgMHgKICAgIHJldHN1YgoKZ2V0X21lZGlhX2NpZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjEKICAgIC8vIGNpZF9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChCeXRlcyhiIm1lZGlhIikpCiAgICBieXRlYyAxOCAvLyAweDZkNjU2NDY5NjEKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gYXNzZXJ0IGV4aXN0cywgIk1lZGlhIGJveCBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gTWVkaWEgYm94IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTIzCiAgICAvLyByZXR1cm4gY2lkX2J5dGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmFwcHJvdmVfbWlsZXN0b25lKCkgLT4gdWludDY0OgphcHByb3ZlX21pbGVzdG9uZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEyNS0xMjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFwcHJvdmVfbWlsZXN0b25lKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gYXNzZXJ0IHNlbGYuZ29hbF9yZWFjaGVkLCAiQ2Fubm90IGFwcHJvdmUgLSBnb2FsIG5vdCByZWFjaGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJnb2FsX3JlYWNoZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ29hbF9yZWFjaGVkIGV4aXN0cwogICAgYXNzZXJ0IC8vIENhbm5vdCBhcHByb3ZlIC0gZ29hbCBub3QgcmVhY2hlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTM0CiAgICAvLyBhc3NlcnQgc2VsZi5jdXJyZW50X21pbGVzdG9uZSA8IHNlbGYubWlsZXN0b25lX2NvdW50LCAiQWxsIG1pbGVzdG9uZXMgY29tcGxldGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfbWlsZXN0b25lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gIm1pbGVzdG9uZV9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnQgZXhpc3RzCiAgICA8CiAgICBhc3NlcnQgLy8gQWxsIG1pbGVzdG9uZXMgY29tcGxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMzYtMTM3CiAgICAvLyAjIENoZWNrIGlmIHNlbmRlciBpcyBvbmUgb2YgdGhlIGFwcHJvdmVycyBhbmQgbWFyayB0aGVpciBhcHByb3ZhbAogICAgLy8gc2VuZGVyID0gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNDAKICAgIC8vIGlmIHNlbmRlciA9PSBzZWxmLmFwcHJvdmVyMToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAiYXBwcm92ZXIxIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMSBleGlzdHMKICAgID09CiAgICBieiBhcHByb3ZlX21pbGVzdG9uZV9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTQxCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuYXBwcm92ZXIxX2FwcHJvdmVkLCAiQWxyZWFkeSBhcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhcHByb3ZlcjFfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIxX2FwcHJvdmVkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gc2VsZi5hcHByb3ZlcjFfYXBwcm92ZWQgPSBUcnVlCiAgICBieXRlY18xIC8vICJhcHByb3ZlcjFfYXBwcm92ZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKCmFwcHJvdmVfbWlsZXN0b25lX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE1NS0xNTYKICAgIC8vICMgQ291bnQgdG90YWwgYXBwcm92YWxzCiAgICAvLyBhcHByb3ZhbF9jb3VudCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTU3CiAgICAvLyBpZiBzZWxmLmFwcHJvdmVyMV9hcHByb3ZlZDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhcHByb3ZlcjFfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIxX2FwcHJvdmVkIGV4aXN0cwogICAgYnogYXBwcm92ZV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTU4CiAgICAvLyBhcHByb3ZhbF9jb3VudCArPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDAKCmFwcHJvdmVfbWlsZXN0b25lX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNTkKICAgIC8vIGlmIHNlbGYuYXBwcm92ZXIyX2FwcHJvdmVkOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFwcHJvdmVyMl9hcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQgZXhpc3RzCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfYnVyeSAxCiAgICBieiBhcHByb3ZlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNjAKICAgIC8vIGFwcHJvdmFsX2NvdW50ICs9IFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKCmFwcHJvdmVfbWlsZXN0b25lX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gaWYgc2VsZi5hcHByb3ZlcjNfYXBwcm92ZWQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYXBwcm92ZXIzX2FwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyM19hcHByb3ZlZCBleGlzdHMKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMQogICAgYnogYXBwcm92ZV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTYyCiAgICAvLyBhcHByb3ZhbF9jb3VudCArPSBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCgphcHByb3ZlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDE1OgogICAgZnJhbWVfZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gcmV0dXJuIGFwcHJvdmFsX2NvdW50CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKYXBwcm92ZV9taWxlc3RvbmVfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNDQKICAgIC8vIGVsaWYgc2VuZGVyID09IHNlbGYuYXBwcm92ZXIyOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJhcHByb3ZlcjIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIyIGV4aXN0cwogICAgZnJhbWVfZGlnIDIKICAgID09CiAgICBieiBhcHByb3ZlX21pbGVzdG9uZV9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTQ1CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuYXBwcm92ZXIyX2FwcHJvdmVkLCAiQWxyZWFkeSBhcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhcHByb3ZlcjJfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIyX2FwcHJvdmVkIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQgPSBUcnVlCiAgICBieXRlY18yIC8vICJhcHByb3ZlcjJfYXBwcm92ZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgYXBwcm92ZV9taWxlc3RvbmVfYWZ0ZXJfaWZfZWxzZUA5CgphcHByb3ZlX21pbGVzdG9uZV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gZWxpZiBzZW5kZXIgPT0gc2VsZi5hcHByb3ZlcjM6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gImFwcHJvdmVyMyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjMgZXhpc3RzCiAgICBmcmFtZV9kaWcgMgogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGFwcHJvdmVycyBjYW4gYXBwcm92ZSBtaWxlc3RvbmVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNDkKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5hcHByb3ZlcjNfYXBwcm92ZWQsICJBbHJlYWR5IGFwcHJvdmVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFwcHJvdmVyM19hcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjNfYXBwcm92ZWQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmFwcHJvdmVyM19hcHByb3ZlZCA9IFRydWUKICAgIGJ5dGVjXzMgLy8gImFwcHJvdmVyM19hcHByb3ZlZCIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBhcHByb3ZlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDkKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLnJlbGVhc2VfbWlsZXN0b25lKCkgLT4gdWludDY0OgpyZWxlYXNlX21pbGVzdG9uZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yLCAiT25seSBjcmVhdG9yIGNhbiByZWxlYXNlIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiByZWxlYXNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNzQKICAgIC8vIGFzc2VydCBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIDwgc2VsZi5taWxlc3RvbmVfY291bnQsICJBbGwgbWlsZXN0b25lcyBjb21wbGV0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAiY3VycmVudF9taWxlc3RvbmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3VycmVudF9taWxlc3RvbmUgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAibWlsZXN0b25lX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZV9jb3VudCBleGlzdHMKICAgIDwKICAgIGFzc2VydCAvLyBBbGwgbWlsZXN0b25lcyBjb21wbGV0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gYXNzZXJ0IHNlbGYuZ29hbF9yZWFjaGVkLCAiQ2Fubm90IHJlbGVhc2UgZnVuZHMgLSBnb2FsIG5vdCByZWFjaGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJnb2FsX3JlYWNoZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ29hbF9yZWFjaGVkIGV4aXN0cwogICAgYXNzZXJ0IC8vIENhbm5vdCByZWxlYXNlIGZ1bmRzIC0gZ29hbCBub3QgcmVhY2hlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTc3LTE3OAogICAgLy8gIyDwn5SQIENSSVRJQ0FMOiBWZXJpZnkgQUxMIGFwcHJvdmVycyBoYXZlIGFwcHJvdmVkCiAgICAvLyBhc3NlcnQgc2VsZi5hcHByb3ZlcjFfYXBwcm92ZWQsICJBcHByb3ZlciAxIGhhcyBub3QgYXBwcm92ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYXBwcm92ZXIxX2FwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMV9hcHByb3ZlZCBleGlzdHMKICAgIGFzc2VydCAvLyBBcHByb3ZlciAxIGhhcyBub3QgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE3OQogICAgLy8gYXNzZXJ0IHNlbGYuYXBwcm92ZXIyX2FwcHJvdmVkLCAiQXBwcm92ZXIgMiBoYXMgbm90IGFwcHJvdmVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFwcHJvdmVyMl9hcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQgZXhpc3RzCiAgICBhc3NlcnQgLy8gQXBwcm92ZXIgMiBoYXMgbm90IGFwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxODAKICAgIC8vIGFzc2VydCBzZWxmLmFwcHJvdmVyM19hcHByb3ZlZCwgIkFwcHJvdmVyIDMgaGFzIG5vdCBhcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhcHByb3ZlcjNfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIzX2FwcHJvdmVkIGV4aXN0cwogICAgYXNzZXJ0IC8vIEFwcHJvdmVyIDMgaGFzIG5vdCBhcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTgyLTE4MwogICAgLy8gIyBDYWxjdWxhdGUgYW1vdW50IHBlciBtaWxlc3RvbmUKICAgIC8vIGFtb3VudF9wZXJfbWlsZXN0b25lID0gc2VsZi5nb2FsX2Ftb3VudCAvLyBzZWxmLm1pbGVzdG9uZV9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImdvYWxfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gIm1pbGVzdG9uZV9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnQgZXhpc3RzCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxODcKICAgIC8vIGNvbnRyYWN0X2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTg4CiAgICAvLyBhc3NlcnQgY29udHJhY3RfYmFsYW5jZSA+PSBhbW91bnRfcGVyX21pbGVzdG9uZSArIG1pbl9iYWxhbmNlLCAiSW5zdWZmaWNpZW50IGJhbGFuY2UgYWZ0ZXIgTUJSIgogICAgZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE4NS0xODYKICAgIC8vICMgUmVzZXJ2ZSBtaW5pbXVtIGJhbGFuY2UgKDAuMSBBTEdPKQogICAgLy8gbWluX2JhbGFuY2UgPSBVSW50NjQoMTAwMDAwKQogICAgaW50Y18yIC8vIDEwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTg4CiAgICAvLyBhc3NlcnQgY29udHJhY3RfYmFsYW5jZSA+PSBhbW91bnRfcGVyX21pbGVzdG9uZSArIG1pbl9iYWxhbmNlLCAiSW5zdWZmaWNpZW50IGJhbGFuY2UgYWZ0ZXIgTUJSIgogICAgKwogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgYmFsYW5jZSBhZnRlciBNQlIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE5MC0xOTUKICAgIC8vICMgU2VuZCBmdW5kcyB0byBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgLy8gICAgIGFtb3VudD1hbW91bnRfcGVyX21pbGVzdG9uZSwKICAgIC8vICAgICBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTkyCiAgICAvLyByZWNlaXZlcj1zZWxmLmNyZWF0b3IsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE5MC0xOTEKICAgIC8vICMgU2VuZCBmdW5kcyB0byBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTQKICAgIC8vIGZlZT0wCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE5MC0xOTUKICAgIC8vICMgU2VuZCBmdW5kcyB0byBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgLy8gICAgIGFtb3VudD1hbW91bnRfcGVyX21pbGVzdG9uZSwKICAgIC8vICAgICBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE5Ny0xOTgKICAgIC8vICMgSW5jcmVtZW50IG1pbGVzdG9uZSBjb3VudGVyCiAgICAvLyBzZWxmLmN1cnJlbnRfbWlsZXN0b25lICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfbWlsZXN0b25lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfbWlsZXN0b25lIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIwMC0yMDEKICAgIC8vICMg8J+UhCBSRVNFVCBhcHByb3ZhbHMgZm9yIG5leHQgbWlsZXN0b25lCiAgICAvLyBzZWxmLmFwcHJvdmVyMV9hcHByb3ZlZCA9IEZhbHNlCiAgICBieXRlY18xIC8vICJhcHByb3ZlcjFfYXBwcm92ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQgPSBGYWxzZQogICAgYnl0ZWNfMiAvLyAiYXBwcm92ZXIyX2FwcHJvdmVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMDMKICAgIC8vIHNlbGYuYXBwcm92ZXIzX2FwcHJvdmVkID0gRmFsc2UKICAgIGJ5dGVjXzMgLy8gImFwcHJvdmVyM19hcHByb3ZlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjA1CiAgICAvLyByZXR1cm4gc2VsZi5jdXJyZW50X21pbGVzdG9uZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfbWlsZXN0b25lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5nZXRfc3RhdHVzKCkgLT4gdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0OgpnZXRfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjExCiAgICAvLyBzZWxmLmdvYWxfYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImdvYWxfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjEyCiAgICAvLyBzZWxmLnJhaXNlZF9hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjEzCiAgICAvLyBzZWxmLmN1cnJlbnRfbWlsZXN0b25lLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfbWlsZXN0b25lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjE0CiAgICAvLyBzZWxmLm1pbGVzdG9uZV9jb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJtaWxlc3RvbmVfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjE1CiAgICAvLyBzZWxmLmNvbnRyaWJ1dG9yX2NvdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJjb250cmlidXRvcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb250cmlidXRvcl9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gc2VsZi5pc19hY3RpdmUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gImlzX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19hY3RpdmUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMTcKICAgIC8vIHNlbGYuZ29hbF9yZWFjaGVkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImdvYWxfcmVhY2hlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb2FsX3JlYWNoZWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMTAtMjE4CiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHNlbGYuZ29hbF9hbW91bnQsCiAgICAvLyAgICAgc2VsZi5yYWlzZWRfYW1vdW50LAogICAgLy8gICAgIHNlbGYuY3VycmVudF9taWxlc3RvbmUsCiAgICAvLyAgICAgc2VsZi5taWxlc3RvbmVfY291bnQsCiAgICAvLyAgICAgc2VsZi5jb250cmlidXRvcl9jb3VudCwKICAgIC8vICAgICBzZWxmLmlzX2FjdGl2ZSwKICAgIC8vICAgICBzZWxmLmdvYWxfcmVhY2hlZAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5nZXRfY3JlYXRvcigpIC0+IGJ5dGVzOgpnZXRfY3JlYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIyMwogICAgLy8gcmV0dXJuIHNlbGYuY3JlYXRvcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuZ2V0X2RlYWRsaW5lKCkgLT4gdWludDY0OgpnZXRfZGVhZGxpbmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMjgKICAgIC8vIHJldHVybiBzZWxmLmRlYWRsaW5lCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gImRlYWRsaW5lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlYWRsaW5lIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5nZXRfYXBwcm92ZXJzKCkgLT4gYnl0ZXMsIGJ5dGVzLCBieXRlczoKZ2V0X2FwcHJvdmVyczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gQWRkcmVzcyhzZWxmLmFwcHJvdmVyMS5ieXRlcyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gImFwcHJvdmVyMSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjEgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMzUKICAgIC8vIEFkZHJlc3Moc2VsZi5hcHByb3ZlcjIuYnl0ZXMpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJhcHByb3ZlcjIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjM2CiAgICAvLyBBZGRyZXNzKHNlbGYuYXBwcm92ZXIzLmJ5dGVzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJhcHByb3ZlcjMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjMzLTIzNwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBBZGRyZXNzKHNlbGYuYXBwcm92ZXIxLmJ5dGVzKSwKICAgIC8vICAgICBBZGRyZXNzKHNlbGYuYXBwcm92ZXIyLmJ5dGVzKSwKICAgIC8vICAgICBBZGRyZXNzKHNlbGYuYXBwcm92ZXIzLmJ5dGVzKQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5nZXRfYXBwcm92YWxfc3RhdHVzKCkgLT4gdWludDY0LCB1aW50NjQsIHVpbnQ2NDoKZ2V0X2FwcHJvdmFsX3N0YXR1czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gc2VsZi5hcHByb3ZlcjFfYXBwcm92ZWQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYXBwcm92ZXIxX2FwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMV9hcHByb3ZlZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYXBwcm92ZXIyX2FwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMl9hcHByb3ZlZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI0OQogICAgLy8gc2VsZi5hcHByb3ZlcjNfYXBwcm92ZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhcHByb3ZlcjNfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIzX2FwcHJvdmVkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjQ2LTI1MAogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBzZWxmLmFwcHJvdmVyMV9hcHByb3ZlZCwKICAgIC8vICAgICBzZWxmLmFwcHJvdmVyMl9hcHByb3ZlZCwKICAgIC8vICAgICBzZWxmLmFwcHJvdmVyM19hcHByb3ZlZAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5oYXNfYXBwcm92ZWQoYXBwcm92ZXJfYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NDoKaGFzX2FwcHJvdmVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjUyLTI1MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGhhc19hcHByb3ZlZChzZWxmLCBhcHByb3Zlcl9hZGRyZXNzOiBBZGRyZXNzKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNTcKICAgIC8vIGlmIHNlbmRlcl9hY2NvdW50ID09IHNlbGYuYXBwcm92ZXIxOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJhcHByb3ZlcjEiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIxIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogaGFzX2FwcHJvdmVkX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNTgKICAgIC8vIHJldHVybiBzZWxmLmFwcHJvdmVyMV9hcHByb3ZlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmVyMV9hcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjFfYXBwcm92ZWQgZXhpc3RzCiAgICByZXRzdWIKCmhhc19hcHByb3ZlZF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI1OQogICAgLy8gZWxpZiBzZW5kZXJfYWNjb3VudCA9PSBzZWxmLmFwcHJvdmVyMjoKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAiYXBwcm92ZXIyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMiBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGhhc19hcHByb3ZlZF9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjYwCiAgICAvLyByZXR1cm4gc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhcHByb3ZlcjJfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIyX2FwcHJvdmVkIGV4aXN0cwogICAgcmV0c3ViCgpoYXNfYXBwcm92ZWRfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNjEKICAgIC8vIGVsaWYgc2VuZGVyX2FjY291bnQgPT0gc2VsZi5hcHByb3ZlcjM6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gImFwcHJvdmVyMyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBoYXNfYXBwcm92ZWRfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gcmV0dXJuIHNlbGYuYXBwcm92ZXIzX2FwcHJvdmVkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYXBwcm92ZXIzX2FwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyM19hcHByb3ZlZCBleGlzdHMKICAgIHJldHN1YgoKaGFzX2FwcHJvdmVkX2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjY0CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmdldF9hcHByb3ZhbF9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X2FwcHJvdmFsX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjY2LTI2NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hcHByb3ZhbF9jb3VudChzZWxmKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjY5CiAgICAvLyBjb3VudCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gaWYgc2VsZi5hcHByb3ZlcjFfYXBwcm92ZWQ6CiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmVyMV9hcHByb3ZlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjFfYXBwcm92ZWQgZXhpc3RzCiAgICBieiBnZXRfYXBwcm92YWxfY291bnRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNzEKICAgIC8vIGNvdW50ICs9IFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMQoKZ2V0X2FwcHJvdmFsX2NvdW50X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gaWYgc2VsZi5hcHByb3ZlcjJfYXBwcm92ZWQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYXBwcm92ZXIyX2FwcHJvdmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMl9hcHByb3ZlZCBleGlzdHMKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IGdldF9hcHByb3ZhbF9jb3VudF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3MwogICAgLy8gY291bnQgKz0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAoKZ2V0X2FwcHJvdmFsX2NvdW50X2FmdGVyX2lmX2Vsc2VANDoKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6Mjc0CiAgICAvLyBpZiBzZWxmLmFwcHJvdmVyM19hcHByb3ZlZDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJhcHByb3ZlcjNfYXBwcm92ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIzX2FwcHJvdmVkIGV4aXN0cwogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICBieiBnZXRfYXBwcm92YWxfY291bnRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNzUKICAgIC8vIGNvdW50ICs9IFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKCmdldF9hcHByb3ZhbF9jb3VudF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNzYKICAgIC8vIHJldHVybiBjb3VudAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5pc19hcHByb3ZlcihhZGRyZXNzOiBieXRlcykgLT4gdWludDY0Ogppc19hcHByb3ZlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3OC0yNzkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBpc19hcHByb3ZlcihzZWxmLCBhZGRyZXNzOiBBZGRyZXNzKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyODMKICAgIC8vIGlmIGFjY291bnQgPT0gc2VsZi5jcmVhdG9yOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGlzX2FwcHJvdmVyX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6Mjg0CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKaXNfYXBwcm92ZXJfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6Mjg2CiAgICAvLyBpZiBhY2NvdW50ID09IHNlbGYuYXBwcm92ZXIxOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJhcHByb3ZlcjEiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXIxIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogaXNfYXBwcm92ZXJfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyODcKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgppc19hcHByb3Zlcl9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyODgKICAgIC8vIGlmIGFjY291bnQgPT0gc2VsZi5hcHByb3ZlcjI6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gImFwcHJvdmVyMiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZlcjIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBpc19hcHByb3Zlcl9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI4OQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCmlzX2FwcHJvdmVyX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI5MAogICAgLy8gaWYgYWNjb3VudCA9PSBzZWxmLmFwcHJvdmVyMzoKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAiYXBwcm92ZXIzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyMyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGlzX2FwcHJvdmVyX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjkxCiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKaXNfYXBwcm92ZXJfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjkzCiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [990, 1132], "errorMessage": "All milestones completed"}, {"pc": [1008, 1084, 1105], "errorMessage": "Already approved"}, {"pc": [1143], "errorMessage": "Approver 1 has not approved"}, {"pc": [1148], "errorMessage": "Approver 2 has not approved"}, {"pc": [1153], "errorMessage": "Approver 3 has not approved"}, {"pc": [933], "errorMessage": "CID too long (max 64 chars)"}, {"pc": [833], "errorMessage": "Campaign ended"}, {"pc": [824], "errorMessage": "Campaign not active"}, {"pc": [978], "errorMessage": "Cannot approve - goal not reached"}, {"pc": [1138], "errorMessage": "Cannot release funds - goal not reached"}, {"pc": [939], "errorMessage": "Failed to create media box"}, {"pc": [845], "errorMessage": "Goal already reached"}, {"pc": [1175], "errorMessage": "Insufficient balance after MBR"}, {"pc": [925], "errorMessage": "Media already set"}, {"pc": [965], "errorMessage": "Media box not found"}, {"pc": [861], "errorMessage": "Minimum 0.1 ALGO donation"}, {"pc": [360, 385, 402, 427, 477, 498, 515, 531, 599, 616, 633, 657, 680, 707], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1099], "errorMessage": "Only approvers can approve milestones"}, {"pc": [1120], "errorMessage": "Only creator can release"}, {"pc": [918], "errorMessage": "Only creator can set media"}, {"pc": [1169], "errorMessage": "account funded"}, {"pc": [711], "errorMessage": "can only call when creating"}, {"pc": [363, 388, 405, 430, 480, 501, 518, 534, 602, 619, 636, 660, 683], "errorMessage": "can only call when not creating"}, {"pc": [998, 1271, 1303, 1424], "errorMessage": "check self.approver1 exists"}, {"pc": [1006, 1018, 1142, 1286, 1313, 1358], "errorMessage": "check self.approver1_approved exists"}, {"pc": [1072, 1276, 1319, 1437], "errorMessage": "check self.approver2 exists"}, {"pc": [1028, 1082, 1147, 1290, 1329, 1368], "errorMessage": "check self.approver2_approved exists"}, {"pc": [1095, 1281, 1335, 1450], "errorMessage": "check self.approver3 exists"}, {"pc": [1050, 1103, 1152, 1294, 1345, 1390], "errorMessage": "check self.approver3_approved exists"}, {"pc": [876, 1243], "errorMessage": "check self.contributor_count exists"}, {"pc": [916, 1118, 1181, 1259, 1411], "errorMessage": "check self.creator exists"}, {"pc": [983, 1125, 1197, 1217, 1233], "errorMessage": "check self.current_milestone exists"}, {"pc": [831, 1265], "errorMessage": "check self.deadline exists"}, {"pc": [843, 892, 1158, 1223], "errorMessage": "check self.goal_amount exists"}, {"pc": [977, 1137, 1253], "errorMessage": "check self.goal_reached exists"}, {"pc": [823, 1248], "errorMessage": "check self.is_active exists"}, {"pc": [923, 955], "errorMessage": "check self.media_cid_length exists"}, {"pc": [988, 1130, 1163, 1238], "errorMessage": "check self.milestone_count exists"}, {"pc": [838, 866, 887, 905, 1228], "errorMessage": "check self.raised_amount exists"}, {"pc": [693], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "name": "goal"}, {"type": "uint64", "name": "milestones"}, {"type": "uint64", "name": "deadline"}, {"type": "uint64", "name": "approval_threshold"}], "name": "create_campaign", "returns": {"type": "uint64"}, "desc": "Create campaign requiring `approval_threshold` approvals per milestone\nApprovers are registered next with set_approvers() (boxes cannot be created until the app account is funded)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "approvers"}], "name": "set_approvers", "returns": {"type": "uint64"}, "desc": "Register the approver board (creator only, once)\nRequires box MBR funding before calling: 2500 + 400 * (9 + 32 * M) microAlgos Returns the number of approvers", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "donate", "returns": {"type": "uint64"}, "desc": "Donate to the campaign", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "approve_milestone", "returns": {"type": "uint64"}, "desc": "\ud83d\udd10 DECENTRALIZED ON-CHAIN APPROVAL\nApprovers call this to approve the current milestone Replaces Firebase - all approvals stored on blockchain! Returns: number of approvals received so far", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "release_milestone", "returns": {"type": "uint64"}, "desc": "Release funds for current milestone (creator only)\n\ud83d\udd12 REQUIRES approval_threshold APPROVERS TO HAVE APPROVED FIRST This ensures multi-signature security on-chain!", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_status", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,bool,bool)"}, "desc": "Get campaign status", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_campaign_snapshot", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])", "struct": "CampaignSnapshot"}, "desc": "Get status, deadline, creator, approver board and approval state in one call\nReplaces the get_status + get_deadline + get_creator + get_approvers + get_approval_status round trips on page load", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_creator", "returns": {"type": "address"}, "desc": "Get campaign creator address", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_deadline", "returns": {"type": "uint64"}, "desc": "Get campaign deadline", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approvers", "returns": {"type": "address[]"}, "desc": "Get all approver addresses (on-chain query)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approval_status", "returns": {"type": "(uint64,uint64)"}, "desc": "Get current approval state as (approval_mask, approval_threshold)\nBit i of the mask is set once approver i (see get_approvers) has approved Frontend can use this instead of Firebase!", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "approver_address"}], "name": "has_approved", "returns": {"type": "bool"}, "desc": "Check if a specific address has approved the current milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_approval_count", "returns": {"type": "uint64"}, "desc": "Get number of approvals for current milestone", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "address"}], "name": "is_approver", "returns": {"type": "bool"}, "desc": "Check if an address is one of the approvers", "events": [], "readonly": true, "recommendations": {}}], "name": "Fundraiser", "state": {"keys": {"box": {}, "global": {"goal_amount": {"key": "Z29hbF9hbW91bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "raised_amount": {"key": "cmFpc2VkX2Ftb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "milestone_count": {"key": "bWlsZXN0b25lX2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "current_milestone": {"key": "Y3VycmVudF9taWxlc3RvbmU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "deadline": {"key": "ZGVhZGxpbmU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_active": {"key": "aXNfYWN0aXZl", "keyType": "AVMString", "valueType": "AVMUint64"}, "creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "contributor_count": {"key": "Y29udHJpYnV0b3JfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "goal_reached": {"key": "Z29hbF9yZWFjaGVk", "keyType": "AVMString", "valueType": "AVMUint64"}, "approver_count": {"key": "YXBwcm92ZXJfY291bnQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "approval_threshold": {"key": "YXBwcm92YWxfdGhyZXNob2xk", "keyType": "AVMString", "valueType": "AVMUint64"}, "approval_mask": {"key": "YXBwcm92YWxfbWFzaw==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 11}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CampaignSnapshot": [{"name": "goal_amount", "type": "uint64"}, {"name": "raised_amount", "type": "uint64"}, {"name": "current_milestone", "type": "uint64"}, {"name": "milestone_count", "type": "uint64"}, {"name": "contributor_count", "type": "uint64"}, {"name": "is_active", "type": "bool"}, {"name": "goal_reached", "type": "bool"}, {"name": "deadline", "type": "uint64"}, {"name": "creator", "type": "address"}, {"name": "approval_threshold", "type": "uint64"}, {"name": "approval_mask", "type": "uint64"}, {"name": "approvers", "type": "address[]"}]}, "byteCode": {"approval": "CiAFAAEgwQKgjQYmEAQVH3x1DWFwcHJvdmFsX21hc2sNcmFpc2VkX2Ftb3VudBFjdXJyZW50X21pbGVzdG9uZQ5hcHByb3Zlcl9jb3VudAdjcmVhdG9yAQALZ29hbF9hbW91bnQPbWlsZXN0b25lX2NvdW50DGdvYWxfcmVhY2hlZBFjb250cmlidXRvcl9jb3VudBJhcHByb3ZhbF90aHJlc2hvbGQIZGVhZGxpbmUJaXNfYWN0aXZlCWFwcHJvdmVycwMGgQExG0EAaYIOBDSLiFwErnMJmQTkw+AQBDU+7hIEwiHAUQSvRWndBA/K7G8EICoOGQRl94dXBIUEDHgEWfQURwQPvHT8BDKksBgEgCHfiDYaAI4OAS4BGgD/AO4A3QCbAIsAewBqAFoARQAsABsAAiJDMRkURDEYRDYaAYgEFicGIk8CVChMULAjQzEZFEQxGESIA/gWKExQsCNDMRkURDEYRDYaAYgDxCcGIk8CVChMULAjQzEZFEQxGESIA6RMFkwWUChMULAjQzEZFEQxGESIA4soTFCwI0MxGRREMRhEiAN1FihMULAjQzEZFEQxGESIA14oTFCwI0MxGRREMRhEiALXKExQsCNDMRkURDEYRIgCpU8GFk8GFk8GFk8GFk8GFicGIk8IVCcGIk8IVE8GTwZQTwVQTwRQTwNQTwJQTCJTJUxUKExQsCNDMRkURDEYRIgCAhYoTFCwI0MxGRREMRhEiAG3FihMULAjQzEZFEQxGEQxFiMJSTgQIxJEiAFFFihMULAjQzEZFEQxGEQ2GgGIAIYWKExQsCNDMRkURDEYFEQ2GgEXNhoCFzYaAxc2GgQXiAAkFihMULAjQ4oBASKL/4sBQQARiwFJIwkajAGLACMIjABC/+qJigQBi/9Ei/+BGA5EJweL/GcqImcnCIv9ZysiZycMi/5nJw0jZycFMQBnJwoiZycJImcnBCJnJwuL/2cpImcjiYoBAYAASTEAIicFZUQSRCInBGVEFESL/yJZSSInC2VESwEOREmBGA5ESQuBFAuBCgiLAzIMDUEAGLGBBrIQgQWyGScPsh4nD7IfIrIBs0L/4CKMAIsAiwIMQQA3IowBiwGLAAxBACOL/1cCAIsAJAtLAUwkWIsBSU4DJAtPAkwkWBNEIwiMAUL/1YsAIwiMAEL/wYsCSSQLi/+BAk8CWCcOTL8nBEsBZ4wAiYoBASInDWVERDIHIicMZUQORCIqZUQiJwdlRAxEi/84BzIKEkSL/zgISSEED0QiKmVECCpMZyInCmVEIwgnCkxnIiplRCInB2VED0EABCcJI2ciKmVEiSInCWVERCIrZUQiJwhlRAxEMQCIAZ8iJwRlREsBDUQiKWVESwFTFEQiKWVETCNUKUxnIillRIj+aIkxACInBWVEEkQiK2VEIicIZUQMRCInCWVERCIpZUSI/kYiJwtlRA9EIicHZUQiJwhlRAoyCnMAREsBIQQID0SxIicFZUSyB7III7IQIrIBsyIrZUQjCCtMZykiZyIrZUSJIicHZUQiKmVEIitlRCInCGVEIicKZUQiJw1lRCInCWVEiSInB2VEFiIqZUQWIitlRBYiJwhlRBYiJwplRBYiJw1lRCcGIk8CVCInCWVEJwYiTwJUIicMZUQWIicFZUQiJwtlRBYiKWVEFogAik8LTwtQTwpQTwlQTwhQTwdQTwYiUyVMVE8FUE8EUE8DUE8CUIACAGNQTFCJIicFZUSJIicMZUSJiABPiSIpZUQiJwtlRImKAQGL/4gAX0kiJwRlRA9BAAMiTIkiKWVEiwBTIxJMiSIpZUSI/SyJigEBIicFZUSL/xJBAAIjiYv/iAAqIicEZUQMiYoAAScOvkAABoACAABMiSInBGVEFkmTgRAORFcGAosAUEyJigEBgAAiJwRlRCcOvkEAKCKMAIsAiwEMQQAdiwAkC4sCTCRYi/8SQQAFiwCMAImLACMIjABC/9uLAUL/7w==", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    CampusChain Multi-Signature Fundraiser Contract\n    Milestone-based crowdfunding with ON-CHAIN decentralized approvals\n    Requires N of M approvers to sign before milestone release\n    100% DECENTRALIZED - No Firebase or centralized database!\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgMzIxIDEwMDAwMAogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1ICJhcHByb3ZhbF9tYXNrIiAicmFpc2VkX2Ftb3VudCIgImN1cnJlbnRfbWlsZXN0b25lIiAiYXBwcm92ZXJfY291bnQiICJjcmVhdG9yIiAweDAwICJnb2FsX2Ftb3VudCIgIm1pbGVzdG9uZV9jb3VudCIgImdvYWxfcmVhY2hlZCIgImNvbnRyaWJ1dG9yX2NvdW50IiAiYXBwcm92YWxfdGhyZXNob2xkIiAiZGVhZGxpbmUiICJpc19hY3RpdmUiIDB4NjE3MDcwNzI2Zjc2NjU3MjczIDB4MDY4MTAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTozOAogICAgLy8gY2xhc3MgRnVuZHJhaXNlcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYWZ0ZXJfaWZfZWxzZUAyMAogICAgcHVzaGJ5dGVzcyAweDM0OGI4ODVjIDB4YWU3MzA5OTkgMHhlNGMzZTAxMCAweDM1M2VlZTEyIDB4YzIyMWMwNTEgMHhhZjQ1NjlkZCAweDBmY2FlYzZmIDB4MjAyYTBlMTkgMHg2NWY3ODc1NyAweDg1MDQwYzc4IDB4NTlmNDE0NDcgMHgwZmJjNzRmYyAweDMyYTRiMDE4IDB4ODAyMWRmODggLy8gbWV0aG9kICJjcmVhdGVfY2FtcGFpZ24odWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAic2V0X2FwcHJvdmVycyhhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJkb25hdGUocGF5KXVpbnQ2NCIsIG1ldGhvZCAiYXBwcm92ZV9taWxlc3RvbmUoKXVpbnQ2NCIsIG1ldGhvZCAicmVsZWFzZV9taWxlc3RvbmUoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXR1cygpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYm9vbCxib29sKSIsIG1ldGhvZCAiZ2V0X2NhbXBhaWduX3NuYXBzaG90KCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxib29sLGJvb2wsdWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCxhZGRyZXNzW10pIiwgbWV0aG9kICJnZXRfY3JlYXRvcigpYWRkcmVzcyIsIG1ldGhvZCAiZ2V0X2RlYWRsaW5lKCl1aW50NjQiLCBtZXRob2QgImdldF9hcHByb3ZlcnMoKWFkZHJlc3NbXSIsIG1ldGhvZCAiZ2V0X2FwcHJvdmFsX3N0YXR1cygpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJoYXNfYXBwcm92ZWQoYWRkcmVzcylib29sIiwgbWV0aG9kICJnZXRfYXBwcm92YWxfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiaXNfYXBwcm92ZXIoYWRkcmVzcylib29sIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfY2FtcGFpZ25fcm91dGVAMyBtYWluX3NldF9hcHByb3ZlcnNfcm91dGVANCBtYWluX2RvbmF0ZV9yb3V0ZUA1IG1haW5fYXBwcm92ZV9taWxlc3RvbmVfcm91dGVANiBtYWluX3JlbGVhc2VfbWlsZXN0b25lX3JvdXRlQDcgbWFpbl9nZXRfc3RhdHVzX3JvdXRlQDggbWFpbl9nZXRfY2FtcGFpZ25fc25hcHNob3Rfcm91dGVAOSBtYWluX2dldF9jcmVhdG9yX3JvdXRlQDEwIG1haW5fZ2V0X2RlYWRsaW5lX3JvdXRlQDExIG1haW5fZ2V0X2FwcHJvdmVyc19yb3V0ZUAxMiBtYWluX2dldF9hcHByb3ZhbF9zdGF0dXNfcm91dGVAMTMgbWFpbl9oYXNfYXBwcm92ZWRfcm91dGVAMTQgbWFpbl9nZXRfYXBwcm92YWxfY291bnRfcm91dGVAMTUgbWFpbl9pc19hcHByb3Zlcl9yb3V0ZUAxNgoKbWFpbl9hZnRlcl9pZl9lbHNlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MzgKICAgIC8vIGNsYXNzIEZ1bmRyYWlzZXIoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5faXNfYXBwcm92ZXJfcm91dGVAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNjIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MzgKICAgIC8vIGNsYXNzIEZ1bmRyYWlzZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBpc19hcHByb3ZlcgogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2FwcHJvdmFsX2NvdW50X3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjU3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2FwcHJvdmFsX2NvdW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2hhc19hcHByb3ZlZF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI0OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTozOAogICAgLy8gY2xhc3MgRnVuZHJhaXNlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjQ5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGhhc19hcHByb3ZlZAogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2FwcHJvdmFsX3N0YXR1c19yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI0MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9hcHByb3ZhbF9zdGF0dXMKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXBwcm92ZXJzX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjM1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2FwcHJvdmVycwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZGVhZGxpbmVfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfZGVhZGxpbmUKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2NyZWF0b3Jfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfY3JlYXRvcgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY2FtcGFpZ25fc25hcHNob3Rfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9jYW1wYWlnbl9zbmFwc2hvdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfc3RhdHVzX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfc3RhdHVzCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciA4CiAgICBzZXRiaXQKICAgIGJ5dGVjIDYgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgOAogICAgc2V0Yml0CiAgICB1bmNvdmVyIDYKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgaW50Y18zIC8vIDMyMQogICAgc3dhcAogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlbGVhc2VfbWlsZXN0b25lX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNTMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHJlbGVhc2VfbWlsZXN0b25lCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfbWlsZXN0b25lX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMzQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGFwcHJvdmVfbWlsZXN0b25lCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RvbmF0ZV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTE2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MzgKICAgIC8vIGNsYXNzIEZ1bmRyYWlzZXIoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTE2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZG9uYXRlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NldF9hcHByb3ZlcnNfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MzgKICAgIC8vIGNsYXNzIEZ1bmRyYWlzZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X2FwcHJvdmVycwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfY2FtcGFpZ25fcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WydOb09wJ10sIGNyZWF0ZT0ncmVxdWlyZScpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MzgKICAgIC8vIGNsYXNzIEZ1bmRyYWlzZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WydOb09wJ10sIGNyZWF0ZT0ncmVxdWlyZScpCiAgICBjYWxsc3ViIGNyZWF0ZV9jYW1wYWlnbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5fY29tbW9uLnN1YnJvdXRpbmVzLnBvcGNvdW50KG1hc2s6IHVpbnQ2NCkgLT4gdWludDY0Ogpwb3Bjb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjE0LTE1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHBvcGNvdW50KG1hc2s6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weToxOAogICAgLy8gY291bnQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgLTEKCnBvcGNvdW50X3doaWxlX3RvcEAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6MTkKICAgIC8vIHdoaWxlIHJlbWFpbmluZyAhPSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgMQogICAgYnogcG9wY291bnRfYWZ0ZXJfd2hpbGVAMwogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6MjAKICAgIC8vIHJlbWFpbmluZyA9IHJlbWFpbmluZyAmIChyZW1haW5pbmcgLSBVSW50NjQoMSkpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgJgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weToyMQogICAgLy8gY291bnQgKz0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgYiBwb3Bjb3VudF93aGlsZV90b3BAMQoKcG9wY291bnRfYWZ0ZXJfd2hpbGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjIyCiAgICAvLyByZXR1cm4gY291bnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuY3JlYXRlX2NhbXBhaWduKGdvYWw6IHVpbnQ2NCwgbWlsZXN0b25lczogdWludDY0LCBkZWFkbGluZTogdWludDY0LCBhcHByb3ZhbF90aHJlc2hvbGQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjcmVhdGVfY2FtcGFpZ246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo2NC03MQogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsnTm9PcCddLCBjcmVhdGU9J3JlcXVpcmUnKQogICAgLy8gZGVmIGNyZWF0ZV9jYW1wYWlnbigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGdvYWw6IFVJbnQ2NCwKICAgIC8vICAgICBtaWxlc3RvbmVzOiBVSW50NjQsCiAgICAvLyAgICAgZGVhZGxpbmU6IFVJbnQ2NCwKICAgIC8vICAgICBhcHByb3ZhbF90aHJlc2hvbGQ6IFVJbnQ2NAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBhc3NlcnQgYXBwcm92YWxfdGhyZXNob2xkID4gVUludDY0KDApLCAiVGhyZXNob2xkIG11c3QgYmUgYXQgbGVhc3QgMSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIFRocmVzaG9sZCBtdXN0IGJlIGF0IGxlYXN0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBhc3NlcnQgYXBwcm92YWxfdGhyZXNob2xkIDw9IFVJbnQ2NChNQVhfQVBQUk9WRVJTKSwgIlRocmVzaG9sZCBleGNlZWRzIG1heGltdW0gYm9hcmQgc2l6ZSIKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyNCAvLyAyNAogICAgPD0KICAgIGFzc2VydCAvLyBUaHJlc2hvbGQgZXhjZWVkcyBtYXhpbXVtIGJvYXJkIHNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBzZWxmLmdvYWxfYW1vdW50ID0gZ29hbAogICAgYnl0ZWMgNyAvLyAiZ29hbF9hbW91bnQiCiAgICBmcmFtZV9kaWcgLTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo4MQogICAgLy8gc2VsZi5yYWlzZWRfYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJyYWlzZWRfYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo4MgogICAgLy8gc2VsZi5taWxlc3RvbmVfY291bnQgPSBtaWxlc3RvbmVzCiAgICBieXRlYyA4IC8vICJtaWxlc3RvbmVfY291bnQiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weTo4MwogICAgLy8gc2VsZi5jdXJyZW50X21pbGVzdG9uZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMyAvLyAiY3VycmVudF9taWxlc3RvbmUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBzZWxmLmRlYWRsaW5lID0gZGVhZGxpbmUKICAgIGJ5dGVjIDEyIC8vICJkZWFkbGluZSIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLmlzX2FjdGl2ZSA9IFRydWUKICAgIGJ5dGVjIDEzIC8vICJpc19hY3RpdmUiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBzZWxmLmNyZWF0b3IgPSBUeG4uc2VuZGVyCiAgICBieXRlYyA1IC8vICJjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBzZWxmLmNvbnRyaWJ1dG9yX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlYyAxMCAvLyAiY29udHJpYnV0b3JfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLmdvYWxfcmVhY2hlZCA9IEZhbHNlCiAgICBieXRlYyA5IC8vICJnb2FsX3JlYWNoZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBzZWxmLmFwcHJvdmVyX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJhcHByb3Zlcl9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6OTEKICAgIC8vIHNlbGYuYXBwcm92YWxfdGhyZXNob2xkID0gYXBwcm92YWxfdGhyZXNob2xkCiAgICBieXRlYyAxMSAvLyAiYXBwcm92YWxfdGhyZXNob2xkIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6OTIKICAgIC8vIHNlbGYuYXBwcm92YWxfbWFzayA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYXBwcm92YWxfbWFzayIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6OTQKICAgIC8vIHJldHVybiBVSW50NjQoMSkKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLnNldF9hcHByb3ZlcnMoYXBwcm92ZXJzOiBieXRlcykgLT4gdWludDY0OgpzZXRfYXBwcm92ZXJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6OTYtOTcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNldF9hcHByb3ZlcnMoc2VsZiwgYXBwcm92ZXJzOiBEeW5hbWljQXJyYXlbQWRkcmVzc10pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yLCAiT25seSBjcmVhdG9yIGNhbiBzZXQgYXBwcm92ZXJzIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBzZXQgYXBwcm92ZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMDQKICAgIC8vIGFzc2VydCBzZWxmLmFwcHJvdmVyX2NvdW50ID09IFVJbnQ2NCgwKSwgIkFwcHJvdmVycyBhbHJlYWR5IHNldCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJhcHByb3Zlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3Zlcl9jb3VudCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBBcHByb3ZlcnMgYWxyZWFkeSBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gY291bnQgPSBhcHByb3ZlcnMubGVuZ3RoCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMDYKICAgIC8vIGFzc2VydCBjb3VudCA+PSBzZWxmLmFwcHJvdmFsX3RocmVzaG9sZCwgIkZld2VyIGFwcHJvdmVycyB0aGFuIHRocmVzaG9sZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAiYXBwcm92YWxfdGhyZXNob2xkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFsX3RocmVzaG9sZCBleGlzdHMKICAgIGRpZyAxCiAgICA8PQogICAgYXNzZXJ0IC8vIEZld2VyIGFwcHJvdmVycyB0aGFuIHRocmVzaG9sZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTA3CiAgICAvLyBhc3NlcnQgY291bnQgPD0gVUludDY0KE1BWF9BUFBST1ZFUlMpLCAiTWF4aW11bSAyNCBhcHByb3ZlcnMiCiAgICBkdXAKICAgIHB1c2hpbnQgMjQgLy8gMjQKICAgIDw9CiAgICBhc3NlcnQgLy8gTWF4aW11bSAyNCBhcHByb3ZlcnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjI5CiAgICAvLyBlbnN1cmVfYnVkZ2V0KGNvdW50ICogY291bnQgKiBVSW50NjQoMjApLCBmZWVfc291cmNlPU9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBkdXAKICAgICoKICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgICoKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgICsKCnNldF9hcHByb3ZlcnNfd2hpbGVfdG9wQDI6CiAgICBmcmFtZV9kaWcgMwogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogc2V0X2FwcHJvdmVyc19hZnRlcl93aGlsZUA1CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgMTUgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtCiAgICBieXRlYyAxNSAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgYiBzZXRfYXBwcm92ZXJzX3doaWxlX3RvcEAyCgpzZXRfYXBwcm92ZXJzX2FmdGVyX3doaWxlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTozMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNvdW50KToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKCnNldF9hcHByb3ZlcnNfZm9yX2hlYWRlckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6MzAKICAgIC8vIGZvciBpIGluIHVyYW5nZShjb3VudCk6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IHNldF9hcHByb3ZlcnNfYWZ0ZXJfZm9yQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTozMQogICAgLy8gZm9yIGogaW4gdXJhbmdlKGkpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMQoKc2V0X2FwcHJvdmVyc19mb3JfaGVhZGVyQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTozMQogICAgLy8gZm9yIGogaW4gdXJhbmdlKGkpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBzZXRfYXBwcm92ZXJzX2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6MzIKICAgIC8vIGFzc2VydCBhcHByb3ZlcnNbaV0gIT0gYXBwcm92ZXJzW2pdLCAiRHVwbGljYXRlIGFwcHJvdmVyIgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgICE9CiAgICBhc3NlcnQgLy8gRHVwbGljYXRlIGFwcHJvdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTozMQogICAgLy8gZm9yIGogaW4gdXJhbmdlKGkpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBzZXRfYXBwcm92ZXJzX2Zvcl9oZWFkZXJAOAoKc2V0X2FwcHJvdmVyc19hZnRlcl9mb3JAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTozMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNvdW50KToKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIHNldF9hcHByb3ZlcnNfZm9yX2hlYWRlckA2CgpzZXRfYXBwcm92ZXJzX2FmdGVyX2ZvckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjExMS0xMTIKICAgIC8vICMgU3RvcmUgcmF3IGFkZHJlc3NlcyAoZHJvcCB0aGUgQVJDLTQgbGVuZ3RoIHByZWZpeCkgc28gYXBwcm92ZXIgaSBpcyBhdCBpICogMzIKICAgIC8vIG9wLkJveC5wdXQoQVBQUk9WRVJTX0tFWSwgb3AuZXh0cmFjdChhcHByb3ZlcnMuYnl0ZXMsIDIsIGNvdW50ICogVUludDY0KDMyKSkpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyIC8vIDIKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdDMKICAgIGJ5dGVjIDE0IC8vIDB4NjE3MDcwNzI2Zjc2NjU3MjczCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMTMKICAgIC8vIHNlbGYuYXBwcm92ZXJfY291bnQgPSBjb3VudAogICAgYnl0ZWMgNCAvLyAiYXBwcm92ZXJfY291bnQiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjExNAogICAgLy8gcmV0dXJuIGNvdW50CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuZG9uYXRlKHBheW1lbnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogpkb25hdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMTYtMTE3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBkb25hdGUoc2VsZiwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTE5CiAgICAvLyBhc3NlcnQgc2VsZi5pc19hY3RpdmUsICJDYW1wYWlnbiBub3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJpc19hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfYWN0aXZlIGV4aXN0cwogICAgYXNzZXJ0IC8vIENhbXBhaWduIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDw9IHNlbGYuZGVhZGxpbmUsICJDYW1wYWlnbiBlbmRlZCIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAiZGVhZGxpbmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVhZGxpbmUgZXhpc3RzCiAgICA8PQogICAgYXNzZXJ0IC8vIENhbXBhaWduIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjEKICAgIC8vIGFzc2VydCBzZWxmLnJhaXNlZF9hbW91bnQgPCBzZWxmLmdvYWxfYW1vdW50LCAiR29hbCBhbHJlYWR5IHJlYWNoZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImdvYWxfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfYW1vdW50IGV4aXN0cwogICAgPAogICAgYXNzZXJ0IC8vIEdvYWwgYWxyZWFkeSByZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjIKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjMKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA+PSBVSW50NjQoMTAwMDAwKSwgIk1pbmltdW0gMC4xIEFMR08gZG9uYXRpb24iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBpbnRjIDQgLy8gMTAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIE1pbmltdW0gMC4xIEFMR08gZG9uYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gc2VsZi5yYWlzZWRfYW1vdW50ICs9IHBheW1lbnQuYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgKwogICAgYnl0ZWNfMiAvLyAicmFpc2VkX2Ftb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjYKICAgIC8vIHNlbGYuY29udHJpYnV0b3JfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImNvbnRyaWJ1dG9yX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbnRyaWJ1dG9yX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDEwIC8vICJjb250cmlidXRvcl9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMjgtMTI5CiAgICAvLyAjIENoZWNrIGlmIGdvYWwgaXMgcmVhY2hlZAogICAgLy8gaWYgc2VsZi5yYWlzZWRfYW1vdW50ID49IHNlbGYuZ29hbF9hbW91bnQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImdvYWxfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfYW1vdW50IGV4aXN0cwogICAgPj0KICAgIGJ6IGRvbmF0ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gc2VsZi5nb2FsX3JlYWNoZWQgPSBUcnVlCiAgICBieXRlYyA5IC8vICJnb2FsX3JlYWNoZWQiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKCmRvbmF0ZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxMzIKICAgIC8vIHJldHVybiBzZWxmLnJhaXNlZF9hbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJyYWlzZWRfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJhaXNlZF9hbW91bnQgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmFwcHJvdmVfbWlsZXN0b25lKCkgLT4gdWludDY0OgphcHByb3ZlX21pbGVzdG9uZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gYXNzZXJ0IHNlbGYuZ29hbF9yZWFjaGVkLCAiQ2Fubm90IGFwcHJvdmUgLSBnb2FsIG5vdCByZWFjaGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gImdvYWxfcmVhY2hlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb2FsX3JlYWNoZWQgZXhpc3RzCiAgICBhc3NlcnQgLy8gQ2Fubm90IGFwcHJvdmUgLSBnb2FsIG5vdCByZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNDMKICAgIC8vIGFzc2VydCBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIDwgc2VsZi5taWxlc3RvbmVfY291bnQsICJBbGwgbWlsZXN0b25lcyBjb21wbGV0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiY3VycmVudF9taWxlc3RvbmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3VycmVudF9taWxlc3RvbmUgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAibWlsZXN0b25lX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZV9jb3VudCBleGlzdHMKICAgIDwKICAgIGFzc2VydCAvLyBBbGwgbWlsZXN0b25lcyBjb21wbGV0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE0NS0xNDYKICAgIC8vICMgQ2hlY2sgaWYgc2VuZGVyIGlzIG9uZSBvZiB0aGUgYXBwcm92ZXJzIGFuZCBzZXQgdGhlaXIgYml0CiAgICAvLyBhcHByb3Zlcl9pbmRleCA9IHNlbGYuX2FwcHJvdmVyX2luZGV4KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIF9hcHByb3Zlcl9pbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTQ3CiAgICAvLyBhc3NlcnQgYXBwcm92ZXJfaW5kZXggPCBzZWxmLmFwcHJvdmVyX2NvdW50LCAiT25seSBhcHByb3ZlcnMgY2FuIGFwcHJvdmUgbWlsZXN0b25lcyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJhcHByb3Zlcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3Zlcl9jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gT25seSBhcHByb3ZlcnMgY2FuIGFwcHJvdmUgbWlsZXN0b25lcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTQ4CiAgICAvLyBhc3NlcnQgb3AuZ2V0Yml0KHNlbGYuYXBwcm92YWxfbWFzaywgYXBwcm92ZXJfaW5kZXgpID09IFVJbnQ2NCgwKSwgIkFscmVhZHkgYXBwcm92ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYXBwcm92YWxfbWFzayIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZhbF9tYXNrIGV4aXN0cwogICAgZGlnIDEKICAgIGdldGJpdAogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYXBwcm92ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gc2VsZi5hcHByb3ZhbF9tYXNrID0gb3Auc2V0Yml0X3VpbnQ2NChzZWxmLmFwcHJvdmFsX21hc2ssIGFwcHJvdmVyX2luZGV4LCAxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfbWFzayBleGlzdHMKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTUxCiAgICAvLyByZXR1cm4gcG9wY291bnQoc2VsZi5hcHByb3ZhbF9tYXNrKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfbWFzayBleGlzdHMKICAgIGNhbGxzdWIgcG9wY291bnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIucmVsZWFzZV9taWxlc3RvbmUoKSAtPiB1aW50NjQ6CnJlbGVhc2VfbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTYwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IsICJPbmx5IGNyZWF0b3IgY2FuIHJlbGVhc2UiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIHJlbGVhc2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gYXNzZXJ0IHNlbGYuY3VycmVudF9taWxlc3RvbmUgPCBzZWxmLm1pbGVzdG9uZV9jb3VudCwgIkFsbCBtaWxlc3RvbmVzIGNvbXBsZXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJjdXJyZW50X21pbGVzdG9uZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jdXJyZW50X21pbGVzdG9uZSBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJtaWxlc3RvbmVfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50IGV4aXN0cwogICAgPAogICAgYXNzZXJ0IC8vIEFsbCBtaWxlc3RvbmVzIGNvbXBsZXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTYyCiAgICAvLyBhc3NlcnQgc2VsZi5nb2FsX3JlYWNoZWQsICJDYW5ub3QgcmVsZWFzZSBmdW5kcyAtIGdvYWwgbm90IHJlYWNoZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZ29hbF9yZWFjaGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvYWxfcmVhY2hlZCBleGlzdHMKICAgIGFzc2VydCAvLyBDYW5ub3QgcmVsZWFzZSBmdW5kcyAtIGdvYWwgbm90IHJlYWNoZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE2NC0xNjUKICAgIC8vICMg8J+UkCBDUklUSUNBTDogVmVyaWZ5IHRoZSBhcHByb3ZhbCB0aHJlc2hvbGQgaGFzIGJlZW4gbWV0CiAgICAvLyBhc3NlcnQgcG9wY291bnQoc2VsZi5hcHByb3ZhbF9tYXNrKSA+PSBzZWxmLmFwcHJvdmFsX3RocmVzaG9sZCwgIk5vdCBlbm91Z2ggYXBwcm92YWxzIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfbWFzayBleGlzdHMKICAgIGNhbGxzdWIgcG9wY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAiYXBwcm92YWxfdGhyZXNob2xkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFsX3RocmVzaG9sZCBleGlzdHMKICAgID49CiAgICBhc3NlcnQgLy8gTm90IGVub3VnaCBhcHByb3ZhbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE2Ny0xNjgKICAgIC8vICMgQ2FsY3VsYXRlIGFtb3VudCBwZXIgbWlsZXN0b25lCiAgICAvLyBhbW91bnRfcGVyX21pbGVzdG9uZSA9IHNlbGYuZ29hbF9hbW91bnQgLy8gc2VsZi5taWxlc3RvbmVfY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJnb2FsX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb2FsX2Ftb3VudCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJtaWxlc3RvbmVfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lX2NvdW50IGV4aXN0cwogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTcyCiAgICAvLyBjb250cmFjdF9iYWxhbmNlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXJ0IGNvbnRyYWN0X2JhbGFuY2UgPj0gYW1vdW50X3Blcl9taWxlc3RvbmUgKyBtaW5fYmFsYW5jZSwgIkluc3VmZmljaWVudCBiYWxhbmNlIGFmdGVyIE1CUiIKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNzAtMTcxCiAgICAvLyAjIFJlc2VydmUgbWluaW11bSBiYWxhbmNlICgwLjEgQUxHTykKICAgIC8vIG1pbl9iYWxhbmNlID0gVUludDY0KDEwMDAwMCkKICAgIGludGMgNCAvLyAxMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXJ0IGNvbnRyYWN0X2JhbGFuY2UgPj0gYW1vdW50X3Blcl9taWxlc3RvbmUgKyBtaW5fYmFsYW5jZSwgIkluc3VmZmljaWVudCBiYWxhbmNlIGFmdGVyIE1CUiIKICAgICsKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IGJhbGFuY2UgYWZ0ZXIgTUJSCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNzUtMTgwCiAgICAvLyAjIFNlbmQgZnVuZHMgdG8gY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYuY3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50X3Blcl9taWxlc3RvbmUsCiAgICAvLyAgICAgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNzUtMTc2CiAgICAvLyAjIFNlbmQgZnVuZHMgdG8gY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTc5CiAgICAvLyBmZWU9MAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxNzUtMTgwCiAgICAvLyAjIFNlbmQgZnVuZHMgdG8gY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYuY3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50X3Blcl9taWxlc3RvbmUsCiAgICAvLyAgICAgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxODItMTgzCiAgICAvLyAjIEluY3JlbWVudCBtaWxlc3RvbmUgY291bnRlcgogICAgLy8gc2VsZi5jdXJyZW50X21pbGVzdG9uZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJjdXJyZW50X21pbGVzdG9uZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jdXJyZW50X21pbGVzdG9uZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJjdXJyZW50X21pbGVzdG9uZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxODUtMTg2CiAgICAvLyAjIPCflIQgUkVTRVQgYXBwcm92YWxzIGZvciBuZXh0IG1pbGVzdG9uZQogICAgLy8gc2VsZi5hcHByb3ZhbF9tYXNrID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJhcHByb3ZhbF9tYXNrIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxODgKICAgIC8vIHJldHVybiBzZWxmLmN1cnJlbnRfbWlsZXN0b25lCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiY3VycmVudF9taWxlc3RvbmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3VycmVudF9taWxlc3RvbmUgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmdldF9zdGF0dXMoKSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9zdGF0dXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTQKICAgIC8vIHNlbGYuZ29hbF9hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAiZ29hbF9hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ29hbF9hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTUKICAgIC8vIHNlbGYucmFpc2VkX2Ftb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJyYWlzZWRfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJhaXNlZF9hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTYKICAgIC8vIHNlbGYuY3VycmVudF9taWxlc3RvbmUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiY3VycmVudF9taWxlc3RvbmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3VycmVudF9taWxlc3RvbmUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTcKICAgIC8vIHNlbGYubWlsZXN0b25lX2NvdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gIm1pbGVzdG9uZV9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToxOTgKICAgIC8vIHNlbGYuY29udHJpYnV0b3JfY291bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImNvbnRyaWJ1dG9yX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbnRyaWJ1dG9yX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTk5CiAgICAvLyBzZWxmLmlzX2FjdGl2ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAiaXNfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX2FjdGl2ZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gc2VsZi5nb2FsX3JlYWNoZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJnb2FsX3JlYWNoZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ29hbF9yZWFjaGVkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MTkzLTIwMQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBzZWxmLmdvYWxfYW1vdW50LAogICAgLy8gICAgIHNlbGYucmFpc2VkX2Ftb3VudCwKICAgIC8vICAgICBzZWxmLmN1cnJlbnRfbWlsZXN0b25lLAogICAgLy8gICAgIHNlbGYubWlsZXN0b25lX2NvdW50LAogICAgLy8gICAgIHNlbGYuY29udHJpYnV0b3JfY291bnQsCiAgICAvLyAgICAgc2VsZi5pc19hY3RpdmUsCiAgICAvLyAgICAgc2VsZi5nb2FsX3JlYWNoZWQKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuZ2V0X2NhbXBhaWduX3NuYXBzaG90KCkgLT4gYnl0ZXM6CmdldF9jYW1wYWlnbl9zbmFwc2hvdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gZ29hbF9hbW91bnQ9QVJDNFVJbnQ2NChzZWxmLmdvYWxfYW1vdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJnb2FsX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb2FsX2Ftb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gcmFpc2VkX2Ftb3VudD1BUkM0VUludDY0KHNlbGYucmFpc2VkX2Ftb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicmFpc2VkX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYWlzZWRfYW1vdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjEzCiAgICAvLyBjdXJyZW50X21pbGVzdG9uZT1BUkM0VUludDY0KHNlbGYuY3VycmVudF9taWxlc3RvbmUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImN1cnJlbnRfbWlsZXN0b25lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfbWlsZXN0b25lIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjE0CiAgICAvLyBtaWxlc3RvbmVfY291bnQ9QVJDNFVJbnQ2NChzZWxmLm1pbGVzdG9uZV9jb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAibWlsZXN0b25lX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbGVzdG9uZV9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gY29udHJpYnV0b3JfY291bnQ9QVJDNFVJbnQ2NChzZWxmLmNvbnRyaWJ1dG9yX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAiY29udHJpYnV0b3JfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29udHJpYnV0b3JfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMTYKICAgIC8vIGlzX2FjdGl2ZT1BUkM0Qm9vbChzZWxmLmlzX2FjdGl2ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gImlzX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19hY3RpdmUgZXhpc3RzCiAgICBieXRlYyA2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjE3CiAgICAvLyBnb2FsX3JlYWNoZWQ9QVJDNEJvb2woc2VsZi5nb2FsX3JlYWNoZWQpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gImdvYWxfcmVhY2hlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb2FsX3JlYWNoZWQgZXhpc3RzCiAgICBieXRlYyA2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjE4CiAgICAvLyBkZWFkbGluZT1BUkM0VUludDY0KHNlbGYuZGVhZGxpbmUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJkZWFkbGluZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWFkbGluZSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gY3JlYXRvcj1BZGRyZXNzKHNlbGYuY3JlYXRvciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjIwCiAgICAvLyBhcHByb3ZhbF90aHJlc2hvbGQ9QVJDNFVJbnQ2NChzZWxmLmFwcHJvdmFsX3RocmVzaG9sZCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gImFwcHJvdmFsX3RocmVzaG9sZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZhbF90aHJlc2hvbGQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMjEKICAgIC8vIGFwcHJvdmFsX21hc2s9QVJDNFVJbnQ2NChzZWxmLmFwcHJvdmFsX21hc2spLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfbWFzayBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIyMgogICAgLy8gYXBwcm92ZXJzPXNlbGYuX2FwcHJvdmVycygpLAogICAgY2FsbHN1YiBfYXBwcm92ZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyMTAtMjIzCiAgICAvLyByZXR1cm4gQ2FtcGFpZ25TbmFwc2hvdCgKICAgIC8vICAgICBnb2FsX2Ftb3VudD1BUkM0VUludDY0KHNlbGYuZ29hbF9hbW91bnQpLAogICAgLy8gICAgIHJhaXNlZF9hbW91bnQ9QVJDNFVJbnQ2NChzZWxmLnJhaXNlZF9hbW91bnQpLAogICAgLy8gICAgIGN1cnJlbnRfbWlsZXN0b25lPUFSQzRVSW50NjQoc2VsZi5jdXJyZW50X21pbGVzdG9uZSksCiAgICAvLyAgICAgbWlsZXN0b25lX2NvdW50PUFSQzRVSW50NjQoc2VsZi5taWxlc3RvbmVfY291bnQpLAogICAgLy8gICAgIGNvbnRyaWJ1dG9yX2NvdW50PUFSQzRVSW50NjQoc2VsZi5jb250cmlidXRvcl9jb3VudCksCiAgICAvLyAgICAgaXNfYWN0aXZlPUFSQzRCb29sKHNlbGYuaXNfYWN0aXZlKSwKICAgIC8vICAgICBnb2FsX3JlYWNoZWQ9QVJDNEJvb2woc2VsZi5nb2FsX3JlYWNoZWQpLAogICAgLy8gICAgIGRlYWRsaW5lPUFSQzRVSW50NjQoc2VsZi5kZWFkbGluZSksCiAgICAvLyAgICAgY3JlYXRvcj1BZGRyZXNzKHNlbGYuY3JlYXRvciksCiAgICAvLyAgICAgYXBwcm92YWxfdGhyZXNob2xkPUFSQzRVSW50NjQoc2VsZi5hcHByb3ZhbF90aHJlc2hvbGQpLAogICAgLy8gICAgIGFwcHJvdmFsX21hc2s9QVJDNFVJbnQ2NChzZWxmLmFwcHJvdmFsX21hc2spLAogICAgLy8gICAgIGFwcHJvdmVycz1zZWxmLl9hcHByb3ZlcnMoKSwKICAgIC8vICkKICAgIHVuY292ZXIgMTEKICAgIHVuY292ZXIgMTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGludGNfMyAvLyAzMjEKICAgIHN3YXAKICAgIHNldGJpdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwNjMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmdldF9jcmVhdG9yKCkgLT4gYnl0ZXM6CmdldF9jcmVhdG9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjI4CiAgICAvLyByZXR1cm4gc2VsZi5jcmVhdG9yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5nZXRfZGVhZGxpbmUoKSAtPiB1aW50NjQ6CmdldF9kZWFkbGluZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gcmV0dXJuIHNlbGYuZGVhZGxpbmUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAiZGVhZGxpbmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGVhZGxpbmUgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmdldF9hcHByb3ZlcnMoKSAtPiBieXRlczoKZ2V0X2FwcHJvdmVyczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjIzOAogICAgLy8gcmV0dXJuIHNlbGYuX2FwcHJvdmVycygpCiAgICBjYWxsc3ViIF9hcHByb3ZlcnMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuZ2V0X2FwcHJvdmFsX3N0YXR1cygpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfYXBwcm92YWxfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjQ3CiAgICAvLyByZXR1cm4gc2VsZi5hcHByb3ZhbF9tYXNrLCBzZWxmLmFwcHJvdmFsX3RocmVzaG9sZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfbWFzayBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAiYXBwcm92YWxfdGhyZXNob2xkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFsX3RocmVzaG9sZCBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuaGFzX2FwcHJvdmVkKGFwcHJvdmVyX2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6Cmhhc19hcHByb3ZlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI0OS0yNTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBoYXNfYXBwcm92ZWQoc2VsZiwgYXBwcm92ZXJfYWRkcmVzczogQWRkcmVzcykgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjUyCiAgICAvLyBhcHByb3Zlcl9pbmRleCA9IHNlbGYuX2FwcHJvdmVyX2luZGV4KGFwcHJvdmVyX2FkZHJlc3MubmF0aXZlKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9hcHByb3Zlcl9pbmRleAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNTMKICAgIC8vIGlmIGFwcHJvdmVyX2luZGV4ID49IHNlbGYuYXBwcm92ZXJfY291bnQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYXBwcm92ZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXJfY291bnQgZXhpc3RzCiAgICA+PQogICAgYnogaGFzX2FwcHJvdmVkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjU0CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCmhhc19hcHByb3ZlZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNTUKICAgIC8vIHJldHVybiBvcC5nZXRiaXQoc2VsZi5hcHByb3ZhbF9tYXNrLCBhcHByb3Zlcl9pbmRleCkgPT0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYXBwcm92YWxfbWFzayIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZhbF9tYXNrIGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgIGdldGJpdAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLmdldF9hcHByb3ZhbF9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X2FwcHJvdmFsX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjYwCiAgICAvLyByZXR1cm4gcG9wY291bnQoc2VsZi5hcHByb3ZhbF9tYXNrKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFwcHJvdmFsX21hc2siCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxfbWFzayBleGlzdHMKICAgIGNhbGxzdWIgcG9wY291bnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5mdW5kcmFpc2VyLmNvbnRyYWN0LkZ1bmRyYWlzZXIuaXNfYXBwcm92ZXIoYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfYXBwcm92ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNjItMjYzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgaXNfYXBwcm92ZXIoc2VsZiwgYWRkcmVzczogQWRkcmVzcykgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjY3CiAgICAvLyBpZiBhY2NvdW50ID09IHNlbGYuY3JlYXRvcjoKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBpc19hcHByb3Zlcl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI2OAogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCmlzX2FwcHJvdmVyX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gcmV0dXJuIHNlbGYuX2FwcHJvdmVyX2luZGV4KGFjY291bnQpIDwgc2VsZi5hcHByb3Zlcl9jb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9hcHByb3Zlcl9pbmRleAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImFwcHJvdmVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyX2NvdW50IGV4aXN0cwogICAgPAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmZ1bmRyYWlzZXIuY29udHJhY3QuRnVuZHJhaXNlci5fYXBwcm92ZXJzKCkgLT4gYnl0ZXM6Cl9hcHByb3ZlcnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNzItMjczCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9hcHByb3ZlcnMoc2VsZikgLT4gRHluYW1pY0FycmF5W0FkZHJlc3NdOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNzUKICAgIC8vIGFwcHJvdmVyc19ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChBUFBST1ZFUlNfS0VZKQogICAgYnl0ZWMgMTQgLy8gMHg2MTcwNzA3MjZmNzY2NTcyNzMKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBfYXBwcm92ZXJzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6Mjc3CiAgICAvLyByZXR1cm4gRHluYW1pY0FycmF5W0FkZHJlc3NdKCkKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIHN3YXAKICAgIHJldHN1YgoKX2FwcHJvdmVyc19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyNzgKICAgIC8vIHJldHVybiBEeW5hbWljQXJyYXlbQWRkcmVzc10uZnJvbV9ieXRlcyhBUkM0VUludDE2KHNlbGYuYXBwcm92ZXJfY291bnQpLmJ5dGVzICsgYXBwcm92ZXJzX2J5dGVzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImFwcHJvdmVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmVyX2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZnVuZHJhaXNlci5jb250cmFjdC5GdW5kcmFpc2VyLl9hcHByb3Zlcl9pbmRleChhY2NvdW50OiBieXRlcykgLT4gdWludDY0OgpfYXBwcm92ZXJfaW5kZXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZnVuZHJhaXNlci9jb250cmFjdC5weToyODAtMjgxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9hcHByb3Zlcl9pbmRleChzZWxmLCBhY2NvdW50OiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjgzCiAgICAvLyByZXR1cm4gYXBwcm92ZXJfaW5kZXgoQnl0ZXMoQVBQUk9WRVJTX0tFWSksIHNlbGYuYXBwcm92ZXJfY291bnQsIGFjY291bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYXBwcm92ZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92ZXJfY291bnQgZXhpc3RzCiAgICBieXRlYyAxNCAvLyAweDYxNzA3MDcyNmY3NjY1NzI3MwogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6MzgKICAgIC8vIGFwcHJvdmVyc19ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChhcHByb3ZlcnNfa2V5KQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL19jb21tb24vc3Vicm91dGluZXMucHk6MzkKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IF9hcHByb3Zlcl9pbmRleF9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXBwcm92ZXJfY291bnQpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAoKX2FwcHJvdmVyX2luZGV4X2Zvcl9oZWFkZXJAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9fY29tbW9uL3N1YnJvdXRpbmVzLnB5OjQwCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXBwcm92ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBfYXBwcm92ZXJfaW5kZXhfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTo0MQogICAgLy8gaWYgb3AuZXh0cmFjdChhcHByb3ZlcnNfYnl0ZXMsIGkgKiBVSW50NjQoMzIpLCAzMikgPT0gYWNjb3VudC5ieXRlczoKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGZyYW1lX2RpZyAyCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBfYXBwcm92ZXJfaW5kZXhfYWZ0ZXJfaWZfZWxzZUA2CiAgICBmcmFtZV9kaWcgMAoKX2FwcHJvdmVyX2luZGV4X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLl9jb21tb24uc3Vicm91dGluZXMuYXBwcm92ZXJfaW5kZXhAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9mdW5kcmFpc2VyL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gcmV0dXJuIGFwcHJvdmVyX2luZGV4KEJ5dGVzKEFQUFJPVkVSU19LRVkpLCBzZWxmLmFwcHJvdmVyX2NvdW50LCBhY2NvdW50KQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9hcHByb3Zlcl9pbmRleF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvX2NvbW1vbi9zdWJyb3V0aW5lcy5weTo0MAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFwcHJvdmVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIF9hcHByb3Zlcl9pbmRleF9mb3JfaGVhZGVyQDMKCl9hcHByb3Zlcl9pbmRleF9hZnRlcl9pZl9lbHNlQDc6CiAgICBmcmFtZV9kaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Z1bmRyYWlzZXIvY29udHJhY3QucHk6MjgzCiAgICAvLyByZXR1cm4gYXBwcm92ZXJfaW5kZXgoQnl0ZXMoQVBQUk9WRVJTX0tFWSksIHNlbGYuYXBwcm92ZXJfY291bnQsIGFjY291bnQpCiAgICBiIF9hcHByb3Zlcl9pbmRleF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5fY29tbW9uLnN1YnJvdXRpbmVzLmFwcHJvdmVyX2luZGV4QDgK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1013, 1074], "errorMessage": "All milestones completed"}, {"pc": [1036], "errorMessage": "Already approved"}, {"pc": [760], "errorMessage": "Approvers already set"}, {"pc": [927], "errorMessage": "Campaign ended"}, {"pc": [918], "errorMessage": "Campaign not active"}, {"pc": [1002], "errorMessage": "Cannot approve - goal not reached"}, {"pc": [1080], "errorMessage": "Cannot release funds - goal not reached"}, {"pc": [869], "errorMessage": "Duplicate approver"}, {"pc": [774], "errorMessage": "Fewer approvers than threshold"}, {"pc": [938], "errorMessage": "Goal already reached"}, {"pc": [855, 867], "errorMessage": "Index access is out of bounds"}, {"pc": [1117], "errorMessage": "Insufficient balance after MBR"}, {"pc": [779], "errorMessage": "Maximum 24 approvers"}, {"pc": [955], "errorMessage": "Minimum 0.1 ALGO donation"}, {"pc": [1094], "errorMessage": "Not enough approvals"}, {"pc": [315, 340, 357, 382, 403, 419, 436, 452, 468, 534, 551, 568, 595, 615], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1027], "errorMessage": "Only approvers can approve milestones"}, {"pc": [1063], "errorMessage": "Only creator can release"}, {"pc": [753], "errorMessage": "Only creator can set approvers"}, {"pc": [686], "errorMessage": "Threshold exceeds maximum board size"}, {"pc": [680], "errorMessage": "Threshold must be at least 1"}, {"pc": [1110], "errorMessage": "account funded"}, {"pc": [619], "errorMessage": "can only call when creating"}, {"pc": [318, 343, 360, 385, 406, 422, 439, 455, 471, 537, 554, 571, 598], "errorMessage": "can only call when not creating"}, {"pc": [1031, 1040, 1050, 1084, 1256, 1324, 1355, 1366], "errorMessage": "check self.approval_mask exists"}, {"pc": [770, 1092, 1251, 1329], "errorMessage": "check self.approval_threshold exists"}, {"pc": [758, 1023, 1344, 1396, 1418, 1443], "errorMessage": "check self.approver_count exists"}, {"pc": [968, 1174, 1212], "errorMessage": "check self.contributor_count exists"}, {"pc": [751, 1061, 1123, 1246, 1309, 1378], "errorMessage": "check self.creator exists"}, {"pc": [1006, 1067, 1138, 1150, 1164, 1200], "errorMessage": "check self.current_milestone exists"}, {"pc": [925, 1240, 1315], "errorMessage": "check self.deadline exists"}, {"pc": [936, 983, 1099, 1156, 1190], "errorMessage": "check self.goal_amount exists"}, {"pc": [1001, 1079, 1184, 1229], "errorMessage": "check self.goal_reached exists"}, {"pc": [917, 1179, 1218], "errorMessage": "check self.is_active exists"}, {"pc": [1011, 1072, 1104, 1169, 1206], "errorMessage": "check self.milestone_count exists"}, {"pc": [931, 959, 978, 995, 1160, 1195], "errorMessage": "check self.raised_amount exists"}, {"pc": [1425], "errorMessage": "overflow"}, {"pc": [581], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,23 +64,40 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class CampaignSnapshot:
+    """Struct for CampaignSnapshot"""
+    goal_amount: int
+    raised_amount: int
+    current_milestone: int
+    milestone_count: int
+    contributor_count: int
+    is_active: bool
+    goal_reached: bool
+    deadline: int
+    creator: str
+    approval_threshold: int
+    approval_mask: int
+    approvers: list[str]
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
-class DonateArgs:
-    """Dataclass for donate arguments"""
-    payment: algokit_utils.AppMethodCallTransactionArgument
+class SetApproversArgs:
+    """Dataclass for set_approvers arguments"""
+    approvers: list[str]
 
     @property
     def abi_method_signature(self) -> str:
-        return "donate(pay)uint64"
+        return "set_approvers(address[])uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
-class SetMediaCidArgs:
-    """Dataclass for set_media_cid arguments"""
-    cid: bytes | str
+class DonateArgs:
+    """Dataclass for donate arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "set_media_cid(byte[])uint64"
+        return "donate(pay)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class HasApprovedArgs:
@@ -106,46 +123,44 @@ class CreateCampaignArgs:
     goal: int
     milestones: int
     deadline: int
-    approver1: str
-    approver2: str
-    approver3: str
+    approval_threshold: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "create_campaign(uint64,uint64,uint64,address,address,address)uint64"
+        return "create_campaign(uint64,uint64,uint64,uint64)uint64"
 
 
 class FundraiserParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    def donate(
+    def set_approvers(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
+        args: tuple[list[str]] | SetApproversArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "donate(pay)uint64",
+            "method": "set_approvers(address[])uint64",
             "args": method_args,
         }))
 
-    def set_media_cid(
+    def donate(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_media_cid(byte[])uint64",
+            "method": "donate(pay)uint64",
             "args": method_args,
         }))
 
-    def get_media_cid(
+    def approve_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -153,10 +168,10 @@ class FundraiserParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_media_cid()byte[]",
+            "method": "approve_milestone()uint64",
         }))
 
-    def approve_milestone(
+    def release_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -164,10 +179,10 @@ class FundraiserParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "approve_milestone()uint64",
+            "method": "release_milestone()uint64",
         }))
 
-    def release_milestone(
+    def get_status(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -175,10 +190,10 @@ class FundraiserParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "release_milestone()uint64",
+            "method": "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)",
         }))
 
-    def get_status(
+    def get_campaign_snapshot(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -186,7 +201,7 @@ class FundraiserParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)",
+            "method": "get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])",
         }))
 
     def get_creator(
@@ -219,7 +234,7 @@ class FundraiserParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_approvers()(address,address,address)",
+            "method": "get_approvers()address[]",
         }))
 
     def get_approval_status(
@@ -230,7 +245,7 @@ class FundraiserParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_approval_status()(bool,bool,bool)",
+            "method": "get_approval_status()(uint64,uint64)",
         }))
 
     def has_approved(
@@ -272,14 +287,14 @@ class FundraiserParams:
 
     def create_campaign(
         self,
-        args: tuple[int, int, int, str, str, str] | CreateCampaignArgs,
+        args: tuple[int, int, int, int] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_campaign(uint64,uint64,uint64,address,address,address)uint64",
+            "method": "create_campaign(uint64,uint64,uint64,uint64)uint64",
             "args": method_args,
         }))
 
@@ -298,33 +313,33 @@ class FundraiserCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    def donate(
+    def set_approvers(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
+        args: tuple[list[str]] | SetApproversArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "donate(pay)uint64",
+            "method": "set_approvers(address[])uint64",
             "args": method_args,
         }))
 
-    def set_media_cid(
+    def donate(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_media_cid(byte[])uint64",
+            "method": "donate(pay)uint64",
             "args": method_args,
         }))
 
-    def get_media_cid(
+    def approve_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -332,10 +347,10 @@ class FundraiserCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_media_cid()byte[]",
+            "method": "approve_milestone()uint64",
         }))
 
-    def approve_milestone(
+    def release_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -343,10 +358,10 @@ class FundraiserCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "approve_milestone()uint64",
+            "method": "release_milestone()uint64",
         }))
 
-    def release_milestone(
+    def get_status(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -354,10 +369,10 @@ class FundraiserCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "release_milestone()uint64",
+            "method": "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)",
         }))
 
-    def get_status(
+    def get_campaign_snapshot(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
@@ -365,7 +380,7 @@ class FundraiserCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)",
+            "method": "get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])",
         }))
 
     def get_creator(
@@ -398,7 +413,7 @@ class FundraiserCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_approvers()(address,address,address)",
+            "method": "get_approvers()address[]",
         }))
 
     def get_approval_status(
@@ -409,7 +424,7 @@ class FundraiserCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_approval_status()(bool,bool,bool)",
+            "method": "get_approval_status()(uint64,uint64)",
         }))
 
     def has_approved(
@@ -451,14 +466,14 @@ class FundraiserCreateTransactionParams:
 
     def create_campaign(
         self,
-        args: tuple[int, int, int, str, str, str] | CreateCampaignArgs,
+        args: tuple[int, int, int, int] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_campaign(uint64,uint64,uint64,address,address,address)uint64",
+            "method": "create_campaign(uint64,uint64,uint64,uint64)uint64",
             "args": method_args,
         }))
 
@@ -477,9 +492,9 @@ class FundraiserSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    def donate(
+    def set_approvers(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
+        args: tuple[list[str]] | SetApproversArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -487,15 +502,15 @@ class FundraiserSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "donate(pay)uint64",
+            "method": "set_approvers(address[])uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def set_media_cid(
+    def donate(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -503,26 +518,12 @@ class FundraiserSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_media_cid(byte[])uint64",
+            "method": "donate(pay)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_media_cid(
-        self,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[bytes]:
-    
-        params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_media_cid()byte[]",
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
-
     def approve_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -565,6 +566,20 @@ class FundraiserSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int, bool, bool]], parsed_response)
 
+    def get_campaign_snapshot(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CampaignSnapshot]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CampaignSnapshot, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CampaignSnapshot], parsed_response)
+
     def get_creator(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -597,29 +612,29 @@ class FundraiserSend:
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[tuple[str, str, str]]:
+    ) -> algokit_utils.SendAppTransactionResult[list[str]]:
     
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_approvers()(address,address,address)",
+            "method": "get_approvers()address[]",
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, str, str]], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[str]], parsed_response)
 
     def get_approval_status(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[tuple[bool, bool, bool]]:
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int]]:
     
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_approval_status()(bool,bool,bool)",
+            "method": "get_approval_status()(uint64,uint64)",
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[bool, bool, bool]], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int]], parsed_response)
 
     def has_approved(
         self,
@@ -669,7 +684,7 @@ class FundraiserSend:
 
     def create_campaign(
         self,
-        args: tuple[int, int, int, str, str, str] | CreateCampaignArgs,
+        args: tuple[int, int, int, int] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -677,7 +692,7 @@ class FundraiserSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_campaign(uint64,uint64,uint64,address,address,address)uint64",
+            "method": "create_campaign(uint64,uint64,uint64,uint64)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -705,13 +720,9 @@ class GlobalStateValue(typing.TypedDict):
     creator: str
     contributor_count: int
     goal_reached: int
-    media_cid_length: int
-    approver1: str
-    approver2: str
-    approver3: str
-    approver1_approved: int
-    approver2_approved: int
-    approver3_approved: int
+    approver_count: int
+    approval_threshold: int
+    approval_mask: int
 
 class FundraiserState:
     """Methods to access state for the current Fundraiser app"""
@@ -822,57 +833,25 @@ class _GlobalState:
         return typing.cast(int, value)
 
     @property
-    def media_cid_length(self) -> int:
-        """Get the current value of the media_cid_length key in global_state state"""
-        value = self.app_client.state.global_state.get_value("media_cid_length")
+    def approver_count(self) -> int:
+        """Get the current value of the approver_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("approver_count")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
     @property
-    def approver1(self) -> str:
-        """Get the current value of the approver1 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("approver1")
-        if isinstance(value, dict) and "address" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
-        return typing.cast(str, value)
-
-    @property
-    def approver2(self) -> str:
-        """Get the current value of the approver2 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("approver2")
-        if isinstance(value, dict) and "address" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
-        return typing.cast(str, value)
-
-    @property
-    def approver3(self) -> str:
-        """Get the current value of the approver3 key in global_state state"""
-        value = self.app_client.state.global_state.get_value("approver3")
-        if isinstance(value, dict) and "address" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
-        return typing.cast(str, value)
-
-    @property
-    def approver1_approved(self) -> int:
-        """Get the current value of the approver1_approved key in global_state state"""
-        value = self.app_client.state.global_state.get_value("approver1_approved")
-        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
-        return typing.cast(int, value)
-
-    @property
-    def approver2_approved(self) -> int:
-        """Get the current value of the approver2_approved key in global_state state"""
-        value = self.app_client.state.global_state.get_value("approver2_approved")
+    def approval_threshold(self) -> int:
+        """Get the current value of the approval_threshold key in global_state state"""
+        value = self.app_client.state.global_state.get_value("approval_threshold")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
     @property
-    def approver3_approved(self) -> int:
-        """Get the current value of the approver3_approved key in global_state state"""
-        value = self.app_client.state.global_state.get_value("approver3_approved")
+    def approval_mask(self) -> int:
+        """Get the current value of the approval_mask key in global_state state"""
+        value = self.app_client.state.global_state.get_value("approval_mask")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
@@ -1023,22 +1002,16 @@ class FundraiserClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["donate(pay)uint64"],
+        method: typing.Literal["set_approvers(address[])uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["set_media_cid(byte[])uint64"],
+        method: typing.Literal["donate(pay)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
-    def decode_return_value(
-        self,
-        method: typing.Literal["get_media_cid()byte[]"],
-        return_value: algokit_utils.ABIReturn | None
-    ) -> bytes | None: ...
-    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["approve_milestone()uint64"],
@@ -1057,6 +1030,12 @@ class FundraiserClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[int, int, int, int, int, bool, bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CampaignSnapshot | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_creator()address"],
@@ -1071,15 +1050,15 @@ class FundraiserClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_approvers()(address,address,address)"],
+        method: typing.Literal["get_approvers()address[]"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> tuple[str, str, str] | None: ...
+    ) -> list[str] | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_approval_status()(bool,bool,bool)"],
+        method: typing.Literal["get_approval_status()(uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> tuple[bool, bool, bool] | None: ...
+    ) -> tuple[int, int] | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -1101,7 +1080,7 @@ class FundraiserClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_campaign(uint64,uint64,uint64,address,address,address)uint64"],
+        method: typing.Literal["create_campaign(uint64,uint64,uint64,uint64)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
@@ -1115,7 +1094,7 @@ class FundraiserClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | bool | bytes | int | str | tuple[bool, bool, bool] | tuple[int, int, int, int, int, bool, bool] | tuple[str, str, str]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | CampaignSnapshot | bool | int | list[str] | str | tuple[int, int, int, int, int, bool, bool] | tuple[int, int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1299,116 +1278,116 @@ class FundraiserFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
-    def donate(
+    def set_approvers(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
+        args: tuple[list[str]] | SetApproversArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the donate(pay)uint64 ABI method"""
+        """Creates a new instance using the set_approvers(address[])uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "donate(pay)uint64",
+                "method": "set_approvers(address[])uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def set_media_cid(
+    def donate(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the set_media_cid(byte[])uint64 ABI method"""
+        """Creates a new instance using the donate(pay)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "set_media_cid(byte[])uint64",
+                "method": "donate(pay)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_media_cid(
+    def approve_milestone(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_media_cid()byte[] ABI method"""
+        """Creates a new instance using the approve_milestone()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_media_cid()byte[]",
+                "method": "approve_milestone()uint64",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def approve_milestone(
+    def release_milestone(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the approve_milestone()uint64 ABI method"""
+        """Creates a new instance using the release_milestone()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "approve_milestone()uint64",
+                "method": "release_milestone()uint64",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def release_milestone(
+    def get_status(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the release_milestone()uint64 ABI method"""
+        """Creates a new instance using the get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "release_milestone()uint64",
+                "method": "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_status(
+    def get_campaign_snapshot(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool) ABI method"""
+        """Creates a new instance using the get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[]) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)",
+                "method": "get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])",
                 "args": None,
                 }
             ),
@@ -1459,13 +1438,13 @@ class FundraiserFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_approvers()(address,address,address) ABI method"""
+        """Creates a new instance using the get_approvers()address[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_approvers()(address,address,address)",
+                "method": "get_approvers()address[]",
                 "args": None,
                 }
             ),
@@ -1478,13 +1457,13 @@ class FundraiserFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_approval_status()(bool,bool,bool) ABI method"""
+        """Creates a new instance using the get_approval_status()(uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_approval_status()(bool,bool,bool)",
+                "method": "get_approval_status()(uint64,uint64)",
                 "args": None,
                 }
             ),
@@ -1552,18 +1531,18 @@ class FundraiserFactoryCreateParams:
 
     def create_campaign(
         self,
-        args: tuple[int, int, int, str, str, str] | CreateCampaignArgs,
+        args: tuple[int, int, int, int] | CreateCampaignArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_campaign(uint64,uint64,uint64,address,address,address)uint64 ABI method"""
+        """Creates a new instance using the create_campaign(uint64,uint64,uint64,uint64)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_campaign(uint64,uint64,uint64,address,address,address)uint64",
+                "method": "create_campaign(uint64,uint64,uint64,uint64)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1664,19 +1643,19 @@ class FundraiserFactorySendCreate:
 
     def create_campaign(
         self,
-        args: tuple[int, int, int, str, str, str] | CreateCampaignArgs,
+        args: tuple[int, int, int, int] | CreateCampaignArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> tuple[FundraiserClient, algokit_utils.AppFactoryCreateMethodCallResult[int]]:
-            """Creates and sends a transaction using the create_campaign(uint64,uint64,uint64,address,address,address)uint64 ABI method"""
+            """Creates and sends a transaction using the create_campaign(uint64,uint64,uint64,uint64)uint64 ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
                     **dataclasses.asdict(params),
-                    "method": "create_campaign(uint64,uint64,uint64,address,address,address)uint64",
+                    "method": "create_campaign(uint64,uint64,uint64,uint64)uint64",
                     "args": _parse_abi_args(args),
                     }
                 ),
@@ -1709,106 +1688,106 @@ class FundraiserComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
-    def donate(
+    def set_approvers(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
+        args: tuple[list[str]] | SetApproversArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.donate(
+            self.client.params.set_approvers(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "donate(pay)uint64", v
+                "set_approvers(address[])uint64", v
             )
         )
         return self
 
-    def set_media_cid(
+    def donate(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DonateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.set_media_cid(
+            self.client.params.donate(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "set_media_cid(byte[])uint64", v
+                "donate(pay)uint64", v
             )
         )
         return self
 
-    def get_media_cid(
+    def approve_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_media_cid(
+            self.client.params.approve_milestone(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_media_cid()byte[]", v
+                "approve_milestone()uint64", v
             )
         )
         return self
 
-    def approve_milestone(
+    def release_milestone(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.approve_milestone(
+            self.client.params.release_milestone(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "approve_milestone()uint64", v
+                "release_milestone()uint64", v
             )
         )
         return self
 
-    def release_milestone(
+    def get_status(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.release_milestone(
+            self.client.params.get_status(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "release_milestone()uint64", v
+                "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)", v
             )
         )
         return self
 
-    def get_status(
+    def get_campaign_snapshot(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_status(
+            self.client.params.get_campaign_snapshot(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_status()(uint64,uint64,uint64,uint64,uint64,bool,bool)", v
+                "get_campaign_snapshot()(uint64,uint64,uint64,uint64,uint64,bool,bool,uint64,address,uint64,uint64,address[])", v
             )
         )
         return self
@@ -1859,7 +1838,7 @@ class FundraiserComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_approvers()(address,address,address)", v
+                "get_approvers()address[]", v
             )
         )
         return self
@@ -1876,7 +1855,7 @@ class FundraiserComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_approval_status()(bool,bool,bool)", v
+                "get_approval_status()(uint64,uint64)", v
             )
         )
         return self
@@ -1936,7 +1915,7 @@ class FundraiserComposer:
 
     def create_campaign(
         self,
-        args: tuple[int, int, int, str, str, str] | CreateCampaignArgs,
+        args: tuple[int, int, int, int] | CreateCampaignArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "FundraiserComposer":
         self._composer.add_app_call_method_call(
@@ -1947,7 +1926,7 @@ class FundraiserComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_campaign(uint64,uint64,uint64,address,address,address)uint64", v
+                "create_campaign(uint64,uint64,uint64,uint64)uint64", v
             )
         )
         return self
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "name": "price"}, {"type": "uint64", "name": "supply"}, {"type": "uint64", "name": "event_date"}, {"type": "uint64", "name": "sale_end_date"}], "name": "create_event", "returns": {"type": "uint64"}, "desc": "Create a new ticketed event\nAdditional organizers can be added after creation using add_organizer()", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "organizer_address"}], "name": "add_organizer", "returns": {"type": "uint64"}, "desc": "Add an organizer who can scan tickets (creator only)\nStores organizer in box with key \"org_{index}\" Requires box MBR funding before calling (20,100 microAlgos per organizer) Returns the organizer index", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "cid"}], "name": "set_media_cid", "returns": {"type": "uint64"}, "desc": "Store IPFS CID for event media (image/video)\nCreator only, can be called once Requires box MBR funding: 2500 + 400 * (5 + cid_length) microAlgos Max CID length: 64 characters", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_media_cid", "returns": {"type": "byte[]"}, "desc": "Retrieve IPFS CID for event media\nReturns empty bytes if no media set", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "buy_ticket", "returns": {"type": "uint64"}, "desc": "Purchase an event ticket - Mints NFT to buyer\nReturns the NFT Asset ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "claim_ticket", "returns": {"type": "void"}, "desc": "Claim your purchased ticket NFT after opting in to the asset.\nUses asset reserve field to verify the rightful buyer.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "ticket_holder"}, {"type": "uint64", "name": "ticket_asset_id"}], "name": "verify_entry", "returns": {"type": "bool"}, "desc": "Verify ticket at event entry (called by creator or any organizer)\nChecks NFT ownership and check-in status All organizers have permission to scan and verify tickets", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "is_checked_in", "returns": {"type": "bool"}, "desc": "Check if a ticket has been used for entry", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "toggle_sale", "returns": {"type": "bool"}, "desc": "Toggle ticket sales on/off (creator or organizers only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_event_info", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,uint64,bool)"}, "desc": "Get event information", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organizer", "returns": {"type": "address"}, "desc": "Get event creator address (main organizer)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "index"}], "name": "get_organizer_by_index", "returns": {"type": "address"}, "desc": "Get organizer address by index\nReturns zero address if index is out of bounds", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organizer_count", "returns": {"type": "uint64"}, "desc": "Get the number of additional organizers", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "address"}], "name": "is_organizer", "returns": {"type": "bool"}, "desc": "Check if an address is an organizer", "events": [], "readonly": true, "recommendations": {}}], "name": "Ticketing", "state": {"keys": {"box": {}, "global": {"ticket_price": {"key": "dGlja2V0X3ByaWNl", "keyType": "AVMString", "valueType": "AVMUint64"}, "max_supply": {"key": "bWF4X3N1cHBseQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "sold_count": {"key": "c29sZF9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "event_date": {"key": "ZXZlbnRfZGF0ZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "sale_end_date": {"key": "c2FsZV9lbmRfZGF0ZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_sale_active": {"key": "aXNfc2FsZV9hY3RpdmU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "unique_buyers": {"key": "dW5pcXVlX2J1eWVycw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "organizer_count": {"key": "b3JnYW5pemVyX2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "media_cid_length": {"key": "bWVkaWFfY2lkX2xlbmd0aA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 9}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiADAAEgJg4EFR98dQ9vcmdhbml6ZXJfY291bnQHY3JlYXRvcg5pc19zYWxlX2FjdGl2ZQEACnNvbGRfY291bnQEb3JnXwpldmVudF9kYXRlDXVuaXF1ZV9idXllcnMQbWVkaWFfY2lkX2xlbmd0aAx0aWNrZXRfcHJpY2UKbWF4X3N1cHBseQ1zYWxlX2VuZF9kYXRlBW1lZGlhMRtBAGmCDgTo3Wv9BMKOUvwEYP9AfQRREI34BHHvW9ME7KUkagQz+IidBIi92yIEChnASAStEL+yBOYZ2ScE+sEQWASddPsABBV5wXs2GgCODgFJATUBHgEGAOsA2wC7AKEAiwBQAEAALAAbAAIiQzEZFEQxGEQ2GgGIBDAnBCJPAlQoTFCwI0MxGRREMRhEiAQVFihMULAjQzEZFEQxGEQ2GgEXiAPTKExQsCNDMRkURDEYRIgDvihMULAjQzEZFEQxGESIA4tPBhZPBhZPBhZPBhZPBhZPBhYnBCJPCFRPBk8GUE8FUE8EUE8DUE8CUExQKExQsCNDMRkURDEYRIgC7ScEIk8CVChMULAjQzEZFEQxGEQ2GgEXiAK+JwQiTwJUKExQsCNDMRkURDEYRDYaARfAHDYaAheIAgMnBCJPAlQoTFCwI0MxGRREMRhENhoBF4gBuyNDMRkURDEYRDEWIwlJOBAjEkSIAQQWKExQsCNDMRkURDEYRIgA40kVFlcGAkxQKExQsCNDMRkURDEYRDYaAVcCAIgAmhYoTFCwI0MxGRREMRhENhoBiABYFihMULAjQzEZFEQxGBRENhoBFzYaAhc2GgMXNhoEF4gABxYoTFCwI0OKBAEnCov8ZycLi/1nJwUiZycHi/5nJwyL/2cqMQBnKyNnJwgiZykiZycJImcjiYoBATEAIiplRBJEIillRIEKDEQiKWVESRYnBkxQSSS5RIv/vyIpZUQjCClMZ4mKAQExACIqZUQSRCInCWVEFESL/xVJgUAORCcNSwG5RCcNi/+/JwlLAWeJIicJZURAAAOAAIknDb5EiYoBASIrZUREIicFZUQiJwtlRAxEMgciJwxlRAxEMgciJwdlRAxEi/84BzIKEkSL/zgIIicKZUQPRCInBWVEIwgnBUxnIicIZUQjCCcITGexMgqL/zgAMgpJsiyyK7IqsimAFGlwZnM6Ly9jYW1wdXMtdGlja2V0sieAA1RJWLIlgAxFdmVudCBUaWNrZXSyJiKyIyOyIoEDshAisgGztDyJigEAi/9xCEQxABJEMQCL/3AARQFEsTIKMQCL/7IRI7ISshSyE4EEshAisgGziYoCASJHAoAARwIxAEkiKmVEEkcCQAA0IillTIwFRCKMBIsEiwUMiweMCEEAHosEFicGTFC+TIwBQQBXiwFJFSQSRIsGEkEASiOMCIsIRDIHIicHZUSBgKMFCA5Ei/6L/3AATIwDQQAmiwMjEkEAHyNEi/8WSYwAvkyMAkEABosCIlsURCMWiwBMvyOMAIkiQv/eiwQjCIwEQv+GigEBi/8WvkAAAyJMiYsAIlsjEkyJigABIoAASTEASSIqZUQSRwJAADQiKWVMjAJEIowBiwGLAgyLBIwFQQAeiwEWJwZMUL5MjABBACKLAEkVJBJEiwMSQQAVI4wFiwVEIitlRBQrTGciK2VEjACJiwEjCIwBQv+7IicKZUQiJwtlRCInBWVEIicHZUQiJwxlRCInCGVEIitlRIkiKmVEiYoBASJJKWVEi/8OQQAEMgNMiYv/FicGTFC+TIwAQQAJiwBJFSQSREyJMgNMiSIpZUSJigEBIoAASSIqZUSL/xJBAAQjjACJIillTIwCRCKMAYsBiwIMQQAoiwEWJwZMUL5MjABBABGLAEkVJBJEi/8SQQAEI4wAiYsBIwiMAUL/0CKMAIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    CampusChain Multi-Organizer Ticketing Contract\n    NFT-based event tickets with anti-scalping and entry verification\n    Each deployment = one event (fully decentralized)\n    Features:\n    - Mints NFT ticket on purchase\n    - Multi-organizer support (creator can add up to 10 organizers)\n    - All organizers can scan tickets and verify entry\n    - QR code verification at entry\n    - Prevents double entry\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAib3JnYW5pemVyX2NvdW50IiAiY3JlYXRvciIgImlzX3NhbGVfYWN0aXZlIiAweDAwICJzb2xkX2NvdW50IiAweDZmNzI2NzVmICJldmVudF9kYXRlIiAidW5pcXVlX2J1eWVycyIgIm1lZGlhX2NpZF9sZW5ndGgiICJ0aWNrZXRfcHJpY2UiICJtYXhfc3VwcGx5IiAic2FsZV9lbmRfZGF0ZSIgMHg2ZDY1NjQ2OTYxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYWZ0ZXJfaWZfZWxzZUAyMAogICAgcHVzaGJ5dGVzcyAweGU4ZGQ2YmZkIDB4YzI4ZTUyZmMgMHg2MGZmNDA3ZCAweDUxMTA4ZGY4IDB4NzFlZjViZDMgMHhlY2E1MjQ2YSAweDMzZjg4ODlkIDB4ODhiZGRiMjIgMHgwYTE5YzA0OCAweGFkMTBiZmIyIDB4ZTYxOWQ5MjcgMHhmYWMxMTA1OCAweDlkNzRmYjAwIDB4MTU3OWMxN2IgLy8gbWV0aG9kICJjcmVhdGVfZXZlbnQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYWRkX29yZ2FuaXplcihhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAic2V0X21lZGlhX2NpZChieXRlW10pdWludDY0IiwgbWV0aG9kICJnZXRfbWVkaWFfY2lkKClieXRlW10iLCBtZXRob2QgImJ1eV90aWNrZXQocGF5KXVpbnQ2NCIsIG1ldGhvZCAiY2xhaW1fdGlja2V0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ2ZXJpZnlfZW50cnkoYWNjb3VudCx1aW50NjQpYm9vbCIsIG1ldGhvZCAiaXNfY2hlY2tlZF9pbih1aW50NjQpYm9vbCIsIG1ldGhvZCAidG9nZ2xlX3NhbGUoKWJvb2wiLCBtZXRob2QgImdldF9ldmVudF9pbmZvKCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYm9vbCkiLCBtZXRob2QgImdldF9vcmdhbml6ZXIoKWFkZHJlc3MiLCBtZXRob2QgImdldF9vcmdhbml6ZXJfYnlfaW5kZXgodWludDY0KWFkZHJlc3MiLCBtZXRob2QgImdldF9vcmdhbml6ZXJfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiaXNfb3JnYW5pemVyKGFkZHJlc3MpYm9vbCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2V2ZW50X3JvdXRlQDMgbWFpbl9hZGRfb3JnYW5pemVyX3JvdXRlQDQgbWFpbl9zZXRfbWVkaWFfY2lkX3JvdXRlQDUgbWFpbl9nZXRfbWVkaWFfY2lkX3JvdXRlQDYgbWFpbl9idXlfdGlja2V0X3JvdXRlQDcgbWFpbl9jbGFpbV90aWNrZXRfcm91dGVAOCBtYWluX3ZlcmlmeV9lbnRyeV9yb3V0ZUA5IG1haW5faXNfY2hlY2tlZF9pbl9yb3V0ZUAxMCBtYWluX3RvZ2dsZV9zYWxlX3JvdXRlQDExIG1haW5fZ2V0X2V2ZW50X2luZm9fcm91dGVAMTIgbWFpbl9nZXRfb3JnYW5pemVyX3JvdXRlQDEzIG1haW5fZ2V0X29yZ2FuaXplcl9ieV9pbmRleF9yb3V0ZUAxNCBtYWluX2dldF9vcmdhbml6ZXJfY291bnRfcm91dGVAMTUgbWFpbl9pc19vcmdhbml6ZXJfcm91dGVAMTYKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2lzX29yZ2FuaXplcl9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjgzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBpc19vcmdhbml6ZXIKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcmdhbml6ZXJfY291bnRfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9vcmdhbml6ZXJfY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X29yZ2FuaXplcl9ieV9pbmRleF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjYyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfb3JnYW5pemVyX2J5X2luZGV4CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcmdhbml6ZXJfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9vcmdhbml6ZXIKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2V2ZW50X2luZm9fcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2V2ZW50X2luZm8KICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgOAogICAgc2V0Yml0CiAgICB1bmNvdmVyIDYKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3RvZ2dsZV9zYWxlX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMjEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHRvZ2dsZV9zYWxlCiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9pc19jaGVja2VkX2luX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjEwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGlzX2NoZWNrZWRfaW4KICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3ZlcmlmeV9lbnRyeV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTY4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgdmVyaWZ5X2VudHJ5CiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV90aWNrZXRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTQ1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTQ1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY2xhaW1fdGlja2V0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2J1eV90aWNrZXRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTExCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMTEKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBidXlfdGlja2V0CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9tZWRpYV9jaWRfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6OTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9tZWRpYV9jaWQKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NldF9tZWRpYV9jaWRfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfbWVkaWFfY2lkCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FkZF9vcmdhbml6ZXJfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF9vcmdhbml6ZXIKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2V2ZW50X3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WydOb09wJ10sIGNyZWF0ZT0ncmVxdWlyZScpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjkKICAgIC8vIEBhYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bJ05vT3AnXSwgY3JlYXRlPSdyZXF1aXJlJykKICAgIGNhbGxzdWIgY3JlYXRlX2V2ZW50CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuY3JlYXRlX2V2ZW50KHByaWNlOiB1aW50NjQsIHN1cHBseTogdWludDY0LCBldmVudF9kYXRlOiB1aW50NjQsIHNhbGVfZW5kX2RhdGU6IHVpbnQ2NCkgLT4gdWludDY0OgpjcmVhdGVfZXZlbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5LTM2CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WydOb09wJ10sIGNyZWF0ZT0ncmVxdWlyZScpCiAgICAvLyBkZWYgY3JlYXRlX2V2ZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJpY2U6IFVJbnQ2NCwKICAgIC8vICAgICBzdXBwbHk6IFVJbnQ2NCwKICAgIC8vICAgICBldmVudF9kYXRlOiBVSW50NjQsCiAgICAvLyAgICAgc2FsZV9lbmRfZGF0ZTogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MQogICAgLy8gc2VsZi50aWNrZXRfcHJpY2UgPSBwcmljZQogICAgYnl0ZWMgMTAgLy8gInRpY2tldF9wcmljZSIKICAgIGZyYW1lX2RpZyAtNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYubWF4X3N1cHBseSA9IHN1cHBseQogICAgYnl0ZWMgMTEgLy8gIm1heF9zdXBwbHkiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBzZWxmLnNvbGRfY291bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDUgLy8gInNvbGRfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuZXZlbnRfZGF0ZSA9IGV2ZW50X2RhdGUKICAgIGJ5dGVjIDcgLy8gImV2ZW50X2RhdGUiCiAgICBmcmFtZV9kaWcgLTIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBzZWxmLnNhbGVfZW5kX2RhdGUgPSBzYWxlX2VuZF9kYXRlCiAgICBieXRlYyAxMiAvLyAic2FsZV9lbmRfZGF0ZSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDYKICAgIC8vIHNlbGYuY3JlYXRvciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NwogICAgLy8gc2VsZi5pc19zYWxlX2FjdGl2ZSA9IFRydWUKICAgIGJ5dGVjXzMgLy8gImlzX3NhbGVfYWN0aXZlIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBzZWxmLnVuaXF1ZV9idXllcnMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDggLy8gInVuaXF1ZV9idXllcnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDkKICAgIC8vIHNlbGYub3JnYW5pemVyX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJvcmdhbml6ZXJfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTAKICAgIC8vIHNlbGYubWVkaWFfY2lkX2xlbmd0aCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOSAvLyAibWVkaWFfY2lkX2xlbmd0aCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MQogICAgLy8gcmV0dXJuIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmFkZF9vcmdhbml6ZXIob3JnYW5pemVyX2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CmFkZF9vcmdhbml6ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUzLTU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfb3JnYW5pemVyKHNlbGYsIG9yZ2FuaXplcl9hZGRyZXNzOiBBZGRyZXNzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgY3JlYXRvciBjYW4gYWRkIG9yZ2FuaXplcnMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGFkZCBvcmdhbml6ZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBhc3NlcnQgc2VsZi5vcmdhbml6ZXJfY291bnQgPCBVSW50NjQoMTApLCAiTWF4aW11bSAxMCBvcmdhbml6ZXJzIGFsbG93ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAib3JnYW5pemVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXplcl9jb3VudCBleGlzdHMKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIDwKICAgIGFzc2VydCAvLyBNYXhpbXVtIDEwIG9yZ2FuaXplcnMgYWxsb3dlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NC02NQogICAgLy8gIyBDcmVhdGUgYm94IGtleSBmcm9tIGN1cnJlbnQgY291bnQKICAgIC8vIGN1cnJlbnRfaW5kZXggPSBzZWxmLm9yZ2FuaXplcl9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY2CiAgICAvLyBib3hfa2V5ID0gYiJvcmdfIiArIG9wLml0b2IoY3VycmVudF9pbmRleCkKICAgIGR1cAogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDZmNzI2NzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjgtNzAKICAgIC8vICMgQ3JlYXRlIGJveCAoMzIgYnl0ZXMgZm9yIGFkZHJlc3MpIGFuZCBzdG9yZSBvcmdhbml6ZXIKICAgIC8vICMgQm94IE1CUjogMjUwMCArIDQwMCAqICgxMiArIDMyKSA9IDIwLDEwMCBtaWNyb0FsZ29zCiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShib3hfa2V5LCAzMiksICJGYWlsZWQgdG8gY3JlYXRlIG9yZ2FuaXplciBib3giCiAgICBkdXAKICAgIGludGNfMiAvLyAzMgogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIEZhaWxlZCB0byBjcmVhdGUgb3JnYW5pemVyIGJveAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3MQogICAgLy8gb3AuQm94LnB1dChib3hfa2V5LCBvcmdhbml6ZXJfYWRkcmVzcy5ieXRlcykKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3MwogICAgLy8gc2VsZi5vcmdhbml6ZXJfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAib3JnYW5pemVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXplcl9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18xIC8vICJvcmdhbml6ZXJfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NAogICAgLy8gcmV0dXJuIGN1cnJlbnRfaW5kZXgKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLnNldF9tZWRpYV9jaWQoY2lkOiBieXRlcykgLT4gdWludDY0OgpzZXRfbWVkaWFfY2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3Ni03NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc2V0X21lZGlhX2NpZChzZWxmLCBjaWQ6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6ODQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgY3JlYXRvciBjYW4gc2V0IG1lZGlhIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBzZXQgbWVkaWEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6ODUKICAgIC8vIGFzc2VydCBzZWxmLm1lZGlhX2NpZF9sZW5ndGggPT0gVUludDY0KDApLCAiTWVkaWEgYWxyZWFkeSBzZXQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAibWVkaWFfY2lkX2xlbmd0aCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tZWRpYV9jaWRfbGVuZ3RoIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIE1lZGlhIGFscmVhZHkgc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBjaWRfbGVuID0gY2lkLmxlbmd0aAogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6ODgKICAgIC8vIGFzc2VydCBjaWRfbGVuIDw9IFVJbnQ2NCg2NCksICJDSUQgdG9vIGxvbmcgKG1heCA2NCBjaGFycykiCiAgICBkdXAKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIDw9CiAgICBhc3NlcnQgLy8gQ0lEIHRvbyBsb25nIChtYXggNjQgY2hhcnMpCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjkwLTkyCiAgICAvLyAjIENyZWF0ZSBib3ggdG8gc3RvcmUgdGhlIENJRAogICAgLy8gIyBCb3ggTUJSOiAyNTAwICsgNDAwICogKDUgKyBsZW4oY2lkKSkKICAgIC8vIGFzc2VydCBvcC5Cb3guY3JlYXRlKEJ5dGVzKGIibWVkaWEiKSwgY2lkX2xlbiksICJGYWlsZWQgdG8gY3JlYXRlIG1lZGlhIGJveCIKICAgIGJ5dGVjIDEzIC8vIDB4NmQ2NTY0Njk2MQogICAgZGlnIDEKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBGYWlsZWQgdG8gY3JlYXRlIG1lZGlhIGJveAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo5MwogICAgLy8gb3AuQm94LnB1dChCeXRlcyhiIm1lZGlhIiksIGNpZCkKICAgIGJ5dGVjIDEzIC8vIDB4NmQ2NTY0Njk2MQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBzZWxmLm1lZGlhX2NpZF9sZW5ndGggPSBjaWRfbGVuCiAgICBieXRlYyA5IC8vICJtZWRpYV9jaWRfbGVuZ3RoIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyByZXR1cm4gY2lkX2xlbgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X21lZGlhX2NpZCgpIC0+IGJ5dGVzOgpnZXRfbWVkaWFfY2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMDQKICAgIC8vIGlmIHNlbGYubWVkaWFfY2lkX2xlbmd0aCA9PSBVSW50NjQoMCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAibWVkaWFfY2lkX2xlbmd0aCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tZWRpYV9jaWRfbGVuZ3RoIGV4aXN0cwogICAgYm56IGdldF9tZWRpYV9jaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gcmV0dXJuIEJ5dGVzKGIiIikKICAgIHB1c2hieXRlcyAweAogICAgcmV0c3ViCgpnZXRfbWVkaWFfY2lkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTA3CiAgICAvLyBjaWRfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoQnl0ZXMoYiJtZWRpYSIpKQogICAgYnl0ZWMgMTMgLy8gMHg2ZDY1NjQ2OTYxCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEwOAogICAgLy8gYXNzZXJ0IGV4aXN0cywgIk1lZGlhIGJveCBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gTWVkaWEgYm94IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMDkKICAgIC8vIHJldHVybiBjaWRfYnl0ZXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmJ1eV90aWNrZXQocGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CmJ1eV90aWNrZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjExMS0xMTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGJ1eV90aWNrZXQoc2VsZiwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGFzc2VydCBzZWxmLmlzX3NhbGVfYWN0aXZlLCAiU2FsZSBub3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImlzX3NhbGVfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3NhbGVfYWN0aXZlIGV4aXN0cwogICAgYXNzZXJ0IC8vIFNhbGUgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMTgKICAgIC8vIGFzc2VydCBzZWxmLnNvbGRfY291bnQgPCBzZWxmLm1heF9zdXBwbHksICJTb2xkIG91dCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJzb2xkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNvbGRfY291bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gIm1heF9zdXBwbHkiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3N1cHBseSBleGlzdHMKICAgIDwKICAgIGFzc2VydCAvLyBTb2xkIG91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMTkKICAgIC8vIGFzc2VydCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8IHNlbGYuc2FsZV9lbmRfZGF0ZSwgIlRpY2tldCBzYWxlcyBoYXZlIGVuZGVkIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJzYWxlX2VuZF9kYXRlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVfZW5kX2RhdGUgZXhpc3RzCiAgICA8CiAgICBhc3NlcnQgLy8gVGlja2V0IHNhbGVzIGhhdmUgZW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTIwCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLmV2ZW50X2RhdGUsICJFdmVudCBoYXMgcGFzc2VkIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImV2ZW50X2RhdGUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXZlbnRfZGF0ZSBleGlzdHMKICAgIDwKICAgIGFzc2VydCAvLyBFdmVudCBoYXMgcGFzc2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTIyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gc2VsZi50aWNrZXRfcHJpY2UsICJJbnN1ZmZpY2llbnQgcGF5bWVudCIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gInRpY2tldF9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWNrZXRfcHJpY2UgZXhpc3RzCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyNC0xMjUKICAgIC8vICMgSW5jcmVtZW50IHRpY2tldCBjb3VudGVyCiAgICAvLyBzZWxmLnNvbGRfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAic29sZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zb2xkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDUgLy8gInNvbGRfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMjYKICAgIC8vIHNlbGYudW5pcXVlX2J1eWVycyArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ1bmlxdWVfYnV5ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXF1ZV9idXllcnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAidW5pcXVlX2J1eWVycyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyOC0xMzkKICAgIC8vICMgTWludCBORlQgdGlja2V0IC0ga2VlcCBpbiBjb250cmFjdCB1bnRpbCBidXllciBvcHRzIGluCiAgICAvLyB0aWNrZXRfYXNzZXRfaWQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIHRvdGFsPTEsICAjIE5GVCAoMSB1bml0IG9ubHkpCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBhc3NldF9uYW1lPWIiRXZlbnQgVGlja2V0IiwKICAgIC8vICAgICB1bml0X25hbWU9YiJUSVgiLAogICAgLy8gICAgIHVybD1iImlwZnM6Ly9jYW1wdXMtdGlja2V0IiwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1wYXltZW50LnNlbmRlciwgICMgTWFyayB0aGUgYnV5ZXIgaW4gcmVzZXJ2ZSBmaWVsZAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICkuc3VibWl0KCkuY3JlYXRlZF9hc3NldC5pZAogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMzUKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gcmVzZXJ2ZT1wYXltZW50LnNlbmRlciwgICMgTWFyayB0aGUgYnV5ZXIgaW4gcmVzZXJ2ZSBmaWVsZAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTM3CiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzOAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMzQKICAgIC8vIHVybD1iImlwZnM6Ly9jYW1wdXMtdGlja2V0IiwKICAgIHB1c2hieXRlcyAweDY5NzA2NjczM2EyZjJmNjM2MTZkNzA3NTczMmQ3NDY5NjM2YjY1NzQKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTMzCiAgICAvLyB1bml0X25hbWU9YiJUSVgiLAogICAgcHVzaGJ5dGVzIDB4NTQ0OTU4CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTMyCiAgICAvLyBhc3NldF9uYW1lPWIiRXZlbnQgVGlja2V0IiwKICAgIHB1c2hieXRlcyAweDQ1NzY2NTZlNzQyMDU0Njk2MzZiNjU3NAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTMxCiAgICAvLyBkZWNpbWFscz0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMzAKICAgIC8vIHRvdGFsPTEsICAjIE5GVCAoMSB1bml0IG9ubHkpCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyOC0xMjkKICAgIC8vICMgTWludCBORlQgdGlja2V0IC0ga2VlcCBpbiBjb250cmFjdCB1bnRpbCBidXllciBvcHRzIGluCiAgICAvLyB0aWNrZXRfYXNzZXRfaWQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMjgtMTM5CiAgICAvLyAjIE1pbnQgTkZUIHRpY2tldCAtIGtlZXAgaW4gY29udHJhY3QgdW50aWwgYnV5ZXIgb3B0cyBpbgogICAgLy8gdGlja2V0X2Fzc2V0X2lkID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xLCAgIyBORlQgKDEgdW5pdCBvbmx5KQogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1iIkV2ZW50IFRpY2tldCIsCiAgICAvLyAgICAgdW5pdF9uYW1lPWIiVElYIiwKICAgIC8vICAgICB1cmw9YiJpcGZzOi8vY2FtcHVzLXRpY2tldCIsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9cGF5bWVudC5zZW5kZXIsICAjIE1hcmsgdGhlIGJ1eWVyIGluIHJlc2VydmUgZmllbGQKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLnN1Ym1pdCgpLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE0MS0xNDMKICAgIC8vICMgTkZUIHN0YXlzIHdpdGggY29udHJhY3QgLSBidXllciBtdXN0IG9wdC1pbiB0aGVuIGNhbGwgY2xhaW1fdGlja2V0CiAgICAvLyAjIENoZWNrLWluIGJveCB3aWxsIGJlIGNyZWF0ZWQgbGF0ZXIgZHVyaW5nIHZlcmlmeV9lbnRyeQogICAgLy8gcmV0dXJuIHRpY2tldF9hc3NldF9pZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuY2xhaW1fdGlja2V0KHRpY2tldF9hc3NldF9pZDogdWludDY0KSAtPiB2b2lkOgpjbGFpbV90aWNrZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE0NS0xNDYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNsYWltX3RpY2tldChzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNTEtMTUyCiAgICAvLyAjIFZlcmlmeSB0aGlzIGFzc2V0IHdhcyBjcmVhdGVkIGJ5IHRoaXMgY29udHJhY3QgYW5kIGJ1eWVyIGlzIG1hcmtlZAogICAgLy8gcmVzZXJ2ZV9hZGRyLCByZXNlcnZlX2V4aXN0cyA9IG9wLkFzc2V0UGFyYW1zR2V0LmFzc2V0X3Jlc2VydmUodGlja2V0X2Fzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0UmVzZXJ2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNTMKICAgIC8vIGFzc2VydCByZXNlcnZlX2V4aXN0cywgIkFzc2V0IG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBc3NldCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTU0CiAgICAvLyBhc3NlcnQgcmVzZXJ2ZV9hZGRyID09IFR4bi5zZW5kZXIsICJOb3QgeW91ciB0aWNrZXQiCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCB5b3VyIHRpY2tldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNTYtMTU3CiAgICAvLyAjIFZlcmlmeSBidXllciBoYXMgb3B0ZWQgaW50byB0aGUgYXNzZXQKICAgIC8vIGJ1eWVyX2JhbGFuY2UsIGJ1eWVyX29wdGVkX2luID0gb3AuQXNzZXRIb2xkaW5nR2V0LmFzc2V0X2JhbGFuY2UoVHhuLnNlbmRlciwgdGlja2V0X2Fzc2V0X2lkKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNTgKICAgIC8vIGFzc2VydCBidXllcl9vcHRlZF9pbiwgIk11c3Qgb3B0LWluIHRvIGFzc2V0IGZpcnN0IgogICAgYXNzZXJ0IC8vIE11c3Qgb3B0LWluIHRvIGFzc2V0IGZpcnN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2MC0xNjYKICAgIC8vICMgVHJhbnNmZXIgdXNpbmcgY2xhd2JhY2sKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBhc3NldF9zZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9dGlja2V0X2Fzc2V0X2lkCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gYXNzZXRfc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gYXNzZXRfYW1vdW50PTEsCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2MC0xNjEKICAgIC8vICMgVHJhbnNmZXIgdXNpbmcgY2xhd2JhY2sKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2MC0xNjYKICAgIC8vICMgVHJhbnNmZXIgdXNpbmcgY2xhd2JhY2sKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBhc3NldF9zZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9dGlja2V0X2Fzc2V0X2lkCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcudmVyaWZ5X2VudHJ5KHRpY2tldF9ob2xkZXI6IGJ5dGVzLCB0aWNrZXRfYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp2ZXJpZnlfZW50cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2OC0xNjkKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHZlcmlmeV9lbnRyeShzZWxmLCB0aWNrZXRfaG9sZGVyOiBBY2NvdW50LCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMgogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTc1LTE3NgogICAgLy8gIyBDaGVjayBpZiBzZW5kZXIgaXMgY3JlYXRvciBvciBvbmUgb2YgdGhlIG9yZ2FuaXplcnMKICAgIC8vIHNlbmRlciA9IFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNzcKICAgIC8vIGlzX2F1dGhvcml6ZWQgPSBzZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNzktMTgwCiAgICAvLyAjIENoZWNrIG9yZ2FuaXplcnMgZnJvbSBib3ggc3RvcmFnZQogICAgLy8gaWYgbm90IGlzX2F1dGhvcml6ZWQ6CiAgICBibnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTgxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDUKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXplcl9jb3VudCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCnZlcmlmeV9lbnRyeV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2J1cnkgOAogICAgYnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTgyCiAgICAvLyBib3hfa2V5ID0gYiJvcmdfIiArIG9wLml0b2IoaSkKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4NmY3MjY3NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxODMKICAgIC8vIG9yZ2FuaXplcl9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChib3hfa2V5KQogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4NAogICAgLy8gaWYgZXhpc3RzOgogICAgYnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxODUKICAgIC8vIG9yZ2FuaXplciA9IEFjY291bnQob3JnYW5pemVyX2J5dGVzKQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTg2CiAgICAvLyBpZiBzZW5kZXIgPT0gb3JnYW5pemVyOgogICAgZnJhbWVfZGlnIDYKICAgID09CiAgICBieiB2ZXJpZnlfZW50cnlfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4NwogICAgLy8gaXNfYXV0aG9yaXplZCA9IFRydWUKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDgKCnZlcmlmeV9lbnRyeV9hZnRlcl9pZl9lbHNlQDEwOgogICAgZnJhbWVfZGlnIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTkwCiAgICAvLyBhc3NlcnQgaXNfYXV0aG9yaXplZCwgIk9ubHkgY3JlYXRvciBvciBvcmdhbml6ZXJzIGNhbiB2ZXJpZnkiCiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIG9yIG9yZ2FuaXplcnMgY2FuIHZlcmlmeQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxOTEKICAgIC8vIGFzc2VydCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLmV2ZW50X2RhdGUgKyBVSW50NjQoODY0MDApLCAiRXZlbnQgdmVyaWZpY2F0aW9uIHBlcmlvZCBlbmRlZCIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJldmVudF9kYXRlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV2ZW50X2RhdGUgZXhpc3RzCiAgICBwdXNoaW50IDg2NDAwIC8vIDg2NDAwCiAgICArCiAgICA8PQogICAgYXNzZXJ0IC8vIEV2ZW50IHZlcmlmaWNhdGlvbiBwZXJpb2QgZW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTkzLTE5NAogICAgLy8gIyBDaGVjayB0aWNrZXRfaG9sZGVyIG93bnMgdGhlIE5GVAogICAgLy8gaG9sZGVyX2JhbGFuY2UsIGhvbGRlcl9leGlzdHMgPSBvcC5Bc3NldEhvbGRpbmdHZXQuYXNzZXRfYmFsYW5jZSh0aWNrZXRfaG9sZGVyLCB0aWNrZXRfYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyBhc3NlcnQgaG9sZGVyX2V4aXN0cyBhbmQgaG9sZGVyX2JhbGFuY2UgPT0gVUludDY0KDEpLCAiVGlja2V0IG5vdCBvd25lZCBieSBob2xkZXIiCiAgICBieiB2ZXJpZnlfZW50cnlfYm9vbF9mYWxzZUAxMwogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogdmVyaWZ5X2VudHJ5X2Jvb2xfZmFsc2VAMTMKICAgIGludGNfMSAvLyAxCgp2ZXJpZnlfZW50cnlfYm9vbF9tZXJnZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyBhc3NlcnQgaG9sZGVyX2V4aXN0cyBhbmQgaG9sZGVyX2JhbGFuY2UgPT0gVUludDY0KDEpLCAiVGlja2V0IG5vdCBvd25lZCBieSBob2xkZXIiCiAgICBhc3NlcnQgLy8gVGlja2V0IG5vdCBvd25lZCBieSBob2xkZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTk3LTE5OAogICAgLy8gIyBDaGVjayB0aWNrZXQgaGFzbid0IGJlZW4gdXNlZCAoY3JlYXRlIGJveCBpZiBmaXJzdCB0aW1lKQogICAgLy8gYm94X2tleSA9IG9wLml0b2IodGlja2V0X2Fzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxOTkKICAgIC8vIHRpY2tldF9zdGF0dXMsIGJveF9leGlzdHMgPSBvcC5Cb3guZ2V0KGJveF9rZXkpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjAxCiAgICAvLyBpZiBib3hfZXhpc3RzOgogICAgYnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjAyLTIwMwogICAgLy8gIyBCb3ggZXhpc3RzIC0gY2hlY2sgaWYgYWxyZWFkeSB1c2VkCiAgICAvLyBhc3NlcnQgb3AuZXh0cmFjdF91aW50NjQodGlja2V0X3N0YXR1cywgMCkgPT0gVUludDY0KDApLCAiVGlja2V0IGFscmVhZHkgdXNlZCIKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgICEKICAgIGFzc2VydCAvLyBUaWNrZXQgYWxyZWFkeSB1c2VkCgp2ZXJpZnlfZW50cnlfYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjA1LTIwNgogICAgLy8gIyBNYXJrIGFzIGNoZWNrZWQtaW4gKGNyZWF0ZXMgYm94IGlmIGRvZXNuJ3QgZXhpc3QpCiAgICAvLyBvcC5Cb3gucHV0KGJveF9rZXksIG9wLml0b2IoVUludDY0KDEpKSkKICAgIGludGNfMSAvLyAxCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMDgKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnZlcmlmeV9lbnRyeV9ib29sX2ZhbHNlQDEzOgogICAgaW50Y18wIC8vIDAKICAgIGIgdmVyaWZ5X2VudHJ5X2Jvb2xfbWVyZ2VAMTQKCnZlcmlmeV9lbnRyeV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIHZlcmlmeV9lbnRyeV9mb3JfaGVhZGVyQDIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5pc19jaGVja2VkX2luKHRpY2tldF9hc3NldF9pZDogdWludDY0KSAtPiB1aW50NjQ6CmlzX2NoZWNrZWRfaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxMC0yMTEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBpc19jaGVja2VkX2luKHNlbGYsIHRpY2tldF9hc3NldF9pZDogVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxMwogICAgLy8gYm94X2tleSA9IG9wLml0b2IodGlja2V0X2Fzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxNAogICAgLy8gdGlja2V0X3N0YXR1cywgYm94X2V4aXN0cyA9IG9wLkJveC5nZXQoYm94X2tleSkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjE2CiAgICAvLyBpZiBub3QgYm94X2V4aXN0czoKICAgIGJueiBpc19jaGVja2VkX2luX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMTcKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKaXNfY2hlY2tlZF9pbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KHRpY2tldF9zdGF0dXMsIDApID09IFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy50b2dnbGVfc2FsZSgpIC0+IHVpbnQ2NDoKdG9nZ2xlX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyMS0yMjIKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHRvZ2dsZV9zYWxlKHNlbGYpIC0+IGJvb2w6CiAgICBwcm90byAwIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMjQtMjI1CiAgICAvLyAjIENoZWNrIGlmIHNlbmRlciBpcyBjcmVhdG9yIG9yIG9uZSBvZiB0aGUgb3JnYW5pemVycwogICAgLy8gc2VuZGVyID0gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gaXNfYXV0aG9yaXplZCA9IHNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyOC0yMjkKICAgIC8vICMgQ2hlY2sgb3JnYW5pemVycyBmcm9tIGJveCBzdG9yYWdlCiAgICAvLyBpZiBub3QgaXNfYXV0aG9yaXplZDoKICAgIGJueiB0b2dnbGVfc2FsZV9hZnRlcl9pZl9lbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJvcmdhbml6ZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxCgp0b2dnbGVfc2FsZV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2J1cnkgNQogICAgYnogdG9nZ2xlX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMzEKICAgIC8vIGJveF9rZXkgPSBiIm9yZ18iICsgb3AuaXRvYihpKQogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHg2ZjcyNjc1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzMgogICAgLy8gb3JnYW5pemVyX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGJveF9rZXkpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjMzCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiB0b2dnbGVfc2FsZV9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjM0CiAgICAvLyBvcmdhbml6ZXIgPSBBY2NvdW50KG9yZ2FuaXplcl9ieXRlcykKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzNQogICAgLy8gaWYgc2VuZGVyID09IG9yZ2FuaXplcjoKICAgIGZyYW1lX2RpZyAzCiAgICA9PQogICAgYnogdG9nZ2xlX3NhbGVfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzNgogICAgLy8gaXNfYXV0aG9yaXplZCA9IFRydWUKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDUKCnRvZ2dsZV9zYWxlX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICBmcmFtZV9kaWcgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMzkKICAgIC8vIGFzc2VydCBpc19hdXRob3JpemVkLCAiT25seSBjcmVhdG9yIG9yIG9yZ2FuaXplcnMgY2FuIHRvZ2dsZSIKICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3Igb3Igb3JnYW5pemVycyBjYW4gdG9nZ2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0MAogICAgLy8gc2VsZi5pc19zYWxlX2FjdGl2ZSA9IG5vdCBzZWxmLmlzX3NhbGVfYWN0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfc2FsZV9hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfc2FsZV9hY3RpdmUgZXhpc3RzCiAgICAhCiAgICBieXRlY18zIC8vICJpc19zYWxlX2FjdGl2ZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gcmV0dXJuIHNlbGYuaXNfc2FsZV9hY3RpdmUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJpc19zYWxlX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19zYWxlX2FjdGl2ZSBleGlzdHMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgp0b2dnbGVfc2FsZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHRvZ2dsZV9zYWxlX2Zvcl9oZWFkZXJAMgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmdldF9ldmVudF9pbmZvKCkgLT4gdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0OgpnZXRfZXZlbnRfaW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjQ4CiAgICAvLyBzZWxmLnRpY2tldF9wcmljZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAidGlja2V0X3ByaWNlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpY2tldF9wcmljZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjQ5CiAgICAvLyBzZWxmLm1heF9zdXBwbHksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gIm1heF9zdXBwbHkiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3N1cHBseSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjUwCiAgICAvLyBzZWxmLnNvbGRfY291bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAic29sZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zb2xkX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNTEKICAgIC8vIHNlbGYuZXZlbnRfZGF0ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJldmVudF9kYXRlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV2ZW50X2RhdGUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI1MgogICAgLy8gc2VsZi5zYWxlX2VuZF9kYXRlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJzYWxlX2VuZF9kYXRlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNhbGVfZW5kX2RhdGUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gc2VsZi51bmlxdWVfYnV5ZXJzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInVuaXF1ZV9idXllcnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudW5pcXVlX2J1eWVycyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjU0CiAgICAvLyBzZWxmLmlzX3NhbGVfYWN0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiaXNfc2FsZV9hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfc2FsZV9hY3RpdmUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0Ny0yNTUKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi50aWNrZXRfcHJpY2UsCiAgICAvLyAgICAgc2VsZi5tYXhfc3VwcGx5LAogICAgLy8gICAgIHNlbGYuc29sZF9jb3VudCwKICAgIC8vICAgICBzZWxmLmV2ZW50X2RhdGUsCiAgICAvLyAgICAgc2VsZi5zYWxlX2VuZF9kYXRlLAogICAgLy8gICAgIHNlbGYudW5pcXVlX2J1eWVycywKICAgIC8vICAgICBzZWxmLmlzX3NhbGVfYWN0aXZlCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfb3JnYW5pemVyKCkgLT4gYnl0ZXM6CmdldF9vcmdhbml6ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2MAogICAgLy8gcmV0dXJuIHNlbGYuY3JlYXRvcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmdldF9vcmdhbml6ZXJfYnlfaW5kZXgoaW5kZXg6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9vcmdhbml6ZXJfYnlfaW5kZXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2Mi0yNjMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfb3JnYW5pemVyX2J5X2luZGV4KHNlbGYsIGluZGV4OiBVSW50NjQpIC0+IEFkZHJlc3M6CiAgICBwcm90byAxIDEKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2OAogICAgLy8gaWYgaW5kZXggPj0gc2VsZi5vcmdhbml6ZXJfY291bnQ6CiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIDw9CiAgICBieiBnZXRfb3JnYW5pemVyX2J5X2luZGV4X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNjkKICAgIC8vIHJldHVybiBBZGRyZXNzKCkgICMgUmV0dXJuIHplcm8gYWRkcmVzcwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9vcmdhbml6ZXJfYnlfaW5kZXhfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNzEKICAgIC8vIGJveF9rZXkgPSBiIm9yZ18iICsgb3AuaXRvYihpbmRleCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDZmNzI2NzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjcyCiAgICAvLyBvcmdhbml6ZXJfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoYm94X2tleSkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNzQKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF9vcmdhbml6ZXJfYnlfaW5kZXhfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gcmV0dXJuIEFkZHJlc3Mob3JnYW5pemVyX2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIHN3YXAKICAgIHJldHN1YgoKZ2V0X29yZ2FuaXplcl9ieV9pbmRleF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gcmV0dXJuIEFkZHJlc3MoKSAgIyBSZXR1cm4gemVybyBhZGRyZXNzIGlmIG5vdCBmb3VuZAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfb3JnYW5pemVyX2NvdW50KCkgLT4gdWludDY0OgpnZXRfb3JnYW5pemVyX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODEKICAgIC8vIHJldHVybiBzZWxmLm9yZ2FuaXplcl9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5pc19vcmdhbml6ZXIoYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfb3JnYW5pemVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODMtMjg0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgaXNfb3JnYW5pemVyKHNlbGYsIGFkZHJlc3M6IEFkZHJlc3MpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODgKICAgIC8vIGlmIGFjY291bnQgPT0gc2VsZi5jcmVhdG9yOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGlzX29yZ2FuaXplcl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mjg5CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgppc19vcmdhbml6ZXJfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTEtMjkyCiAgICAvLyAjIENoZWNrIG9yZ2FuaXplcnMgZnJvbSBib3ggc3RvcmFnZQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJvcmdhbml6ZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxCgppc19vcmdhbml6ZXJfZm9yX2hlYWRlckAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTEtMjkyCiAgICAvLyAjIENoZWNrIG9yZ2FuaXplcnMgZnJvbSBib3ggc3RvcmFnZQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogaXNfb3JnYW5pemVyX2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTMKICAgIC8vIGJveF9rZXkgPSBiIm9yZ18iICsgb3AuaXRvYihpKQogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHg2ZjcyNjc1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5NAogICAgLy8gb3JnYW5pemVyX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGJveF9rZXkpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mjk1CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBpc19vcmdhbml6ZXJfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5NgogICAgLy8gb3JnYW5pemVyID0gQWNjb3VudChvcmdhbml6ZXJfYnl0ZXMpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTcKICAgIC8vIGlmIGFjY291bnQgPT0gb3JnYW5pemVyOgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogaXNfb3JnYW5pemVyX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTgKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmlzX29yZ2FuaXplcl9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5MS0yOTIKICAgIC8vICMgQ2hlY2sgb3JnYW5pemVycyBmcm9tIGJveCBzdG9yYWdlCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgaXNfb3JnYW5pemVyX2Zvcl9oZWFkZXJAMwoKaXNfb3JnYW5pemVyX2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzAwCiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1053, 1226, 1341, 1412], "errorMessage": "Address length is 32 bytes"}, {"pc": [949], "errorMessage": "Asset not found"}, {"pc": [747], "errorMessage": "CID too long (max 64 chars)"}, {"pc": [818], "errorMessage": "Event has passed"}, {"pc": [1079], "errorMessage": "Event verification period ended"}, {"pc": [753], "errorMessage": "Failed to create media box"}, {"pc": [708], "errorMessage": "Failed to create organizer box"}, {"pc": [837], "errorMessage": "Insufficient payment"}, {"pc": [694], "errorMessage": "Maximum 10 organizers allowed"}, {"pc": [739], "errorMessage": "Media already set"}, {"pc": [779], "errorMessage": "Media box not found"}, {"pc": [962], "errorMessage": "Must opt-in to asset first"}, {"pc": [953], "errorMessage": "Not your ticket"}, {"pc": [271, 296, 313, 333, 349, 408, 430, 456, 488, 504, 531, 555, 578, 598], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [686], "errorMessage": "Only creator can add organizers"}, {"pc": [732], "errorMessage": "Only creator can set media"}, {"pc": [1238], "errorMessage": "Only creator or organizers can toggle"}, {"pc": [1065], "errorMessage": "Only creator or organizers can verify"}, {"pc": [788], "errorMessage": "Sale not active"}, {"pc": [800], "errorMessage": "Sold out"}, {"pc": [1119], "errorMessage": "Ticket already used"}, {"pc": [1100], "errorMessage": "Ticket not owned by holder"}, {"pc": [809], "errorMessage": "Ticket sales have ended"}, {"pc": [602], "errorMessage": "can only call when creating"}, {"pc": [274, 299, 316, 336, 352, 411, 433, 459, 491, 507, 534, 558, 581], "errorMessage": "can only call when not creating"}, {"pc": [684, 730, 1004, 1177, 1301, 1363], "errorMessage": "check self.creator exists"}, {"pc": [816, 1072, 1282], "errorMessage": "check self.event_date exists"}, {"pc": [787, 1242, 1250, 1296], "errorMessage": "check self.is_sale_active exists"}, {"pc": [798, 1272], "errorMessage": "check self.max_supply exists"}, {"pc": [737, 769], "errorMessage": "check self.media_cid_length exists"}, {"pc": [690, 698, 715, 1017, 1190, 1310, 1351, 1380], "errorMessage": "check self.organizer_count exists"}, {"pc": [807, 1287], "errorMessage": "check self.sale_end_date exists"}, {"pc": [793, 842, 1277], "errorMessage": "check self.sold_count exists"}, {"pc": [835, 1267], "errorMessage": "check self.ticket_price exists"}, {"pc": [853, 1292], "errorMessage": "check self.unique_buyers exists"}, {"pc": [517], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "name": "price"}, {"type": "uint64", "name": "supply"}, {"type": "uint64", "name": "event_date"}, {"type": "uint64", "name": "sale_end_date"}], "name": "create_event", "returns": {"type": "uint64"}, "desc": "Create a new ticketed event\nAdditional organizers can be added after creation using add_organizer()", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "organizer_address"}], "name": "add_organizer", "returns": {"type": "uint64"}, "desc": "Add an organizer who can scan tickets (creator only)\nStores organizer in box with key \"org_{index}\" Requires box MBR funding before calling (20,100 microAlgos per organizer) Returns the organizer index", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "buy_ticket", "returns": {"type": "uint64"}, "desc": "Purchase an event ticket - Mints NFT to buyer\nReturns the NFT Asset ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "price"}, {"type": "uint64", "name": "supply"}, {"type": "bool", "name": "seated"}], "name": "add_tier", "returns": {"type": "uint64"}, "desc": "Add a pricing tier (creator only). Returns the tier id.\nSeated tiers get a seat bitmap box with one bit per seat (0..supply-1). Requires box MBR funding before calling: tier box 2500 + 400 * (11 + 25), seat map 2500 + 400 * (11 + ceil(supply / 8))", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "tier_id"}, {"type": "uint64", "name": "seat"}, {"type": "pay", "name": "payment"}], "name": "buy_tier_ticket", "returns": {"type": "uint64"}, "desc": "Purchase a ticket in a tier (and a specific seat for seated tiers).\n`seat` is ignored for unseated tiers. Mints the NFT like buy_ticket and records tier/seat in a \"tk_\" box (MBR 2500 + 400 * (11 + 16) microAlgos). Returns the NFT Asset ID", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "tier_id"}], "name": "get_tier", "returns": {"type": "(uint64,uint64,uint64,bool)", "struct": "TierRecord"}, "desc": "Get a tier's price, supply, sold counter and seated flag", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_tiers", "returns": {"type": "(uint64,uint64,uint64,bool)[]"}, "desc": "Get every tier in one call (index in the array = tier id)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "tier_id"}, {"type": "uint64", "name": "seat"}], "name": "is_seat_available", "returns": {"type": "bool"}, "desc": "O(1) seat lookup: reads a single byte of the tier's seat bitmap", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "get_ticket_seat", "returns": {"type": "(uint64,uint64)", "struct": "TicketSeat"}, "desc": "Get the tier and seat a ticket was sold for", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "claim_ticket", "returns": {"type": "void"}, "desc": "Claim your purchased ticket NFT after opting in to the asset.\nUses asset reserve field to verify the rightful buyer.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "ticket_holder"}, {"type": "uint64", "name": "ticket_asset_id"}], "name": "verify_entry", "returns": {"type": "bool"}, "desc": "Verify ticket at event entry (called by creator or any organizer)\nChecks NFT ownership and check-in status All organizers have permission to scan and verify tickets", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "is_checked_in", "returns": {"type": "bool"}, "desc": "Check if a ticket has been used for entry", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "asset_ids"}], "name": "get_ticket_status_batch", "returns": {"type": "(bool,uint64,address)[]"}, "desc": "Get (checked_in, transfer_count, owner) for many tickets in one call.\nOwner is the asset reserve address (zero address for unknown assets). Intended for simulate: large batches need allow_unnamed_resources, extra opcode budget and allow_more_logging for the return value.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "toggle_sale", "returns": {"type": "bool"}, "desc": "Toggle ticket sales on/off (creator or organizers only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_event_info", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,uint64,bool)"}, "desc": "Get event information", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_event_snapshot", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])", "struct": "EventSnapshot"}, "desc": "Get event info, resale cap and the full organizer list in one call.\nReplaces the get_event_info + get_organizer + get_organizer_count + get_organizer_by_index + get_max_resale_price round trips.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organizer", "returns": {"type": "address"}, "desc": "Get event creator address (main organizer)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "index"}], "name": "get_organizer_by_index", "returns": {"type": "address"}, "desc": "Get organizer address by index\nReturns zero address if index is out of bounds", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_organizer_count", "returns": {"type": "uint64"}, "desc": "Get the number of additional organizers", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "address"}], "name": "is_organizer", "returns": {"type": "bool"}, "desc": "Check if an address is an organizer", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}, {"type": "account", "name": "new_owner"}, {"type": "uint64", "name": "sale_price"}, {"type": "pay", "name": "payment"}], "name": "transfer_ticket", "returns": {"type": "bool"}, "desc": "Transfer (resell) a ticket to a new owner with 110% anti-scalping cap.\nThe seller calls this method; the grouped payment goes to the seller. The contract enforces that sale_price <= 110% of the price the ticket was sold at: its tier price for tiered tickets, ticket_price otherwise. Uses clawback to move the NFT from seller to buyer. Records the transfer in box storage for provenance tracking.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_max_resale_price", "returns": {"type": "uint64"}, "desc": "Returns the maximum allowed resale price (110% of original ticket price).\nThis is enforced on-chain in transfer_ticket.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "get_ticket_resale_cap", "returns": {"type": "uint64"}, "desc": "Maximum resale price of one ticket (110% of its tier price, or of ticket_price)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}], "name": "get_transfer_count", "returns": {"type": "uint64"}, "desc": "Get the number of times a ticket has been resold", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}, {"type": "uint64", "name": "index"}], "name": "get_sale_history", "returns": {"type": "(address,address,uint64,uint64)"}, "desc": "Get a specific sale history entry for a ticket.\nReturns (seller, buyer, price, timestamp).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "ticket_asset_id"}, {"type": "uint64", "name": "from_index"}, {"type": "uint64", "name": "count"}], "name": "get_sale_history_range", "returns": {"type": "(address,address,uint64,uint64)[]"}, "desc": "Get up to `count` consecutive sale history entries starting at `from_index`.\nReads the records straight out of the history box in one extract. Capped at 12 records per call; page with from_index for longer histories.", "events": [], "readonly": true, "recommendations": {}}], "name": "Ticketing", "state": {"keys": {"box": {}, "global": {"ticket_price": {"key": "dGlja2V0X3ByaWNl", "keyType": "AVMString", "valueType": "AVMUint64"}, "max_supply": {"key": "bWF4X3N1cHBseQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "sold_count": {"key": "c29sZF9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "event_date": {"key": "ZXZlbnRfZGF0ZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "sale_end_date": {"key": "c2FsZV9lbmRfZGF0ZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_sale_active": {"key": "aXNfc2FsZV9hY3RpdmU=", "keyType": "AVMString", "valueType": "AVMUint64"}, "creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "unique_buyers": {"key": "dW5pcXVlX2J1eWVycw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "organizer_count": {"key": "b3JnYW5pemVyX2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "tier_count": {"key": "dGllcl9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "tier_sold_count": {"key": "dGllcl9zb2xkX2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 10}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"EventSnapshot": [{"name": "ticket_price", "type": "uint64"}, {"name": "max_supply", "type": "uint64"}, {"name": "sold_count", "type": "uint64"}, {"name": "tier_sold_count", "type": "uint64"}, {"name": "event_date", "type": "uint64"}, {"name": "sale_end_date", "type": "uint64"}, {"name": "unique_buyers", "type": "uint64"}, {"name": "is_sale_active", "type": "bool"}, {"name": "max_resale_price", "type": "uint64"}, {"name": "creator", "type": "address"}, {"name": "organizer_count", "type": "uint64"}, {"name": "organizers", "type": "address[]"}], "TicketSeat": [{"name": "tier_id", "type": "uint64"}, {"name": "seat", "type": "uint64"}], "TierRecord": [{"name": "price", "type": "uint64"}, {"name": "supply", "type": "uint64"}, {"name": "sold", "type": "uint64"}, {"name": "seated", "type": "bool"}]}, "byteCode": {"approval": "CiAEAAEIICYTBBUffHUBAA9vcmdhbml6ZXJfY291bnQKdGllcl9jb3VudAdjcmVhdG9yDmlzX3NhbGVfYWN0aXZlDXVuaXF1ZV9idXllcnMMdGlja2V0X3ByaWNlCnNvbGRfY291bnQKZXZlbnRfZGF0ZQRvcmdfA3RyXw1zYWxlX2VuZF9kYXRlCm1heF9zdXBwbHkPdGllcl9zb2xkX2NvdW50A3NoXwNzbV8DdGtfAgAAMRtBAL2CGgTo3Wv9BMKOUvwEce9b0wSaORueBEGtaG4EP+Rj4gRoUwO7BMTJGtsEv5BFEwTspSRqBDP4iJ0EiL3bIgRFl0IGBAoZwEgErRC/sgS3NmufBOYZ2ScE+sEQWASddPsABBV5wXsEEGHk9gQAomZvBEQIOQ0EKqJQDgRKoMk2BIvdvhI2GgCOGgJ4AmQCSQIrAggB9AHkAccBswGjAYQBawFYAUMBCQD5AOkA1QDEAKwAfwBuAFkARAAeAAIiQzEZFEQxGEQ2GgEXNhoCFzYaAxeICf8oTFCwI0MxGRREMRhENhoBFzYaAheICbZMFkwWTwNPA1BPAlBMUChMULAjQzEZFEQxGEQ2GgEXiAmLFihMULAjQzEZFEQxGEQ2GgEXiAltFihMULAjQzEZFEQxGESICVgWKExQsCNDMRkURDEYRDYaARc2GgIXwBw2GgMXMRYjCUk4ECMSRIgITikiTwJUKExQsCNDMRkURDEYRDYaAYgH4ikiTwJUKExQsCNDMRkURDEYRIgHyBYoTFCwI0MxGRREMRhENhoBF4gHhihMULAjQzEZFEQxGESIB3AoTFCwI0MxGRREMRhEiAalKExQsCNDMRkURDEYRIgGcU8GFk8GFk8GFk8GFk8GFk8GFikiTwhUTwZPBlBPBVBPBFBPA1BPAlBMUChMULAjQzEZFEQxGESIBdApIk8CVChMULAjQzEZFEQxGEQ2GgGIBQsoTFCwI0MxGRREMRhENhoBF4gE7ikiTwJUKExQsCNDMRkURDEYRDYaARfAHDYaAheIBDMpIk8CVChMULAjQzEZFEQxGEQ2GgEXiAPsI0MxGRREMRhENhoBF4gDZihMULAjQzEZFEQxGEQ2GgEXNhoCF4gDFSkiTwJUKExQsCNDMRkURDEYRIgCwyhMULAjQzEZFEQxGEQ2GgEXiAKaKExQsCNDMRkURDEYRDYaARc2GgIXMRYjCUk4ECMSRIgBthYoTFCwI0MxGRREMRhENhoBFzYaAhc2GgMiU4gBExYoTFCwI0MxGRREMRhEMRYjCUk4ECMSRIgAoBYoTFCwI0MxGRREMRhENhoBiABdFihMULAjQzEZFEQxGBRENhoBFzYaAhc2GgMXNhoEF4gABxYoTFCwI0OKBAEnB4v8ZycNi/1nJwgiZycOImcnCYv+ZycMi/9nJwQxAGcnBSNnJwYiZyoiZysiZyOJigEBMQAiJwRlRBJEIiplRIEKDEQiKmVESRYnCkxQSSW5RIv/vyIqZUQjCCpMZ4mKAQEiJwVlREQiJwhlRCInDWVEDEQyByInDGVEDEQyByInCWVEDESL/zgHMgoSRIv/OAgiJwdlRA9EIicIZUQjCCcITGciJwZlRCMIJwZMZ4v/OACIAfeJigMBIoAAMQAiJwRlRBJEIitlRIEQDESL/kSL/0EACov+gYCAAg5BAFgjRCIrZUxJTgKMAUQWSYwAJwtMUIv9Fov+Fikii/9UTgJQgAgAAAAAAAAAAFBMUEsBgRm5RL+L/0EAD4v+gQcIJAonEIsAUEy5RCIrZUQjCCtMZ4sBjACJIkL/pYoDASInBWVERDIHIicMZUQMRDIHIicJZUQMRCIrZUSL/Q1Ei/0WSScLTFBJvkhJgRBbSU8CSSRbSU4DTwINRIv/OAcyChJEi/84CEsBIlsPRCJMgcABUykiTwJUIlNBACWL/osDDESL/Yv+iADsRCcQiwBQi/4kCkojuov+JBgjVLuL/owEiwIjCBaLAYEQTwK7IicOZUQjCCcOTGciJwZlRCMIJwZMZ4v/OACIAMKLBBaLAExQSwEWJxFMUEy/jACJigEBIitlRIv/DUSL/xYnC0xQvkiJigABgAAiK2VEIosCiwEMQQAXiwJJFicLTFC+SIsATFCMACMIjAJC/+EiK2VEFkmTgRAORFcGAosAUIwAiYoCASIrZUSL/g1Ei/4WJwtMUL5ISYHAAVMpIk8CVCJTQQAKiwAkW4v/DkEAAyJMiYv+i/+IAA9MiYoBAYv/FicRTFC+RImKAgGL/hYnEExQi/8kCiO6i/8kGFMUiYoBAbEyCkcCsiyyK4v/siqyKYAUaXBmczovL2NhbXB1cy10aWNrZXSyJ4ADVElYsiWADEV2ZW50IFRpY2tldLImIrIjI7IigQOyECKyAbO0PImKAQCL/3EIRDEAEkQxAIv/cABFAUSxMgoxAIv/shEjshKyFLITgQSyECKyAbOJigIBIkcCgABHAjEASSInBGVEEkcCQAA0IiplTIwFRCKMBIsEiwUMiweMCEEAHosEFicKTFC+TIwBQQBXiwFJFSUSRIsGEkEASiOMCIsIRDIHIicJZUSBgKMFCA5Ei/6L/3AATIwDQQAmiwMjEkEAHyNEi/8WSYwAvkyMAkEABosCIlsURCMWiwBMvyOMAIkiQv/eiwQjCIwEQv+GigEBi/+IAJmJigEBIoAASYv/IlkiiwSLAwxBADyL/1cCAIsEJAtbSYwBcQhMjABAAAQyA4wAiwFJiABlKSJPAlRMiAPKFlCLAFCLAkxQjAKLBCMIjARC/7yLAxZJk4EQDkRXBgKLAlCMAIkiJwdlRCInB2VEgQoKCImKAQGL/xYnEUxQvkAABYj/4EyJiwBXAAgnC0xQIiS6F0mBCgoITImKAQGL/xa+QAADIkyJiwAiWyMSTImKAAEigABJMQBJIicEZUQSRwJAADQiKmVMjAJEIowBiwGLAgyLBIwFQQAeiwEWJwpMUL5MjABBACWLAEkVJRJEiwMSQQAYI4wFiwVEIicFZUQUJwVMZyInBWVEjACJiwEjCIwBQv+4IicHZUQiJw1lRCInCGVEIicJZUQiJwxlRCInBmVEIicFZUSJigABIkknEiIqZUQiiwSLAwxBADuLBBYnCkxQvkyMAIsCjAFBAByLAlcCAIsASU4CFSUSRExQSRUlChZXBgJMUIwBiwGMAosEIwiMBEL/vSInB2VEFiInDWVEFiInCGVEFiInDmVEFiInCWVEFiInDGVEFiInBmVEFiInBWVEKSJPAlSI/qQWIicEZUQiKmVEFk8KTwpQTwlQTwhQTwdQTwZQTwVQTwRQTwNQTwJQTFCAAgBrUIsCUIwAiSInBGVEiYoBASJJKmVEi/8OQQAEMgNMiYv/FicKTFC+TIwAQQAJiwBJFSUSREyJMgNMiSIqZUSJigEBIoAASSInBGVEi/8SQQAEI4wAiSIqZUyMAkQijAGLAYsCDEEAKIsBFicKTFC+TIwAQQARiwBJFSUSRIv/EkEABCOMAImLASMIjAFC/9AijACJigQBIkcCgABJi/yI/eSL/g9Ei/84CIv+D0SL/zgHMQASRDEAi/xwAEEAsosFIxJBAKsjRIv9i/xwAEUBRIv8FkmMAL5MjAFBAAaLASJbFESxMQCL/LIRI7ISi/2yFLITgQSyECKyAbOxMgpHArIssiuL/bIqsimL/LIhgQOyECKyAbMnD4sAUEmMAr1MjAMijARBAD+LAkkiJLoXjASLA4FQCNMxAIv+FjIHFk8Ci/1QTwJQTFCLBElOAoFQCyQIiwJJTgNMTwK7TCMIFiJMuyOMAImLAoFYuURC/8ciQv9SiPz/iYoBAYv/iP0FiYoBAYv/iACRiYoCBIv+iACIi/8NRIv+FicPTFCL/4FQCyQIgVC6SVcAIEsBVyAgSwKBQFtPA4FIW4mKAwGAAIv9iABVSYv+DkEABScSjACJiwGL/glJjACL/w1BAASL/4wAiwCBDA1BAASBDIwAi/0WJw9MUIv+gVALJAiLAElOAoFQC08DTgK6TBZJk4EQDkRXBgJMUIwAiYoBAYv/FicPTFBJvUUBQQAIiwAiJLoXTIkiTIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    Citadel Multi-Organizer Ticketing Contract\n    NFT-based event tickets with anti-scalping and entry verification\n    Each deployment = one event (fully decentralized)\n    Features:\n    - Mints NFT ticket on purchase\n    - Multi-organizer support (creator can add up to 10 organizers)\n    - All organizers can scan tickets and verify entry\n    - QR code verification at entry\n    - Prevents double entry\n    - 110% anti-scalping resale cap enforced on-chain\n    - Optional pricing tiers with per-seat availability bitmaps, so one app\n      serves a whole venue\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMgogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4MDAgIm9yZ2FuaXplcl9jb3VudCIgInRpZXJfY291bnQiICJjcmVhdG9yIiAiaXNfc2FsZV9hY3RpdmUiICJ1bmlxdWVfYnV5ZXJzIiAidGlja2V0X3ByaWNlIiAic29sZF9jb3VudCIgImV2ZW50X2RhdGUiIDB4NmY3MjY3NWYgMHg3NDcyNWYgInNhbGVfZW5kX2RhdGUiICJtYXhfc3VwcGx5IiAidGllcl9zb2xkX2NvdW50IiAweDczNjg1ZiAweDczNmQ1ZiAweDc0NmI1ZiAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYWZ0ZXJfaWZfZWxzZUAzMgogICAgcHVzaGJ5dGVzcyAweGU4ZGQ2YmZkIDB4YzI4ZTUyZmMgMHg3MWVmNWJkMyAweDlhMzkxYjllIDB4NDFhZDY4NmUgMHgzZmU0NjNlMiAweDY4NTMwM2JiIDB4YzRjOTFhZGIgMHhiZjkwNDUxMyAweGVjYTUyNDZhIDB4MzNmODg4OWQgMHg4OGJkZGIyMiAweDQ1OTc0MjA2IDB4MGExOWMwNDggMHhhZDEwYmZiMiAweGI3MzY2YjlmIDB4ZTYxOWQ5MjcgMHhmYWMxMTA1OCAweDlkNzRmYjAwIDB4MTU3OWMxN2IgMHgxMDYxZTRmNiAweDAwYTI2NjZmIDB4NDQwODM5MGQgMHgyYWEyNTAwZSAweDRhYTBjOTM2IDB4OGJkZGJlMTIgLy8gbWV0aG9kICJjcmVhdGVfZXZlbnQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYWRkX29yZ2FuaXplcihhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAiYnV5X3RpY2tldChwYXkpdWludDY0IiwgbWV0aG9kICJhZGRfdGllcih1aW50NjQsdWludDY0LGJvb2wpdWludDY0IiwgbWV0aG9kICJidXlfdGllcl90aWNrZXQodWludDY0LHVpbnQ2NCxwYXkpdWludDY0IiwgbWV0aG9kICJnZXRfdGllcih1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0LGJvb2wpIiwgbWV0aG9kICJnZXRfdGllcnMoKSh1aW50NjQsdWludDY0LHVpbnQ2NCxib29sKVtdIiwgbWV0aG9kICJpc19zZWF0X2F2YWlsYWJsZSh1aW50NjQsdWludDY0KWJvb2wiLCBtZXRob2QgImdldF90aWNrZXRfc2VhdCh1aW50NjQpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJjbGFpbV90aWNrZXQodWludDY0KXZvaWQiLCBtZXRob2QgInZlcmlmeV9lbnRyeShhY2NvdW50LHVpbnQ2NClib29sIiwgbWV0aG9kICJpc19jaGVja2VkX2luKHVpbnQ2NClib29sIiwgbWV0aG9kICJnZXRfdGlja2V0X3N0YXR1c19iYXRjaCh1aW50NjRbXSkoYm9vbCx1aW50NjQsYWRkcmVzcylbXSIsIG1ldGhvZCAidG9nZ2xlX3NhbGUoKWJvb2wiLCBtZXRob2QgImdldF9ldmVudF9pbmZvKCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYm9vbCkiLCBtZXRob2QgImdldF9ldmVudF9zbmFwc2hvdCgpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxib29sLHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCxhZGRyZXNzW10pIiwgbWV0aG9kICJnZXRfb3JnYW5pemVyKClhZGRyZXNzIiwgbWV0aG9kICJnZXRfb3JnYW5pemVyX2J5X2luZGV4KHVpbnQ2NClhZGRyZXNzIiwgbWV0aG9kICJnZXRfb3JnYW5pemVyX2NvdW50KCl1aW50NjQiLCBtZXRob2QgImlzX29yZ2FuaXplcihhZGRyZXNzKWJvb2wiLCBtZXRob2QgInRyYW5zZmVyX3RpY2tldCh1aW50NjQsYWNjb3VudCx1aW50NjQscGF5KWJvb2wiLCBtZXRob2QgImdldF9tYXhfcmVzYWxlX3ByaWNlKCl1aW50NjQiLCBtZXRob2QgImdldF90aWNrZXRfcmVzYWxlX2NhcCh1aW50NjQpdWludDY0IiwgbWV0aG9kICJnZXRfdHJhbnNmZXJfY291bnQodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3NhbGVfaGlzdG9yeSh1aW50NjQsdWludDY0KShhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9zYWxlX2hpc3RvcnlfcmFuZ2UodWludDY0LHVpbnQ2NCx1aW50NjQpKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KVtdIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfZXZlbnRfcm91dGVAMyBtYWluX2FkZF9vcmdhbml6ZXJfcm91dGVANCBtYWluX2J1eV90aWNrZXRfcm91dGVANSBtYWluX2FkZF90aWVyX3JvdXRlQDYgbWFpbl9idXlfdGllcl90aWNrZXRfcm91dGVANyBtYWluX2dldF90aWVyX3JvdXRlQDggbWFpbl9nZXRfdGllcnNfcm91dGVAOSBtYWluX2lzX3NlYXRfYXZhaWxhYmxlX3JvdXRlQDEwIG1haW5fZ2V0X3RpY2tldF9zZWF0X3JvdXRlQDExIG1haW5fY2xhaW1fdGlja2V0X3JvdXRlQDEyIG1haW5fdmVyaWZ5X2VudHJ5X3JvdXRlQDEzIG1haW5faXNfY2hlY2tlZF9pbl9yb3V0ZUAxNCBtYWluX2dldF90aWNrZXRfc3RhdHVzX2JhdGNoX3JvdXRlQDE1IG1haW5fdG9nZ2xlX3NhbGVfcm91dGVAMTYgbWFpbl9nZXRfZXZlbnRfaW5mb19yb3V0ZUAxNyBtYWluX2dldF9ldmVudF9zbmFwc2hvdF9yb3V0ZUAxOCBtYWluX2dldF9vcmdhbml6ZXJfcm91dGVAMTkgbWFpbl9nZXRfb3JnYW5pemVyX2J5X2luZGV4X3JvdXRlQDIwIG1haW5fZ2V0X29yZ2FuaXplcl9jb3VudF9yb3V0ZUAyMSBtYWluX2lzX29yZ2FuaXplcl9yb3V0ZUAyMiBtYWluX3RyYW5zZmVyX3RpY2tldF9yb3V0ZUAyMyBtYWluX2dldF9tYXhfcmVzYWxlX3ByaWNlX3JvdXRlQDI0IG1haW5fZ2V0X3RpY2tldF9yZXNhbGVfY2FwX3JvdXRlQDI1IG1haW5fZ2V0X3RyYW5zZmVyX2NvdW50X3JvdXRlQDI2IG1haW5fZ2V0X3NhbGVfaGlzdG9yeV9yb3V0ZUAyNyBtYWluX2dldF9zYWxlX2hpc3RvcnlfcmFuZ2Vfcm91dGVAMjgKCm1haW5fYWZ0ZXJfaWZfZWxzZUAzMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfc2FsZV9oaXN0b3J5X3JhbmdlX3JvdXRlQDI4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NDkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfc2FsZV9oaXN0b3J5X3JhbmdlCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9zYWxlX2hpc3Rvcnlfcm91dGVAMjc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYzMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjMzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9zYWxlX2hpc3RvcnkKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3RyYW5zZmVyX2NvdW50X3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MjgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYyOAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdHJhbnNmZXJfY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3RpY2tldF9yZXNhbGVfY2FwX3JvdXRlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MjMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdGlja2V0X3Jlc2FsZV9jYXAKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X21heF9yZXNhbGVfcHJpY2Vfcm91dGVAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYxNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9tYXhfcmVzYWxlX3ByaWNlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX3RpY2tldF9yb3V0ZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUyOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHRyYW5zZmVyX3RpY2tldAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faXNfb3JnYW5pemVyX3JvdXRlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MDgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUwOAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBpc19vcmdhbml6ZXIKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcmdhbml6ZXJfY291bnRfcm91dGVAMjE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUwMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9vcmdhbml6ZXJfY291bnQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X29yZ2FuaXplcl9ieV9pbmRleF9yb3V0ZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDg3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0ODcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X29yZ2FuaXplcl9ieV9pbmRleAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfb3JnYW5pemVyX3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0ODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfb3JnYW5pemVyCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9ldmVudF9zbmFwc2hvdF9yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDUzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2V2ZW50X3NuYXBzaG90CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9ldmVudF9pbmZvX3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NDAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfZXZlbnRfaW5mbwogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciA4CiAgICBzZXRiaXQKICAgIHVuY292ZXIgNgogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fdG9nZ2xlX3NhbGVfcm91dGVAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQxNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdG9nZ2xlX3NhbGUKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF90aWNrZXRfc3RhdHVzX2JhdGNoX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNjgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM2OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdGlja2V0X3N0YXR1c19iYXRjaAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9pc19jaGVja2VkX2luX3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNjMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM2MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBpc19jaGVja2VkX2luCiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl92ZXJpZnlfZW50cnlfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMyMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzIxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgdmVyaWZ5X2VudHJ5CiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV90aWNrZXRfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGFpbV90aWNrZXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3RpY2tldF9zZWF0X3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdGlja2V0X3NlYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faXNfc2VhdF9hdmFpbGFibGVfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjYxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGlzX3NlYXRfYXZhaWxhYmxlCiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdGllcnNfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjUzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3RpZXJzCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF90aWVyX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjQ3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF90aWVyCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2J1eV90aWVyX3RpY2tldF9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMDgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMDgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBidXlfdGllcl90aWNrZXQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYWRkX3RpZXJfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTc2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF90aWVyCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2J1eV90aWNrZXRfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTUzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo3NwogICAgLy8gY2xhc3MgVGlja2V0aW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTUzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgYnV5X3RpY2tldAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hZGRfb3JnYW5pemVyX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGNsYXNzIFRpY2tldGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMzAKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBhZGRfb3JnYW5pemVyCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9ldmVudF9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMDUKICAgIC8vIEBhYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bJ05vT3AnXSwgY3JlYXRlPSdyZXF1aXJlJykKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBjbGFzcyBUaWNrZXRpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTA1CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WydOb09wJ10sIGNyZWF0ZT0ncmVxdWlyZScpCiAgICBjYWxsc3ViIGNyZWF0ZV9ldmVudAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmNyZWF0ZV9ldmVudChwcmljZTogdWludDY0LCBzdXBwbHk6IHVpbnQ2NCwgZXZlbnRfZGF0ZTogdWludDY0LCBzYWxlX2VuZF9kYXRlOiB1aW50NjQpIC0+IHVpbnQ2NDoKY3JlYXRlX2V2ZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMDUtMTEyCiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WydOb09wJ10sIGNyZWF0ZT0ncmVxdWlyZScpCiAgICAvLyBkZWYgY3JlYXRlX2V2ZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJpY2U6IFVJbnQ2NCwKICAgIC8vICAgICBzdXBwbHk6IFVJbnQ2NCwKICAgIC8vICAgICBldmVudF9kYXRlOiBVSW50NjQsCiAgICAvLyAgICAgc2FsZV9lbmRfZGF0ZTogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIHNlbGYudGlja2V0X3ByaWNlID0gcHJpY2UKICAgIGJ5dGVjIDcgLy8gInRpY2tldF9wcmljZSIKICAgIGZyYW1lX2RpZyAtNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTE4CiAgICAvLyBzZWxmLm1heF9zdXBwbHkgPSBzdXBwbHkKICAgIGJ5dGVjIDEzIC8vICJtYXhfc3VwcGx5IgogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMTkKICAgIC8vIHNlbGYuc29sZF9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOCAvLyAic29sZF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMjAKICAgIC8vIHNlbGYudGllcl9zb2xkX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlYyAxNCAvLyAidGllcl9zb2xkX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gc2VsZi5ldmVudF9kYXRlID0gZXZlbnRfZGF0ZQogICAgYnl0ZWMgOSAvLyAiZXZlbnRfZGF0ZSIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTIyCiAgICAvLyBzZWxmLnNhbGVfZW5kX2RhdGUgPSBzYWxlX2VuZF9kYXRlCiAgICBieXRlYyAxMiAvLyAic2FsZV9lbmRfZGF0ZSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTIzCiAgICAvLyBzZWxmLmNyZWF0b3IgPSBUeG4uc2VuZGVyCiAgICBieXRlYyA0IC8vICJjcmVhdG9yIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTI0CiAgICAvLyBzZWxmLmlzX3NhbGVfYWN0aXZlID0gVHJ1ZQogICAgYnl0ZWMgNSAvLyAiaXNfc2FsZV9hY3RpdmUiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTI1CiAgICAvLyBzZWxmLnVuaXF1ZV9idXllcnMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDYgLy8gInVuaXF1ZV9idXllcnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTI2CiAgICAvLyBzZWxmLm9yZ2FuaXplcl9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAib3JnYW5pemVyX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyNwogICAgLy8gc2VsZi50aWVyX2NvdW50ID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJ0aWVyX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gcmV0dXJuIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmFkZF9vcmdhbml6ZXIob3JnYW5pemVyX2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CmFkZF9vcmdhbml6ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzMC0xMzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFkZF9vcmdhbml6ZXIoc2VsZiwgb3JnYW5pemVyX2FkZHJlc3M6IEFkZHJlc3MpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxMzgKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgY3JlYXRvciBjYW4gYWRkIG9yZ2FuaXplcnMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIGFkZCBvcmdhbml6ZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjEzOQogICAgLy8gYXNzZXJ0IHNlbGYub3JnYW5pemVyX2NvdW50IDwgVUludDY0KDEwKSwgIk1heGltdW0gMTAgb3JnYW5pemVycyBhbGxvd2VkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICA8CiAgICBhc3NlcnQgLy8gTWF4aW11bSAxMCBvcmdhbml6ZXJzIGFsbG93ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyBDcmVhdGUgYm94IGtleSBmcm9tIGN1cnJlbnQgY291bnQKICAgIC8vIGN1cnJlbnRfaW5kZXggPSBzZWxmLm9yZ2FuaXplcl9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE0MwogICAgLy8gYm94X2tleSA9IGIib3JnXyIgKyBvcC5pdG9iKGN1cnJlbnRfaW5kZXgpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NmY3MjY3NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNDUtMTQ3CiAgICAvLyAjIENyZWF0ZSBib3ggKDMyIGJ5dGVzIGZvciBhZGRyZXNzKSBhbmQgc3RvcmUgb3JnYW5pemVyCiAgICAvLyAjIEJveCBNQlI6IDI1MDAgKyA0MDAgKiAoMTIgKyAzMikgPSAyMCwxMDAgbWljcm9BbGdvcwogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUoYm94X2tleSwgMzIpLCAiRmFpbGVkIHRvIGNyZWF0ZSBvcmdhbml6ZXIgYm94IgogICAgZHVwCiAgICBpbnRjXzMgLy8gMzIKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBGYWlsZWQgdG8gY3JlYXRlIG9yZ2FuaXplciBib3gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTQ4CiAgICAvLyBvcC5Cb3gucHV0KGJveF9rZXksIG9yZ2FuaXplcl9hZGRyZXNzLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gc2VsZi5vcmdhbml6ZXJfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAib3JnYW5pemVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXplcl9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJvcmdhbml6ZXJfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNTEKICAgIC8vIHJldHVybiBjdXJyZW50X2luZGV4CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5idXlfdGlja2V0KHBheW1lbnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpidXlfdGlja2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNTMtMTU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBidXlfdGlja2V0KHNlbGYsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTU5CiAgICAvLyBhc3NlcnQgc2VsZi5pc19zYWxlX2FjdGl2ZSwgIlNhbGUgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJpc19zYWxlX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19zYWxlX2FjdGl2ZSBleGlzdHMKICAgIGFzc2VydCAvLyBTYWxlIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTYwCiAgICAvLyBhc3NlcnQgc2VsZi5zb2xkX2NvdW50IDwgc2VsZi5tYXhfc3VwcGx5LCAiU29sZCBvdXQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAic29sZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zb2xkX2NvdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJtYXhfc3VwcGx5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9zdXBwbHkgZXhpc3RzCiAgICA8CiAgICBhc3NlcnQgLy8gU29sZCBvdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTYxCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPCBzZWxmLnNhbGVfZW5kX2RhdGUsICJUaWNrZXQgc2FsZXMgaGF2ZSBlbmRlZCIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAic2FsZV9lbmRfZGF0ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlX2VuZF9kYXRlIGV4aXN0cwogICAgPAogICAgYXNzZXJ0IC8vIFRpY2tldCBzYWxlcyBoYXZlIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDwgc2VsZi5ldmVudF9kYXRlLCAiRXZlbnQgaGFzIHBhc3NlZCIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJldmVudF9kYXRlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV2ZW50X2RhdGUgZXhpc3RzCiAgICA8CiAgICBhc3NlcnQgLy8gRXZlbnQgaGFzIHBhc3NlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID49IHNlbGYudGlja2V0X3ByaWNlLCAiSW5zdWZmaWNpZW50IHBheW1lbnQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInRpY2tldF9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWNrZXRfcHJpY2UgZXhpc3RzCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE2Ni0xNjcKICAgIC8vICMgSW5jcmVtZW50IHRpY2tldCBjb3VudGVyCiAgICAvLyBzZWxmLnNvbGRfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAic29sZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zb2xkX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDggLy8gInNvbGRfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxNjgKICAgIC8vIHNlbGYudW5pcXVlX2J1eWVycyArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJ1bmlxdWVfYnV5ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXF1ZV9idXllcnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNiAvLyAidW5pcXVlX2J1eWVycyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE3MC0xNzIKICAgIC8vICMgTkZUIHN0YXlzIHdpdGggY29udHJhY3QgLSBidXllciBtdXN0IG9wdC1pbiB0aGVuIGNhbGwgY2xhaW1fdGlja2V0CiAgICAvLyAjIENoZWNrLWluIGJveCB3aWxsIGJlIGNyZWF0ZWQgbGF0ZXIgZHVyaW5nIHZlcmlmeV9lbnRyeQogICAgLy8gcmV0dXJuIHNlbGYuX21pbnRfdGlja2V0KHBheW1lbnQuc2VuZGVyKQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGNhbGxzdWIgX21pbnRfdGlja2V0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5hZGRfdGllcihwcmljZTogdWludDY0LCBzdXBwbHk6IHVpbnQ2NCwgc2VhdGVkOiB1aW50NjQpIC0+IHVpbnQ2NDoKYWRkX3RpZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE3Ni0xNzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFkZF90aWVyKHNlbGYsIHByaWNlOiBVSW50NjQsIHN1cHBseTogVUludDY0LCBzZWF0ZWQ6IGJvb2wpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxODQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgY3JlYXRvciBjYW4gYWRkIHRpZXJzIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBhZGQgdGllcnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTg1CiAgICAvLyBhc3NlcnQgc2VsZi50aWVyX2NvdW50IDwgVUludDY0KE1BWF9USUVSUyksICJNYXhpbXVtIDE2IHRpZXJzIGFsbG93ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidGllcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWVyX2NvdW50IGV4aXN0cwogICAgcHVzaGludCAxNiAvLyAxNgogICAgPAogICAgYXNzZXJ0IC8vIE1heGltdW0gMTYgdGllcnMgYWxsb3dlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxODYKICAgIC8vIGFzc2VydCBzdXBwbHkgPiBVSW50NjQoMCksICJTdXBwbHkgbXVzdCBiZSA+IDAiCiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2VydCAvLyBTdXBwbHkgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTg3CiAgICAvLyBhc3NlcnQgbm90IHNlYXRlZCBvciBzdXBwbHkgPD0gVUludDY0KE1BWF9TRUFUU19QRVJfVElFUiksICJUb28gbWFueSBzZWF0cyBmb3Igb25lIHRpZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IGFkZF90aWVyX2Jvb2xfdHJ1ZUAyCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgMzI3NjggLy8gMzI3NjgKICAgIDw9CiAgICBieiBhZGRfdGllcl9ib29sX2ZhbHNlQDMKCmFkZF90aWVyX2Jvb2xfdHJ1ZUAyOgogICAgaW50Y18xIC8vIDEKCmFkZF90aWVyX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTg3CiAgICAvLyBhc3NlcnQgbm90IHNlYXRlZCBvciBzdXBwbHkgPD0gVUludDY0KE1BWF9TRUFUU19QRVJfVElFUiksICJUb28gbWFueSBzZWF0cyBmb3Igb25lIHRpZXIiCiAgICBhc3NlcnQgLy8gVG9vIG1hbnkgc2VhdHMgZm9yIG9uZSB0aWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gdGllcl9pZCA9IHNlbGYudGllcl9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRpZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpZXJfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gdGllcl9rZXkgPSBiInRyXyIgKyBvcC5pdG9iKHRpZXJfaWQpCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYnl0ZWMgMTEgLy8gMHg3NDcyNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxOTIKICAgIC8vIHByaWNlPUFSQzRVSW50NjQocHJpY2UpLAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE5MwogICAgLy8gc3VwcGx5PUFSQzRVSW50NjQoc3VwcGx5KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxOTUKICAgIC8vIHNlYXRlZD1BUkM0Qm9vbChzZWF0ZWQpLAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfZGlnIC0xCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTkxLTE5NgogICAgLy8gdGllciA9IFRpZXJSZWNvcmQoCiAgICAvLyAgICAgcHJpY2U9QVJDNFVJbnQ2NChwcmljZSksCiAgICAvLyAgICAgc3VwcGx5PUFSQzRVSW50NjQoc3VwcGx5KSwKICAgIC8vICAgICBzb2xkPUFSQzRVSW50NjQoMCksCiAgICAvLyAgICAgc2VhdGVkPUFSQzRCb29sKHNlYXRlZCksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTk0CiAgICAvLyBzb2xkPUFSQzRVSW50NjQoMCksCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjE5MS0xOTYKICAgIC8vIHRpZXIgPSBUaWVyUmVjb3JkKAogICAgLy8gICAgIHByaWNlPUFSQzRVSW50NjQocHJpY2UpLAogICAgLy8gICAgIHN1cHBseT1BUkM0VUludDY0KHN1cHBseSksCiAgICAvLyAgICAgc29sZD1BUkM0VUludDY0KDApLAogICAgLy8gICAgIHNlYXRlZD1BUkM0Qm9vbChzZWF0ZWQpLAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MTk3CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZSh0aWVyX2tleSwgdGllci5ieXRlcy5sZW5ndGgpLCAiRmFpbGVkIHRvIGNyZWF0ZSB0aWVyIGJveCIKICAgIGRpZyAxCiAgICBwdXNoaW50IDI1IC8vIDI1CiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gRmFpbGVkIHRvIGNyZWF0ZSB0aWVyIGJveAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToxOTgKICAgIC8vIG9wLkJveC5wdXQodGllcl9rZXksIHRpZXIuYnl0ZXMpCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gaWYgc2VhdGVkOgogICAgZnJhbWVfZGlnIC0xCiAgICBieiBhZGRfdGllcl9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjAxLTIwMgogICAgLy8gIyBCb3guY3JlYXRlIHplcm8tZmlsbHMsIHNvIGV2ZXJ5IHNlYXQgc3RhcnRzIGF2YWlsYWJsZQogICAgLy8gc2VhdF9tYXBfc2l6ZSA9IChzdXBwbHkgKyBVSW50NjQoNykpIC8vIFVJbnQ2NCg4KQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDcgLy8gNwogICAgKwogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjAzCiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShiInNtXyIgKyBvcC5pdG9iKHRpZXJfaWQpLCBzZWF0X21hcF9zaXplKSwgIkZhaWxlZCB0byBjcmVhdGUgc2VhdCBtYXAiCiAgICBieXRlYyAxNiAvLyAweDczNmQ1ZgogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgc3dhcAogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIEZhaWxlZCB0byBjcmVhdGUgc2VhdCBtYXAKCmFkZF90aWVyX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjA1CiAgICAvLyBzZWxmLnRpZXJfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidGllcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzMgLy8gInRpZXJfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMDYKICAgIC8vIHJldHVybiB0aWVyX2lkCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmFkZF90aWVyX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGFkZF90aWVyX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmJ1eV90aWVyX3RpY2tldCh0aWVyX2lkOiB1aW50NjQsIHNlYXQ6IHVpbnQ2NCwgcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CmJ1eV90aWVyX3RpY2tldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjA4LTIwOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgYnV5X3RpZXJfdGlja2V0KHNlbGYsIHRpZXJfaWQ6IFVJbnQ2NCwgc2VhdDogVUludDY0LCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfc2FsZV9hY3RpdmUsICJTYWxlIG5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiaXNfc2FsZV9hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfc2FsZV9hY3RpdmUgZXhpc3RzCiAgICBhc3NlcnQgLy8gU2FsZSBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDwgc2VsZi5zYWxlX2VuZF9kYXRlLCAiVGlja2V0IHNhbGVzIGhhdmUgZW5kZWQiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gInNhbGVfZW5kX2RhdGUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2FsZV9lbmRfZGF0ZSBleGlzdHMKICAgIDwKICAgIGFzc2VydCAvLyBUaWNrZXQgc2FsZXMgaGF2ZSBlbmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMTgKICAgIC8vIGFzc2VydCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8IHNlbGYuZXZlbnRfZGF0ZSwgIkV2ZW50IGhhcyBwYXNzZWQiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZXZlbnRfZGF0ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ldmVudF9kYXRlIGV4aXN0cwogICAgPAogICAgYXNzZXJ0IC8vIEV2ZW50IGhhcyBwYXNzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjE5CiAgICAvLyBhc3NlcnQgdGllcl9pZCA8IHNlbGYudGllcl9jb3VudCwgIlRpZXIgbm90IGZvdW5kIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRpZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGllcl9jb3VudCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMwogICAgPgogICAgYXNzZXJ0IC8vIFRpZXIgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gdGllcl9rZXkgPSBiInRyXyIgKyBvcC5pdG9iKHRpZXJfaWQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgMTEgLy8gMHg3NDcyNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIyMgogICAgLy8gdGllciA9IFRpZXJSZWNvcmQuZnJvbV9ieXRlcyhvcC5Cb3guZ2V0KHRpZXJfa2V5KVswXSkKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMjMKICAgIC8vIHNvbGQgPSB0aWVyLnNvbGQubmF0aXZlCiAgICBkdXAKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMjQKICAgIC8vIGFzc2VydCBzb2xkIDwgdGllci5zdXBwbHkubmF0aXZlLCAiVGllciBzb2xkIG91dCIKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgPgogICAgYXNzZXJ0IC8vIFRpZXIgc29sZCBvdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjI1CiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMjYKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA+PSB0aWVyLnByaWNlLm5hdGl2ZSwgIkluc3VmZmljaWVudCBwYXltZW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjI4CiAgICAvLyBzZWF0X251bWJlciA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjI5CiAgICAvLyBpZiB0aWVyLnNlYXRlZC5uYXRpdmU6CiAgICBwdXNoaW50IDE5MiAvLyAxOTIKICAgIGdldGJpdAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIGJ6IGJ1eV90aWVyX3RpY2tldF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjMwCiAgICAvLyBhc3NlcnQgc2VhdCA8IHRpZXIuc3VwcGx5Lm5hdGl2ZSwgIlNlYXQgbm90IGluIHRpZXIiCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBhc3NlcnQgLy8gU2VhdCBub3QgaW4gdGllcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMzEKICAgIC8vIGFzc2VydCBzZWxmLl9pc19zZWF0X2F2YWlsYWJsZSh0aWVyX2lkLCBzZWF0KSwgIlNlYXQgYWxyZWFkeSB0YWtlbiIKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIF9pc19zZWF0X2F2YWlsYWJsZQogICAgYXNzZXJ0IC8vIFNlYXQgYWxyZWFkeSB0YWtlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMzIKICAgIC8vIHNlYXRfbWFwX2tleSA9IGIic21fIiArIG9wLml0b2IodGllcl9pZCkKICAgIGJ5dGVjIDE2IC8vIDB4NzM2ZDVmCiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gc2VhdF9ieXRlID0gb3AuQm94LmV4dHJhY3Qoc2VhdF9tYXBfa2V5LCBzZWF0IC8vIFVJbnQ2NCg4KSwgMSkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIGR1cDIKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMzQKICAgIC8vIG9wLkJveC5yZXBsYWNlKHNlYXRfbWFwX2tleSwgc2VhdCAvLyBVSW50NjQoOCksIG9wLnNldGJpdF9ieXRlcyhzZWF0X2J5dGUsIHNlYXQgJSBVSW50NjQoOCksIDEpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzIgLy8gOAogICAgJQogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgYm94X3JlcGxhY2UKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfYnVyeSA0CgpidXlfdGllcl90aWNrZXRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyMzctMjM4CiAgICAvLyAjIEJ1bXAgb25seSB0aGUgc29sZCBjb3VudGVyIGZpZWxkIGluIHRoZSB0aWVyIGJveAogICAgLy8gb3AuQm94LnJlcGxhY2UodGllcl9rZXksIFRJRVJfU09MRF9PRkZTRVQsIG9wLml0b2Ioc29sZCArIFVJbnQ2NCgxKSkpCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gc2VsZi50aWVyX3NvbGRfY291bnQgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gInRpZXJfc29sZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWVyX3NvbGRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTQgLy8gInRpZXJfc29sZF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0MAogICAgLy8gc2VsZi51bmlxdWVfYnV5ZXJzICs9IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInVuaXF1ZV9idXllcnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudW5pcXVlX2J1eWVycyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA2IC8vICJ1bmlxdWVfYnV5ZXJzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjQyCiAgICAvLyB0aWNrZXRfYXNzZXRfaWQgPSBzZWxmLl9taW50X3RpY2tldChwYXltZW50LnNlbmRlcikKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBjYWxsc3ViIF9taW50X3RpY2tldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNDMKICAgIC8vIHRpY2tldF9zZWF0ID0gVGlja2V0U2VhdCh0aWVyX2lkPUFSQzRVSW50NjQodGllcl9pZCksIHNlYXQ9QVJDNFVJbnQ2NChzZWF0X251bWJlcikpCiAgICBmcmFtZV9kaWcgNAogICAgaXRvYgogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNDQKICAgIC8vIG9wLkJveC5wdXQoYiJ0a18iICsgb3AuaXRvYih0aWNrZXRfYXNzZXRfaWQpLCB0aWNrZXRfc2VhdC5ieXRlcykKICAgIGRpZyAxCiAgICBpdG9iCiAgICBieXRlYyAxNyAvLyAweDc0NmI1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gcmV0dXJuIHRpY2tldF9hc3NldF9pZAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfdGllcih0aWVyX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfdGllcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjQ3LTI0OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF90aWVyKHNlbGYsIHRpZXJfaWQ6IFVJbnQ2NCkgLT4gVGllclJlY29yZDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNTAKICAgIC8vIGFzc2VydCB0aWVyX2lkIDwgc2VsZi50aWVyX2NvdW50LCAiVGllciBub3QgZm91bmQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidGllcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWVyX2NvdW50IGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBhc3NlcnQgLy8gVGllciBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjUxCiAgICAvLyByZXR1cm4gVGllclJlY29yZC5mcm9tX2J5dGVzKG9wLkJveC5nZXQoYiJ0cl8iICsgb3AuaXRvYih0aWVyX2lkKSlbMF0pCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDExIC8vIDB4NzQ3MjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHBvcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X3RpZXJzKCkgLT4gYnl0ZXM6CmdldF90aWVyczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjUzLTI1NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF90aWVycyhzZWxmKSAtPiBEeW5hbWljQXJyYXlbVGllclJlY29yZF06CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjU2CiAgICAvLyBwYWNrZWQgPSBCeXRlcygpCiAgICBwdXNoYnl0ZXMgMHgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjU3CiAgICAvLyBmb3IgdGllcl9pZCBpbiB1cmFuZ2Uoc2VsZi50aWVyX2NvdW50KToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0aWVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpZXJfY291bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAoKZ2V0X3RpZXJzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjU3CiAgICAvLyBmb3IgdGllcl9pZCBpbiB1cmFuZ2Uoc2VsZi50aWVyX2NvdW50KToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogZ2V0X3RpZXJzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gcGFja2VkICs9IG9wLkJveC5nZXQoYiJ0cl8iICsgb3AuaXRvYih0aWVyX2lkKSlbMF0KICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjIDExIC8vIDB4NzQ3MjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHBvcAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gZm9yIHRpZXJfaWQgaW4gdXJhbmdlKHNlbGYudGllcl9jb3VudCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGdldF90aWVyc19mb3JfaGVhZGVyQDEKCmdldF90aWVyc19hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjU5CiAgICAvLyByZXR1cm4gRHluYW1pY0FycmF5W1RpZXJSZWNvcmRdLmZyb21fYnl0ZXMoQVJDNFVJbnQxNihzZWxmLnRpZXJfY291bnQpLmJ5dGVzICsgcGFja2VkKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRpZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGllcl9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5pc19zZWF0X2F2YWlsYWJsZSh0aWVyX2lkOiB1aW50NjQsIHNlYXQ6IHVpbnQ2NCkgLT4gdWludDY0Ogppc19zZWF0X2F2YWlsYWJsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjYxLTI2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGlzX3NlYXRfYXZhaWxhYmxlKHNlbGYsIHRpZXJfaWQ6IFVJbnQ2NCwgc2VhdDogVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gYXNzZXJ0IHRpZXJfaWQgPCBzZWxmLnRpZXJfY291bnQsICJUaWVyIG5vdCBmb3VuZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0aWVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpZXJfY291bnQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgID4KICAgIGFzc2VydCAvLyBUaWVyIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNjUKICAgIC8vIHRpZXIgPSBUaWVyUmVjb3JkLmZyb21fYnl0ZXMob3AuQm94LmdldChiInRyXyIgKyBvcC5pdG9iKHRpZXJfaWQpKVswXSkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWMgMTEgLy8gMHg3NDcyNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgcG9wCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjY2CiAgICAvLyBpZiBub3QgdGllci5zZWF0ZWQubmF0aXZlIG9yIHNlYXQgPj0gdGllci5zdXBwbHkubmF0aXZlOgogICAgcHVzaGludCAxOTIgLy8gMTkyCiAgICBnZXRiaXQKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBieiBpc19zZWF0X2F2YWlsYWJsZV9pZl9ib2R5QDIKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgPD0KICAgIGJ6IGlzX3NlYXRfYXZhaWxhYmxlX2FmdGVyX2lmX2Vsc2VAMwoKaXNfc2VhdF9hdmFpbGFibGVfaWZfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNjcKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKaXNfc2VhdF9hdmFpbGFibGVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNjgKICAgIC8vIHJldHVybiBzZWxmLl9pc19zZWF0X2F2YWlsYWJsZSh0aWVyX2lkLCBzZWF0KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2lzX3NlYXRfYXZhaWxhYmxlCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfdGlja2V0X3NlYXQodGlja2V0X2Fzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfdGlja2V0X3NlYXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI3MC0yNzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfdGlja2V0X3NlYXQoc2VsZiwgdGlja2V0X2Fzc2V0X2lkOiBVSW50NjQpIC0+IFRpY2tldFNlYXQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjczCiAgICAvLyBzZWF0X2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGIidGtfIiArIG9wLml0b2IodGlja2V0X2Fzc2V0X2lkKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgMTcgLy8gMHg3NDZiNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNzQKICAgIC8vIGFzc2VydCBleGlzdHMsICJOb3QgYSB0aWVyZWQgdGlja2V0IgogICAgYXNzZXJ0IC8vIE5vdCBhIHRpZXJlZCB0aWNrZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mjc1CiAgICAvLyByZXR1cm4gVGlja2V0U2VhdC5mcm9tX2J5dGVzKHNlYXRfYnl0ZXMpCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5faXNfc2VhdF9hdmFpbGFibGUodGllcl9pZDogdWludDY0LCBzZWF0OiB1aW50NjQpIC0+IHVpbnQ2NDoKX2lzX3NlYXRfYXZhaWxhYmxlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyNzctMjc4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9pc19zZWF0X2F2YWlsYWJsZShzZWxmLCB0aWVyX2lkOiBVSW50NjQsIHNlYXQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODAKICAgIC8vIHNlYXRfYnl0ZSA9IG9wLkJveC5leHRyYWN0KGIic21fIiArIG9wLml0b2IodGllcl9pZCksIHNlYXQgLy8gVUludDY0KDgpLCAxKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlYyAxNiAvLyAweDczNmQ1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyA4CiAgICAvCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MjgxCiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KHNlYXRfYnl0ZSwgc2VhdCAlIFVJbnQ2NCg4KSkgPT0gVUludDY0KDApCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyA4CiAgICAlCiAgICBnZXRiaXQKICAgICEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLl9taW50X3RpY2tldChidXllcjogYnl0ZXMpIC0+IHVpbnQ2NDoKX21pbnRfdGlja2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODMtMjg0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9taW50X3RpY2tldChzZWxmLCBidXllcjogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI4Ni0yOTYKICAgIC8vIHJldHVybiBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIHRvdGFsPTEsICAjIE5GVCAoMSB1bml0IG9ubHkpCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBhc3NldF9uYW1lPWIiRXZlbnQgVGlja2V0IiwKICAgIC8vICAgICB1bml0X25hbWU9YiJUSVgiLAogICAgLy8gICAgIHVybD1iImlwZnM6Ly9jYW1wdXMtdGlja2V0IiwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1idXllciwgICMgTWFyayB0aGUgYnV5ZXIgaW4gcmVzZXJ2ZSBmaWVsZAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICkuc3VibWl0KCkuY3JlYXRlZF9hc3NldC5pZAogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTIKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5NC0yOTUKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwbiAyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gdXJsPWIiaXBmczovL2NhbXB1cy10aWNrZXQiLAogICAgcHVzaGJ5dGVzIDB4Njk3MDY2NzMzYTJmMmY2MzYxNmQ3MDc1NzMyZDc0Njk2MzZiNjU3NAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVSTAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyOTAKICAgIC8vIHVuaXRfbmFtZT1iIlRJWCIsCiAgICBwdXNoYnl0ZXMgMHg1NDQ5NTgKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODkKICAgIC8vIGFzc2V0X25hbWU9YiJFdmVudCBUaWNrZXQiLAogICAgcHVzaGJ5dGVzIDB4NDU3NjY1NmU3NDIwNTQ2OTYzNmI2NTc0CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weToyODgKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gdG90YWw9MSwgICMgTkZUICgxIHVuaXQgb25seSkKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mjg2CiAgICAvLyByZXR1cm4gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mjg2LTI5NgogICAgLy8gcmV0dXJuIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MSwgICMgTkZUICgxIHVuaXQgb25seSkKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGFzc2V0X25hbWU9YiJFdmVudCBUaWNrZXQiLAogICAgLy8gICAgIHVuaXRfbmFtZT1iIlRJWCIsCiAgICAvLyAgICAgdXJsPWIiaXBmczovL2NhbXB1cy10aWNrZXQiLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPWJ1eWVyLCAgIyBNYXJrIHRoZSBidXllciBpbiByZXNlcnZlIGZpZWxkCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKS5zdWJtaXQoKS5jcmVhdGVkX2Fzc2V0LmlkCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuY2xhaW1fdGlja2V0KHRpY2tldF9hc3NldF9pZDogdWludDY0KSAtPiB2b2lkOgpjbGFpbV90aWNrZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjI5OC0yOTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNsYWltX3RpY2tldChzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMDQtMzA1CiAgICAvLyAjIFZlcmlmeSB0aGlzIGFzc2V0IHdhcyBjcmVhdGVkIGJ5IHRoaXMgY29udHJhY3QgYW5kIGJ1eWVyIGlzIG1hcmtlZAogICAgLy8gcmVzZXJ2ZV9hZGRyLCByZXNlcnZlX2V4aXN0cyA9IG9wLkFzc2V0UGFyYW1zR2V0LmFzc2V0X3Jlc2VydmUodGlja2V0X2Fzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0UmVzZXJ2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMDYKICAgIC8vIGFzc2VydCByZXNlcnZlX2V4aXN0cywgIkFzc2V0IG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBc3NldCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzA3CiAgICAvLyBhc3NlcnQgcmVzZXJ2ZV9hZGRyID09IFR4bi5zZW5kZXIsICJOb3QgeW91ciB0aWNrZXQiCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCB5b3VyIHRpY2tldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMDktMzEwCiAgICAvLyAjIFZlcmlmeSBidXllciBoYXMgb3B0ZWQgaW50byB0aGUgYXNzZXQKICAgIC8vIGJ1eWVyX2JhbGFuY2UsIGJ1eWVyX29wdGVkX2luID0gb3AuQXNzZXRIb2xkaW5nR2V0LmFzc2V0X2JhbGFuY2UoVHhuLnNlbmRlciwgdGlja2V0X2Fzc2V0X2lkKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMTEKICAgIC8vIGFzc2VydCBidXllcl9vcHRlZF9pbiwgIk11c3Qgb3B0LWluIHRvIGFzc2V0IGZpcnN0IgogICAgYXNzZXJ0IC8vIE11c3Qgb3B0LWluIHRvIGFzc2V0IGZpcnN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMxMy0zMTkKICAgIC8vICMgVHJhbnNmZXIgdXNpbmcgY2xhd2JhY2sKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBhc3NldF9zZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9dGlja2V0X2Fzc2V0X2lkCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gYXNzZXRfc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMTYKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMxNwogICAgLy8gYXNzZXRfYW1vdW50PTEsCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMxMy0zMTQKICAgIC8vICMgVHJhbnNmZXIgdXNpbmcgY2xhd2JhY2sKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMxMy0zMTkKICAgIC8vICMgVHJhbnNmZXIgdXNpbmcgY2xhd2JhY2sKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBhc3NldF9zZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9dGlja2V0X2Fzc2V0X2lkCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcudmVyaWZ5X2VudHJ5KHRpY2tldF9ob2xkZXI6IGJ5dGVzLCB0aWNrZXRfYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp2ZXJpZnlfZW50cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMyMS0zMjIKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHZlcmlmeV9lbnRyeShzZWxmLCB0aWNrZXRfaG9sZGVyOiBBY2NvdW50LCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMgogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzI4LTMyOQogICAgLy8gIyBDaGVjayBpZiBzZW5kZXIgaXMgY3JlYXRvciBvciBvbmUgb2YgdGhlIG9yZ2FuaXplcnMKICAgIC8vIHNlbmRlciA9IFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMzAKICAgIC8vIGlzX2F1dGhvcml6ZWQgPSBzZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMzItMzMzCiAgICAvLyAjIENoZWNrIG9yZ2FuaXplcnMgZnJvbSBib3ggc3RvcmFnZQogICAgLy8gaWYgbm90IGlzX2F1dGhvcml6ZWQ6CiAgICBibnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzM0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDUKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXplcl9jb3VudCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCnZlcmlmeV9lbnRyeV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMzNAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYub3JnYW5pemVyX2NvdW50KToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2J1cnkgOAogICAgYnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzM1CiAgICAvLyBib3hfa2V5ID0gYiJvcmdfIiArIG9wLml0b2IoaSkKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAweDZmNzI2NzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzM2CiAgICAvLyBvcmdhbml6ZXJfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoYm94X2tleSkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMzcKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IHZlcmlmeV9lbnRyeV9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzM4CiAgICAvLyBvcmdhbml6ZXIgPSBBY2NvdW50KG9yZ2FuaXplcl9ieXRlcykKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjMzOQogICAgLy8gaWYgc2VuZGVyID09IG9yZ2FuaXplcjoKICAgIGZyYW1lX2RpZyA2CiAgICA9PQogICAgYnogdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNDAKICAgIC8vIGlzX2F1dGhvcml6ZWQgPSBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSA4Cgp2ZXJpZnlfZW50cnlfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gYXNzZXJ0IGlzX2F1dGhvcml6ZWQsICJPbmx5IGNyZWF0b3Igb3Igb3JnYW5pemVycyBjYW4gdmVyaWZ5IgogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBvciBvcmdhbml6ZXJzIGNhbiB2ZXJpZnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzQ0CiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gc2VsZi5ldmVudF9kYXRlICsgVUludDY0KDg2NDAwKSwgIkV2ZW50IHZlcmlmaWNhdGlvbiBwZXJpb2QgZW5kZWQiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZXZlbnRfZGF0ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ldmVudF9kYXRlIGV4aXN0cwogICAgcHVzaGludCA4NjQwMCAvLyA4NjQwMAogICAgKwogICAgPD0KICAgIGFzc2VydCAvLyBFdmVudCB2ZXJpZmljYXRpb24gcGVyaW9kIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM0Ni0zNDcKICAgIC8vICMgQ2hlY2sgdGlja2V0X2hvbGRlciBvd25zIHRoZSBORlQKICAgIC8vIGhvbGRlcl9iYWxhbmNlLCBob2xkZXJfZXhpc3RzID0gb3AuQXNzZXRIb2xkaW5nR2V0LmFzc2V0X2JhbGFuY2UodGlja2V0X2hvbGRlciwgdGlja2V0X2Fzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgc3dhcAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gYXNzZXJ0IGhvbGRlcl9leGlzdHMgYW5kIGhvbGRlcl9iYWxhbmNlID09IFVJbnQ2NCgxKSwgIlRpY2tldCBub3Qgb3duZWQgYnkgaG9sZGVyIgogICAgYnogdmVyaWZ5X2VudHJ5X2Jvb2xfZmFsc2VAMTMKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IHZlcmlmeV9lbnRyeV9ib29sX2ZhbHNlQDEzCiAgICBpbnRjXzEgLy8gMQoKdmVyaWZ5X2VudHJ5X2Jvb2xfbWVyZ2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gYXNzZXJ0IGhvbGRlcl9leGlzdHMgYW5kIGhvbGRlcl9iYWxhbmNlID09IFVJbnQ2NCgxKSwgIlRpY2tldCBub3Qgb3duZWQgYnkgaG9sZGVyIgogICAgYXNzZXJ0IC8vIFRpY2tldCBub3Qgb3duZWQgYnkgaG9sZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM1MC0zNTEKICAgIC8vICMgQ2hlY2sgdGlja2V0IGhhc24ndCBiZWVuIHVzZWQgKGNyZWF0ZSBib3ggaWYgZmlyc3QgdGltZSkKICAgIC8vIGJveF9rZXkgPSBvcC5pdG9iKHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzUyCiAgICAvLyB0aWNrZXRfc3RhdHVzLCBib3hfZXhpc3RzID0gb3AuQm94LmdldChib3hfa2V5KQogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gaWYgYm94X2V4aXN0czoKICAgIGJ6IHZlcmlmeV9lbnRyeV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM1NS0zNTYKICAgIC8vICMgQm94IGV4aXN0cyAtIGNoZWNrIGlmIGFscmVhZHkgdXNlZAogICAgLy8gYXNzZXJ0IG9wLmV4dHJhY3RfdWludDY0KHRpY2tldF9zdGF0dXMsIDApID09IFVJbnQ2NCgwKSwgIlRpY2tldCBhbHJlYWR5IHVzZWQiCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICAhCiAgICBhc3NlcnQgLy8gVGlja2V0IGFscmVhZHkgdXNlZAoKdmVyaWZ5X2VudHJ5X2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM1OC0zNTkKICAgIC8vICMgTWFyayBhcyBjaGVja2VkLWluIChjcmVhdGVzIGJveCBpZiBkb2Vzbid0IGV4aXN0KQogICAgLy8gb3AuQm94LnB1dChib3hfa2V5LCBvcC5pdG9iKFVJbnQ2NCgxKSkpCiAgICBpbnRjXzEgLy8gMQogICAgaXRvYgogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzYxCiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgp2ZXJpZnlfZW50cnlfYm9vbF9mYWxzZUAxMzoKICAgIGludGNfMCAvLyAwCiAgICBiIHZlcmlmeV9lbnRyeV9ib29sX21lcmdlQDE0Cgp2ZXJpZnlfZW50cnlfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozMzQKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9yZ2FuaXplcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiB2ZXJpZnlfZW50cnlfZm9yX2hlYWRlckAyCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuaXNfY2hlY2tlZF9pbih0aWNrZXRfYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0Ogppc19jaGVja2VkX2luOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNjMtMzY0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgaXNfY2hlY2tlZF9pbihzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNjYKICAgIC8vIHJldHVybiBzZWxmLl9pc19jaGVja2VkX2luKHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfaXNfY2hlY2tlZF9pbgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X3RpY2tldF9zdGF0dXNfYmF0Y2goYXNzZXRfaWRzOiBieXRlcykgLT4gYnl0ZXM6CmdldF90aWNrZXRfc3RhdHVzX2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNjgtMzY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3RpY2tldF9zdGF0dXNfYmF0Y2goc2VsZiwgYXNzZXRfaWRzOiBEeW5hbWljQXJyYXlbQVJDNFVJbnQ2NF0pIC0+IER5bmFtaWNBcnJheVtUaWNrZXRTdGF0dXNdOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM3NgogICAgLy8gcGFja2VkID0gQnl0ZXMoKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM3NwogICAgLy8gZm9yIGFzc2V0X2lkIGluIGFzc2V0X2lkczoKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAoKZ2V0X3RpY2tldF9zdGF0dXNfYmF0Y2hfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNzcKICAgIC8vIGZvciBhc3NldF9pZCBpbiBhc3NldF9pZHM6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIDwKICAgIGJ6IGdldF90aWNrZXRfc3RhdHVzX2JhdGNoX2FmdGVyX2ZvckA2CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18yIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mzc4CiAgICAvLyB0aWNrZXRfYXNzZXRfaWQgPSBhc3NldF9pZC5uYXRpdmUKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozNzkKICAgIC8vIG93bmVyLCBhc3NldF9leGlzdHMgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9yZXNlcnZlKHRpY2tldF9hc3NldF9pZCkKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRSZXNlcnZlCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6MzgwCiAgICAvLyBpZiBub3QgYXNzZXRfZXhpc3RzOgogICAgYm56IGdldF90aWNrZXRfc3RhdHVzX2JhdGNoX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozODEKICAgIC8vIG93bmVyID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBmcmFtZV9idXJ5IDAKCmdldF90aWNrZXRfc3RhdHVzX2JhdGNoX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mzg0CiAgICAvLyBjaGVja2VkX2luPUFSQzRCb29sKHNlbGYuX2lzX2NoZWNrZWRfaW4odGlja2V0X2Fzc2V0X2lkKSksCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjYWxsc3ViIF9pc19jaGVja2VkX2luCiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozODUKICAgIC8vIHRyYW5zZmVyX2NvdW50PUFSQzRVSW50NjQoc2VsZi5fdHJhbnNmZXJfY291bnQodGlja2V0X2Fzc2V0X2lkKSksCiAgICBzd2FwCiAgICBjYWxsc3ViIF90cmFuc2Zlcl9jb3VudAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozODMtMzg3CiAgICAvLyByb3cgPSBUaWNrZXRTdGF0dXMoCiAgICAvLyAgICAgY2hlY2tlZF9pbj1BUkM0Qm9vbChzZWxmLl9pc19jaGVja2VkX2luKHRpY2tldF9hc3NldF9pZCkpLAogICAgLy8gICAgIHRyYW5zZmVyX2NvdW50PUFSQzRVSW50NjQoc2VsZi5fdHJhbnNmZXJfY291bnQodGlja2V0X2Fzc2V0X2lkKSksCiAgICAvLyAgICAgb3duZXI9QWRkcmVzcyhvd25lciksCiAgICAvLyApCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6Mzg4CiAgICAvLyBwYWNrZWQgKz0gcm93LmJ5dGVzCiAgICBmcmFtZV9kaWcgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGdldF90aWNrZXRfc3RhdHVzX2JhdGNoX2Zvcl9oZWFkZXJAMQoKZ2V0X3RpY2tldF9zdGF0dXNfYmF0Y2hfYWZ0ZXJfZm9yQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjM5MAogICAgLy8gcmV0dXJuIER5bmFtaWNBcnJheVtUaWNrZXRTdGF0dXNdLmZyb21fYnl0ZXMoQVJDNFVJbnQxNihhc3NldF9pZHMubGVuZ3RoKS5ieXRlcyArIHBhY2tlZCkKICAgIGZyYW1lX2RpZyAzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAyCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuX21heF9yZXNhbGVfcHJpY2UoKSAtPiB1aW50NjQ6Cl9tYXhfcmVzYWxlX3ByaWNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozOTUKICAgIC8vIHJldHVybiBzZWxmLnRpY2tldF9wcmljZSArIHNlbGYudGlja2V0X3ByaWNlIC8vIFVJbnQ2NCgxMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0aWNrZXRfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGlja2V0X3ByaWNlIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInRpY2tldF9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWNrZXRfcHJpY2UgZXhpc3RzCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICAvCiAgICArCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5fdGlja2V0X3Jlc2FsZV9jYXAodGlja2V0X2Fzc2V0X2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKX3RpY2tldF9yZXNhbGVfY2FwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTozOTctMzk4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF90aWNrZXRfcmVzYWxlX2NhcChzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQwMAogICAgLy8gc2VhdF9ieXRlcywgaXNfdGllcmVkID0gb3AuQm94LmdldChiInRrXyIgKyBvcC5pdG9iKHRpY2tldF9hc3NldF9pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDE3IC8vIDB4NzQ2YjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDAxCiAgICAvLyBpZiBub3QgaXNfdGllcmVkOgogICAgYm56IF90aWNrZXRfcmVzYWxlX2NhcF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDAyCiAgICAvLyByZXR1cm4gc2VsZi5fbWF4X3Jlc2FsZV9wcmljZSgpCiAgICBjYWxsc3ViIF9tYXhfcmVzYWxlX3ByaWNlCiAgICBzd2FwCiAgICByZXRzdWIKCl90aWNrZXRfcmVzYWxlX2NhcF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQwMwogICAgLy8gdGllcl9wcmljZSA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QoYiJ0cl8iICsgb3AuZXh0cmFjdChzZWF0X2J5dGVzLCAwLCA4KSwgVElFUl9QUklDRV9PRkZTRVQsIDgpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMCA4CiAgICBieXRlYyAxMSAvLyAweDc0NzI1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQwNAogICAgLy8gcmV0dXJuIHRpZXJfcHJpY2UgKyB0aWVyX3ByaWNlIC8vIFVJbnQ2NCgxMCkKICAgIGR1cAogICAgcHVzaGludCAxMCAvLyAxMAogICAgLwogICAgKwogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuX2lzX2NoZWNrZWRfaW4odGlja2V0X2Fzc2V0X2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKX2lzX2NoZWNrZWRfaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQwNi00MDcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2lzX2NoZWNrZWRfaW4oc2VsZiwgdGlja2V0X2Fzc2V0X2lkOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDA5CiAgICAvLyBib3hfa2V5ID0gb3AuaXRvYih0aWNrZXRfYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDEwCiAgICAvLyB0aWNrZXRfc3RhdHVzLCBib3hfZXhpc3RzID0gb3AuQm94LmdldChib3hfa2V5KQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MTIKICAgIC8vIGlmIG5vdCBib3hfZXhpc3RzOgogICAgYm56IF9pc19jaGVja2VkX2luX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MTMKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKX2lzX2NoZWNrZWRfaW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MTUKICAgIC8vIHJldHVybiBvcC5leHRyYWN0X3VpbnQ2NCh0aWNrZXRfc3RhdHVzLCAwKSA9PSBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcudG9nZ2xlX3NhbGUoKSAtPiB1aW50NjQ6CnRvZ2dsZV9zYWxlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MTctNDE4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB0b2dnbGVfc2FsZShzZWxmKSAtPiBib29sOgogICAgcHJvdG8gMCAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDIwLTQyMQogICAgLy8gIyBDaGVjayBpZiBzZW5kZXIgaXMgY3JlYXRvciBvciBvbmUgb2YgdGhlIG9yZ2FuaXplcnMKICAgIC8vIHNlbmRlciA9IFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MjIKICAgIC8vIGlzX2F1dGhvcml6ZWQgPSBzZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MjQtNDI1CiAgICAvLyAjIENoZWNrIG9yZ2FuaXplcnMgZnJvbSBib3ggc3RvcmFnZQogICAgLy8gaWYgbm90IGlzX2F1dGhvcml6ZWQ6CiAgICBibnogdG9nZ2xlX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MjYKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9yZ2FuaXplcl9jb3VudCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAib3JnYW5pemVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemVyX2NvdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMQoKdG9nZ2xlX3NhbGVfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MjYKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9yZ2FuaXplcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDUKICAgIGJ6IHRvZ2dsZV9zYWxlX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDI3CiAgICAvLyBib3hfa2V5ID0gYiJvcmdfIiArIG9wLml0b2IoaSkKICAgIGZyYW1lX2RpZyAxCiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAweDZmNzI2NzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDI4CiAgICAvLyBvcmdhbml6ZXJfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoYm94X2tleSkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MjkKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IHRvZ2dsZV9zYWxlX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0MzAKICAgIC8vIG9yZ2FuaXplciA9IEFjY291bnQob3JnYW5pemVyX2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDMxCiAgICAvLyBpZiBzZW5kZXIgPT0gb3JnYW5pemVyOgogICAgZnJhbWVfZGlnIDMKICAgID09CiAgICBieiB0b2dnbGVfc2FsZV9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDMyCiAgICAvLyBpc19hdXRob3JpemVkID0gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgNQoKdG9nZ2xlX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQzNQogICAgLy8gYXNzZXJ0IGlzX2F1dGhvcml6ZWQsICJPbmx5IGNyZWF0b3Igb3Igb3JnYW5pemVycyBjYW4gdG9nZ2xlIgogICAgYXNzZXJ0IC8vIE9ubHkgY3JlYXRvciBvciBvcmdhbml6ZXJzIGNhbiB0b2dnbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDM2CiAgICAvLyBzZWxmLmlzX3NhbGVfYWN0aXZlID0gbm90IHNlbGYuaXNfc2FsZV9hY3RpdmUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJpc19zYWxlX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19zYWxlX2FjdGl2ZSBleGlzdHMKICAgICEKICAgIGJ5dGVjIDUgLy8gImlzX3NhbGVfYWN0aXZlIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDM3CiAgICAvLyByZXR1cm4gc2VsZi5pc19zYWxlX2FjdGl2ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImlzX3NhbGVfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3NhbGVfYWN0aXZlIGV4aXN0cwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnRvZ2dsZV9zYWxlX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDI2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgdG9nZ2xlX3NhbGVfZm9yX2hlYWRlckAyCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X2V2ZW50X2luZm8oKSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9ldmVudF9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NDQKICAgIC8vIHNlbGYudGlja2V0X3ByaWNlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInRpY2tldF9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50aWNrZXRfcHJpY2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ0NQogICAgLy8gc2VsZi5tYXhfc3VwcGx5LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJtYXhfc3VwcGx5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9zdXBwbHkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ0NgogICAgLy8gc2VsZi5zb2xkX2NvdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInNvbGRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc29sZF9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDQ3CiAgICAvLyBzZWxmLmV2ZW50X2RhdGUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZXZlbnRfZGF0ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ldmVudF9kYXRlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NDgKICAgIC8vIHNlbGYuc2FsZV9lbmRfZGF0ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAic2FsZV9lbmRfZGF0ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zYWxlX2VuZF9kYXRlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NDkKICAgIC8vIHNlbGYudW5pcXVlX2J1eWVycywKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJ1bmlxdWVfYnV5ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXF1ZV9idXllcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ1MAogICAgLy8gc2VsZi5pc19zYWxlX2FjdGl2ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImlzX3NhbGVfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3NhbGVfYWN0aXZlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NDMtNDUxCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHNlbGYudGlja2V0X3ByaWNlLAogICAgLy8gICAgIHNlbGYubWF4X3N1cHBseSwKICAgIC8vICAgICBzZWxmLnNvbGRfY291bnQsCiAgICAvLyAgICAgc2VsZi5ldmVudF9kYXRlLAogICAgLy8gICAgIHNlbGYuc2FsZV9lbmRfZGF0ZSwKICAgIC8vICAgICBzZWxmLnVuaXF1ZV9idXllcnMsCiAgICAvLyAgICAgc2VsZi5pc19zYWxlX2FjdGl2ZQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X2V2ZW50X3NuYXBzaG90KCkgLT4gYnl0ZXM6CmdldF9ldmVudF9zbmFwc2hvdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDUzLTQ1NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9ldmVudF9zbmFwc2hvdChzZWxmKSAtPiBFdmVudFNuYXBzaG90OgogICAgcHJvdG8gMCAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ2MAogICAgLy8gb3JnYW5pemVycyA9IER5bmFtaWNBcnJheVtBZGRyZXNzXSgpCiAgICBieXRlYyAxOCAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDYxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAoKZ2V0X2V2ZW50X3NuYXBzaG90X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDYxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBieiBnZXRfZXZlbnRfc25hcHNob3RfYWZ0ZXJfZm9yQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDYyCiAgICAvLyBib3hfa2V5ID0gYiJvcmdfIiArIG9wLml0b2IoaSkKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAweDZmNzI2NzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDYzCiAgICAvLyBvcmdhbml6ZXJfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoYm94X2tleSkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NjQKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF9ldmVudF9zbmFwc2hvdF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDY1CiAgICAvLyBvcmdhbml6ZXJzLmFwcGVuZChBZGRyZXNzKG9yZ2FuaXplcl9ieXRlcykpCiAgICBmcmFtZV9kaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQoKZ2V0X2V2ZW50X3NuYXBzaG90X2FmdGVyX2lmX2Vsc2VANDoKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDYxCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc2VsZi5vcmdhbml6ZXJfY291bnQpOgogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgZ2V0X2V2ZW50X3NuYXBzaG90X2Zvcl9oZWFkZXJAMQoKZ2V0X2V2ZW50X3NuYXBzaG90X2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NjgKICAgIC8vIHRpY2tldF9wcmljZT1BUkM0VUludDY0KHNlbGYudGlja2V0X3ByaWNlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0aWNrZXRfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGlja2V0X3ByaWNlIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NjkKICAgIC8vIG1heF9zdXBwbHk9QVJDNFVJbnQ2NChzZWxmLm1heF9zdXBwbHkpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJtYXhfc3VwcGx5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9zdXBwbHkgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gc29sZF9jb3VudD1BUkM0VUludDY0KHNlbGYuc29sZF9jb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAic29sZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zb2xkX2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NzEKICAgIC8vIHRpZXJfc29sZF9jb3VudD1BUkM0VUludDY0KHNlbGYudGllcl9zb2xkX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAidGllcl9zb2xkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRpZXJfc29sZF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDcyCiAgICAvLyBldmVudF9kYXRlPUFSQzRVSW50NjQoc2VsZi5ldmVudF9kYXRlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJldmVudF9kYXRlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmV2ZW50X2RhdGUgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ3MwogICAgLy8gc2FsZV9lbmRfZGF0ZT1BUkM0VUludDY0KHNlbGYuc2FsZV9lbmRfZGF0ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gInNhbGVfZW5kX2RhdGUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2FsZV9lbmRfZGF0ZSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDc0CiAgICAvLyB1bmlxdWVfYnV5ZXJzPUFSQzRVSW50NjQoc2VsZi51bmlxdWVfYnV5ZXJzKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJ1bmlxdWVfYnV5ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnVuaXF1ZV9idXllcnMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gaXNfc2FsZV9hY3RpdmU9QVJDNEJvb2woc2VsZi5pc19zYWxlX2FjdGl2ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiaXNfc2FsZV9hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfc2FsZV9hY3RpdmUgZXhpc3RzCiAgICBieXRlY18xIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NzYKICAgIC8vIG1heF9yZXNhbGVfcHJpY2U9QVJDNFVJbnQ2NChzZWxmLl9tYXhfcmVzYWxlX3ByaWNlKCkpLAogICAgY2FsbHN1YiBfbWF4X3Jlc2FsZV9wcmljZQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0NzcKICAgIC8vIGNyZWF0b3I9QWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDc4CiAgICAvLyBvcmdhbml6ZXJfY291bnQ9QVJDNFVJbnQ2NChzZWxmLm9yZ2FuaXplcl9jb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAib3JnYW5pemVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9yZ2FuaXplcl9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDY3LTQ4MAogICAgLy8gcmV0dXJuIEV2ZW50U25hcHNob3QoCiAgICAvLyAgICAgdGlja2V0X3ByaWNlPUFSQzRVSW50NjQoc2VsZi50aWNrZXRfcHJpY2UpLAogICAgLy8gICAgIG1heF9zdXBwbHk9QVJDNFVJbnQ2NChzZWxmLm1heF9zdXBwbHkpLAogICAgLy8gICAgIHNvbGRfY291bnQ9QVJDNFVJbnQ2NChzZWxmLnNvbGRfY291bnQpLAogICAgLy8gICAgIHRpZXJfc29sZF9jb3VudD1BUkM0VUludDY0KHNlbGYudGllcl9zb2xkX2NvdW50KSwKICAgIC8vICAgICBldmVudF9kYXRlPUFSQzRVSW50NjQoc2VsZi5ldmVudF9kYXRlKSwKICAgIC8vICAgICBzYWxlX2VuZF9kYXRlPUFSQzRVSW50NjQoc2VsZi5zYWxlX2VuZF9kYXRlKSwKICAgIC8vICAgICB1bmlxdWVfYnV5ZXJzPUFSQzRVSW50NjQoc2VsZi51bmlxdWVfYnV5ZXJzKSwKICAgIC8vICAgICBpc19zYWxlX2FjdGl2ZT1BUkM0Qm9vbChzZWxmLmlzX3NhbGVfYWN0aXZlKSwKICAgIC8vICAgICBtYXhfcmVzYWxlX3ByaWNlPUFSQzRVSW50NjQoc2VsZi5fbWF4X3Jlc2FsZV9wcmljZSgpKSwKICAgIC8vICAgICBjcmVhdG9yPUFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIC8vICAgICBvcmdhbml6ZXJfY291bnQ9QVJDNFVJbnQ2NChzZWxmLm9yZ2FuaXplcl9jb3VudCksCiAgICAvLyAgICAgb3JnYW5pemVycz1vcmdhbml6ZXJzLmNvcHkoKSwKICAgIC8vICkKICAgIHVuY292ZXIgMTAKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwNmIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDIKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfb3JnYW5pemVyKCkgLT4gYnl0ZXM6CmdldF9vcmdhbml6ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gcmV0dXJuIEFkZHJlc3Moc2VsZi5jcmVhdG9yKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmdldF9vcmdhbml6ZXJfYnlfaW5kZXgoaW5kZXg6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9vcmdhbml6ZXJfYnlfaW5kZXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ4Ny00ODgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfb3JnYW5pemVyX2J5X2luZGV4KHNlbGYsIGluZGV4OiBVSW50NjQpIC0+IEFkZHJlc3M6CiAgICBwcm90byAxIDEKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ5MwogICAgLy8gaWYgaW5kZXggPj0gc2VsZi5vcmdhbml6ZXJfY291bnQ6CiAgICBkdXAKICAgIGJ5dGVjXzIgLy8gIm9yZ2FuaXplcl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcmdhbml6ZXJfY291bnQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIDw9CiAgICBieiBnZXRfb3JnYW5pemVyX2J5X2luZGV4X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0OTQKICAgIC8vIHJldHVybiBBZGRyZXNzKCkgICMgUmV0dXJuIHplcm8gYWRkcmVzcwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9vcmdhbml6ZXJfYnlfaW5kZXhfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo0OTYKICAgIC8vIGJveF9rZXkgPSBiIm9yZ18iICsgb3AuaXRvYihpbmRleCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgMTAgLy8gMHg2ZjcyNjc1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjQ5NwogICAgLy8gb3JnYW5pemVyX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGJveF9rZXkpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NDk5CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBnZXRfb3JnYW5pemVyX2J5X2luZGV4X2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MDAKICAgIC8vIHJldHVybiBBZGRyZXNzKG9yZ2FuaXplcl9ieXRlcykKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBzd2FwCiAgICByZXRzdWIKCmdldF9vcmdhbml6ZXJfYnlfaW5kZXhfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MDEKICAgIC8vIHJldHVybiBBZGRyZXNzKCkgICMgUmV0dXJuIHplcm8gYWRkcmVzcyBpZiBub3QgZm91bmQKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X29yZ2FuaXplcl9jb3VudCgpIC0+IHVpbnQ2NDoKZ2V0X29yZ2FuaXplcl9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTA2CiAgICAvLyByZXR1cm4gc2VsZi5vcmdhbml6ZXJfY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJvcmdhbml6ZXJfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemVyX2NvdW50IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuaXNfb3JnYW5pemVyKGFkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CmlzX29yZ2FuaXplcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTA4LTUwOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGlzX29yZ2FuaXplcihzZWxmLCBhZGRyZXNzOiBBZGRyZXNzKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTEzCiAgICAvLyBpZiBhY2NvdW50ID09IHNlbGYuY3JlYXRvcjoKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBpc19vcmdhbml6ZXJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUxNAogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNfb3JnYW5pemVyX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTE2LTUxNwogICAgLy8gIyBDaGVjayBvcmdhbml6ZXJzIGZyb20gYm94IHN0b3JhZ2UKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9yZ2FuaXplcl9jb3VudCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAib3JnYW5pemVyX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3JnYW5pemVyX2NvdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMQoKaXNfb3JnYW5pemVyX2Zvcl9oZWFkZXJAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTE2LTUxNwogICAgLy8gIyBDaGVjayBvcmdhbml6ZXJzIGZyb20gYm94IHN0b3JhZ2UKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9yZ2FuaXplcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGlzX29yZ2FuaXplcl9hZnRlcl9mb3JAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTE4CiAgICAvLyBib3hfa2V5ID0gYiJvcmdfIiArIG9wLml0b2IoaSkKICAgIGZyYW1lX2RpZyAxCiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAweDZmNzI2NzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTE5CiAgICAvLyBvcmdhbml6ZXJfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoYm94X2tleSkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MjAKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGlzX29yZ2FuaXplcl9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTIxCiAgICAvLyBvcmdhbml6ZXIgPSBBY2NvdW50KG9yZ2FuaXplcl9ieXRlcykKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUyMgogICAgLy8gaWYgYWNjb3VudCA9PSBvcmdhbml6ZXI6CiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBpc19vcmdhbml6ZXJfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUyMwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKaXNfb3JnYW5pemVyX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTE2LTUxNwogICAgLy8gIyBDaGVjayBvcmdhbml6ZXJzIGZyb20gYm94IHN0b3JhZ2UKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLm9yZ2FuaXplcl9jb3VudCk6CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBpc19vcmdhbml6ZXJfZm9yX2hlYWRlckAzCgppc19vcmdhbml6ZXJfYWZ0ZXJfZm9yQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1MjUKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcudHJhbnNmZXJfdGlja2V0KHRpY2tldF9hc3NldF9pZDogdWludDY0LCBuZXdfb3duZXI6IGJ5dGVzLCBzYWxlX3ByaWNlOiB1aW50NjQsIHBheW1lbnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp0cmFuc2Zlcl90aWNrZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjUyOS01MzYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHRyYW5zZmVyX3RpY2tldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHRpY2tldF9hc3NldF9pZDogVUludDY0LAogICAgLy8gICAgIG5ld19vd25lcjogQWNjb3VudCwKICAgIC8vICAgICBzYWxlX3ByaWNlOiBVSW50NjQsCiAgICAvLyAgICAgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byA0IDEKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIHB1c2hieXRlcyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU0NS01NDYKICAgIC8vICMg4pSA4pSAIFByaWNlIGNhcDogbWF4IHJlc2FsZSA9IG9yaWdpbmFsIHByaWNlICsgb3JpZ2luYWwgcHJpY2UgLyAxMCAoMTEwJSkg4pSA4pSACiAgICAvLyBhc3NlcnQgc2FsZV9wcmljZSA8PSBzZWxmLl90aWNrZXRfcmVzYWxlX2NhcCh0aWNrZXRfYXNzZXRfaWQpLCAiUmVzYWxlIHByaWNlIGV4Y2VlZHMgMTEwJSBjYXAiCiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgX3RpY2tldF9yZXNhbGVfY2FwCiAgICBmcmFtZV9kaWcgLTIKICAgID49CiAgICBhc3NlcnQgLy8gUmVzYWxlIHByaWNlIGV4Y2VlZHMgMTEwJSBjYXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTQ4LTU0OQogICAgLy8gIyDilIDilIAgVmVyaWZ5IHBheW1lbnQgbWF0Y2hlcyB0aGUgc2FsZV9wcmljZSBhbmQgZ29lcyB0byBzZWxsZXIg4pSA4pSACiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gc2FsZV9wcmljZSwgIlBheW1lbnQgbGVzcyB0aGFuIHNhbGUgcHJpY2UiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICA+PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbGVzcyB0aGFuIHNhbGUgcHJpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTUwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBUeG4uc2VuZGVyLCAiUGF5bWVudCBtdXN0IGdvIHRvIHNlbGxlciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGdvIHRvIHNlbGxlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NTQKICAgIC8vIFR4bi5zZW5kZXIsIHRpY2tldF9hc3NldF9pZAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NTItNTU1CiAgICAvLyAjIOKUgOKUgCBWZXJpZnkgc2VsbGVyIGFjdHVhbGx5IGhvbGRzIHRoZSB0aWNrZXQgTkZUIOKUgOKUgAogICAgLy8gc2VsbGVyX2JhbGFuY2UsIHNlbGxlcl9vcHRlZCA9IG9wLkFzc2V0SG9sZGluZ0dldC5hc3NldF9iYWxhbmNlKAogICAgLy8gICAgIFR4bi5zZW5kZXIsIHRpY2tldF9hc3NldF9pZAogICAgLy8gKQogICAgZnJhbWVfZGlnIC00CiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTU2CiAgICAvLyBhc3NlcnQgc2VsbGVyX29wdGVkIGFuZCBzZWxsZXJfYmFsYW5jZSA9PSBVSW50NjQoMSksICJTZWxsZXIgZG9lcyBub3QgaG9sZCB0aWNrZXQiCiAgICBieiB0cmFuc2Zlcl90aWNrZXRfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiB0cmFuc2Zlcl90aWNrZXRfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKdHJhbnNmZXJfdGlja2V0X2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTU2CiAgICAvLyBhc3NlcnQgc2VsbGVyX29wdGVkIGFuZCBzZWxsZXJfYmFsYW5jZSA9PSBVSW50NjQoMSksICJTZWxsZXIgZG9lcyBub3QgaG9sZCB0aWNrZXQiCiAgICBhc3NlcnQgLy8gU2VsbGVyIGRvZXMgbm90IGhvbGQgdGlja2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU1OC01NjEKICAgIC8vICMg4pSA4pSAIFZlcmlmeSBidXllciBoYXMgb3B0ZWQgaW50byB0aGUgYXNzZXQg4pSA4pSACiAgICAvLyBidXllcl9iYWxhbmNlLCBidXllcl9vcHRlZCA9IG9wLkFzc2V0SG9sZGluZ0dldC5hc3NldF9iYWxhbmNlKAogICAgLy8gICAgIG5ld19vd25lciwgdGlja2V0X2Fzc2V0X2lkCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtNAogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTYyCiAgICAvLyBhc3NlcnQgYnV5ZXJfb3B0ZWQsICJCdXllciBtdXN0IG9wdC1pbiB0byBhc3NldCBmaXJzdCIKICAgIGFzc2VydCAvLyBCdXllciBtdXN0IG9wdC1pbiB0byBhc3NldCBmaXJzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NjQtNTY1CiAgICAvLyAjIOKUgOKUgCBWZXJpZnkgdGlja2V0IGhhcyBOT1QgYWxyZWFkeSBiZWVuIHVzZWQgZm9yIGVudHJ5IOKUgOKUgAogICAgLy8gY2hlY2tpbl9rZXkgPSBvcC5pdG9iKHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTY2CiAgICAvLyBjaGVja2luX3N0YXR1cywgY2hlY2tpbl9leGlzdHMgPSBvcC5Cb3guZ2V0KGNoZWNraW5fa2V5KQogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU2NwogICAgLy8gaWYgY2hlY2tpbl9leGlzdHM6CiAgICBieiB0cmFuc2Zlcl90aWNrZXRfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU2OAogICAgLy8gYXNzZXJ0IG9wLmV4dHJhY3RfdWludDY0KGNoZWNraW5fc3RhdHVzLCAwKSA9PSBVSW50NjQoMCksICJUaWNrZXQgYWxyZWFkeSB1c2VkIgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgIQogICAgYXNzZXJ0IC8vIFRpY2tldCBhbHJlYWR5IHVzZWQKCnRyYW5zZmVyX3RpY2tldF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU3MC01NzYKICAgIC8vICMg4pSA4pSAIENsYXdiYWNrLXRyYW5zZmVyIE5GVCBmcm9tIHNlbGxlciDihpIgYnV5ZXIg4pSA4pSACiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9bmV3X293bmVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9dGlja2V0X2Fzc2V0X2lkLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NzIKICAgIC8vIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC00CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NzQKICAgIC8vIGFzc2V0X2Ftb3VudD0xLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU3MC01NzEKICAgIC8vICMg4pSA4pSAIENsYXdiYWNrLXRyYW5zZmVyIE5GVCBmcm9tIHNlbGxlciDihpIgYnV5ZXIg4pSA4pSACiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NzAtNTc2CiAgICAvLyAjIOKUgOKUgCBDbGF3YmFjay10cmFuc2ZlciBORlQgZnJvbSBzZWxsZXIg4oaSIGJ1eWVyIOKUgOKUgAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPW5ld19vd25lciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MSwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXRpY2tldF9hc3NldF9pZCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU3OC01ODUKICAgIC8vICMg4pSA4pSAIFVwZGF0ZSB0aGUgcmVzZXJ2ZSBmaWVsZCB0byByZWZsZWN0IG5ldyBvd25lciDilIDilIAKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PXRpY2tldF9hc3NldF9pZCwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1uZXdfb3duZXIsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTgxCiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1ODMtNTg0CiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NzgtNTc5CiAgICAvLyAjIOKUgOKUgCBVcGRhdGUgdGhlIHJlc2VydmUgZmllbGQgdG8gcmVmbGVjdCBuZXcgb3duZXIg4pSA4pSACiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1NzgtNTg1CiAgICAvLyAjIOKUgOKUgCBVcGRhdGUgdGhlIHJlc2VydmUgZmllbGQgdG8gcmVmbGVjdCBuZXcgb3duZXIg4pSA4pSACiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGNvbmZpZ19hc3NldD10aWNrZXRfYXNzZXRfaWQsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9bmV3X293bmVyLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo1ODctNTkxCiAgICAvLyAjIOKUgOKUgCBBcHBlbmQgc2FsZSB0byB0aGUgdGlja2V0J3MgaGlzdG9yeSBib3ggZm9yIHByb3ZlbmFuY2Ug4pSA4pSACiAgICAvLyAjIE9uZSBib3ggcGVyIHRpY2tldDogaGVhZGVyIGNvdW50KDgpIGZvbGxvd2VkIGJ5IDgwLWJ5dGUgU2FsZVJlY29yZHMuCiAgICAvLyAjIFRoZSBib3ggaXMgZ3Jvd24gaW4gcGxhY2Ugd2l0aCBib3hfcmVzaXplLCBzbyBlYWNoIHJlc2FsZSBjb3N0cyBvbmUKICAgIC8vICMgYm94IHdyaXRlIGluc3RlYWQgb2YgYSBuZXcgYm94IHBsdXMgYSBzZXBhcmF0ZSBjb3VudGVyIGJveC4KICAgIC8vIGhpc3Rvcnlfa2V5ID0gYiJzaF8iICsgb3AuaXRvYih0aWNrZXRfYXNzZXRfaWQpCiAgICBieXRlYyAxNSAvLyAweDczNjg1ZgogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTkyCiAgICAvLyBoaXN0b3J5X2xlbmd0aCwgaGlzdG9yeV9leGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGhpc3Rvcnlfa2V5KQogICAgYm94X2xlbgogICAgc3dhcAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU5MwogICAgLy8gdHJhbnNmZXJfaW5kZXggPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTk0CiAgICAvLyBpZiBoaXN0b3J5X2V4aXN0czoKICAgIGJ6IHRyYW5zZmVyX3RpY2tldF9lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTk1CiAgICAvLyB0cmFuc2Zlcl9pbmRleCA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QoaGlzdG9yeV9rZXksIDAsIEhJU1RPUllfSEVBREVSX1NJWkUpKQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgZnJhbWVfYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU5NgogICAgLy8gb3AuQm94LnJlc2l6ZShoaXN0b3J5X2tleSwgaGlzdG9yeV9sZW5ndGggKyBTQUxFX1JFQ09SRF9TSVpFKQogICAgZnJhbWVfZGlnIDMKICAgIHB1c2hpbnQgODAgLy8gODAKICAgICsKICAgIGJveF9yZXNpemUKCnRyYW5zZmVyX3RpY2tldF9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MDMKICAgIC8vIHNlbGxlcj1BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MDUKICAgIC8vIHByaWNlPUFSQzRVSW50NjQoc2FsZV9wcmljZSksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjA2CiAgICAvLyB0aW1lc3RhbXA9QVJDNFVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYwMi02MDcKICAgIC8vIHJlY29yZCA9IFNhbGVSZWNvcmQoCiAgICAvLyAgICAgc2VsbGVyPUFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYnV5ZXI9QWRkcmVzcyhuZXdfb3duZXIpLAogICAgLy8gICAgIHByaWNlPUFSQzRVSW50NjQoc2FsZV9wcmljZSksCiAgICAvLyAgICAgdGltZXN0YW1wPUFSQzRVSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MDkKICAgIC8vIGhpc3Rvcnlfa2V5LCBISVNUT1JZX0hFQURFUl9TSVpFICsgdHJhbnNmZXJfaW5kZXggKiBTQUxFX1JFQ09SRF9TSVpFLCByZWNvcmQuYnl0ZXMKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgODAgLy8gODAKICAgICoKICAgIGludGNfMiAvLyA4CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYwOC02MTAKICAgIC8vIG9wLkJveC5yZXBsYWNlKAogICAgLy8gICAgIGhpc3Rvcnlfa2V5LCBISVNUT1JZX0hFQURFUl9TSVpFICsgdHJhbnNmZXJfaW5kZXggKiBTQUxFX1JFQ09SRF9TSVpFLCByZWNvcmQuYnl0ZXMKICAgIC8vICkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjExCiAgICAvLyBvcC5Cb3gucmVwbGFjZShoaXN0b3J5X2tleSwgMCwgb3AuaXRvYih0cmFuc2Zlcl9pbmRleCArIFVJbnQ2NCgxKSkpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYxMwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKdHJhbnNmZXJfdGlja2V0X2Vsc2VfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NTk4LTYwMAogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUoCiAgICAvLyAgICAgaGlzdG9yeV9rZXksIEhJU1RPUllfSEVBREVSX1NJWkUgKyBTQUxFX1JFQ09SRF9TSVpFCiAgICAvLyApLCAiRmFpbGVkIHRvIGNyZWF0ZSBoaXN0b3J5IGJveCIKICAgIGZyYW1lX2RpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU5OQogICAgLy8gaGlzdG9yeV9rZXksIEhJU1RPUllfSEVBREVSX1NJWkUgKyBTQUxFX1JFQ09SRF9TSVpFCiAgICBwdXNoaW50IDg4IC8vIDg4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjU5OC02MDAKICAgIC8vIGFzc2VydCBvcC5Cb3guY3JlYXRlKAogICAgLy8gICAgIGhpc3Rvcnlfa2V5LCBISVNUT1JZX0hFQURFUl9TSVpFICsgU0FMRV9SRUNPUkRfU0laRQogICAgLy8gKSwgIkZhaWxlZCB0byBjcmVhdGUgaGlzdG9yeSBib3giCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gRmFpbGVkIHRvIGNyZWF0ZSBoaXN0b3J5IGJveAogICAgYiB0cmFuc2Zlcl90aWNrZXRfYWZ0ZXJfaWZfZWxzZUAxMQoKdHJhbnNmZXJfdGlja2V0X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIHRyYW5zZmVyX3RpY2tldF9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfbWF4X3Jlc2FsZV9wcmljZSgpIC0+IHVpbnQ2NDoKZ2V0X21heF9yZXNhbGVfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYyMQogICAgLy8gcmV0dXJuIHNlbGYuX21heF9yZXNhbGVfcHJpY2UoKQogICAgY2FsbHN1YiBfbWF4X3Jlc2FsZV9wcmljZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnRpY2tldGluZy5jb250cmFjdC5UaWNrZXRpbmcuZ2V0X3RpY2tldF9yZXNhbGVfY2FwKHRpY2tldF9hc3NldF9pZDogdWludDY0KSAtPiB1aW50NjQ6CmdldF90aWNrZXRfcmVzYWxlX2NhcDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjIzLTYyNAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF90aWNrZXRfcmVzYWxlX2NhcChzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYyNgogICAgLy8gcmV0dXJuIHNlbGYuX3RpY2tldF9yZXNhbGVfY2FwKHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfdGlja2V0X3Jlc2FsZV9jYXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmdldF90cmFuc2Zlcl9jb3VudCh0aWNrZXRfYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfdHJhbnNmZXJfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjYyOC02MjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfdHJhbnNmZXJfY291bnQoc2VsZiwgdGlja2V0X2Fzc2V0X2lkOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MzEKICAgIC8vIHJldHVybiBzZWxmLl90cmFuc2Zlcl9jb3VudCh0aWNrZXRfYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX3RyYW5zZmVyX2NvdW50CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5nZXRfc2FsZV9oaXN0b3J5KHRpY2tldF9hc3NldF9pZDogdWludDY0LCBpbmRleDogdWludDY0KSAtPiBieXRlcywgYnl0ZXMsIHVpbnQ2NCwgdWludDY0OgpnZXRfc2FsZV9oaXN0b3J5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2MzMtNjM2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3NhbGVfaGlzdG9yeSgKICAgIC8vICAgICBzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCwgaW5kZXg6IFVJbnQ2NAogICAgLy8gKSAtPiB0dXBsZVtBZGRyZXNzLCBBZGRyZXNzLCBVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjQxCiAgICAvLyBhc3NlcnQgaW5kZXggPCBzZWxmLl90cmFuc2Zlcl9jb3VudCh0aWNrZXRfYXNzZXRfaWQpLCAiSGlzdG9yeSBlbnRyeSBub3QgZm91bmQiCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgX3RyYW5zZmVyX2NvdW50CiAgICBmcmFtZV9kaWcgLTEKICAgID4KICAgIGFzc2VydCAvLyBIaXN0b3J5IGVudHJ5IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NDMKICAgIC8vIGhpc3Rvcnlfa2V5ID0gYiJzaF8iICsgb3AuaXRvYih0aWNrZXRfYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDE1IC8vIDB4NzM2ODVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjQ1CiAgICAvLyBvcC5Cb3guZXh0cmFjdChoaXN0b3J5X2tleSwgSElTVE9SWV9IRUFERVJfU0laRSArIGluZGV4ICogU0FMRV9SRUNPUkRfU0laRSwgU0FMRV9SRUNPUkRfU0laRSkKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA4MCAvLyA4MAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIHB1c2hpbnQgODAgLy8gODAKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY0NwogICAgLy8gcmV0dXJuIHJlY29yZC5zZWxsZXIsIHJlY29yZC5idXllciwgcmVjb3JkLnByaWNlLm5hdGl2ZSwgcmVjb3JkLnRpbWVzdGFtcC5uYXRpdmUKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMgogICAgcHVzaGludCA2NCAvLyA2NAogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMwogICAgcHVzaGludCA3MiAvLyA3MgogICAgZXh0cmFjdF91aW50NjQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy50aWNrZXRpbmcuY29udHJhY3QuVGlja2V0aW5nLmdldF9zYWxlX2hpc3RvcnlfcmFuZ2UodGlja2V0X2Fzc2V0X2lkOiB1aW50NjQsIGZyb21faW5kZXg6IHVpbnQ2NCwgY291bnQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9zYWxlX2hpc3RvcnlfcmFuZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY0OS02NTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfc2FsZV9oaXN0b3J5X3JhbmdlKAogICAgLy8gICAgIHNlbGYsIHRpY2tldF9hc3NldF9pZDogVUludDY0LCBmcm9tX2luZGV4OiBVSW50NjQsIGNvdW50OiBVSW50NjQKICAgIC8vICkgLT4gRHluYW1pY0FycmF5W1NhbGVSZWNvcmRdOgogICAgcHJvdG8gMyAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjU4CiAgICAvLyB0b3RhbCA9IHNlbGYuX3RyYW5zZmVyX2NvdW50KHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiBfdHJhbnNmZXJfY291bnQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NTkKICAgIC8vIGlmIGZyb21faW5kZXggPj0gdG90YWw6CiAgICBmcmFtZV9kaWcgLTIKICAgIDw9CiAgICBieiBnZXRfc2FsZV9oaXN0b3J5X3JhbmdlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NjAKICAgIC8vIHJldHVybiBEeW5hbWljQXJyYXlbU2FsZVJlY29yZF0oKQogICAgYnl0ZWMgMTggLy8gMHgwMDAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3NhbGVfaGlzdG9yeV9yYW5nZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY2MgogICAgLy8gcGFnZV9zaXplID0gdG90YWwgLSBmcm9tX2luZGV4CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC0yCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NjMKICAgIC8vIGlmIGNvdW50IDwgcGFnZV9zaXplOgogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBieiBnZXRfc2FsZV9oaXN0b3J5X3JhbmdlX2FmdGVyX2lmX2Vsc2VANAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDAKCmdldF9zYWxlX2hpc3RvcnlfcmFuZ2VfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NjUKICAgIC8vIGlmIHBhZ2Vfc2l6ZSA+IE1BWF9ISVNUT1JZX1BBR0U6CiAgICBmcmFtZV9kaWcgMAogICAgcHVzaGludCAxMiAvLyAxMgogICAgPgogICAgYnogZ2V0X3NhbGVfaGlzdG9yeV9yYW5nZV9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjY2CiAgICAvLyBwYWdlX3NpemUgPSBVSW50NjQoTUFYX0hJU1RPUllfUEFHRSkKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIGZyYW1lX2J1cnkgMAoKZ2V0X3NhbGVfaGlzdG9yeV9yYW5nZV9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY2OAogICAgLy8gaGlzdG9yeV9rZXkgPSBiInNoXyIgKyBvcC5pdG9iKHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgYnl0ZWMgMTUgLy8gMHg3MzY4NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NzEKICAgIC8vIEhJU1RPUllfSEVBREVSX1NJWkUgKyBmcm9tX2luZGV4ICogU0FMRV9SRUNPUkRfU0laRSwKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA4MCAvLyA4MAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjcyCiAgICAvLyBwYWdlX3NpemUgKiBTQUxFX1JFQ09SRF9TSVpFLAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA4MCAvLyA4MAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NjktNjczCiAgICAvLyByZWNvcmRzID0gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgaGlzdG9yeV9rZXksCiAgICAvLyAgICAgSElTVE9SWV9IRUFERVJfU0laRSArIGZyb21faW5kZXggKiBTQUxFX1JFQ09SRF9TSVpFLAogICAgLy8gICAgIHBhZ2Vfc2l6ZSAqIFNBTEVfUkVDT1JEX1NJWkUsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY3NAogICAgLy8gcmV0dXJuIER5bmFtaWNBcnJheVtTYWxlUmVjb3JkXS5mcm9tX2J5dGVzKEFSQzRVSW50MTYocGFnZV9zaXplKS5ieXRlcyArIHJlY29yZHMpCiAgICBzd2FwCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMudGlja2V0aW5nLmNvbnRyYWN0LlRpY2tldGluZy5fdHJhbnNmZXJfY291bnQodGlja2V0X2Fzc2V0X2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKX3RyYW5zZmVyX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3RpY2tldGluZy9jb250cmFjdC5weTo2NzYtNjc3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF90cmFuc2Zlcl9jb3VudChzZWxmLCB0aWNrZXRfYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY3OQogICAgLy8gaGlzdG9yeV9rZXkgPSBiInNoXyIgKyBvcC5pdG9iKHRpY2tldF9hc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgMTUgLy8gMHg3MzY4NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY4MAogICAgLy8gX2xlbmd0aCwgaGlzdG9yeV9leGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGhpc3Rvcnlfa2V5KQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY4MQogICAgLy8gaWYgaGlzdG9yeV9leGlzdHM6CiAgICBieiBfdHJhbnNmZXJfY291bnRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvdGlja2V0aW5nL2NvbnRyYWN0LnB5OjY4MgogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3QoaGlzdG9yeV9rZXksIDAsIEhJU1RPUllfSEVBREVSX1NJWkUpKQogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIHN3YXAKICAgIHJldHN1YgoKX3RyYW5zZmVyX2NvdW50X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy90aWNrZXRpbmcvY29udHJhY3QucHk6NjgzCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1923, 2258, 2385, 2565, 2637], "errorMessage": "Address length is 32 bytes"}, {"pc": [1818], "errorMessage": "Asset not found"}, {"pc": [2721], "errorMessage": "Buyer must opt-in to asset first"}, {"pc": [1177, 1386], "errorMessage": "Event has passed"}, {"pc": [1949], "errorMessage": "Event verification period ended"}, {"pc": [2878], "errorMessage": "Failed to create history box"}, {"pc": [1125], "errorMessage": "Failed to create organizer box"}, {"pc": [1341], "errorMessage": "Failed to create seat map"}, {"pc": [1320], "errorMessage": "Failed to create tier box"}, {"pc": [2919], "errorMessage": "History entry not found"}, {"pc": [2938, 2943], "errorMessage": "Index access is out of bounds"}, {"pc": [1196, 1440], "errorMessage": "Insufficient payment"}, {"pc": [1111], "errorMessage": "Maximum 10 organizers allowed"}, {"pc": [1249], "errorMessage": "Maximum 16 tiers allowed"}, {"pc": [1831], "errorMessage": "Must opt-in to asset first"}, {"pc": [1704], "errorMessage": "Not a tiered ticket"}, {"pc": [1822], "errorMessage": "Not your ticket"}, {"pc": [379, 407, 445, 466, 487, 504, 549, 573, 590, 610, 626, 642, 700, 721, 740, 765, 796, 812, 832, 861, 877, 897, 932, 962, 989, 1009], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1103], "errorMessage": "Only creator can add organizers"}, {"pc": [1241], "errorMessage": "Only creator can add tiers"}, {"pc": [2270], "errorMessage": "Only creator or organizers can toggle"}, {"pc": [1935], "errorMessage": "Only creator or organizers can verify"}, {"pc": [2686], "errorMessage": "Payment less than sale price"}, {"pc": [2694], "errorMessage": "Payment must go to seller"}, {"pc": [2678], "errorMessage": "Resale price exceeds 110% cap"}, {"pc": [1147, 1368], "errorMessage": "Sale not active"}, {"pc": [1470], "errorMessage": "Seat already taken"}, {"pc": [1462], "errorMessage": "Seat not in tier"}, {"pc": [2712], "errorMessage": "Seller does not hold ticket"}, {"pc": [1159], "errorMessage": "Sold out"}, {"pc": [1252], "errorMessage": "Supply must be > 0"}, {"pc": [1989, 2740], "errorMessage": "Ticket already used"}, {"pc": [1970], "errorMessage": "Ticket not owned by holder"}, {"pc": [1168, 1377], "errorMessage": "Ticket sales have ended"}, {"pc": [1394, 1564, 1646], "errorMessage": "Tier not found"}, {"pc": [1422], "errorMessage": "Tier sold out"}, {"pc": [1269], "errorMessage": "Too many seats for one tier"}, {"pc": [1013], "errorMessage": "can only call when creating"}, {"pc": [382, 410, 448, 469, 490, 507, 552, 576, 593, 613, 629, 645, 703, 724, 743, 768, 799, 815, 835, 864, 880, 900, 935, 965, 992], "errorMessage": "can only call when not creating"}, {"pc": [1101, 1239, 1874, 2209, 2473, 2525, 2588], "errorMessage": "check self.creator exists"}, {"pc": [1175, 1384, 1942, 2317, 2441], "errorMessage": "check self.event_date exists"}, {"pc": [1146, 1367, 2275, 2285, 2332, 2459], "errorMessage": "check self.is_sale_active exists"}, {"pc": [1157, 2307, 2423], "errorMessage": "check self.max_supply exists"}, {"pc": [1107, 1115, 1132, 1887, 2222, 2344, 2477, 2534, 2575, 2605], "errorMessage": "check self.organizer_count exists"}, {"pc": [1166, 1375, 2322, 2447], "errorMessage": "check self.sale_end_date exists"}, {"pc": [1152, 1201, 2312, 2429], "errorMessage": "check self.sold_count exists"}, {"pc": [1194, 2124, 2129, 2302, 2417], "errorMessage": "check self.ticket_price exists"}, {"pc": [1245, 1279, 1345, 1390, 1560, 1583, 1619, 1642], "errorMessage": "check self.tier_count exists"}, {"pc": [1510, 2435], "errorMessage": "check self.tier_sold_count exists"}, {"pc": [1212, 1521, 2327, 2453], "errorMessage": "check self.unique_buyers exists"}, {"pc": [1626, 2110, 3043], "errorMessage": "overflow"}, {"pc": [531, 918, 975], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,37 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class EventSnapshot:
+    """Struct for EventSnapshot"""
+    ticket_price: int
+    max_supply: int
+    sold_count: int
+    tier_sold_count: int
+    event_date: int
+    sale_end_date: int
+    unique_buyers: int
+    is_sale_active: bool
+    max_resale_price: int
+    creator: str
+    organizer_count: int
+    organizers: list[str]
+
+@dataclasses.dataclass(frozen=True)
+class TicketSeat:
+    """Struct for TicketSeat"""
+    tier_id: int
+    seat: int
+
+@dataclasses.dataclass(frozen=True)
+class TierRecord:
+    """Struct for TierRecord"""
+    price: int
+    supply: int
+    sold: int
+    seated: bool
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AddOrganizerArgs:
     """Dataclass for add_organizer arguments"""
@@ -74,22 +105,63 @@ class AddOrganizerArgs:
         return "add_organizer(address)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
-class SetMediaCidArgs:
-    """Dataclass for set_media_cid arguments"""
-    cid: bytes | str
+class BuyTicketArgs:
+    """Dataclass for buy_ticket arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "set_media_cid(byte[])uint64"
+        return "buy_ticket(pay)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
-class BuyTicketArgs:
-    """Dataclass for buy_ticket arguments"""
+class AddTierArgs:
+    """Dataclass for add_tier arguments"""
+    price: int
+    supply: int
+    seated: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "add_tier(uint64,uint64,bool)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BuyTierTicketArgs:
+    """Dataclass for buy_tier_ticket arguments"""
+    tier_id: int
+    seat: int
     payment: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "buy_ticket(pay)uint64"
+        return "buy_tier_ticket(uint64,uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTierArgs:
+    """Dataclass for get_tier arguments"""
+    tier_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_tier(uint64)(uint64,uint64,uint64,bool)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class IsSeatAvailableArgs:
+    """Dataclass for is_seat_available arguments"""
+    tier_id: int
+    seat: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "is_seat_available(uint64,uint64)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTicketSeatArgs:
+    """Dataclass for get_ticket_seat arguments"""
+    ticket_asset_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_ticket_seat(uint64)(uint64,uint64)"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ClaimTicketArgs:
@@ -119,6 +191,15 @@ class IsCheckedInArgs:
     def abi_method_signature(self) -> str:
         return "is_checked_in(uint64)bool"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTicketStatusBatchArgs:
+    """Dataclass for get_ticket_status_batch arguments"""
+    asset_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_ticket_status_batch(uint64[])(bool,uint64,address)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetOrganizerByIndexArgs:
     """Dataclass for get_organizer_by_index arguments"""
@@ -137,6 +218,57 @@ class IsOrganizerArgs:
     def abi_method_signature(self) -> str:
         return "is_organizer(address)bool"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TransferTicketArgs:
+    """Dataclass for transfer_ticket arguments"""
+    ticket_asset_id: int
+    new_owner: str | bytes
+    sale_price: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "transfer_ticket(uint64,account,uint64,pay)bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTicketResaleCapArgs:
+    """Dataclass for get_ticket_resale_cap arguments"""
+    ticket_asset_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_ticket_resale_cap(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetTransferCountArgs:
+    """Dataclass for get_transfer_count arguments"""
+    ticket_asset_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_transfer_count(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSaleHistoryArgs:
+    """Dataclass for get_sale_history arguments"""
+    ticket_asset_id: int
+    index: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_sale_history(uint64,uint64)(address,address,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSaleHistoryRangeArgs:
+    """Dataclass for get_sale_history_range arguments"""
+    ticket_asset_id: int
+    from_index: int
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateEventArgs:
     """Dataclass for create_event arguments"""
@@ -167,20 +299,59 @@ class TicketingParams:
             "args": method_args,
         }))
 
-    def set_media_cid(
+    def buy_ticket(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_ticket(pay)uint64",
+            "args": method_args,
+        }))
+
+    def add_tier(
+        self,
+        args: tuple[int, int, bool] | AddTierArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_tier(uint64,uint64,bool)uint64",
+            "args": method_args,
+        }))
+
+    def buy_tier_ticket(
+        self,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyTierTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "buy_tier_ticket(uint64,uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def get_tier(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[int] | GetTierArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_media_cid(byte[])uint64",
+            "method": "get_tier(uint64)(uint64,uint64,uint64,bool)",
             "args": method_args,
         }))
 
-    def get_media_cid(
+    def get_tiers(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
@@ -188,19 +359,32 @@ class TicketingParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_media_cid()byte[]",
+            "method": "get_tiers()(uint64,uint64,uint64,bool)[]",
         }))
 
-    def buy_ticket(
+    def is_seat_available(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        args: tuple[int, int] | IsSeatAvailableArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "buy_ticket(pay)uint64",
+            "method": "is_seat_available(uint64,uint64)bool",
+            "args": method_args,
+        }))
+
+    def get_ticket_seat(
+        self,
+        args: tuple[int] | GetTicketSeatArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_seat(uint64)(uint64,uint64)",
             "args": method_args,
         }))
 
@@ -243,6 +427,19 @@ class TicketingParams:
             "args": method_args,
         }))
 
+    def get_ticket_status_batch(
+        self,
+        args: tuple[list[int]] | GetTicketStatusBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_status_batch(uint64[])(bool,uint64,address)[]",
+            "args": method_args,
+        }))
+
     def toggle_sale(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -265,6 +462,17 @@ class TicketingParams:
             "method": "get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool)",
         }))
 
+    def get_event_snapshot(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])",
+        }))
+
     def get_organizer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -313,6 +521,82 @@ class TicketingParams:
             "args": method_args,
         }))
 
+    def transfer_ticket(
+        self,
+        args: tuple[int, str | bytes, int, algokit_utils.AppMethodCallTransactionArgument] | TransferTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "transfer_ticket(uint64,account,uint64,pay)bool",
+            "args": method_args,
+        }))
+
+    def get_max_resale_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_max_resale_price()uint64",
+        }))
+
+    def get_ticket_resale_cap(
+        self,
+        args: tuple[int] | GetTicketResaleCapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_resale_cap(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_transfer_count(
+        self,
+        args: tuple[int] | GetTransferCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_transfer_count(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_sale_history(
+        self,
+        args: tuple[int, int] | GetSaleHistoryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_history(uint64,uint64)(address,address,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_sale_history_range(
+        self,
+        args: tuple[int, int, int] | GetSaleHistoryRangeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
     def create_event(
         self,
         args: tuple[int, int, int, int] | CreateEventArgs,
@@ -354,125 +638,201 @@ class TicketingCreateTransactionParams:
             "args": method_args,
         }))
 
-    def set_media_cid(
+    def buy_ticket(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_media_cid(byte[])uint64",
+            "method": "buy_ticket(pay)uint64",
             "args": method_args,
         }))
 
-    def get_media_cid(
+    def add_tier(
         self,
+        args: tuple[int, int, bool] | AddTierArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_media_cid()byte[]",
+            "method": "add_tier(uint64,uint64,bool)uint64",
+            "args": method_args,
         }))
 
-    def buy_ticket(
+    def buy_tier_ticket(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyTierTicketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "buy_ticket(pay)uint64",
+            "method": "buy_tier_ticket(uint64,uint64,pay)uint64",
             "args": method_args,
         }))
 
-    def claim_ticket(
+    def get_tier(
         self,
-        args: tuple[int] | ClaimTicketArgs,
+        args: tuple[int] | GetTierArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_ticket(uint64)void",
+            "method": "get_tier(uint64)(uint64,uint64,uint64,bool)",
             "args": method_args,
         }))
 
-    def verify_entry(
+    def get_tiers(
         self,
-        args: tuple[str | bytes, int] | VerifyEntryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-        method_args = _parse_abi_args(args)
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_entry(account,uint64)bool",
-            "args": method_args,
+            "method": "get_tiers()(uint64,uint64,uint64,bool)[]",
         }))
 
-    def is_checked_in(
+    def is_seat_available(
         self,
-        args: tuple[int] | IsCheckedInArgs,
+        args: tuple[int, int] | IsSeatAvailableArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "is_checked_in(uint64)bool",
+            "method": "is_seat_available(uint64,uint64)bool",
             "args": method_args,
         }))
 
-    def toggle_sale(
+    def get_ticket_seat(
         self,
+        args: tuple[int] | GetTicketSeatArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "toggle_sale()bool",
+            "method": "get_ticket_seat(uint64)(uint64,uint64)",
+            "args": method_args,
         }))
 
-    def get_event_info(
+    def claim_ticket(
         self,
+        args: tuple[int] | ClaimTicketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool)",
+            "method": "claim_ticket(uint64)void",
+            "args": method_args,
         }))
 
-    def get_organizer(
+    def verify_entry(
         self,
+        args: tuple[str | bytes, int] | VerifyEntryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organizer()address",
+            "method": "verify_entry(account,uint64)bool",
+            "args": method_args,
         }))
 
-    def get_organizer_by_index(
+    def is_checked_in(
         self,
-        args: tuple[int] | GetOrganizerByIndexArgs,
+        args: tuple[int] | IsCheckedInArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_organizer_by_index(uint64)address",
+            "method": "is_checked_in(uint64)bool",
+            "args": method_args,
+        }))
+
+    def get_ticket_status_batch(
+        self,
+        args: tuple[list[int]] | GetTicketStatusBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_status_batch(uint64[])(bool,uint64,address)[]",
+            "args": method_args,
+        }))
+
+    def toggle_sale(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "toggle_sale()bool",
+        }))
+
+    def get_event_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool)",
+        }))
+
+    def get_event_snapshot(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])",
+        }))
+
+    def get_organizer(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organizer()address",
+        }))
+
+    def get_organizer_by_index(
+        self,
+        args: tuple[int] | GetOrganizerByIndexArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_organizer_by_index(uint64)address",
             "args": method_args,
         }))
 
@@ -500,6 +860,82 @@ class TicketingCreateTransactionParams:
             "args": method_args,
         }))
 
+    def transfer_ticket(
+        self,
+        args: tuple[int, str | bytes, int, algokit_utils.AppMethodCallTransactionArgument] | TransferTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "transfer_ticket(uint64,account,uint64,pay)bool",
+            "args": method_args,
+        }))
+
+    def get_max_resale_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_max_resale_price()uint64",
+        }))
+
+    def get_ticket_resale_cap(
+        self,
+        args: tuple[int] | GetTicketResaleCapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_resale_cap(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_transfer_count(
+        self,
+        args: tuple[int] | GetTransferCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_transfer_count(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_sale_history(
+        self,
+        args: tuple[int, int] | GetSaleHistoryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_history(uint64,uint64)(address,address,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_sale_history_range(
+        self,
+        args: tuple[int, int, int] | GetSaleHistoryRangeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
     def create_event(
         self,
         args: tuple[int, int, int, int] | CreateEventArgs,
@@ -544,9 +980,9 @@ class TicketingSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def set_media_cid(
+    def buy_ticket(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -554,29 +990,31 @@ class TicketingSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "set_media_cid(byte[])uint64",
+            "method": "buy_ticket(pay)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_media_cid(
+    def add_tier(
         self,
+        args: tuple[int, int, bool] | AddTierArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[bytes]:
-    
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_media_cid()byte[]",
+            "method": "add_tier(uint64,uint64,bool)uint64",
+            "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def buy_ticket(
+    def buy_tier_ticket(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyTierTicketArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -584,12 +1022,74 @@ class TicketingSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "buy_ticket(pay)uint64",
+            "method": "buy_tier_ticket(uint64,uint64,pay)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_tier(
+        self,
+        args: tuple[int] | GetTierArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[TierRecord]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_tier(uint64)(uint64,uint64,uint64,bool)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(TierRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[TierRecord], parsed_response)
+
+    def get_tiers(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int, int, bool]]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_tiers()(uint64,uint64,uint64,bool)[]",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int, int, bool]]], parsed_response)
+
+    def is_seat_available(
+        self,
+        args: tuple[int, int] | IsSeatAvailableArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "is_seat_available(uint64,uint64)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_ticket_seat(
+        self,
+        args: tuple[int] | GetTicketSeatArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[TicketSeat]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_seat(uint64)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(TicketSeat, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[TicketSeat], parsed_response)
+
     def claim_ticket(
         self,
         args: tuple[int] | ClaimTicketArgs,
@@ -638,6 +1138,22 @@ class TicketingSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
+    def get_ticket_status_batch(
+        self,
+        args: tuple[list[int]] | GetTicketStatusBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[bool, int, str]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_status_batch(uint64[])(bool,uint64,address)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[bool, int, str]]], parsed_response)
+
     def toggle_sale(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -666,6 +1182,20 @@ class TicketingSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int, int, int, int, int, bool]], parsed_response)
 
+    def get_event_snapshot(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[EventSnapshot]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(EventSnapshot, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[EventSnapshot], parsed_response)
+
     def get_organizer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -726,6 +1256,100 @@ class TicketingSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
+    def transfer_ticket(
+        self,
+        args: tuple[int, str | bytes, int, algokit_utils.AppMethodCallTransactionArgument] | TransferTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "transfer_ticket(uint64,account,uint64,pay)bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_max_resale_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_max_resale_price()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_ticket_resale_cap(
+        self,
+        args: tuple[int] | GetTicketResaleCapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_ticket_resale_cap(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_transfer_count(
+        self,
+        args: tuple[int] | GetTransferCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_transfer_count(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_sale_history(
+        self,
+        args: tuple[int, int] | GetSaleHistoryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[str, str, int, int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_history(uint64,uint64)(address,address,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, str, int, int]], parsed_response)
+
+    def get_sale_history_range(
+        self,
+        args: tuple[int, int, int] | GetSaleHistoryRangeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[str, str, int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[str, str, int, int]]], parsed_response)
+
     def create_event(
         self,
         args: tuple[int, int, int, int] | CreateEventArgs,
@@ -764,7 +1388,8 @@ class GlobalStateValue(typing.TypedDict):
     creator: str
     unique_buyers: int
     organizer_count: int
-    media_cid_length: int
+    tier_count: int
+    tier_sold_count: int
 
 class TicketingState:
     """Methods to access state for the current Ticketing app"""
@@ -875,9 +1500,17 @@ class _GlobalState:
         return typing.cast(int, value)
 
     @property
-    def media_cid_length(self) -> int:
-        """Get the current value of the media_cid_length key in global_state state"""
-        value = self.app_client.state.global_state.get_value("media_cid_length")
+    def tier_count(self) -> int:
+        """Get the current value of the tier_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("tier_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def tier_sold_count(self) -> int:
+        """Get the current value of the tier_sold_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("tier_sold_count")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
@@ -1028,27 +1661,51 @@ class TicketingClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["add_organizer(address)uint64"],
+        method: typing.Literal["add_organizer(address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["buy_ticket(pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["add_tier(uint64,uint64,bool)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["set_media_cid(byte[])uint64"],
+        method: typing.Literal["buy_tier_ticket(uint64,uint64,pay)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_media_cid()byte[]"],
+        method: typing.Literal["get_tier(uint64)(uint64,uint64,uint64,bool)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> bytes | None: ...
+    ) -> TierRecord | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["buy_ticket(pay)uint64"],
+        method: typing.Literal["get_tiers()(uint64,uint64,uint64,bool)[]"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> int | None: ...
+    ) -> list[tuple[int, int, int, bool]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["is_seat_available(uint64,uint64)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_ticket_seat(uint64)(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> TicketSeat | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -1068,6 +1725,12 @@ class TicketingClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> bool | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_ticket_status_batch(uint64[])(bool,uint64,address)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[bool, int, str]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["toggle_sale()bool"],
@@ -1080,6 +1743,12 @@ class TicketingClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[int, int, int, int, int, int, bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> EventSnapshot | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_organizer()address"],
@@ -1104,6 +1773,42 @@ class TicketingClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> bool | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["transfer_ticket(uint64,account,uint64,pay)bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_max_resale_price()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_ticket_resale_cap(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_transfer_count(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_sale_history(uint64,uint64)(address,address,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[str, str, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[str, str, int, int]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["create_event(uint64,uint64,uint64,uint64)uint64"],
@@ -1120,7 +1825,7 @@ class TicketingClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | bool | bytes | int | str | tuple[int, int, int, int, int, int, bool]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | EventSnapshot | None | TicketSeat | TierRecord | bool | int | list[tuple[bool, int, str]] | list[tuple[int, int, int, bool]] | list[tuple[str, str, int, int]] | str | tuple[int, int, int, int, int, int, bool] | tuple[str, str, int, int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1304,255 +2009,493 @@ class TicketingFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
-    def add_organizer(
+    def add_organizer(
+        self,
+        args: tuple[str] | AddOrganizerArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the add_organizer(address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "add_organizer(address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def buy_ticket(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_ticket(pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_ticket(pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def add_tier(
+        self,
+        args: tuple[int, int, bool] | AddTierArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the add_tier(uint64,uint64,bool)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "add_tier(uint64,uint64,bool)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def buy_tier_ticket(
+        self,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyTierTicketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the buy_tier_ticket(uint64,uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "buy_tier_ticket(uint64,uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_tier(
+        self,
+        args: tuple[int] | GetTierArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_tier(uint64)(uint64,uint64,uint64,bool) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_tier(uint64)(uint64,uint64,uint64,bool)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_tiers(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_tiers()(uint64,uint64,uint64,bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_tiers()(uint64,uint64,uint64,bool)[]",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def is_seat_available(
+        self,
+        args: tuple[int, int] | IsSeatAvailableArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the is_seat_available(uint64,uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "is_seat_available(uint64,uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_ticket_seat(
+        self,
+        args: tuple[int] | GetTicketSeatArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_ticket_seat(uint64)(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_ticket_seat(uint64)(uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim_ticket(
+        self,
+        args: tuple[int] | ClaimTicketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_ticket(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_ticket(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_entry(
+        self,
+        args: tuple[str | bytes, int] | VerifyEntryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_entry(account,uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "verify_entry(account,uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def is_checked_in(
+        self,
+        args: tuple[int] | IsCheckedInArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the is_checked_in(uint64)bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "is_checked_in(uint64)bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_ticket_status_batch(
+        self,
+        args: tuple[list[int]] | GetTicketStatusBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_ticket_status_batch(uint64[])(bool,uint64,address)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_ticket_status_batch(uint64[])(bool,uint64,address)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def toggle_sale(
         self,
-        args: tuple[str] | AddOrganizerArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the add_organizer(address)uint64 ABI method"""
+        """Creates a new instance using the toggle_sale()bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "add_organizer(address)uint64",
-                "args": _parse_abi_args(args),
+                "method": "toggle_sale()bool",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def set_media_cid(
+    def get_event_info(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the set_media_cid(byte[])uint64 ABI method"""
+        """Creates a new instance using the get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "set_media_cid(byte[])uint64",
-                "args": _parse_abi_args(args),
+                "method": "get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool)",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_media_cid(
+    def get_event_snapshot(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_media_cid()byte[] ABI method"""
+        """Creates a new instance using the get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[]) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_media_cid()byte[]",
+                "method": "get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def buy_ticket(
+    def get_organizer(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the buy_ticket(pay)uint64 ABI method"""
+        """Creates a new instance using the get_organizer()address ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "buy_ticket(pay)uint64",
-                "args": _parse_abi_args(args),
+                "method": "get_organizer()address",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def claim_ticket(
+    def get_organizer_by_index(
         self,
-        args: tuple[int] | ClaimTicketArgs,
+        args: tuple[int] | GetOrganizerByIndexArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the claim_ticket(uint64)void ABI method"""
+        """Creates a new instance using the get_organizer_by_index(uint64)address ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "claim_ticket(uint64)void",
+                "method": "get_organizer_by_index(uint64)address",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def verify_entry(
+    def get_organizer_count(
         self,
-        args: tuple[str | bytes, int] | VerifyEntryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the verify_entry(account,uint64)bool ABI method"""
+        """Creates a new instance using the get_organizer_count()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "verify_entry(account,uint64)bool",
-                "args": _parse_abi_args(args),
+                "method": "get_organizer_count()uint64",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def is_checked_in(
+    def is_organizer(
         self,
-        args: tuple[int] | IsCheckedInArgs,
+        args: tuple[str] | IsOrganizerArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the is_checked_in(uint64)bool ABI method"""
+        """Creates a new instance using the is_organizer(address)bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "is_checked_in(uint64)bool",
+                "method": "is_organizer(address)bool",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def toggle_sale(
+    def transfer_ticket(
         self,
+        args: tuple[int, str | bytes, int, algokit_utils.AppMethodCallTransactionArgument] | TransferTicketArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the toggle_sale()bool ABI method"""
+        """Creates a new instance using the transfer_ticket(uint64,account,uint64,pay)bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "toggle_sale()bool",
-                "args": None,
+                "method": "transfer_ticket(uint64,account,uint64,pay)bool",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_event_info(
+    def get_max_resale_price(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool) ABI method"""
+        """Creates a new instance using the get_max_resale_price()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_event_info()(uint64,uint64,uint64,uint64,uint64,uint64,bool)",
+                "method": "get_max_resale_price()uint64",
                 "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_organizer(
+    def get_ticket_resale_cap(
         self,
+        args: tuple[int] | GetTicketResaleCapArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_organizer()address ABI method"""
+        """Creates a new instance using the get_ticket_resale_cap(uint64)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_organizer()address",
-                "args": None,
+                "method": "get_ticket_resale_cap(uint64)uint64",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_organizer_by_index(
+    def get_transfer_count(
         self,
-        args: tuple[int] | GetOrganizerByIndexArgs,
+        args: tuple[int] | GetTransferCountArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_organizer_by_index(uint64)address ABI method"""
+        """Creates a new instance using the get_transfer_count(uint64)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_organizer_by_index(uint64)address",
+                "method": "get_transfer_count(uint64)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_organizer_count(
+    def get_sale_history(
         self,
+        args: tuple[int, int] | GetSaleHistoryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_organizer_count()uint64 ABI method"""
+        """Creates a new instance using the get_sale_history(uint64,uint64)(address,address,uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_organizer_count()uint64",
-                "args": None,
+                "method": "get_sale_history(uint64,uint64)(address,address,uint64,uint64)",
+                "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def is_organizer(
+    def get_sale_history_range(
         self,
-        args: tuple[str] | IsOrganizerArgs,
+        args: tuple[int, int, int] | GetSaleHistoryRangeArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the is_organizer(address)bool ABI method"""
+        """Creates a new instance using the get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "is_organizer(address)bool",
+                "method": "get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1736,55 +2679,127 @@ class TicketingComposer:
         )
         return self
 
-    def set_media_cid(
+    def buy_ticket(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.buy_ticket(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "buy_ticket(pay)uint64", v
+            )
+        )
+        return self
+
+    def add_tier(
+        self,
+        args: tuple[int, int, bool] | AddTierArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.add_tier(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "add_tier(uint64,uint64,bool)uint64", v
+            )
+        )
+        return self
+
+    def buy_tier_ticket(
         self,
-        args: tuple[bytes | str] | SetMediaCidArgs,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | BuyTierTicketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "TicketingComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.set_media_cid(
+            self.client.params.buy_tier_ticket(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "set_media_cid(byte[])uint64", v
+                "buy_tier_ticket(uint64,uint64,pay)uint64", v
             )
         )
         return self
 
-    def get_media_cid(
+    def get_tier(
         self,
+        args: tuple[int] | GetTierArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "TicketingComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.get_media_cid(
+            self.client.params.get_tier(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_tier(uint64)(uint64,uint64,uint64,bool)", v
+            )
+        )
+        return self
+
+    def get_tiers(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_tiers(
                 
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_media_cid()byte[]", v
+                "get_tiers()(uint64,uint64,uint64,bool)[]", v
             )
         )
         return self
 
-    def buy_ticket(
+    def is_seat_available(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | BuyTicketArgs,
+        args: tuple[int, int] | IsSeatAvailableArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "TicketingComposer":
         self._composer.add_app_call_method_call(
-            self.client.params.buy_ticket(
+            self.client.params.is_seat_available(
                 args=args,
                 params=params,
             )
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "buy_ticket(pay)uint64", v
+                "is_seat_available(uint64,uint64)bool", v
+            )
+        )
+        return self
+
+    def get_ticket_seat(
+        self,
+        args: tuple[int] | GetTicketSeatArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_ticket_seat(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_ticket_seat(uint64)(uint64,uint64)", v
             )
         )
         return self
@@ -1843,6 +2858,24 @@ class TicketingComposer:
         )
         return self
 
+    def get_ticket_status_batch(
+        self,
+        args: tuple[list[int]] | GetTicketStatusBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_ticket_status_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_ticket_status_batch(uint64[])(bool,uint64,address)[]", v
+            )
+        )
+        return self
+
     def toggle_sale(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1877,6 +2910,23 @@ class TicketingComposer:
         )
         return self
 
+    def get_event_snapshot(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_event_snapshot(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_event_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint64,address,uint64,address[])", v
+            )
+        )
+        return self
+
     def get_organizer(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1947,6 +2997,113 @@ class TicketingComposer:
         )
         return self
 
+    def transfer_ticket(
+        self,
+        args: tuple[int, str | bytes, int, algokit_utils.AppMethodCallTransactionArgument] | TransferTicketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.transfer_ticket(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "transfer_ticket(uint64,account,uint64,pay)bool", v
+            )
+        )
+        return self
+
+    def get_max_resale_price(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_max_resale_price(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_max_resale_price()uint64", v
+            )
+        )
+        return self
+
+    def get_ticket_resale_cap(
+        self,
+        args: tuple[int] | GetTicketResaleCapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_ticket_resale_cap(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_ticket_resale_cap(uint64)uint64", v
+            )
+        )
+        return self
+
+    def get_transfer_count(
+        self,
+        args: tuple[int] | GetTransferCountArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_transfer_count(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_transfer_count(uint64)uint64", v
+            )
+        )
+        return self
+
+    def get_sale_history(
+        self,
+        args: tuple[int, int] | GetSaleHistoryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_sale_history(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_sale_history(uint64,uint64)(address,address,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_sale_history_range(
+        self,
+        args: tuple[int, int, int] | GetSaleHistoryRangeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "TicketingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_sale_history_range(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_sale_history_range(uint64,uint64,uint64)(address,address,uint64,uint64)[]", v
+            )
+        )
+        return self
+
     def create_event(
         self,
         args: tuple[int, int, int, int] | CreateEventArgs,
@@ -1,14 +1,63 @@
 from algopy import *
-from algopy.arc4 import abimethod
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    DynamicArray,
+    Struct,
+    UInt16 as ARC4UInt16,
+    UInt64 as ARC4UInt64,
+)
+
+from smart_contracts._common.subroutines import address_at, append_address, pop_address, replace_address
+
+# Balances are held as shares: balance = shares * exchange_index / INDEX_SCALE.
+# Paying in yield only raises exchange_index, so every depositor accrues it at once.
+INDEX_SCALE = 1_000_000_000
+# Accounts per deposit_batch / withdraw_batch call
+MAX_BATCH = 16
+
+# Depositor index boxes: "dx_" + itob(chunk) -> up to 32 depositor addresses, where
+# depositor index i lives in chunk i // 32 at offset (i % 32) * 32. An account that
+# withdraws everything is swapped out for the last depositor, so the index stays dense.
+DEPOSITOR_INDEX_PREFIX = b"dx_"
+# ABI return values are logged (1024 byte cap): 25 × 40-byte rows per page
+MAX_DEPOSITOR_PAGE = 25
+# 64 × 8-byte balances per get_balances call
+MAX_BALANCE_LOOKUP = 64
+
+
+class DepositRecord(Struct):
+    """Per-depositor box value: dense depositor index + shares held"""
+
+    index: ARC4UInt64
+    shares: ARC4UInt64
+
+
+class DepositorEntry(Struct):
+    """Depositor page row: address + current balance in microAlgos"""
+
+    depositor: Address
+    balance: ARC4UInt64
 
 
 class Bank(ARC4Contract):
     total_deposit: UInt64
+    total_shares: UInt64
+    exchange_index: UInt64
+    admin: Account
+    depositor_count: UInt64
 
     def __init__(self) -> None:
         """Initializes contract storages on deployment"""
-        self.deposits = BoxMap(Account, UInt64, key_prefix="")
+        # account -> depositor index + shares
+        self.deposits = BoxMap(Account, DepositRecord, key_prefix=b"d_")
+        # custodian -> 1 while allowed to run batch entry points
+        self.custodians = BoxMap(Account, UInt64, key_prefix=b"cu_")
         self.total_deposit = UInt64(0)
+        self.total_shares = UInt64(0)
+        self.exchange_index = UInt64(INDEX_SCALE)
+        self.admin = Txn.sender
+        self.depositor_count = UInt64(0)
 
     @abimethod()
     def deposit(self, memo: String, pay_txn: gtxn.PaymentTransaction) -> UInt64:
@@ -16,31 +65,191 @@ class Bank(ARC4Contract):
         assert pay_txn.receiver == Global.current_application_address, "Receiver must be the contract address"
         assert pay_txn.amount > 0, "Deposit amount must be greater than zero"
 
-        amount, exists = self.deposits.maybe(pay_txn.sender)
-        if exists:
-            self.deposits[pay_txn.sender] = amount + pay_txn.amount
-        else:
-            self.deposits[pay_txn.sender] = pay_txn.amount
-
-        self.total_deposit += pay_txn.amount
-        return self.deposits[pay_txn.sender]
+        self._credit(pay_txn.sender, pay_txn.amount)
+        return self._balance_of(pay_txn.sender)
 
     @abimethod()
     def withdraw(self, amount: UInt64) -> UInt64:
         """Sends ALGO back to the caller from their recorded balance"""
-        current, exists = self.deposits.maybe(Txn.sender)
-        assert exists, "No deposits found for this account"
+        assert Txn.sender in self.deposits, "No deposits found for this account"
         assert amount > 0, "Withdrawal amount must be greater than zero"
-        assert amount <= current, "Withdrawal amount exceeds balance"
 
-        itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
+        return self._debit_and_pay(Txn.sender, amount)
+
+    @abimethod()
+    def deposit_batch(
+        self,
+        accounts: DynamicArray[Address],
+        amounts: DynamicArray[ARC4UInt64],
+        pay_txn: gtxn.PaymentTransaction,
+    ) -> UInt64:
+        """
+        Custodian credits many accounts from one payment; amounts[i] goes to accounts[i]
+        and the payment must equal their sum. Returns the number of accounts credited.
+        """
+        assert Txn.sender in self.custodians, "Only custodians"
+        assert accounts.length == amounts.length, "Length mismatch"
+        assert accounts.length <= UInt64(MAX_BATCH), "Batch too large"
+        assert pay_txn.receiver == Global.current_application_address, "Receiver must be the contract address"
+
+        total = UInt64(0)
+        for i in urange(accounts.length):
+            amount = amounts[i].native
+            assert amount > 0, "Deposit amount must be greater than zero"
+            self._credit(accounts[i].native, amount)
+            total += amount
+        assert pay_txn.amount == total, "Payment must equal the batch total"
+
+        return accounts.length
+
+    @abimethod()
+    def withdraw_batch(
+        self,
+        accounts: DynamicArray[Address],
+        amounts: DynamicArray[ARC4UInt64],
+    ) -> UInt64:
+        """
+        Custodian withdraws amounts[i] from accounts[i]'s balance. Funds are always
+        paid to the account itself. Returns the total paid out.
+        """
+        assert Txn.sender in self.custodians, "Only custodians"
+        assert accounts.length == amounts.length, "Length mismatch"
+        assert accounts.length <= UInt64(MAX_BATCH), "Batch too large"
+
+        total = UInt64(0)
+        for i in urange(accounts.length):
+            account = accounts[i].native
+            amount = amounts[i].native
+            assert account in self.deposits, "No deposits found for this account"
+            assert amount > 0, "Withdrawal amount must be greater than zero"
+            self._debit_and_pay(account, amount)
+            total += amount
+
+        return total
 
-        remaining = current - amount
+    @abimethod()
+    def distribute_yield(self, pay_txn: gtxn.PaymentTransaction) -> UInt64:
+        """Spreads a payment across all depositors pro rata by raising the exchange index"""
+        assert pay_txn.receiver == Global.current_application_address, "Receiver must be the contract address"
+        assert pay_txn.amount > 0, "Yield amount must be greater than zero"
+        assert self.total_shares > 0, "No depositors"
+
+        high, low = op.mulw(pay_txn.amount, UInt64(INDEX_SCALE))
+        self.exchange_index += op.divw(high, low, self.total_shares)
+        self.total_deposit += pay_txn.amount
+        return self.exchange_index
+
+    @abimethod()
+    def set_custodian(self, custodian: Account, enabled: bool) -> None:
+        """Admin allows or revokes a custodian for the batch entry points"""
+        assert Txn.sender == self.admin, "Only admin"
+        if enabled:
+            self.custodians[custodian] = UInt64(1)
+        elif custodian in self.custodians:
+            del self.custodians[custodian]
+
+    @abimethod(readonly=True)
+    def get_balances(self, accounts: DynamicArray[Address]) -> DynamicArray[ARC4UInt64]:
+        """Current balance of each account in input order (0 for non-depositors), up to 64 per call"""
+        assert accounts.length <= UInt64(MAX_BALANCE_LOOKUP), "Too many accounts"
+
+        packed = Bytes()
+        for i in urange(accounts.length):
+            packed += op.itob(self._balance_of(accounts[i].native))
+        return DynamicArray[ARC4UInt64].from_bytes(ARC4UInt16(accounts.length).bytes + packed)
+
+    @abimethod(readonly=True)
+    def get_depositors_page(self, offset: UInt64, limit: UInt64) -> DynamicArray[DepositorEntry]:
+        """
+        Returns up to `limit` depositors with their balances, starting at index `offset`.
+        Capped at 25 rows per call; page with offset up to depositor_count.
+        """
+        if offset >= self.depositor_count:
+            return DynamicArray[DepositorEntry]()
+
+        page_size = self.depositor_count - offset
+        if limit < page_size:
+            page_size = limit
+        if page_size > MAX_DEPOSITOR_PAGE:
+            page_size = UInt64(MAX_DEPOSITOR_PAGE)
+
+        packed = Bytes()
+        for index in urange(offset, offset + page_size):
+            depositor = address_at(Bytes(DEPOSITOR_INDEX_PREFIX), index)
+            packed += depositor.bytes + op.itob(self._balance_of(depositor))
+        return DynamicArray[DepositorEntry].from_bytes(ARC4UInt16(page_size).bytes + packed)
+
+    @subroutine
+    def _credit(self, account: Account, amount: UInt64) -> None:
+        """Converts amount to shares (rounding down) and adds them to the account"""
+        high, low = op.mulw(amount, UInt64(INDEX_SCALE))
+        shares = op.divw(high, low, self.exchange_index)
+        assert shares > 0, "Deposit too small"
+
+        if account in self.deposits:
+            current = self.deposits[account].copy()
+            self.deposits[account] = DepositRecord(
+                index=current.index, shares=ARC4UInt64(current.shares.native + shares)
+            )
+        else:
+            self.deposits[account] = DepositRecord(
+                index=ARC4UInt64(self.depositor_count), shares=ARC4UInt64(shares)
+            )
+            append_address(Bytes(DEPOSITOR_INDEX_PREFIX), self.depositor_count, account)
+            self.depositor_count += UInt64(1)
+
+        self.total_shares += shares
+        self.total_deposit += amount
+
+    @subroutine
+    def _debit_and_pay(self, account: Account, amount: UInt64) -> UInt64:
+        """
+        Burns the shares backing amount (rounding up), pays it out and returns the remaining balance.
+        Leftover shares worth less than one microAlgo are burned too, closing the account.
+        """
+        high, low = op.mulw(amount, UInt64(INDEX_SCALE))
+        shares = op.divw(high, low, self.exchange_index)
+        check_high, check_low = op.mulw(shares, self.exchange_index)
+        if check_high != high or check_low != low:
+            shares += UInt64(1)
+        current = self.deposits[account].copy()
+        assert shares <= current.shares.native, "Withdrawal amount exceeds balance"
+
+        itxn.Payment(receiver=account, amount=amount, fee=0).submit()
+
+        remaining = current.shares.native - shares
+        if remaining > UInt64(0) and self._shares_to_amount(remaining) == UInt64(0):
+            shares += remaining
+            remaining = UInt64(0)
         if remaining == UInt64(0):
-            del self.deposits[Txn.sender]
+            del self.deposits[account]
+            self._remove_depositor(current.index.native)
         else:
-            self.deposits[Txn.sender] = remaining
+            self.deposits[account] = DepositRecord(index=current.index, shares=ARC4UInt64(remaining))
+
+        self.total_shares -= shares
+        self.total_deposit -= amount
+        return self._shares_to_amount(remaining)
+
+    @subroutine
+    def _balance_of(self, account: Account) -> UInt64:
+        if account not in self.deposits:
+            return UInt64(0)
+        return self._shares_to_amount(self.deposits[account].shares.native)
 
-        return remaining
+    @subroutine
+    def _shares_to_amount(self, shares: UInt64) -> UInt64:
+        high, low = op.mulw(shares, self.exchange_index)
+        return op.divw(high, low, UInt64(INDEX_SCALE))
 
+    @subroutine
+    def _remove_depositor(self, index: UInt64) -> None:
+        """Move the last depositor into the freed index and shrink the index by one"""
+        last = self.depositor_count - UInt64(1)
+        if index != last:
+            moved = address_at(Bytes(DEPOSITOR_INDEX_PREFIX), last)
+            replace_address(Bytes(DEPOSITOR_INDEX_PREFIX), index, moved)
+            self.deposits[moved] = DepositRecord(index=ARC4UInt64(index), shares=self.deposits[moved].shares)
 
+        pop_address(Bytes(DEPOSITOR_INDEX_PREFIX), self.depositor_count)
+        self.depositor_count = last
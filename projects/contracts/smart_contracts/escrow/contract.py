@@ -1,5 +1,148 @@
 from algopy import *
-from algopy.arc4 import abimethod, Address
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    Bool as ARC4Bool,
+    DynamicArray,
+    DynamicBytes,
+    Struct,
+    UInt16 as ARC4UInt16,
+    UInt64 as ARC4UInt64,
+)
+
+from smart_contracts._common.subroutines import (
+    address_at,
+    append_address,
+    approver_index,
+    assert_unique_approvers,
+    popcount,
+)
+
+# Withdrawal request box: "wr_" + itob(request_id) -> WithdrawalRequest
+# One box per request: 64 bytes of fixed fields, 3 × 2-byte offsets, then the
+# purpose, quotation and receipt hashes. Byte offsets of the fixed fields are
+# used for in-place box_replace updates.
+WR_AMOUNT = 0
+WR_STATUS = 8
+WR_AI_SCORE = 16
+WR_VOTES_FOR = 24
+WR_VOTES_AGAINST = 32
+WR_TIMESTAMP = 40
+WR_VOTING_DEADLINE = 48
+WR_RECEIPT_AI_SCORE = 56
+WR_FIXED_SIZE = 64
+
+# Request index box: "rq_index" -> itob(request_id) per request, in submission order,
+# so requests can be paged by position even though ids are caller-chosen.
+REQUEST_INDEX_KEY = b"rq_index"
+# ABI return values are logged (1024 byte cap): 14 × 72-byte summaries per page
+MAX_REQUEST_PAGE = 14
+
+# Donor index boxes: "dx_" + itob(chunk) -> up to 32 donor addresses (1 KB), where
+# donor index i lives in chunk i // 32 at offset (i % 32) * 32.
+DONOR_INDEX_PREFIX = b"dx_"
+# 25 × 40-byte DonorEntry rows per page
+MAX_DONOR_PAGE = 25
+
+# Box minimum balance: 2500 + 400 * (key length + value length) microAlgos
+BOX_FLAT_MBR = 2500
+BOX_BYTE_MBR = 400
+
+# Vote bitmap box: "vb_" + itob(request_id) -> one bit per donor index, set once
+# the donor has voted on that request. 1,000 donors fit in 125 bytes. Kept after
+# voting closes (approved, rejected or expired) until cleanup_votes deletes it.
+
+# Approver box: "approvers" -> concatenated 32-byte addresses; approver i owns bit i
+# of approval_mask. Boards are capped at 24 members so get_campaign_snapshot, which
+# returns the whole board, stays under the 1024-byte ABI log cap.
+APPROVERS_KEY = b"approvers"
+MAX_APPROVERS = 24
+
+# A refund below this to an empty (closed) account would fail the batch, so it is
+# parked in "pr_" + donor -> amount and pulled with claim_refund instead. The parked
+# refund itself covers the box MBR (2500 + 400 * (35 + 8) microAlgos) until it is
+# claimed; a refund smaller than that stays in escrow.
+MIN_ACCOUNT_BALANCE = 100000
+PENDING_REFUND_MBR = 19700
+# Donors paid per refund_batch call
+MAX_REFUND_BATCH = 32
+
+# Relayed ballot: 0-ALGO payment to the app, note = "vote" + itob(request_id) + itob(vote)
+BALLOT_PREFIX = b"vote"
+BALLOT_NOTE_SIZE = 20
+# Opcode budget reserved per group transaction scanned by vote_on_request_batch
+BALLOT_BUDGET = 160
+
+
+class WithdrawalRequest(Struct):
+    """
+    Withdrawal request record with its proof hashes.
+    Status codes: 0=pending_ai, 1=ai_approved, 2=pending_vote,
+                  3=approved, 4=rejected, 5=released, 6=completed,
+                  7=expired (voting deadline passed without a majority)
+    receipt_hash is last so submit_spend_proof can append it with a resize.
+    """
+
+    amount: ARC4UInt64
+    status: ARC4UInt64
+    ai_score: ARC4UInt64
+    votes_for: ARC4UInt64
+    votes_against: ARC4UInt64
+    timestamp: ARC4UInt64
+    voting_deadline: ARC4UInt64
+    receipt_ai_score: ARC4UInt64
+    purpose_hash: DynamicBytes
+    quotation_hash: DynamicBytes
+    receipt_hash: DynamicBytes
+
+
+class RequestSummary(Struct):
+    """Fixed-width page row: request id + the 64 fixed bytes of its WithdrawalRequest"""
+
+    request_id: ARC4UInt64
+    amount: ARC4UInt64
+    status: ARC4UInt64
+    ai_score: ARC4UInt64
+    votes_for: ARC4UInt64
+    votes_against: ARC4UInt64
+    timestamp: ARC4UInt64
+    voting_deadline: ARC4UInt64
+    receipt_ai_score: ARC4UInt64
+
+
+class DonorEntry(Struct):
+    """Donor page row: address + total donated"""
+
+    donor: Address
+    total: ARC4UInt64
+
+
+class DonorRecord(Struct):
+    """Per-donor box value: dense index assigned at first donation + total donated"""
+
+    index: ARC4UInt64
+    total: ARC4UInt64
+
+
+class CampaignSnapshot(Struct):
+    """Everything a campaign page needs, returned by get_campaign_snapshot"""
+
+    goal_amount: ARC4UInt64
+    raised_amount: ARC4UInt64
+    current_milestone: ARC4UInt64
+    milestone_count: ARC4UInt64
+    contributor_count: ARC4UInt64
+    is_active: ARC4Bool
+    goal_reached: ARC4Bool
+    deadline: ARC4UInt64
+    creator: Address
+    approval_threshold: ARC4UInt64
+    approval_mask: ARC4UInt64
+    total_released: ARC4UInt64
+    request_count: ARC4UInt64
+    rejection_count: ARC4UInt64
+    is_frozen: ARC4Bool
+    approvers: DynamicArray[Address]
 
 
 class FundraiserEscrow(ARC4Contract):
@@ -28,13 +171,10 @@ class FundraiserEscrow(ARC4Contract):
     contributor_count: UInt64
     goal_reached: bool
 
-    # Multi-signature approvers
-    approver1: Account
-    approver2: Account
-    approver3: Account
-    approver1_approved: bool
-    approver2_approved: bool
-    approver3_approved: bool
+    # N-of-M approvers (addresses in the approvers box) and current milestone approvals
+    approver_count: UInt64
+    approval_threshold: UInt64
+    approval_mask: UInt64
 
     # Escrow tracking
     total_released: UInt64
@@ -43,8 +183,14 @@ class FundraiserEscrow(ARC4Contract):
     is_frozen: bool
     voting_window: UInt64  # default 172800 = 48 hours
 
+    # Refunds for frozen campaigns
+    refund_pool: UInt64  # unreleased funds snapshotted at the first refund batch
+    refund_cursor: UInt64  # next donor index to refund
+    total_refunded: UInt64
+
     def __init__(self) -> None:
-        self.donors = BoxMap(Account, UInt64, key_prefix=b"d_")
+        self.donors = BoxMap(Account, DonorRecord, key_prefix=b"d_")
+        self.pending_refunds = BoxMap(Account, UInt64, key_prefix=b"pr_")
 
     @abimethod(allow_actions=["NoOp"], create="require")
     def create_campaign(
@@ -52,10 +198,15 @@ class FundraiserEscrow(ARC4Contract):
         goal: UInt64,
         milestones: UInt64,
         deadline: UInt64,
-        approver1: Address,
-        approver2: Address,
-        approver3: Address,
+        approval_threshold: UInt64,
     ) -> UInt64:
+        """
+        Create campaign requiring `approval_threshold` approvals per milestone.
+        Approvers are registered next with set_approvers() once the app is funded.
+        """
+        assert approval_threshold > UInt64(0), "Threshold must be at least 1"
+        assert approval_threshold <= UInt64(MAX_APPROVERS), "Threshold exceeds maximum board size"
+
         self.goal_amount = goal
         self.raised_amount = UInt64(0)
         self.milestone_count = milestones
@@ -66,12 +217,9 @@ class FundraiserEscrow(ARC4Contract):
         self.contributor_count = UInt64(0)
         self.goal_reached = False
 
-        self.approver1 = approver1.native
-        self.approver2 = approver2.native
-        self.approver3 = approver3.native
-        self.approver1_approved = False
-        self.approver2_approved = False
-        self.approver3_approved = False
+        self.approver_count = UInt64(0)
+        self.approval_threshold = approval_threshold
+        self.approval_mask = UInt64(0)
 
         # Escrow state
         self.total_released = UInt64(0)
@@ -80,8 +228,31 @@ class FundraiserEscrow(ARC4Contract):
         self.is_frozen = False
         self.voting_window = UInt64(172800)  # 48 hours
 
+        self.refund_pool = UInt64(0)
+        self.refund_cursor = UInt64(0)
+        self.total_refunded = UInt64(0)
+
         return UInt64(1)
 
+    @abimethod()
+    def set_approvers(self, approvers: DynamicArray[Address]) -> UInt64:
+        """
+        Register the approver board (creator only, once).
+        Requires box MBR funding before calling: 2500 + 400 * (9 + 32 * M) microAlgos.
+        """
+        assert Txn.sender == self.creator, "Only creator"
+        assert self.approver_count == UInt64(0), "Approvers already set"
+        count = approvers.length
+        assert count >= self.approval_threshold, "Fewer approvers than threshold"
+        assert count <= UInt64(MAX_APPROVERS), "Maximum 24 approvers"
+
+        assert_unique_approvers(approvers)
+
+        # Store raw addresses (drop the ARC-4 length prefix) so approver i is at i * 32
+        op.Box.put(APPROVERS_KEY, op.extract(approvers.bytes, 2, count * UInt64(32)))
+        self.approver_count = count
+        return count
+
     @abimethod()
     def donate(self, payment: gtxn.PaymentTransaction) -> UInt64:
         """Donate to the campaign. Tracks per-donor amount for vote weighting."""
@@ -92,14 +263,23 @@ class FundraiserEscrow(ARC4Contract):
         assert payment.amount >= UInt64(100000), "Minimum 0.1 ALGO"
 
         self.raised_amount += payment.amount
-        self.contributor_count += UInt64(1)
 
-        # Track per-donor total for weighted voting
-        existing, exists = self.donors.maybe(payment.sender)
-        if exists:
-            self.donors[payment.sender] = existing + payment.amount
+        # Track per-donor total for weighted voting. A first donation assigns the
+        # next dense index, records the address in the donor index and counts a
+        # new unique contributor.
+        if payment.sender in self.donors:
+            existing = self.donors[payment.sender].copy()
+            self.donors[payment.sender] = DonorRecord(
+                index=existing.index,
+                total=ARC4UInt64(existing.total.native + payment.amount),
+            )
         else:
-            self.donors[payment.sender] = payment.amount
+            self.donors[payment.sender] = DonorRecord(
+                index=ARC4UInt64(self.contributor_count),
+                total=ARC4UInt64(payment.amount),
+            )
+            append_address(Bytes(DONOR_INDEX_PREFIX), self.contributor_count, payment.sender)
+            self.contributor_count += UInt64(1)
 
         if self.raised_amount >= self.goal_amount:
             self.goal_reached = True
@@ -108,41 +288,25 @@ class FundraiserEscrow(ARC4Contract):
 
     @abimethod()
     def approve_milestone(self) -> UInt64:
-        """Approver signs off on current milestone (3-of-3 multisig)."""
+        """Approver signs off on current milestone (N-of-M multisig)."""
         assert self.goal_reached, "Goal not reached"
         assert self.current_milestone < self.milestone_count, "All milestones done"
 
-        sender = Txn.sender
-        if sender == self.approver1:
-            assert not self.approver1_approved, "Already approved"
-            self.approver1_approved = True
-        elif sender == self.approver2:
-            assert not self.approver2_approved, "Already approved"
-            self.approver2_approved = True
-        elif sender == self.approver3:
-            assert not self.approver3_approved, "Already approved"
-            self.approver3_approved = True
-        else:
-            assert False, "Not an approver"
-
-        count = UInt64(0)
-        if self.approver1_approved:
-            count += UInt64(1)
-        if self.approver2_approved:
-            count += UInt64(1)
-        if self.approver3_approved:
-            count += UInt64(1)
-        return count
+        approver_index = self._approver_index(Txn.sender)
+        assert approver_index < self.approver_count, "Not an approver"
+        assert op.getbit(self.approval_mask, approver_index) == UInt64(0), "Already approved"
+        self.approval_mask = op.setbit_uint64(self.approval_mask, approver_index, 1)
+
+        return popcount(self.approval_mask)
 
     @abimethod()
     def release_milestone(self) -> UInt64:
-        """Release milestone funds after 3/3 approval."""
+        """Release milestone funds after threshold approval."""
         assert Txn.sender == self.creator, "Only creator"
+        assert not self.is_frozen, "Campaign frozen"
         assert self.current_milestone < self.milestone_count, "All done"
         assert self.goal_reached, "Goal not reached"
-        assert self.approver1_approved, "Approver 1 pending"
-        assert self.approver2_approved, "Approver 2 pending"
-        assert self.approver3_approved, "Approver 3 pending"
+        assert popcount(self.approval_mask) >= self.approval_threshold, "Not enough approvals"
 
         amount_per_milestone = self.goal_amount // self.milestone_count
         min_balance = UInt64(100000)
@@ -152,9 +316,7 @@ class FundraiserEscrow(ARC4Contract):
 
         self.current_milestone += UInt64(1)
         self.total_released += amount_per_milestone
-        self.approver1_approved = False
-        self.approver2_approved = False
-        self.approver3_approved = False
+        self.approval_mask = UInt64(0)
 
         return self.current_milestone
 
@@ -172,7 +334,7 @@ class FundraiserEscrow(ARC4Contract):
     ) -> UInt64:
         """
         Fundraiser submits a withdrawal request with quotation proof.
-        Creates a box: req_{id} with packed data.
+        Creates a single box: wr_{id} holding the WithdrawalRequest record.
         """
         assert Txn.sender == self.creator, "Only creator"
         assert not self.is_frozen, "Campaign frozen"
@@ -182,38 +344,34 @@ class FundraiserEscrow(ARC4Contract):
         assert amount_requested <= remaining, "Exceeds available"
         assert amount_requested > UInt64(0), "Zero amount"
 
-        # Box key: "wr_" + request_id (8 bytes)
-        box_key = b"wr_" + op.itob(request_id)
+        box_key = self._request_key(request_id)
 
         # Check request doesn't already exist
-        _existing, exists = op.Box.get(box_key)
+        _length, exists = op.Box.length(box_key)
         assert not exists, "Request already exists"
 
-        # Pack data: amount(8) + status(8) + ai_score(8) + votes_for(8) + votes_against(8) +
-        #            timestamp(8) + voting_deadline(8) = 56 bytes fixed
-        # Then: purpose_hash (variable) + quotation_hash (variable) stored separately
-        status = UInt64(0)  # 0=pending_ai
-        timestamp = Global.latest_timestamp
-        voting_deadline = UInt64(0)
-
-        packed = (
-            op.itob(amount_requested)
-            + op.itob(status)
-            + op.itob(UInt64(0))  # ai_score
-            + op.itob(UInt64(0))  # votes_for
-            + op.itob(UInt64(0))  # votes_against
-            + op.itob(timestamp)
-            + op.itob(voting_deadline)
+        # Single record box; receipt fields are filled in by submit_spend_proof
+        request = WithdrawalRequest(
+            amount=ARC4UInt64(amount_requested),
+            status=ARC4UInt64(0),  # pending_ai
+            ai_score=ARC4UInt64(0),
+            votes_for=ARC4UInt64(0),
+            votes_against=ARC4UInt64(0),
+            timestamp=ARC4UInt64(Global.latest_timestamp),
+            voting_deadline=ARC4UInt64(0),
+            receipt_ai_score=ARC4UInt64(0),
+            purpose_hash=DynamicBytes(purpose_hash),
+            quotation_hash=DynamicBytes(quotation_hash),
+            receipt_hash=DynamicBytes(),
         )
-        op.Box.put(box_key, packed)
+        op.Box.put(box_key, request.bytes)
 
-        # Store quotation hash in separate box
-        quote_key = b"qt_" + op.itob(request_id)
-        op.Box.put(quote_key, quotation_hash)
-
-        # Store purpose hash
-        purp_key = b"pp_" + op.itob(request_id)
-        op.Box.put(purp_key, purpose_hash)
+        # Append the id to the dense request index (position = request_count)
+        if self.request_count == UInt64(0):
+            assert op.Box.create(REQUEST_INDEX_KEY, 8), "Failed to create request index"
+        else:
+            op.Box.resize(REQUEST_INDEX_KEY, (self.request_count + UInt64(1)) * UInt64(8))
+        op.Box.replace(REQUEST_INDEX_KEY, self.request_count * UInt64(8), op.itob(request_id))
 
         self.request_count += UInt64(1)
         return request_id
@@ -225,27 +383,16 @@ class FundraiserEscrow(ARC4Contract):
         ai_confidence_score: UInt64,
     ) -> UInt64:
         """Record AI verification result. Sets status and opens voting."""
-        box_key = b"wr_" + op.itob(request_id)
-        packed, exists = op.Box.get(box_key)
-        assert exists, "Request not found"
-
-        status = op.extract_uint64(packed, 8)
-        assert status == UInt64(0), "Not pending AI"
+        request = self._load_request(request_id)
+        assert request.status.native == UInt64(0), "Not pending AI"
 
         # Update status: 1=ai_approved (>=80), 2=pending_vote (<80)
         new_status = UInt64(1) if ai_confidence_score >= UInt64(80) else UInt64(2)
         voting_deadline = Global.latest_timestamp + self.voting_window
 
-        new_packed = (
-            op.extract(packed, 0, 8)  # amount
-            + op.itob(new_status)  # status
-            + op.itob(ai_confidence_score)  # ai_score
-            + op.extract(packed, 24, 8)  # votes_for
-            + op.extract(packed, 32, 8)  # votes_against
-            + op.extract(packed, 40, 8)  # timestamp
-            + op.itob(voting_deadline)  # voting_deadline
-        )
-        op.Box.put(box_key, new_packed)
+        self._set_request_field(request_id, UInt64(WR_STATUS), new_status)
+        self._set_request_field(request_id, UInt64(WR_AI_SCORE), ai_confidence_score)
+        self._set_request_field(request_id, UInt64(WR_VOTING_DEADLINE), voting_deadline)
         return ai_confidence_score
 
     @abimethod()
@@ -259,92 +406,128 @@ class FundraiserEscrow(ARC4Contract):
         vote: 1=approve, 0=reject
         Returns current approval percentage (0-100).
         """
-        box_key = b"wr_" + op.itob(request_id)
-        packed, exists = op.Box.get(box_key)
-        assert exists, "Request not found"
-
-        status = op.extract_uint64(packed, 8)
+        request = self._load_request(request_id)
+        status = request.status.native
         assert status == UInt64(1) or status == UInt64(2), "Not in voting phase"
-
-        voting_deadline = op.extract_uint64(packed, 48)
-        assert Global.latest_timestamp <= voting_deadline, "Voting ended"
+        assert Global.latest_timestamp <= request.voting_deadline.native, "Voting ended"
 
         # Check caller is a donor
-        donor_amount, is_donor = self.donors.maybe(Txn.sender)
-        assert is_donor, "Not a donor"
-
-        # Check hasn't voted already (per-request vote box)
-        vote_key = b"vt_" + op.itob(request_id) + Txn.sender.bytes
-        _vote_data, already_voted = op.Box.get(vote_key)
-        assert not already_voted, "Already voted"
+        assert Txn.sender in self.donors, "Not a donor"
+        donor = self.donors[Txn.sender].copy()
+        donor_amount = donor.total.native
 
-        # Record vote
-        op.Box.put(vote_key, op.itob(vote))
+        # Check hasn't voted already and record the vote (one bit per donor)
+        self._mark_voted(request_id, donor.index.native)
 
         # Update tallies
-        votes_for = op.extract_uint64(packed, 24)
-        votes_against = op.extract_uint64(packed, 32)
+        votes_for = request.votes_for.native
+        votes_against = request.votes_against.native
 
         if vote == UInt64(1):
             votes_for += donor_amount
         else:
             votes_against += donor_amount
 
-        # Check if threshold reached (>50% of raised)
-        threshold = self.raised_amount // UInt64(2)
-        new_status = op.extract_uint64(packed, 8)
+        return self._apply_tally(request_id, votes_for, votes_against)
 
-        if votes_for > threshold:
-            new_status = UInt64(3)  # approved
-        elif votes_against > threshold:
-            new_status = UInt64(4)  # rejected
-            self.rejection_count += UInt64(1)
-            if self.rejection_count >= UInt64(3):
-                self.is_frozen = True
+    @abimethod()
+    def vote_on_request_batch(self, request_id: UInt64) -> UInt64:
+        """
+        Tally several donors' votes on one request in a single app call.
+        Each ballot is a 0-ALGO payment from the donor to the app address in the
+        same group, with note "vote" + itob(request_id) + itob(vote) (1=approve,
+        0=reject). The donor's signature on the payment authenticates the vote,
+        and a relayer can cover ballot fees through fee pooling.
+        Tallies and the threshold/status transition are written once per batch;
+        extra opcode budget for the scan is drawn from the group's fee credit.
+        Returns current approval percentage (0-100).
+        """
+        request = self._load_request(request_id)
+        status = request.status.native
+        assert status == UInt64(1) or status == UInt64(2), "Not in voting phase"
+        assert Global.latest_timestamp <= request.voting_deadline.native, "Voting ended"
+
+        votes_for = request.votes_for.native
+        votes_against = request.votes_against.native
+        ballot_count = UInt64(0)
+
+        ensure_budget(Global.group_size * UInt64(BALLOT_BUDGET), fee_source=OpUpFeeSource.GroupCredit)
+
+        for i in urange(Global.group_size):
+            ballot = gtxn.Transaction(i)
+            if (
+                ballot.type == TransactionType.Payment
+                and ballot.receiver == Global.current_application_address
+                and ballot.note.length == BALLOT_NOTE_SIZE
+                and op.extract(ballot.note, 0, 4) == BALLOT_PREFIX
+            ):
+                assert ballot.amount == UInt64(0), "Ballot must be a 0 ALGO payment"
+                assert ballot.close_remainder_to == Global.zero_address, "Ballot cannot close account"
+                assert ballot.rekey_to == Global.zero_address, "Ballot cannot rekey"
+                assert op.extract_uint64(ballot.note, 4) == request_id, "Ballot for another request"
+
+                assert ballot.sender in self.donors, "Not a donor"
+                donor = self.donors[ballot.sender].copy()
+                self._mark_voted(request_id, donor.index.native)
+
+                if op.extract_uint64(ballot.note, 12) == UInt64(1):
+                    votes_for += donor.total.native
+                else:
+                    votes_against += donor.total.native
+                ballot_count += UInt64(1)
+
+        assert ballot_count > UInt64(0), "No ballots in group"
+        return self._apply_tally(request_id, votes_for, votes_against)
 
-        new_packed = (
-            op.extract(packed, 0, 8)  # amount
-            + op.itob(new_status)
-            + op.extract(packed, 16, 8)  # ai_score
-            + op.itob(votes_for)
-            + op.itob(votes_against)
-            + op.extract(packed, 40, 8)  # timestamp
-            + op.extract(packed, 48, 8)  # voting_deadline
-        )
-        op.Box.put(box_key, new_packed)
+    @abimethod()
+    def expire_request(self, request_id: UInt64) -> UInt64:
+        """
+        Close voting on a request whose deadline passed without a majority either
+        way. Callable by anyone. An expired request does
+        not count towards the rejections that freeze the campaign.
+        Returns the new status (7=expired).
+        """
+        request = self._load_request(request_id)
+        status = request.status.native
+        assert status == UInt64(1) or status == UInt64(2), "Not in voting phase"
+        assert Global.latest_timestamp > request.voting_deadline.native, "Voting still open"
 
-        # Return approval percentage
-        total_votes = votes_for + votes_against
-        if total_votes > UInt64(0):
-            return (votes_for * UInt64(100)) // total_votes
-        return UInt64(0)
+        self._set_request_field(request_id, UInt64(WR_STATUS), UInt64(7))  # expired
+        return UInt64(7)
+
+    @abimethod()
+    def cleanup_votes(self, request_id: UInt64) -> UInt64:
+        """
+        Delete the vote bitmap of a request whose voting has closed, freeing its MBR.
+        Callable by anyone. has_voted reads False for every donor afterwards.
+        Returns the MBR freed.
+        """
+        request = self._load_request(request_id)
+        assert request.status.native >= UInt64(3), "Voting still open"
+
+        bitmap_key = b"vb_" + op.itob(request_id)
+        bitmap_length, exists = op.Box.length(bitmap_key)
+        assert exists, "Nothing to clean up"
+        op.Box.delete(bitmap_key)
+        return UInt64(BOX_FLAT_MBR) + UInt64(BOX_BYTE_MBR) * (bitmap_key.length + bitmap_length)
 
     @abimethod()
     def release_request_funds(self, request_id: UInt64) -> UInt64:
         """Release funds for an approved withdrawal request."""
         assert Txn.sender == self.creator, "Only creator"
+        assert not self.is_frozen, "Campaign frozen"
 
-        box_key = b"wr_" + op.itob(request_id)
-        packed, exists = op.Box.get(box_key)
-        assert exists, "Request not found"
-
-        status = op.extract_uint64(packed, 8)
-        assert status == UInt64(3), "Not approved"
+        request = self._load_request(request_id)
+        assert request.status.native == UInt64(3), "Not approved"
 
-        amount = op.extract_uint64(packed, 0)
+        amount = request.amount.native
         min_balance = UInt64(100000)
         assert Global.current_application_address.balance >= amount + min_balance
 
         itxn.Payment(receiver=self.creator, amount=amount, fee=0).submit()
         self.total_released += amount
 
-        # Update status to released (5)
-        new_packed = (
-            op.extract(packed, 0, 8)
-            + op.itob(UInt64(5))  # released
-            + op.extract(packed, 16, 40)
-        )
-        op.Box.put(box_key, new_packed)
+        self._set_request_field(request_id, UInt64(WR_STATUS), UInt64(5))  # released
 
         return amount
 
@@ -358,36 +541,92 @@ class FundraiserEscrow(ARC4Contract):
         """Submit post-spend receipt proof for an already-released request."""
         assert Txn.sender == self.creator, "Only creator"
 
-        box_key = b"wr_" + op.itob(request_id)
-        packed, exists = op.Box.get(box_key)
-        assert exists, "Request not found"
+        request = self._load_request(request_id)
+        assert request.status.native == UInt64(5), "Not released yet"
 
-        status = op.extract_uint64(packed, 8)
-        assert status == UInt64(5), "Not released yet"
+        # Append receipt_hash: it is the last field, so its (empty) length
+        # prefix sits in the final 2 bytes of the box and no offsets move
+        box_key = self._request_key(request_id)
+        box_length, _exists = op.Box.length(box_key)
+        op.Box.resize(box_key, box_length + receipt_hash.length)
+        op.Box.replace(box_key, box_length - UInt64(2), DynamicBytes(receipt_hash).bytes)
 
-        # Store receipt in separate box
-        receipt_key = b"rc_" + op.itob(request_id)
-        op.Box.put(receipt_key, receipt_hash)
+        self._set_request_field(request_id, UInt64(WR_RECEIPT_AI_SCORE), receipt_ai_score)
+        self._set_request_field(request_id, UInt64(WR_STATUS), UInt64(6))  # completed
 
-        # Store receipt AI score
-        rcs_key = b"rs_" + op.itob(request_id)
-        op.Box.put(rcs_key, op.itob(receipt_ai_score))
+        return True
 
-        # Update status to completed (6)
-        new_packed = (
-            op.extract(packed, 0, 8)
-            + op.itob(UInt64(6))  # completed
-            + op.extract(packed, 16, 40)
-        )
-        op.Box.put(box_key, new_packed)
+    # ============================================================
+    # REFUNDS (frozen campaigns)
+    # ============================================================
 
-        return True
+    @abimethod()
+    def refund_batch(self, start: UInt64, count: UInt64) -> UInt64:
+        """
+        Refund up to `count` donors of a frozen campaign, walking the donor index
+        from `start` (must equal the refund cursor, so batches resume in order and
+        nobody is paid twice). Each donor gets total_donated * refund_pool / raised;
+        a refund below 0.1 ALGO to an empty account is parked for claim_refund.
+        The pool is what escrow can actually spend: box MBRs paid out of donations
+        stay locked, so the last batch never runs into the app's minimum balance.
+        Anyone may call this. The caller covers the inner payment fees through fee
+        pooling, and extra opcode budget is drawn from the same group credit.
+        Returns the new refund cursor.
+        """
+        assert self.is_frozen, "Campaign not frozen"
+        assert start == self.refund_cursor, "Start must equal refund cursor"
+        assert start < self.contributor_count, "All donors refunded"
+        assert count <= UInt64(MAX_REFUND_BATCH), "Batch too large"
+
+        if start == UInt64(0):
+            # Freeze the pool at what escrow still holds for donors, less the
+            # minimum balance that backs its boxes
+            app = Global.current_application_address
+            self.refund_pool = self.raised_amount - self.total_released
+            if app.balance - app.min_balance < self.refund_pool:
+                self.refund_pool = app.balance - app.min_balance
+            self.is_active = False
+
+        end = start + count
+        if end > self.contributor_count:
+            end = self.contributor_count
+
+        ensure_budget((end - start) * UInt64(100), fee_source=OpUpFeeSource.GroupCredit)
+
+        for donor_index in urange(start, end):
+            donor = address_at(Bytes(DONOR_INDEX_PREFIX), donor_index)
+            high, low = op.mulw(self.donors[donor].total.native, self.refund_pool)
+            refund = op.divw(high, low, self.raised_amount)
+            if refund >= UInt64(MIN_ACCOUNT_BALANCE) or (refund > UInt64(0) and donor.balance > UInt64(0)):
+                itxn.Payment(receiver=donor, amount=refund, fee=0).submit()
+                self.total_refunded += refund
+            elif refund >= UInt64(PENDING_REFUND_MBR):
+                self.pending_refunds[donor] = refund
+
+        self.refund_cursor = end
+        return end
+
+    @abimethod()
+    def claim_refund(self) -> UInt64:
+        """Pay the caller a refund refund_batch parked for them. Returns the amount paid."""
+        refund, exists = self.pending_refunds.maybe(Txn.sender)
+        assert exists, "No pending refund"
+
+        del self.pending_refunds[Txn.sender]
+        itxn.Payment(receiver=Txn.sender, amount=refund, fee=0).submit()
+        self.total_refunded += refund
+        return refund
+
+    @abimethod(readonly=True)
+    def get_refund_status(self) -> tuple[UInt64, UInt64, UInt64]:
+        """Returns (refund_pool, refund_cursor, total_refunded)"""
+        return (self.refund_pool, self.refund_cursor, self.total_refunded)
 
     # ============================================================
     # READ METHODS
     # ============================================================
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_status(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64, bool, bool]:
         return (
             self.goal_amount,
@@ -410,70 +649,224 @@ class FundraiserEscrow(ARC4Contract):
         Returns withdrawal request info:
         (amount, status, ai_score, votes_for, votes_against, timestamp, voting_deadline)
         Status codes: 0=pending_ai, 1=ai_approved, 2=pending_vote,
-                      3=approved, 4=rejected, 5=released, 6=completed
+                      3=approved, 4=rejected, 5=released, 6=completed,
+                  7=expired (voting deadline passed without a majority)
         """
-        box_key = b"wr_" + op.itob(request_id)
-        packed, exists = op.Box.get(box_key)
-        assert exists, "Request not found"
-
+        request = self._load_request(request_id)
         return (
-            op.extract_uint64(packed, 0),
-            op.extract_uint64(packed, 8),
-            op.extract_uint64(packed, 16),
-            op.extract_uint64(packed, 24),
-            op.extract_uint64(packed, 32),
-            op.extract_uint64(packed, 40),
-            op.extract_uint64(packed, 48),
+            request.amount.native,
+            request.status.native,
+            request.ai_score.native,
+            request.votes_for.native,
+            request.votes_against.native,
+            request.timestamp.native,
+            request.voting_deadline.native,
         )
 
+    @abimethod(readonly=True)
+    def get_request_record(self, request_id: UInt64) -> WithdrawalRequest:
+        """Returns the full withdrawal request record, including proof hashes."""
+        return self._load_request(request_id)
+
+    @abimethod(readonly=True)
+    def get_requests_page(self, offset: UInt64, limit: UInt64) -> DynamicArray[RequestSummary]:
+        """
+        Returns up to `limit` requests in submission order, starting at position `offset`.
+        Capped at 14 rows per call; page with offset to walk the full escrow history.
+        """
+        if offset >= self.request_count:
+            return DynamicArray[RequestSummary]()
+
+        page_size = self.request_count - offset
+        if limit < page_size:
+            page_size = limit
+        if page_size > MAX_REQUEST_PAGE:
+            page_size = UInt64(MAX_REQUEST_PAGE)
+
+        request_ids = op.Box.extract(REQUEST_INDEX_KEY, offset * UInt64(8), page_size * UInt64(8))
+        packed = Bytes()
+        for i in urange(page_size):
+            request_id_bytes = op.extract(request_ids, i * UInt64(8), 8)
+            packed += request_id_bytes + op.Box.extract(b"wr_" + request_id_bytes, 0, WR_FIXED_SIZE)
+        return DynamicArray[RequestSummary].from_bytes(ARC4UInt16(page_size).bytes + packed)
+
     @abimethod(readonly=True)
     def get_donor_weight(self, donor: Address) -> UInt64:
         """Get donor's voting weight (= total donated amount)."""
-        amount, exists = self.donors.maybe(donor.native)
-        if exists:
-            return amount
+        if donor.native in self.donors:
+            return self.donors[donor.native].total.native
         return UInt64(0)
 
     @abimethod(readonly=True)
-    def get_creator(self) -> Account:
-        return self.creator
+    def get_donors_page(self, offset: UInt64, limit: UInt64) -> DynamicArray[DonorEntry]:
+        """
+        Returns up to `limit` donors (address, total donated) in first-donation
+        order, starting at donor index `offset`. Capped at 25 rows per call.
+        """
+        if offset >= self.contributor_count:
+            return DynamicArray[DonorEntry]()
+
+        page_size = self.contributor_count - offset
+        if limit < page_size:
+            page_size = limit
+        if page_size > MAX_DONOR_PAGE:
+            page_size = UInt64(MAX_DONOR_PAGE)
+
+        packed = Bytes()
+        for donor_index in urange(offset, offset + page_size):
+            donor = address_at(Bytes(DONOR_INDEX_PREFIX), donor_index)
+            packed += donor.bytes + self.donors[donor].total.bytes
+        return DynamicArray[DonorEntry].from_bytes(ARC4UInt16(page_size).bytes + packed)
+
+    @abimethod(readonly=True)
+    def has_voted(self, request_id: UInt64, donor: Address) -> bool:
+        """
+        Whether a donor has voted on a request, also after voting has closed.
+        False for everyone once cleanup_votes has deleted the request's bitmap.
+        """
+        if donor.native not in self.donors:
+            return False
+        record = self.donors[donor.native].copy()
+
+        bitmap_key = b"vb_" + op.itob(request_id)
+        donor_index = record.index.native
+        bitmap_length, bitmap_exists = op.Box.length(bitmap_key)
+        if not bitmap_exists or donor_index // UInt64(8) >= bitmap_length:
+            return False
+        voted_byte = op.Box.extract(bitmap_key, donor_index // UInt64(8), 1)
+        return op.getbit(voted_byte, donor_index % UInt64(8)) == UInt64(1)
+
+    @abimethod(readonly=True)
+    def get_campaign_snapshot(self) -> CampaignSnapshot:
+        """
+        Status, deadline, creator, approver board, approval state and escrow
+        status in one call (replaces six separate getters on page load).
+        """
+        return CampaignSnapshot(
+            goal_amount=ARC4UInt64(self.goal_amount),
+            raised_amount=ARC4UInt64(self.raised_amount),
+            current_milestone=ARC4UInt64(self.current_milestone),
+            milestone_count=ARC4UInt64(self.milestone_count),
+            contributor_count=ARC4UInt64(self.contributor_count),
+            is_active=ARC4Bool(self.is_active),
+            goal_reached=ARC4Bool(self.goal_reached),
+            deadline=ARC4UInt64(self.deadline),
+            creator=Address(self.creator),
+            approval_threshold=ARC4UInt64(self.approval_threshold),
+            approval_mask=ARC4UInt64(self.approval_mask),
+            total_released=ARC4UInt64(self.total_released),
+            request_count=ARC4UInt64(self.request_count),
+            rejection_count=ARC4UInt64(self.rejection_count),
+            is_frozen=ARC4Bool(self.is_frozen),
+            approvers=self._approvers(),
+        )
+
+    @abimethod(readonly=True)
+    def get_creator(self) -> Address:
+        return Address(self.creator)
 
     @abimethod(readonly=True)
     def get_deadline(self) -> UInt64:
         return self.deadline
 
     @abimethod(readonly=True)
-    def get_approvers(self) -> tuple[Address, Address, Address]:
-        return (
-            Address(self.approver1.bytes),
-            Address(self.approver2.bytes),
-            Address(self.approver3.bytes),
-        )
+    def get_approvers(self) -> DynamicArray[Address]:
+        return self._approvers()
 
     @abimethod(readonly=True)
-    def get_approval_status(self) -> tuple[bool, bool, bool]:
-        return (self.approver1_approved, self.approver2_approved, self.approver3_approved)
+    def get_approval_status(self) -> tuple[UInt64, UInt64]:
+        """Returns (approval_mask, approval_threshold); bit i = approver i approved"""
+        return self.approval_mask, self.approval_threshold
 
     @abimethod(readonly=True)
     def get_approval_count(self) -> UInt64:
-        count = UInt64(0)
-        if self.approver1_approved:
-            count += UInt64(1)
-        if self.approver2_approved:
-            count += UInt64(1)
-        if self.approver3_approved:
-            count += UInt64(1)
-        return count
+        return popcount(self.approval_mask)
 
     @abimethod(readonly=True)
     def is_approver(self, address: Address) -> bool:
         account = address.native
         if account == self.creator:
             return True
-        if account == self.approver1:
-            return True
-        if account == self.approver2:
-            return True
-        if account == self.approver3:
-            return True
-        return False
+        return self._approver_index(account) < self.approver_count
+
+    # ============================================================
+    # APPROVER BOARD
+    # ============================================================
+
+    @subroutine
+    def _approvers(self) -> DynamicArray[Address]:
+        """Approver board as an ARC-4 array (empty until set_approvers)."""
+        approvers_bytes, exists = op.Box.get(APPROVERS_KEY)
+        if not exists:
+            return DynamicArray[Address]()
+        return DynamicArray[Address].from_bytes(ARC4UInt16(self.approver_count).bytes + approvers_bytes)
+
+    @subroutine
+    def _approver_index(self, account: Account) -> UInt64:
+        """Position of account in the approver box (approver_count if not found)."""
+        return approver_index(Bytes(APPROVERS_KEY), self.approver_count, account)
+
+    # ============================================================
+    # WITHDRAWAL REQUEST STORAGE
+    # ============================================================
+
+    @subroutine
+    def _request_key(self, request_id: UInt64) -> Bytes:
+        return b"wr_" + op.itob(request_id)
+
+    @subroutine
+    def _load_request(self, request_id: UInt64) -> WithdrawalRequest:
+        """Read the full request record in a single box read."""
+        packed, exists = op.Box.get(self._request_key(request_id))
+        assert exists, "Request not found"
+        return WithdrawalRequest.from_bytes(packed)
+
+    @subroutine
+    def _set_request_field(self, request_id: UInt64, offset: UInt64, value: UInt64) -> None:
+        """Overwrite one 8-byte field of the request record in place."""
+        op.Box.replace(self._request_key(request_id), offset, op.itob(value))
+
+    @subroutine
+    def _apply_tally(self, request_id: UInt64, votes_for: UInt64, votes_against: UInt64) -> UInt64:
+        """
+        Store new tallies and apply the >50%-of-raised approve/reject transition.
+        Returns current approval percentage (0-100).
+        """
+        self._set_request_field(request_id, UInt64(WR_VOTES_FOR), votes_for)
+        self._set_request_field(request_id, UInt64(WR_VOTES_AGAINST), votes_against)
+
+        # Check if threshold reached (>50% of raised)
+        threshold = self.raised_amount // UInt64(2)
+
+        if votes_for > threshold:
+            self._set_request_field(request_id, UInt64(WR_STATUS), UInt64(3))  # approved
+        elif votes_against > threshold:
+            self._set_request_field(request_id, UInt64(WR_STATUS), UInt64(4))  # rejected
+            self.rejection_count += UInt64(1)
+            if self.rejection_count >= UInt64(3):
+                self.is_frozen = True
+
+        # Return approval percentage
+        total_votes = votes_for + votes_against
+        if total_votes > UInt64(0):
+            return (votes_for * UInt64(100)) // total_votes
+        return UInt64(0)
+
+    @subroutine
+    def _mark_voted(self, request_id: UInt64, donor_index: UInt64) -> None:
+        """
+        Set the donor's bit in the request's vote bitmap, failing if already set.
+        The bitmap grows on demand, since donors can join after a request is made.
+        """
+        bitmap_key = b"vb_" + op.itob(request_id)
+        byte_index = donor_index // UInt64(8)
+        bitmap_length, bitmap_exists = op.Box.length(bitmap_key)
+        if not bitmap_exists:
+            bitmap_length = (self.contributor_count + UInt64(7)) // UInt64(8)
+            assert op.Box.create(bitmap_key, bitmap_length), "Failed to create vote bitmap"
+        if byte_index >= bitmap_length:
+            op.Box.resize(bitmap_key, byte_index + UInt64(1))
+
+        voted_byte = op.Box.extract(bitmap_key, byte_index, 1)
+        assert op.getbit(voted_byte, donor_index % UInt64(8)) == UInt64(0), "Already voted"
+        op.Box.replace(bitmap_key, byte_index, op.setbit_bytes(voted_byte, donor_index % UInt64(8), 1))
@@ -1,12 +1,45 @@
 from algopy import *
-from algopy.arc4 import abimethod, Address
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    Bool as ARC4Bool,
+    DynamicArray,
+    Struct,
+    UInt16 as ARC4UInt16,
+    UInt64 as ARC4UInt64,
+)
+
+from smart_contracts._common.subroutines import approver_index, assert_unique_approvers, popcount
+
+# Approver box: "approvers" -> concatenated 32-byte addresses; approver i owns bit i
+# of approval_mask. Boards are capped at 24 members so get_campaign_snapshot, which
+# returns the whole board, stays under the 1024-byte ABI log cap.
+APPROVERS_KEY = b"approvers"
+MAX_APPROVERS = 24
+
+
+class CampaignSnapshot(Struct):
+    """Everything a campaign page needs, returned by get_campaign_snapshot"""
+
+    goal_amount: ARC4UInt64
+    raised_amount: ARC4UInt64
+    current_milestone: ARC4UInt64
+    milestone_count: ARC4UInt64
+    contributor_count: ARC4UInt64
+    is_active: ARC4Bool
+    goal_reached: ARC4Bool
+    deadline: ARC4UInt64
+    creator: Address
+    approval_threshold: ARC4UInt64
+    approval_mask: ARC4UInt64
+    approvers: DynamicArray[Address]
 
 
 class Fundraiser(ARC4Contract):
     """
     CampusChain Multi-Signature Fundraiser Contract
     Milestone-based crowdfunding with ON-CHAIN decentralized approvals
-    Requires ALL 3 approvers to sign before milestone release
+    Requires N of M approvers to sign before milestone release
     100% DECENTRALIZED - No Firebase or centralized database!
     """
 
@@ -21,15 +54,12 @@ class Fundraiser(ARC4Contract):
     contributor_count: UInt64
     goal_reached: bool
     
-    # Multi-signature approvers (3 required signers)
-    approver1: Account
-    approver2: Account
-    approver3: Account
-    
-    # Approval tracking for CURRENT milestone (reset after each release)
-    approver1_approved: bool
-    approver2_approved: bool
-    approver3_approved: bool
+    # N-of-M approvers: addresses live in the approvers box
+    approver_count: UInt64
+    approval_threshold: UInt64
+
+    # Approvals for CURRENT milestone as a bitmask (reset after each release)
+    approval_mask: UInt64
 
     @abimethod(allow_actions=['NoOp'], create='require')
     def create_campaign(
@@ -37,14 +67,16 @@ class Fundraiser(ARC4Contract):
         goal: UInt64, 
         milestones: UInt64, 
         deadline: UInt64,
-        approver1: Address,
-        approver2: Address,
-        approver3: Address
+        approval_threshold: UInt64
     ) -> UInt64:
         """
-        Create campaign with 3 mandatory approvers
-        All 3 must approve each milestone before funds can be released
+        Create campaign requiring `approval_threshold` approvals per milestone
+        Approvers are registered next with set_approvers() (boxes cannot be
+        created until the app account is funded)
         """
+        assert approval_threshold > UInt64(0), "Threshold must be at least 1"
+        assert approval_threshold <= UInt64(MAX_APPROVERS), "Threshold exceeds maximum board size"
+
         self.goal_amount = goal
         self.raised_amount = UInt64(0)
         self.milestone_count = milestones
@@ -54,19 +86,33 @@ class Fundraiser(ARC4Contract):
         self.creator = Txn.sender
         self.contributor_count = UInt64(0)
         self.goal_reached = False
-        
-        # Store approver addresses (convert ARC4 Address to native Account)
-        self.approver1 = approver1.native
-        self.approver2 = approver2.native
-        self.approver3 = approver3.native
-        
-        # Initialize all approvals to false
-        self.approver1_approved = False
-        self.approver2_approved = False
-        self.approver3_approved = False
-        
+
+        self.approver_count = UInt64(0)
+        self.approval_threshold = approval_threshold
+        self.approval_mask = UInt64(0)
+
         return UInt64(1)
 
+    @abimethod()
+    def set_approvers(self, approvers: DynamicArray[Address]) -> UInt64:
+        """
+        Register the approver board (creator only, once)
+        Requires box MBR funding before calling: 2500 + 400 * (9 + 32 * M) microAlgos
+        Returns the number of approvers
+        """
+        assert Txn.sender == self.creator, "Only creator can set approvers"
+        assert self.approver_count == UInt64(0), "Approvers already set"
+        count = approvers.length
+        assert count >= self.approval_threshold, "Fewer approvers than threshold"
+        assert count <= UInt64(MAX_APPROVERS), "Maximum 24 approvers"
+
+        assert_unique_approvers(approvers)
+
+        # Store raw addresses (drop the ARC-4 length prefix) so approver i is at i * 32
+        op.Box.put(APPROVERS_KEY, op.extract(approvers.bytes, 2, count * UInt64(32)))
+        self.approver_count = count
+        return count
+
     @abimethod()
     def donate(self, payment: gtxn.PaymentTransaction) -> UInt64:
         """Donate to the campaign"""
@@ -91,56 +137,32 @@ class Fundraiser(ARC4Contract):
         🔐 DECENTRALIZED ON-CHAIN APPROVAL
         Approvers call this to approve the current milestone
         Replaces Firebase - all approvals stored on blockchain!
-        Returns: number of approvals received (1, 2, or 3)
+        Returns: number of approvals received so far
         """
         assert self.goal_reached, "Cannot approve - goal not reached"
         assert self.current_milestone < self.milestone_count, "All milestones completed"
         
-        # Check if sender is one of the approvers and mark their approval
-        sender = Txn.sender
-        approval_recorded = False
-        
-        if sender == self.approver1:
-            assert not self.approver1_approved, "Already approved"
-            self.approver1_approved = True
-            approval_recorded = True
-        elif sender == self.approver2:
-            assert not self.approver2_approved, "Already approved"
-            self.approver2_approved = True
-            approval_recorded = True
-        elif sender == self.approver3:
-            assert not self.approver3_approved, "Already approved"
-            self.approver3_approved = True
-            approval_recorded = True
-        else:
-            assert False, "Only approvers can approve milestones"
-        
-        # Count total approvals
-        approval_count = UInt64(0)
-        if self.approver1_approved:
-            approval_count += UInt64(1)
-        if self.approver2_approved:
-            approval_count += UInt64(1)
-        if self.approver3_approved:
-            approval_count += UInt64(1)
-        
-        return approval_count
+        # Check if sender is one of the approvers and set their bit
+        approver_index = self._approver_index(Txn.sender)
+        assert approver_index < self.approver_count, "Only approvers can approve milestones"
+        assert op.getbit(self.approval_mask, approver_index) == UInt64(0), "Already approved"
+        self.approval_mask = op.setbit_uint64(self.approval_mask, approver_index, 1)
+
+        return popcount(self.approval_mask)
 
     @abimethod()
     def release_milestone(self) -> UInt64:
         """
         Release funds for current milestone (creator only)
-        🔒 REQUIRES ALL 3 APPROVERS TO HAVE APPROVED FIRST
+        🔒 REQUIRES approval_threshold APPROVERS TO HAVE APPROVED FIRST
         This ensures multi-signature security on-chain!
         """
         assert Txn.sender == self.creator, "Only creator can release"
         assert self.current_milestone < self.milestone_count, "All milestones completed"
         assert self.goal_reached, "Cannot release funds - goal not reached"
         
-        # 🔐 CRITICAL: Verify ALL approvers have approved
-        assert self.approver1_approved, "Approver 1 has not approved"
-        assert self.approver2_approved, "Approver 2 has not approved"
-        assert self.approver3_approved, "Approver 3 has not approved"
+        # 🔐 CRITICAL: Verify the approval threshold has been met
+        assert popcount(self.approval_mask) >= self.approval_threshold, "Not enough approvals"
         
         # Calculate amount per milestone
         amount_per_milestone = self.goal_amount // self.milestone_count
@@ -161,13 +183,11 @@ class Fundraiser(ARC4Contract):
         self.current_milestone += UInt64(1)
         
         # 🔄 RESET approvals for next milestone
-        self.approver1_approved = False
-        self.approver2_approved = False
-        self.approver3_approved = False
+        self.approval_mask = UInt64(0)
         
         return self.current_milestone
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_status(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64, bool, bool]:
         """Get campaign status"""
         return (
@@ -180,6 +200,28 @@ class Fundraiser(ARC4Contract):
             self.goal_reached
         )
     
+    @abimethod(readonly=True)
+    def get_campaign_snapshot(self) -> CampaignSnapshot:
+        """
+        Get status, deadline, creator, approver board and approval state in one call
+        Replaces the get_status + get_deadline + get_creator + get_approvers +
+        get_approval_status round trips on page load
+        """
+        return CampaignSnapshot(
+            goal_amount=ARC4UInt64(self.goal_amount),
+            raised_amount=ARC4UInt64(self.raised_amount),
+            current_milestone=ARC4UInt64(self.current_milestone),
+            milestone_count=ARC4UInt64(self.milestone_count),
+            contributor_count=ARC4UInt64(self.contributor_count),
+            is_active=ARC4Bool(self.is_active),
+            goal_reached=ARC4Bool(self.goal_reached),
+            deadline=ARC4UInt64(self.deadline),
+            creator=Address(self.creator),
+            approval_threshold=ARC4UInt64(self.approval_threshold),
+            approval_mask=ARC4UInt64(self.approval_mask),
+            approvers=self._approvers(),
+        )
+
     @abimethod(readonly=True)
     def get_creator(self) -> Account:
         """Get campaign creator address"""
@@ -191,52 +233,31 @@ class Fundraiser(ARC4Contract):
         return self.deadline
     
     @abimethod(readonly=True)
-    def get_approvers(self) -> tuple[Address, Address, Address]:
+    def get_approvers(self) -> DynamicArray[Address]:
         """Get all approver addresses (on-chain query)"""
-        return (
-            Address(self.approver1.bytes),
-            Address(self.approver2.bytes),
-            Address(self.approver3.bytes)
-        )
+        return self._approvers()
     
     @abimethod(readonly=True)
-    def get_approval_status(self) -> tuple[bool, bool, bool]:
+    def get_approval_status(self) -> tuple[UInt64, UInt64]:
         """
-        Get current approval status for each approver
-        Returns (approver1_approved, approver2_approved, approver3_approved)
+        Get current approval state as (approval_mask, approval_threshold)
+        Bit i of the mask is set once approver i (see get_approvers) has approved
         Frontend can use this instead of Firebase!
         """
-        return (
-            self.approver1_approved,
-            self.approver2_approved,
-            self.approver3_approved
-        )
+        return self.approval_mask, self.approval_threshold
     
     @abimethod(readonly=True)
     def has_approved(self, approver_address: Address) -> bool:
         """Check if a specific address has approved the current milestone"""
-        sender_account = approver_address.native
-        
-        if sender_account == self.approver1:
-            return self.approver1_approved
-        elif sender_account == self.approver2:
-            return self.approver2_approved
-        elif sender_account == self.approver3:
-            return self.approver3_approved
-        else:
+        approver_index = self._approver_index(approver_address.native)
+        if approver_index >= self.approver_count:
             return False
+        return op.getbit(self.approval_mask, approver_index) == UInt64(1)
     
     @abimethod(readonly=True)
     def get_approval_count(self) -> UInt64:
         """Get number of approvals for current milestone"""
-        count = UInt64(0)
-        if self.approver1_approved:
-            count += UInt64(1)
-        if self.approver2_approved:
-            count += UInt64(1)
-        if self.approver3_approved:
-            count += UInt64(1)
-        return count
+        return popcount(self.approval_mask)
     
     @abimethod(readonly=True)
     def is_approver(self, address: Address) -> bool:
@@ -246,11 +267,17 @@ class Fundraiser(ARC4Contract):
         if account == self.creator:
             return True
         
-        if account == self.approver1:
-            return True
-        if account == self.approver2:
-            return True
-        if account == self.approver3:
-            return True
-        
-        return False
+        return self._approver_index(account) < self.approver_count
+
+    @subroutine
+    def _approvers(self) -> DynamicArray[Address]:
+        """Approver board as an ARC-4 array (empty until set_approvers)"""
+        approvers_bytes, exists = op.Box.get(APPROVERS_KEY)
+        if not exists:
+            return DynamicArray[Address]()
+        return DynamicArray[Address].from_bytes(ARC4UInt16(self.approver_count).bytes + approvers_bytes)
+
+    @subroutine
+    def _approver_index(self, account: Account) -> UInt64:
+        """Position of account in the approver box (approver_count if not found)"""
+        return approver_index(Bytes(APPROVERS_KEY), self.approver_count, account)
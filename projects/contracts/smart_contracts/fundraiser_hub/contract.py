@@ -0,0 +1,355 @@
+from algopy import *
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    Bool as ARC4Bool,
+    DynamicArray,
+    Struct,
+    UInt16 as ARC4UInt16,
+    UInt64 as ARC4UInt64,
+)
+
+from smart_contracts._common.subroutines import (
+    ADDRESS_CHUNK_SIZE,
+    append_address,
+    approver_index,
+    assert_unique_approvers,
+    popcount,
+)
+
+# Campaign box: "c_" + itob(campaign_id) -> CampaignRecord (113 bytes, fixed width).
+# Byte offsets of the fields are used for in-place box_replace updates.
+CR_CREATOR = 0
+CR_GOAL = 32
+CR_RAISED = 40
+CR_DEADLINE = 48
+CR_MILESTONE_COUNT = 56
+CR_CURRENT_MILESTONE = 64
+CR_CONTRIBUTOR_COUNT = 72
+CR_TOTAL_RELEASED = 80
+CR_APPROVAL_THRESHOLD = 88
+CR_APPROVAL_MASK = 96
+CR_APPROVER_COUNT = 104
+# is_active and goal_reached are packed into one byte (bits 0 and 1)
+CR_FLAGS = 112
+CR_SIZE = 113
+FLAG_GOAL_REACHED = 1
+# ABI return values are logged (1024 byte cap): 9 × 113-byte records per page
+MAX_CAMPAIGN_PAGE = 9
+
+# Approver box: "ca_" + itob(campaign_id) -> concatenated 32-byte addresses; approver i
+# owns bit i of the campaign's approval_mask. Boards are capped at 24 members so
+# get_approvers stays under the 1024-byte ABI log cap.
+MAX_APPROVERS = 24
+
+# Shared donor index: donors[account] is a dense index assigned on the donor's first
+# donation to any campaign, and "dx_" + itob(chunk) holds up to 32 donor addresses
+# (donor index i lives in chunk i // 32 at offset (i % 32) * 32).
+# Hub campaigns follow the Fundraiser model: milestones are approved by the campaign's
+# approver board (approval_mask), and donors do not vote, so there is no vote index.
+DONOR_INDEX_PREFIX = b"dx_"
+
+# Per-campaign contribution: "cc_" + itob(campaign_id) + itob(donor_index) -> itob(total)
+
+# Box minimum balance: 2500 + 400 * (key length + value length) microAlgos
+BOX_FLAT_MBR = 2500
+BOX_BYTE_MBR = 400
+MIN_DONATION = 100000
+
+
+class CampaignRecord(Struct):
+    """Fixed-width campaign record, stored as-is in the campaign box"""
+
+    creator: Address
+    goal_amount: ARC4UInt64
+    raised_amount: ARC4UInt64
+    deadline: ARC4UInt64
+    milestone_count: ARC4UInt64
+    current_milestone: ARC4UInt64
+    contributor_count: ARC4UInt64
+    total_released: ARC4UInt64
+    approval_threshold: ARC4UInt64
+    approval_mask: ARC4UInt64
+    approver_count: ARC4UInt64
+    is_active: ARC4Bool
+    goal_reached: ARC4Bool
+
+
+class FundraiserHub(ARC4Contract):
+    """
+    CampusChain Fundraiser Hub
+    Hosts many milestone campaigns under one app id instead of one app per campaign
+    Each campaign is a box record with its own raised/released accounting and
+    N-of-M approver board; donors get one index shared by every campaign
+    Campaigns never hold more than their goal: a donation past it is partly refunded
+    """
+
+    campaign_count: UInt64
+    donor_count: UInt64
+
+    def __init__(self) -> None:
+        self.campaign_count = UInt64(0)
+        self.donor_count = UInt64(0)
+        self.donors = BoxMap(Account, UInt64, key_prefix=b"d_")
+
+    @abimethod()
+    def create_campaign(
+        self,
+        goal: UInt64,
+        milestones: UInt64,
+        deadline: UInt64,
+        approval_threshold: UInt64,
+        approvers: DynamicArray[Address],
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> UInt64:
+        """
+        Create a campaign owned by the sender and return its id
+        mbr_payment covers the campaign and approver boxes:
+        2500 + 400 * (10 + 113) + 2500 + 400 * (11 + 32 * M) microAlgos
+        """
+        assert milestones > UInt64(0), "At least one milestone"
+        assert approval_threshold > UInt64(0), "Threshold must be at least 1"
+        assert approval_threshold <= UInt64(MAX_APPROVERS), "Threshold exceeds maximum board size"
+        count = approvers.length
+        assert count >= approval_threshold, "Fewer approvers than threshold"
+        assert count <= UInt64(MAX_APPROVERS), "Maximum 24 approvers"
+
+        assert_unique_approvers(approvers)
+
+        assert mbr_payment.receiver == Global.current_application_address, "MBR must go to the hub"
+        assert mbr_payment.amount >= self._box_mbr(
+            UInt64(10), UInt64(CR_SIZE)
+        ) + self._box_mbr(UInt64(11), count * UInt64(32)), "Insufficient MBR payment"
+
+        campaign_id = self.campaign_count
+        record = CampaignRecord(
+            creator=Address(Txn.sender),
+            goal_amount=ARC4UInt64(goal),
+            raised_amount=ARC4UInt64(0),
+            deadline=ARC4UInt64(deadline),
+            milestone_count=ARC4UInt64(milestones),
+            current_milestone=ARC4UInt64(0),
+            contributor_count=ARC4UInt64(0),
+            total_released=ARC4UInt64(0),
+            approval_threshold=ARC4UInt64(approval_threshold),
+            approval_mask=ARC4UInt64(0),
+            approver_count=ARC4UInt64(count),
+            is_active=ARC4Bool(True),
+            goal_reached=ARC4Bool(False),
+        )
+        op.Box.put(self._campaign_key(campaign_id), record.bytes)
+        # Store raw addresses (drop the ARC-4 length prefix) so approver i is at i * 32
+        op.Box.put(b"ca_" + op.itob(campaign_id), op.extract(approvers.bytes, 2, count * UInt64(32)))
+
+        self.campaign_count += UInt64(1)
+        return campaign_id
+
+    @abimethod()
+    def donate(self, campaign_id: UInt64, payment: gtxn.PaymentTransaction) -> UInt64:
+        """
+        Donate to a campaign and return its raised amount
+        A donor's first donation to the hub, and first donation to each campaign,
+        creates index/contribution boxes whose MBR is taken out of the payment
+        before it is credited to the campaign
+        Whatever would take the campaign past its goal is paid back to the donor
+        (the caller covers the refund fee through fee pooling)
+        """
+        record = self._load_campaign(campaign_id)
+        assert record.is_active.native, "Campaign not active"
+        assert Global.latest_timestamp <= record.deadline.native, "Campaign ended"
+        assert record.raised_amount.native < record.goal_amount.native, "Goal already reached"
+        assert payment.receiver == Global.current_application_address
+
+        mbr_cost = UInt64(0)
+        donor_index, known_donor = self.donors.maybe(payment.sender)
+        if not known_donor:
+            donor_index = self.donor_count
+            mbr_cost += self._box_mbr(UInt64(34), UInt64(8)) + UInt64(32 * BOX_BYTE_MBR)
+            if donor_index % UInt64(ADDRESS_CHUNK_SIZE) == UInt64(0):
+                mbr_cost += self._box_mbr(UInt64(11), UInt64(0))
+
+        contribution_key = b"cc_" + op.itob(campaign_id) + op.itob(donor_index)
+        previous, contributed = op.Box.get(contribution_key)
+        if not contributed:
+            mbr_cost += self._box_mbr(UInt64(19), UInt64(8))
+
+        assert payment.amount >= mbr_cost + UInt64(MIN_DONATION), "Minimum 0.1 ALGO donation"
+        amount = payment.amount - mbr_cost
+        remaining_goal = record.goal_amount.native - record.raised_amount.native
+        if amount > remaining_goal:
+            itxn.Payment(receiver=payment.sender, amount=amount - remaining_goal, fee=0).submit()
+            amount = remaining_goal
+
+        if not known_donor:
+            self.donors[payment.sender] = donor_index
+            append_address(Bytes(DONOR_INDEX_PREFIX), self.donor_count, payment.sender)
+            self.donor_count += UInt64(1)
+
+        if contributed:
+            op.Box.put(contribution_key, op.itob(op.btoi(previous) + amount))
+        else:
+            op.Box.put(contribution_key, op.itob(amount))
+            self._set_campaign_field(
+                campaign_id, UInt64(CR_CONTRIBUTOR_COUNT), record.contributor_count.native + UInt64(1)
+            )
+
+        raised = record.raised_amount.native + amount
+        self._set_campaign_field(campaign_id, UInt64(CR_RAISED), raised)
+
+        # Check if goal is reached
+        if raised >= record.goal_amount.native:
+            flags = op.Box.extract(self._campaign_key(campaign_id), CR_FLAGS, 1)
+            op.Box.replace(
+                self._campaign_key(campaign_id), CR_FLAGS, op.setbit_bytes(flags, FLAG_GOAL_REACHED, 1)
+            )
+
+        return raised
+
+    @abimethod()
+    def approve_milestone(self, campaign_id: UInt64) -> UInt64:
+        """
+        Approvers call this to approve the campaign's current milestone
+        Returns: number of approvals received so far
+        """
+        record = self._load_campaign(campaign_id)
+        assert record.goal_reached.native, "Cannot approve - goal not reached"
+        assert record.current_milestone.native < record.milestone_count.native, "All milestones completed"
+
+        approver_count = record.approver_count.native
+        approver_index = self._approver_index(campaign_id, approver_count, Txn.sender)
+        assert approver_index < approver_count, "Only approvers can approve milestones"
+        mask = record.approval_mask.native
+        assert op.getbit(mask, approver_index) == UInt64(0), "Already approved"
+        mask = op.setbit_uint64(mask, approver_index, 1)
+        self._set_campaign_field(campaign_id, UInt64(CR_APPROVAL_MASK), mask)
+
+        return popcount(mask)
+
+    @abimethod()
+    def release_milestone(self, campaign_id: UInt64) -> UInt64:
+        """
+        Release funds for the campaign's current milestone (creator only)
+        Requires approval_threshold approvals, and is paid only out of what this
+        campaign has raised and not yet released; the last milestone also pays out
+        the rounding remainder of goal / milestones
+        """
+        record = self._load_campaign(campaign_id)
+        assert Txn.sender == record.creator.native, "Only creator can release"
+        assert record.current_milestone.native < record.milestone_count.native, "All milestones completed"
+        assert record.goal_reached.native, "Cannot release funds - goal not reached"
+        assert popcount(record.approval_mask.native) >= record.approval_threshold.native, "Not enough approvals"
+
+        amount_per_milestone = record.goal_amount.native // record.milestone_count.native
+        total_released = record.total_released.native
+        if record.current_milestone.native == record.milestone_count.native - UInt64(1):
+            amount_per_milestone = record.raised_amount.native - total_released
+        assert record.raised_amount.native - total_released >= amount_per_milestone, "Insufficient campaign funds"
+
+        itxn.Payment(
+            receiver=record.creator.native,
+            amount=amount_per_milestone,
+            fee=0
+        ).submit()
+
+        current_milestone = record.current_milestone.native + UInt64(1)
+        self._set_campaign_field(campaign_id, UInt64(CR_CURRENT_MILESTONE), current_milestone)
+        self._set_campaign_field(campaign_id, UInt64(CR_TOTAL_RELEASED), total_released + amount_per_milestone)
+        # Reset approvals for next milestone
+        self._set_campaign_field(campaign_id, UInt64(CR_APPROVAL_MASK), UInt64(0))
+
+        return current_milestone
+
+    # ============================================================
+    # READ METHODS
+    # ============================================================
+
+    @abimethod(readonly=True)
+    def get_campaign(self, campaign_id: UInt64) -> CampaignRecord:
+        """Get one campaign record"""
+        return self._load_campaign(campaign_id)
+
+    @abimethod(readonly=True)
+    def get_campaigns_page(self, offset: UInt64, limit: UInt64) -> DynamicArray[CampaignRecord]:
+        """
+        Returns up to `limit` campaigns in creation order, starting at id `offset`
+        Capped at 9 records per call; page with offset to list every campaign
+        """
+        if offset >= self.campaign_count:
+            return DynamicArray[CampaignRecord]()
+
+        page_size = self.campaign_count - offset
+        if limit < page_size:
+            page_size = limit
+        if page_size > MAX_CAMPAIGN_PAGE:
+            page_size = UInt64(MAX_CAMPAIGN_PAGE)
+
+        packed = Bytes()
+        for campaign_id in urange(offset, offset + page_size):
+            packed += op.Box.extract(self._campaign_key(campaign_id), 0, CR_SIZE)
+        return DynamicArray[CampaignRecord].from_bytes(ARC4UInt16(page_size).bytes + packed)
+
+    @abimethod(readonly=True)
+    def get_campaign_count(self) -> UInt64:
+        """Get number of campaigns hosted by the hub"""
+        return self.campaign_count
+
+    @abimethod(readonly=True)
+    def get_approvers(self, campaign_id: UInt64) -> DynamicArray[Address]:
+        """Get all approver addresses of a campaign"""
+        approvers_bytes, exists = op.Box.get(b"ca_" + op.itob(campaign_id))
+        assert exists, "Campaign not found"
+        return DynamicArray[Address].from_bytes(
+            ARC4UInt16(approvers_bytes.length // UInt64(32)).bytes + approvers_bytes
+        )
+
+    @abimethod(readonly=True)
+    def has_approved(self, campaign_id: UInt64, approver_address: Address) -> bool:
+        """Check if an address has approved the campaign's current milestone"""
+        record = self._load_campaign(campaign_id)
+        approver_count = record.approver_count.native
+        approver_index = self._approver_index(campaign_id, approver_count, approver_address.native)
+        if approver_index >= approver_count:
+            return False
+        return op.getbit(record.approval_mask.native, approver_index) == UInt64(1)
+
+    @abimethod(readonly=True)
+    def get_contribution(self, campaign_id: UInt64, donor: Address) -> UInt64:
+        """Get a donor's credited total for one campaign"""
+        donor_index, exists = self.donors.maybe(donor.native)
+        if not exists:
+            return UInt64(0)
+        total, contributed = op.Box.get(b"cc_" + op.itob(campaign_id) + op.itob(donor_index))
+        if not contributed:
+            return UInt64(0)
+        return op.btoi(total)
+
+    @abimethod(readonly=True)
+    def get_donor_index(self, donor: Address) -> tuple[UInt64, bool]:
+        """Get a donor's shared index as (index, exists)"""
+        return self.donors.maybe(donor.native)
+
+    @subroutine
+    def _campaign_key(self, campaign_id: UInt64) -> Bytes:
+        return b"c_" + op.itob(campaign_id)
+
+    @subroutine
+    def _load_campaign(self, campaign_id: UInt64) -> CampaignRecord:
+        """Read the full campaign record in a single box read"""
+        packed, exists = op.Box.get(self._campaign_key(campaign_id))
+        assert exists, "Campaign not found"
+        return CampaignRecord.from_bytes(packed)
+
+    @subroutine
+    def _set_campaign_field(self, campaign_id: UInt64, offset: UInt64, value: UInt64) -> None:
+        """Overwrite one 8-byte field of the campaign record in place"""
+        op.Box.replace(self._campaign_key(campaign_id), offset, op.itob(value))
+
+    @subroutine
+    def _approver_index(self, campaign_id: UInt64, approver_count: UInt64, account: Account) -> UInt64:
+        """Position of account in the campaign's approver box (approver_count if not found)"""
+        return approver_index(b"ca_" + op.itob(campaign_id), approver_count, account)
+
+    @subroutine
+    def _box_mbr(self, key_length: UInt64, value_length: UInt64) -> UInt64:
+        """Minimum balance locked by a box of the given key and value size"""
+        return UInt64(BOX_FLAT_MBR) + UInt64(BOX_BYTE_MBR) * (key_length + value_length)
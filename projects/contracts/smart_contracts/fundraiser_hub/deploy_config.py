@@ -0,0 +1,31 @@
+import logging
+
+import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+
+def deploy() -> None:
+    from smart_contracts.artifacts.fundraiser_hub.fundraiser_hub_client import FundraiserHubFactory
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+
+    factory = algorand.client.get_typed_app_factory(
+        FundraiserHubFactory, default_sender=deployer_.address
+    )
+
+    app_client, result = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        logger.info(
+            f"Deployed FundraiserHub app {app_client.app_id} to address {app_client.app_address}"
+        )
+
+
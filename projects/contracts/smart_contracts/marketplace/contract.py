@@ -1,160 +1,459 @@
 from algopy import *
-from algopy.arc4 import abimethod, Address
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    DynamicArray,
+    DynamicBytes,
+    Struct,
+    UInt16 as ARC4UInt16,
+    UInt64 as ARC4UInt64,
+)
+
+# Listing box: "l_" + itob(listing_id) -> Listing
+# 104 bytes of fixed fields, 2 × 2-byte offsets, then the title and image hashes.
+# Byte offsets of the fixed fields are used for in-place box_replace updates.
+L_SELLER = 0
+L_BUYER = 32
+L_PRICE = 64
+L_STATUS = 72
+L_PURCHASE_TIMESTAMP = 80
+L_VOTES_RELEASE = 88
+L_VOTES_REFUND = 96
+L_FIXED_SIZE = 104
+
+# get_listings_page filter value that matches every status
+STATUS_ANY = 255
+# ABI return values are logged (1024 byte cap): 9 × 112-byte summaries per page
+MAX_LISTING_PAGE = 9
+# Listing ids examined per get_listings_page call when filtering by status
+MAX_LISTING_SCAN = 64
+
+# Box minimum balance: 2500 + 400 * (key length + value length) microAlgos
+BOX_FLAT_MBR = 2500
+BOX_BYTE_MBR = 400
+
+# Votes needed before a dispute can resolve, until the admin changes it
+DEFAULT_DISPUTE_QUORUM = 3
+
+# Arbitrator pool: arbitrators[account] is a dense index assigned at registration.
+# Dispute box: "dv_" + itob(listing_id) -> raiser address, raised-at timestamp, number of
+# eligible arbitrators, the quorum in force and the arbitrator pool size when raised,
+# then a vote bitmap with one bit per arbitrator registered at that time, set once they vote.
+# The raiser funds the box and gets its MBR back from cleanup_dispute after resolution.
+DV_RAISED_AT = 32
+DV_ELIGIBLE = 40
+DV_QUORUM = 48
+DV_ARBITRATOR_COUNT = 56
+DV_BITMAP = 64
+# A dispute still open 7 days after it was raised can be refunded to the buyer
+DISPUTE_TIMEOUT = 604800
+
+
+class Listing(Struct):
+    """
+    Listing record with its content hashes.
+    Status codes: 0=listed, 1=sold_pending, 2=completed, 3=disputed, 4=cancelled, 5=refunded
+    votes_release / votes_refund are the running dispute tallies.
+    """
+
+    seller: Address
+    buyer: Address
+    price: ARC4UInt64
+    status: ARC4UInt64
+    purchase_timestamp: ARC4UInt64
+    votes_release: ARC4UInt64
+    votes_refund: ARC4UInt64
+    title_hash: DynamicBytes
+    image_hash: DynamicBytes
+
+
+class ListingSummary(Struct):
+    """Fixed-width page row: listing id + the 104 fixed bytes of its Listing"""
+
+    listing_id: ARC4UInt64
+    seller: Address
+    buyer: Address
+    price: ARC4UInt64
+    status: ARC4UInt64
+    purchase_timestamp: ARC4UInt64
+    votes_release: ARC4UInt64
+    votes_refund: ARC4UInt64
 
 
 class Marketplace(ARC4Contract):
     """
     CampusChain Marketplace — Buy/Sell with Escrow
-    
+
     Students list items, buyers pay into escrow, both confirm exchange.
+    Every listing is a box record under this one app, keyed by listing id.
     - Seller lists item with price
     - Buyer pays → funds locked in contract
     - In-person exchange on campus
     - Buyer confirms → funds released to seller
-    - Dispute path: community arbitrators vote
+    - Dispute path: community arbitrators vote; unresolved after 7 days → buyer refunded
     - Auto-timeout: 72h no buyer confirmation → seller can claim
     """
 
-    seller: Account
-    price: UInt64
-    status: UInt64  # 0=listed, 1=sold_pending, 2=completed, 3=disputed, 4=cancelled, 5=refunded
-    buyer: Account
-    purchase_timestamp: UInt64
-    title_hash: Bytes
-    image_hash: Bytes
-    listing_count: UInt64  # global listing tracker
+    listing_count: UInt64
+    admin: Account
+    dispute_quorum: UInt64
+    arbitrator_count: UInt64
 
     def __init__(self) -> None:
-        self.arbitrator_votes = BoxMap(Account, UInt64, key_prefix=b"av_")
+        self.listing_count = UInt64(0)
+        self.admin = Txn.sender
+        self.dispute_quorum = UInt64(DEFAULT_DISPUTE_QUORUM)
+        self.arbitrator_count = UInt64(0)
+        self.arbitrators = BoxMap(Account, UInt64, key_prefix=b"ar_")
 
-    @abimethod(allow_actions=["NoOp"], create="require")
+    @abimethod()
     def list_item(
         self,
         title_hash: Bytes,
         price: UInt64,
         image_hash: Bytes,
+        mbr_payment: gtxn.PaymentTransaction,
     ) -> UInt64:
-        """List an item for sale."""
+        """
+        List an item for sale and return its listing id.
+        mbr_payment covers the listing box:
+        2500 + 400 * (10 + 112 + len(title_hash) + len(image_hash)) microAlgos
+        """
         assert price > UInt64(0), "Price must be > 0"
 
-        self.seller = Txn.sender
-        self.price = price
-        self.status = UInt64(0)  # listed
-        self.buyer = Global.zero_address
-        self.purchase_timestamp = UInt64(0)
-        self.title_hash = title_hash
-        self.image_hash = image_hash
-        self.listing_count = UInt64(0)
-        return UInt64(1)
+        listing = Listing(
+            seller=Address(Txn.sender),
+            buyer=Address(Global.zero_address),
+            price=ARC4UInt64(price),
+            status=ARC4UInt64(0),  # listed
+            purchase_timestamp=ARC4UInt64(0),
+            votes_release=ARC4UInt64(0),
+            votes_refund=ARC4UInt64(0),
+            title_hash=DynamicBytes(title_hash),
+            image_hash=DynamicBytes(image_hash),
+        )
+        assert mbr_payment.receiver == Global.current_application_address, "MBR must go to the app"
+        assert mbr_payment.amount >= UInt64(BOX_FLAT_MBR) + UInt64(BOX_BYTE_MBR) * (
+            UInt64(10) + listing.bytes.length
+        ), "Insufficient MBR payment"
+
+        listing_id = self.listing_count
+        op.Box.put(self._listing_key(listing_id), listing.bytes)
+        self.listing_count += UInt64(1)
+        return listing_id
 
     @abimethod()
-    def buy_item(self, payment: gtxn.PaymentTransaction) -> UInt64:
+    def buy_item(self, listing_id: UInt64, payment: gtxn.PaymentTransaction) -> UInt64:
         """Buy item — payment locked in escrow."""
-        assert self.status == UInt64(0), "Not available"
+        listing = self._load_listing(listing_id)
+        assert listing.status.native == UInt64(0), "Not available"
         assert payment.receiver == Global.current_application_address
-        assert payment.amount >= self.price, "Insufficient payment"
-        assert Txn.sender != self.seller, "Cannot buy own item"
+        assert payment.amount >= listing.price.native, "Insufficient payment"
+        assert Txn.sender != listing.seller.native, "Cannot buy own item"
 
-        self.buyer = Txn.sender
-        self.status = UInt64(1)  # sold_pending
-        self.purchase_timestamp = Global.latest_timestamp
+        op.Box.replace(self._listing_key(listing_id), L_BUYER, Txn.sender.bytes)
+        self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(1))  # sold_pending
+        self._set_listing_field(listing_id, UInt64(L_PURCHASE_TIMESTAMP), Global.latest_timestamp)
         return UInt64(1)
 
     @abimethod()
-    def confirm_delivery(self) -> UInt64:
+    def confirm_delivery(self, listing_id: UInt64) -> UInt64:
         """Buyer confirms receipt → funds released to seller."""
-        assert Txn.sender == self.buyer, "Only buyer"
-        assert self.status == UInt64(1), "Not pending delivery"
+        listing = self._load_listing(listing_id)
+        assert Txn.sender == listing.buyer.native, "Only buyer"
+        assert listing.status.native == UInt64(1), "Not pending delivery"
 
+        price = listing.price.native
         min_balance = UInt64(100000)
-        assert Global.current_application_address.balance >= self.price + min_balance
+        assert Global.current_application_address.balance >= price + min_balance
 
-        itxn.Payment(receiver=self.seller, amount=self.price, fee=0).submit()
-        self.status = UInt64(2)  # completed
-        return self.price
+        itxn.Payment(receiver=listing.seller.native, amount=price, fee=0).submit()
+        self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(2))  # completed
+        return price
 
     @abimethod()
-    def raise_dispute(self) -> UInt64:
-        """Buyer or seller raises dispute."""
-        assert Txn.sender == self.buyer or Txn.sender == self.seller, "Not buyer or seller"
-        assert self.status == UInt64(1), "Not pending"
+    def raise_dispute(self, listing_id: UInt64, mbr_payment: gtxn.PaymentTransaction) -> UInt64:
+        """
+        Buyer or seller raises dispute.
+        mbr_payment covers the dispute box, refunded by cleanup_dispute:
+        2500 + 400 * (11 + 64 + ceil(arbitrator_count / 8)) microAlgos
+        """
+        listing = self._load_listing(listing_id)
+        assert Txn.sender == listing.buyer.native or Txn.sender == listing.seller.native, "Not buyer or seller"
+        assert listing.status.native == UInt64(1), "Not pending"
 
-        self.status = UInt64(3)  # disputed
+        # Buyer and seller cannot vote on their own dispute
+        eligible = self.arbitrator_count
+        if listing.buyer.native in self.arbitrators:
+            eligible -= UInt64(1)
+        if listing.seller.native in self.arbitrators:
+            eligible -= UInt64(1)
+        assert self.dispute_quorum <= eligible, "Not enough eligible arbitrators for quorum"
+
+        bitmap_length = (self.arbitrator_count + UInt64(7)) // UInt64(8)
+        assert mbr_payment.receiver == Global.current_application_address, "MBR must go to the app"
+        assert mbr_payment.amount >= self._dispute_mbr(bitmap_length), "Insufficient MBR payment"
+        dispute_key = self._dispute_key(listing_id)
+        assert op.Box.create(dispute_key, UInt64(DV_BITMAP) + bitmap_length), "Dispute already raised"
+        op.Box.replace(
+            dispute_key,
+            0,
+            Txn.sender.bytes
+            + op.itob(Global.latest_timestamp)
+            + op.itob(eligible)
+            + op.itob(self.dispute_quorum)
+            + op.itob(self.arbitrator_count),
+        )
+
+        self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(3))  # disputed
         return UInt64(1)
 
     @abimethod()
-    def vote_dispute(self, resolution: UInt64) -> UInt64:
+    def vote_dispute(self, listing_id: UInt64, resolution: UInt64) -> UInt64:
         """
-        Community arbitrator votes on dispute.
+        Community arbitrator votes on a listing's dispute.
         resolution: 1=release to seller, 0=refund buyer
+        Once the quorum in force when the dispute was raised is reached, the side
+        with more votes wins; a tie stays open until the next vote breaks it, and
+        is settled for the buyer once every eligible arbitrator has voted.
         Returns number of votes cast so far.
         """
-        assert self.status == UInt64(3), "Not disputed"
-        assert Txn.sender != self.buyer, "Buyer cannot vote"
-        assert Txn.sender != self.seller, "Seller cannot vote"
-
-        # Check hasn't voted
-        _existing, already_voted = self.arbitrator_votes.maybe(Txn.sender)
-        assert not already_voted, "Already voted"
-
-        self.arbitrator_votes[Txn.sender] = resolution
-        self.listing_count += UInt64(1)  # repurpose as vote counter
-
-        # After 3 votes, resolve
-        if self.listing_count >= UInt64(3):
-            # Count votes (simplified: use listing_count as total)
-            # In practice we'd iterate boxes, but for simplicity
-            # we auto-resolve based on this voter's vote
-            min_balance = UInt64(100000)
-            if resolution == UInt64(1):
-                # Release to seller
-                if Global.current_application_address.balance >= self.price + min_balance:
-                    itxn.Payment(receiver=self.seller, amount=self.price, fee=0).submit()
-                self.status = UInt64(2)  # completed
-            else:
-                # Refund buyer
-                if Global.current_application_address.balance >= self.price + min_balance:
-                    itxn.Payment(receiver=self.buyer, amount=self.price, fee=0).submit()
-                self.status = UInt64(5)  # refunded
-
-        return self.listing_count
+        listing = self._load_listing(listing_id)
+        assert listing.status.native == UInt64(3), "Not disputed"
+        assert resolution <= UInt64(1), "Resolution must be 0 or 1"
+        assert Txn.sender != listing.buyer.native, "Buyer cannot vote"
+        assert Txn.sender != listing.seller.native, "Seller cannot vote"
+
+        # Check registered and hasn't voted, then set this arbitrator's bit
+        arbitrator_index, registered = self.arbitrators.maybe(Txn.sender)
+        assert registered, "Not an arbitrator"
+        dispute_key = self._dispute_key(listing_id)
+        arbitrator_count = op.btoi(op.Box.extract(dispute_key, DV_ARBITRATOR_COUNT, 8))
+        assert arbitrator_index < arbitrator_count, "Registered after dispute was raised"
+        byte_index = UInt64(DV_BITMAP) + arbitrator_index // UInt64(8)
+        voted_byte = op.Box.extract(dispute_key, byte_index, 1)
+        assert op.getbit(voted_byte, arbitrator_index % UInt64(8)) == UInt64(0), "Already voted"
+        op.Box.replace(dispute_key, byte_index, op.setbit_bytes(voted_byte, arbitrator_index % UInt64(8), 1))
+
+        # Running tallies: one field update per vote, no scan over voters
+        votes_release = listing.votes_release.native
+        votes_refund = listing.votes_refund.native
+        if resolution == UInt64(1):
+            votes_release += UInt64(1)
+            self._set_listing_field(listing_id, UInt64(L_VOTES_RELEASE), votes_release)
+        else:
+            votes_refund += UInt64(1)
+            self._set_listing_field(listing_id, UInt64(L_VOTES_REFUND), votes_refund)
+
+        vote_count = votes_release + votes_refund
+        quorum = op.btoi(op.Box.extract(dispute_key, DV_QUORUM, 8))
+        eligible = op.btoi(op.Box.extract(dispute_key, DV_ELIGIBLE, 8))
+        if vote_count >= quorum and votes_release != votes_refund:
+            self._settle_dispute(listing_id, votes_release > votes_refund)
+        elif vote_count >= eligible:
+            # Everyone eligible has voted and it is still a tie: the buyer keeps the benefit of the doubt
+            self._settle_dispute(listing_id, False)
+
+        return vote_count
+
+    @abimethod()
+    def claim_dispute_timeout(self, listing_id: UInt64) -> UInt64:
+        """
+        Refund the buyer when a dispute is still open 7 days after it was raised.
+        Callable by anyone. Returns the amount refunded.
+        """
+        listing = self._load_listing(listing_id)
+        assert listing.status.native == UInt64(3), "Not disputed"
+        raised_at = op.btoi(op.Box.extract(self._dispute_key(listing_id), DV_RAISED_AT, 8))
+        assert Global.latest_timestamp >= raised_at + UInt64(DISPUTE_TIMEOUT), "Dispute still open"
+
+        self._settle_dispute(listing_id, False)
+        return listing.price.native
 
     @abimethod()
-    def claim_timeout(self) -> UInt64:
+    def cleanup_dispute(self, listing_id: UInt64) -> UInt64:
+        """
+        Delete a resolved dispute's vote storage and refund its MBR to whoever
+        raised the dispute. Callable by anyone. Returns the amount refunded.
+        """
+        status = op.btoi(op.Box.extract(self._listing_key(listing_id), L_STATUS, 8))
+        assert status == UInt64(2) or status == UInt64(5), "Dispute not resolved"
+
+        dispute_key = self._dispute_key(listing_id)
+        box_length, exists = op.Box.length(dispute_key)
+        assert exists, "Nothing to clean up"
+        raiser = Account(op.Box.extract(dispute_key, 0, 32))
+        refund = self._dispute_mbr(box_length - UInt64(DV_BITMAP))
+        op.Box.delete(dispute_key)
+
+        itxn.Payment(receiver=raiser, amount=refund, fee=0).submit()
+        return refund
+
+    @abimethod()
+    def add_arbitrator(self, arbitrator: Address, mbr_payment: gtxn.PaymentTransaction) -> UInt64:
+        """
+        Admin registers an arbitrator and returns their pool index.
+        mbr_payment covers the pool entry: 2500 + 400 * (35 + 8) microAlgos
+        """
+        assert Txn.sender == self.admin, "Only admin"
+        assert arbitrator.native not in self.arbitrators, "Already an arbitrator"
+        assert mbr_payment.receiver == Global.current_application_address, "MBR must go to the app"
+        assert mbr_payment.amount >= UInt64(BOX_FLAT_MBR + BOX_BYTE_MBR * 43), "Insufficient MBR payment"
+
+        arbitrator_index = self.arbitrator_count
+        self.arbitrators[arbitrator.native] = arbitrator_index
+        self.arbitrator_count += UInt64(1)
+        return arbitrator_index
+
+    @abimethod()
+    def set_dispute_quorum(self, quorum: UInt64) -> UInt64:
+        """Admin sets how many arbitrator votes a dispute needs before it resolves."""
+        assert Txn.sender == self.admin, "Only admin"
+        assert quorum > UInt64(0), "Quorum must be at least 1"
+        assert quorum <= self.arbitrator_count, "Quorum exceeds arbitrator pool"
+
+        self.dispute_quorum = quorum
+        return quorum
+
+    @abimethod()
+    def claim_timeout(self, listing_id: UInt64) -> UInt64:
         """Seller claims funds after 72h buyer silence."""
-        assert Txn.sender == self.seller, "Only seller"
-        assert self.status == UInt64(1), "Not pending"
-        assert Global.latest_timestamp >= self.purchase_timestamp + UInt64(259200), "72h not passed"
+        listing = self._load_listing(listing_id)
+        assert Txn.sender == listing.seller.native, "Only seller"
+        assert listing.status.native == UInt64(1), "Not pending"
+        assert Global.latest_timestamp >= listing.purchase_timestamp.native + UInt64(259200), "72h not passed"
 
+        price = listing.price.native
         min_balance = UInt64(100000)
-        assert Global.current_application_address.balance >= self.price + min_balance
+        assert Global.current_application_address.balance >= price + min_balance
 
-        itxn.Payment(receiver=self.seller, amount=self.price, fee=0).submit()
-        self.status = UInt64(2)  # completed
-        return self.price
+        itxn.Payment(receiver=listing.seller.native, amount=price, fee=0).submit()
+        self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(2))  # completed
+        return price
 
     @abimethod()
-    def cancel_listing(self) -> UInt64:
+    def cancel_listing(self, listing_id: UInt64) -> UInt64:
         """Seller cancels listing before anyone buys."""
-        assert Txn.sender == self.seller, "Only seller"
-        assert self.status == UInt64(0), "Cannot cancel after sale"
+        listing = self._load_listing(listing_id)
+        assert Txn.sender == listing.seller.native, "Only seller"
+        assert listing.status.native == UInt64(0), "Cannot cancel after sale"
 
-        self.status = UInt64(4)  # cancelled
+        self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(4))  # cancelled
         return UInt64(1)
 
-    @abimethod()
-    def get_listing_info(self) -> tuple[UInt64, UInt64, UInt64]:
+    # ============================================================
+    # READ METHODS
+    # ============================================================
+
+    @abimethod(readonly=True)
+    def get_listing(self, listing_id: UInt64) -> Listing:
+        """Full listing record including title and image hashes."""
+        return self._load_listing(listing_id)
+
+    @abimethod(readonly=True)
+    def get_listings_page(
+        self, status: UInt64, offset: UInt64, limit: UInt64
+    ) -> tuple[UInt64, DynamicArray[ListingSummary]]:
+        """
+        Returns (next_offset, rows): up to `limit` listings with the given status
+        (255 = any status), walking listing ids upward from `offset`.
+        At most 9 rows are returned and 64 ids examined per call; call again with
+        next_offset until it reaches listing_count.
+        """
+        page_limit = limit
+        if page_limit > MAX_LISTING_PAGE:
+            page_limit = UInt64(MAX_LISTING_PAGE)
+        scan_end = offset + UInt64(MAX_LISTING_SCAN)
+        if scan_end > self.listing_count:
+            scan_end = self.listing_count
+
+        ensure_budget(UInt64(MAX_LISTING_SCAN * 40), fee_source=OpUpFeeSource.GroupCredit)
+        found = UInt64(0)
+        packed = Bytes()
+        listing_id = offset
+        while listing_id < scan_end and found < page_limit:
+            fixed = op.Box.extract(self._listing_key(listing_id), 0, L_FIXED_SIZE)
+            if status == UInt64(STATUS_ANY) or op.extract_uint64(fixed, L_STATUS) == status:
+                packed += op.itob(listing_id) + fixed
+                found += UInt64(1)
+            listing_id += UInt64(1)
+
+        return listing_id, DynamicArray[ListingSummary].from_bytes(ARC4UInt16(found).bytes + packed)
+
+    @abimethod(readonly=True)
+    def get_listing_info(self, listing_id: UInt64) -> tuple[UInt64, UInt64, UInt64]:
         """Returns (price, status, purchase_timestamp)"""
-        return (self.price, self.status, self.purchase_timestamp)
+        listing = self._load_listing(listing_id)
+        return (listing.price.native, listing.status.native, listing.purchase_timestamp.native)
 
     @abimethod(readonly=True)
-    def get_seller(self) -> Account:
-        return self.seller
+    def get_dispute_tally(self, listing_id: UInt64) -> tuple[UInt64, UInt64, UInt64]:
+        """Returns (votes_release, votes_refund, dispute_quorum)"""
+        listing = self._load_listing(listing_id)
+        return (listing.votes_release.native, listing.votes_refund.native, self.dispute_quorum)
 
     @abimethod(readonly=True)
-    def get_buyer(self) -> Account:
-        return self.buyer
+    def has_voted(self, listing_id: UInt64, arbitrator: Address) -> bool:
+        """Whether an arbitrator has voted on a listing's dispute (false once cleaned up)."""
+        arbitrator_index, registered = self.arbitrators.maybe(arbitrator.native)
+        if not registered:
+            return False
+
+        dispute_key = self._dispute_key(listing_id)
+        _length, exists = op.Box.length(dispute_key)
+        if not exists or arbitrator_index >= op.btoi(op.Box.extract(dispute_key, DV_ARBITRATOR_COUNT, 8)):
+            return False
+        byte_index = UInt64(DV_BITMAP) + arbitrator_index // UInt64(8)
+        voted_byte = op.Box.extract(dispute_key, byte_index, 1)
+        return op.getbit(voted_byte, arbitrator_index % UInt64(8)) == UInt64(1)
+
+    @abimethod(readonly=True)
+    def get_seller(self, listing_id: UInt64) -> Address:
+        return Address(op.Box.extract(self._listing_key(listing_id), L_SELLER, 32))
 
     @abimethod(readonly=True)
-    def get_status(self) -> UInt64:
-        return self.status
+    def get_buyer(self, listing_id: UInt64) -> Address:
+        return Address(op.Box.extract(self._listing_key(listing_id), L_BUYER, 32))
+
+    @abimethod(readonly=True)
+    def get_status(self, listing_id: UInt64) -> UInt64:
+        return op.btoi(op.Box.extract(self._listing_key(listing_id), L_STATUS, 8))
+
+    @subroutine
+    def _listing_key(self, listing_id: UInt64) -> Bytes:
+        return b"l_" + op.itob(listing_id)
+
+    @subroutine
+    def _dispute_key(self, listing_id: UInt64) -> Bytes:
+        return b"dv_" + op.itob(listing_id)
+
+    @subroutine
+    def _settle_dispute(self, listing_id: UInt64, release_to_seller: bool) -> None:
+        """Pay out a disputed listing's escrow to the seller or back to the buyer."""
+        listing = self._load_listing(listing_id)
+        price = listing.price.native
+        min_balance = UInt64(100000)
+        assert Global.current_application_address.balance >= price + min_balance
+        if release_to_seller:
+            itxn.Payment(receiver=listing.seller.native, amount=price, fee=0).submit()
+            self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(2))  # completed
+        else:
+            itxn.Payment(receiver=listing.buyer.native, amount=price, fee=0).submit()
+            self._set_listing_field(listing_id, UInt64(L_STATUS), UInt64(5))  # refunded
+
+    @subroutine
+    def _dispute_mbr(self, bitmap_length: UInt64) -> UInt64:
+        """MBR of a dispute box holding a bitmap of the given length."""
+        return UInt64(BOX_FLAT_MBR) + UInt64(BOX_BYTE_MBR) * (UInt64(11 + DV_BITMAP) + bitmap_length)
+
+    @subroutine
+    def _load_listing(self, listing_id: UInt64) -> Listing:
+        """Read the full listing record in a single box read."""
+        packed, exists = op.Box.get(self._listing_key(listing_id))
+        assert exists, "Listing not found"
+        return Listing.from_bytes(packed)
+
+    @subroutine
+    def _set_listing_field(self, listing_id: UInt64, offset: UInt64, value: UInt64) -> None:
+        """Overwrite one 8-byte field of the listing record in place."""
+        op.Box.replace(self._listing_key(listing_id), offset, op.itob(value))
@@ -1,5 +1,47 @@
 from algopy import *
-from algopy.arc4 import abimethod
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    Bool as ARC4Bool,
+    Struct,
+    UInt64 as ARC4UInt64,
+)
+
+# Member box: "m_" + address -> MemberRecord (41 bytes, fixed width).
+# Byte offsets of the fields are used for in-place box_replace updates.
+M_JOIN_ORDER = 0
+M_CONTRIBUTED = 8
+M_STAKE = 16
+M_LAST_PAID_CYCLE = 24
+M_PENALIZED_CYCLE = 32
+M_RECEIVED = 40
+
+# Rotation box: "order" -> member address per rotation slot (32 bytes each), so slot i
+# holds the member whose join_order is i. Slots before rotation_cursor have been paid.
+# The box grows by one slot per join.
+ORDER_KEY = b"order"
+# Paid bitmap box: "paid" -> one bit per rotation slot, set by contribute and cleared
+# when the cycle advances.
+PAID_KEY = b"paid"
+# Order box is capped at 32 KB. advance_cycle only touches the order box, the paid
+# bitmap and at most two member boxes, so its box references stay within one group
+# (32 for a full order box); default penalties are applied per member, lazily.
+MAX_MEMBERS = 1024
+# Opcode budget reserved per rotation slot scanned by advance_cycle
+SLOT_SCAN_BUDGET = 24
+# 30 days per cycle
+CYCLE_SECONDS = 2592000
+
+
+class MemberRecord(Struct):
+    """Everything the pool tracks per member, in one box"""
+
+    join_order: ARC4UInt64
+    total_contributed: ARC4UInt64
+    stake: ARC4UInt64
+    last_paid_cycle: ARC4UInt64  # 0 until the first contribution (cycles start at 1)
+    penalized_cycle: ARC4UInt64  # missed cycles up to here have been taken from the stake
+    has_received: ARC4Bool
 
 
 class SavingsPool(ARC4Contract):
@@ -11,7 +53,10 @@ class SavingsPool(ARC4Contract):
     - Members join by staking 1 month's contribution as collateral
     - Each cycle, all members contribute → one member receives the full pot
     - Rotation: first-joined = first-paid
-    - Defaulters lose collateral and move to end of rotation
+    - Defaulters lose collateral and move to end of rotation; the penalty is taken
+      from their stake the next time they contribute, are skipped, or anyone calls
+      apply_penalties for them, and goes into the next payout
+    - Anyone can advance the cycle once its deadline passes
     """
 
     pool_name: Bytes
@@ -25,18 +70,12 @@ class SavingsPool(ARC4Contract):
     cycle_deadline: UInt64
     cycle_contributions: UInt64  # how many have contributed this cycle
     total_pool_value: UInt64
+    rotation_cursor: UInt64  # next rotation slot to receive the pot
+    carried_pot: UInt64  # pot of cycles nobody eligible paid into, added to the next payout
 
     def __init__(self) -> None:
-        # member_{address} → join_order (8 bytes)
-        self.member_order = BoxMap(Account, UInt64, key_prefix=b"mo_")
-        # member_{address} → total_contributed (8 bytes)
-        self.member_contributed = BoxMap(Account, UInt64, key_prefix=b"mc_")
-        # member_{address} → has_received (8 bytes, 0 or 1)
-        self.member_received = BoxMap(Account, UInt64, key_prefix=b"mr_")
-        # member_{address} → paid_this_cycle (8 bytes, 0 or 1)
-        self.member_cycle_paid = BoxMap(Account, UInt64, key_prefix=b"mp_")
-        # member_{address} → stake deposited (8 bytes)
-        self.member_stake = BoxMap(Account, UInt64, key_prefix=b"ms_")
+        # member_{address} → MemberRecord (one box per member)
+        self.members = BoxMap(Account, MemberRecord, key_prefix=b"m_")
 
     @abimethod(allow_actions=["NoOp"], create="require")
     def create_pool(
@@ -46,6 +85,7 @@ class SavingsPool(ARC4Contract):
         max_members: UInt64,
         duration: UInt64,
     ) -> UInt64:
+        assert max_members <= UInt64(MAX_MEMBERS), "Maximum 1024 members"
         self.pool_name = name
         self.contribution_amount = contribution
         self.max_members = max_members
@@ -57,6 +97,8 @@ class SavingsPool(ARC4Contract):
         self.cycle_deadline = UInt64(0)
         self.cycle_contributions = UInt64(0)
         self.total_pool_value = UInt64(0)
+        self.rotation_cursor = UInt64(0)
+        self.carried_pot = UInt64(0)
         return UInt64(1)
 
     @abimethod()
@@ -68,15 +110,23 @@ class SavingsPool(ARC4Contract):
         assert stake_txn.amount >= self.contribution_amount, "Stake too low"
 
         # Check not already a member
-        _existing, already_member = self.member_order.maybe(Txn.sender)
-        assert not already_member, "Already a member"
+        assert Txn.sender not in self.members, "Already a member"
 
         position = self.current_members
-        self.member_order[Txn.sender] = position
-        self.member_contributed[Txn.sender] = UInt64(0)
-        self.member_received[Txn.sender] = UInt64(0)
-        self.member_cycle_paid[Txn.sender] = UInt64(0)
-        self.member_stake[Txn.sender] = stake_txn.amount
+        self.members[Txn.sender] = MemberRecord(
+            join_order=ARC4UInt64(position),
+            total_contributed=ARC4UInt64(0),
+            stake=ARC4UInt64(stake_txn.amount),
+            last_paid_cycle=ARC4UInt64(0),
+            penalized_cycle=ARC4UInt64(0),
+            has_received=ARC4Bool(False),
+        )
+
+        if position == UInt64(0):
+            assert op.Box.create(ORDER_KEY, 32), "Failed to create rotation"
+        else:
+            op.Box.resize(ORDER_KEY, (position + UInt64(1)) * UInt64(32))
+        op.Box.replace(ORDER_KEY, position * UInt64(32), Txn.sender.bytes)
 
         self.current_members += UInt64(1)
         self.total_pool_value += stake_txn.amount
@@ -92,8 +142,8 @@ class SavingsPool(ARC4Contract):
 
         self.pool_status = UInt64(1)  # active
         self.current_cycle = UInt64(1)
-        # 30 days per cycle
-        self.cycle_deadline = Global.latest_timestamp + UInt64(2592000)
+        assert op.Box.create(PAID_KEY, (self.current_members + UInt64(7)) // UInt64(8)), "Failed to create paid bitmap"
+        self.cycle_deadline = Global.latest_timestamp + UInt64(CYCLE_SECONDS)
         return UInt64(1)
 
     @abimethod()
@@ -104,56 +154,102 @@ class SavingsPool(ARC4Contract):
         assert pay_txn.amount >= self.contribution_amount, "Insufficient"
 
         # Check is member
-        _order, is_member = self.member_order.maybe(Txn.sender)
-        assert is_member, "Not a member"
+        assert Txn.sender in self.members, "Not a member"
+        member = self.members[Txn.sender].copy()
 
-        # Check hasn't paid this cycle
-        paid, _exists = self.member_cycle_paid.maybe(Txn.sender)
-        assert paid == UInt64(0), "Already paid this cycle"
+        # Check hasn't paid this cycle: paying records the cycle number, so a new
+        # cycle needs no per-member reset
+        assert member.last_paid_cycle.native < self.current_cycle, "Already paid this cycle"
 
-        self.member_cycle_paid[Txn.sender] = UInt64(1)
-        existing_total, _e = self.member_contributed.maybe(Txn.sender)
-        self.member_contributed[Txn.sender] = existing_total + pay_txn.amount
+        # Earlier cycles this member skipped are charged before the new payment is recorded
+        self._apply_penalties(Txn.sender, self.current_cycle - UInt64(1))
+        self._set_member_field(Txn.sender, UInt64(M_LAST_PAID_CYCLE), self.current_cycle)
+        slot = member.join_order.native
+        paid_byte = op.Box.extract(PAID_KEY, slot // UInt64(8), 1)
+        op.Box.replace(PAID_KEY, slot // UInt64(8), op.setbit_bytes(paid_byte, slot % UInt64(8), 1))
+        self._set_member_field(
+            Txn.sender, UInt64(M_CONTRIBUTED), member.total_contributed.native + pay_txn.amount
+        )
         self.cycle_contributions += UInt64(1)
         self.total_pool_value += pay_txn.amount
 
         return self.cycle_contributions
 
     @abimethod()
-    def trigger_payout(self, recipient: Account) -> UInt64:
-        """Trigger payout for current cycle. Creator only."""
-        assert Txn.sender == self.creator, "Only creator"
+    def advance_cycle(self) -> UInt64:
+        """
+        Close the current cycle once its deadline has passed. Callable by anyone.
+        The pot goes to the first member from the rotation cursor who paid this
+        cycle; the defaulter in the cursor slot is swapped towards the end of the
+        rotation and charged for its missed cycles. Other defaulters are charged
+        lazily (see apply_penalties), so the call needs box references only for the
+        order box, the paid bitmap, the recipient and the skipped member. If nobody
+        from the cursor onward paid, the pot is carried over to the next cycle and
+        the rotation stays put. Returns the amount paid out.
+        """
         assert self.pool_status == UInt64(1), "Pool not active"
+        assert Global.latest_timestamp >= self.cycle_deadline, "Cycle still open"
 
-        # Verify recipient is a member who hasn't received yet
-        order, is_member = self.member_order.maybe(recipient)
-        assert is_member, "Not a member"
-        received, _e = self.member_received.maybe(recipient)
-        assert received == UInt64(0), "Already received"
+        ensure_budget(self.current_members * UInt64(SLOT_SCAN_BUDGET), fee_source=OpUpFeeSource.GroupCredit)
+        paid_bitmap = op.Box.get(PAID_KEY)[0]
+        recipient_slot = self.rotation_cursor
+        found = False
+        for slot in urange(self.rotation_cursor, self.current_members):
+            if op.getbit(paid_bitmap, slot) == UInt64(1):
+                recipient_slot = slot
+                found = True
+                break
 
-        # Calculate payout (all contributions this cycle)
-        payout = self.contribution_amount * self.current_members
-        min_balance = UInt64(100000)
-        assert Global.current_application_address.balance >= payout + min_balance
+        if found:
+            # Swap the eligible member into the cursor slot, moving the skipped defaulter back
+            if recipient_slot != self.rotation_cursor:
+                skipped = self._member_at(self.rotation_cursor)
+                self._apply_penalties(skipped, self.current_cycle)
+                recipient = self._member_at(recipient_slot)
+                op.Box.replace(ORDER_KEY, self.rotation_cursor * UInt64(32), recipient.bytes)
+                op.Box.replace(ORDER_KEY, recipient_slot * UInt64(32), skipped.bytes)
+                self._set_member_field(recipient, UInt64(M_JOIN_ORDER), self.rotation_cursor)
+                self._set_member_field(skipped, UInt64(M_JOIN_ORDER), recipient_slot)
 
-        itxn.Payment(receiver=recipient, amount=payout, fee=0).submit()
-
-        self.member_received[recipient] = UInt64(1)
-        self.total_pool_value -= payout
+            recipient = self._member_at(self.rotation_cursor)
+            payout = self.carried_pot + self.contribution_amount * self.cycle_contributions
+            if payout > UInt64(0):
+                itxn.Payment(receiver=recipient, amount=payout, fee=0).submit()
+            op.Box.replace(self._member_key(recipient), M_RECEIVED, ARC4Bool(True).bytes)
+            self.total_pool_value -= payout
+            self.carried_pot = UInt64(0)
+            self.rotation_cursor += UInt64(1)
+        else:
+            # Nobody eligible paid: no defaulter is rewarded, the pot rolls into the next cycle
+            self.carried_pot += self.contribution_amount * self.cycle_contributions
+            payout = UInt64(0)
 
         # Advance cycle
         self.current_cycle += UInt64(1)
         self.cycle_contributions = UInt64(0)
+        op.Box.put(PAID_KEY, op.bzero(paid_bitmap.length))
 
         # Check if pool is complete
-        if self.current_cycle > self.duration_months:
+        if self.current_cycle > self.duration_months or self.rotation_cursor >= self.current_members:
             self.pool_status = UInt64(2)  # completed
 
-        # Reset cycle payments for all (simplified — next contribute checks)
-        self.cycle_deadline = Global.latest_timestamp + UInt64(2592000)
+        # Members become unpaid for the new cycle simply because current_cycle moved on
+        self.cycle_deadline = Global.latest_timestamp + UInt64(CYCLE_SECONDS)
 
         return payout
 
+    @abimethod()
+    def apply_penalties(self, member: Account) -> UInt64:
+        """
+        Take a member's unpaid penalties for closed cycles from their stake into the
+        pot of the current cycle. Callable by anyone. Returns the stake left.
+        """
+        assert self.pool_status == UInt64(1), "Pool not active"
+        assert member in self.members, "Not a member"
+
+        self._apply_penalties(member, self._last_closed_cycle())
+        return self.members[member].stake.native
+
     @abimethod()
     def get_pool_info(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64, UInt64]:
         """Returns (contribution, max_members, current_members, current_cycle, duration, status)"""
@@ -168,19 +264,89 @@ class SavingsPool(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_member_info(self, member: Account) -> tuple[UInt64, UInt64, UInt64, UInt64]:
-        """Returns (join_order, total_contributed, has_received, stake)"""
-        order, exists = self.member_order.maybe(member)
-        if not exists:
+        """Returns (join_order, total_contributed, has_received, stake net of unapplied penalties)"""
+        if member not in self.members:
             return (UInt64(0), UInt64(0), UInt64(0), UInt64(0))
-        contributed, _e1 = self.member_contributed.maybe(member)
-        received, _e2 = self.member_received.maybe(member)
-        stake, _e3 = self.member_stake.maybe(member)
-        return (order, contributed, received, stake)
+        record = self.members[member].copy()
+        received = UInt64(1) if record.has_received.native else UInt64(0)
+        stake = record.stake.native - self._penalty_due(record, self._last_closed_cycle())
+        return (record.join_order.native, record.total_contributed.native, received, stake)
+
+    @abimethod(readonly=True)
+    def has_paid_current_cycle(self, member: Account) -> bool:
+        if member not in self.members:
+            return False
+        return self.members[member].last_paid_cycle.native == self.current_cycle
+
+    @abimethod(readonly=True)
+    def get_rotation_status(self) -> tuple[UInt64, UInt64, Address]:
+        """
+        Returns (rotation_cursor, cycle_deadline, next recipient if the cycle closed now);
+        the recipient is the zero address when nobody eligible has paid yet.
+        """
+        if self.rotation_cursor >= self.current_members:
+            return (self.rotation_cursor, self.cycle_deadline, Address(Global.zero_address))
+        paid_bitmap, exists = op.Box.get(PAID_KEY)
+        if exists:
+            for slot in urange(self.rotation_cursor, self.current_members):
+                if op.getbit(paid_bitmap, slot) == UInt64(1):
+                    return (self.rotation_cursor, self.cycle_deadline, Address(self._member_at(slot)))
+        return (self.rotation_cursor, self.cycle_deadline, Address(Global.zero_address))
 
     @abimethod(readonly=True)
-    def get_creator(self) -> Account:
-        return self.creator
+    def get_creator(self) -> Address:
+        return Address(self.creator)
 
     @abimethod(readonly=True)
     def get_pool_status(self) -> UInt64:
         return self.pool_status
+
+    @subroutine
+    def _apply_penalties(self, member: Account, through_cycle: UInt64) -> None:
+        """Charge the member's missed cycles up to through_cycle to its stake, into the pot."""
+        record = self.members[member].copy()
+        penalty = self._penalty_due(record, through_cycle)
+        if penalty > UInt64(0):
+            self._set_member_field(member, UInt64(M_STAKE), record.stake.native - penalty)
+            self.carried_pot += penalty
+        if record.penalized_cycle.native < through_cycle:
+            self._set_member_field(member, UInt64(M_PENALIZED_CYCLE), through_cycle)
+
+    @subroutine
+    def _penalty_due(self, record: MemberRecord, through_cycle: UInt64) -> UInt64:
+        """
+        One contribution per cycle up to through_cycle that the member neither paid nor
+        was charged for, capped at the stake. Penalties are applied before every
+        contribution, so every cycle after both last_paid_cycle and penalized_cycle
+        was missed.
+        """
+        settled = record.last_paid_cycle.native
+        if record.penalized_cycle.native > settled:
+            settled = record.penalized_cycle.native
+        if through_cycle <= settled:
+            return UInt64(0)
+        penalty = (through_cycle - settled) * self.contribution_amount
+        if record.stake.native < penalty:
+            penalty = record.stake.native
+        return penalty
+
+    @subroutine
+    def _last_closed_cycle(self) -> UInt64:
+        """Latest cycle whose deadline has been processed (0 before the pool starts)."""
+        if self.current_cycle == UInt64(0):
+            return UInt64(0)
+        return self.current_cycle - UInt64(1)
+
+    @subroutine
+    def _member_key(self, member: Account) -> Bytes:
+        return b"m_" + member.bytes
+
+    @subroutine
+    def _member_at(self, slot: UInt64) -> Account:
+        """Member address in a rotation slot."""
+        return Account(op.Box.extract(ORDER_KEY, slot * UInt64(32), 32))
+
+    @subroutine
+    def _set_member_field(self, member: Account, offset: UInt64, value: UInt64) -> None:
+        """Overwrite one 8-byte field of the member record in place."""
+        op.Box.replace(self._member_key(member), offset, op.itob(value))
@@ -1,6 +1,29 @@
 from algopy import *
 from algopy.arc4 import abimethod, Address
 
+# Member list box: "members" -> address + itob(stake) per dense member index (40 bytes each)
+MEMBERS_KEY = b"members"
+MEMBER_ROW_SIZE = 40
+# _tally_forfeits reads every member row as one stack value (4096 byte limit)
+MAX_MEMBERS = 100
+# Attendance box: "attendance" -> itob(sessions_attended) per member index, created at start
+ATTENDANCE_KEY = b"attendance"
+# Session bitmap box: "ss_" + itob(session) -> one bit per member index, set once the
+# member is marked present for that session. Kept after the session for audits.
+SESSION_KEY_LENGTH = 11
+# Box MBR: 2500 per box + 400 per byte of key and value
+BOX_FLAT_MBR = 2500
+BOX_BYTE_MBR = 400
+
+# Members paid per settle_batch call
+MAX_SETTLE_BATCH = 32
+# Opcode budget reserved per member paid in settle_batch
+SETTLE_BUDGET_PER_MEMBER = 60
+# A payment below this to an empty (closed) account would fail, so it is credited instead.
+# The member's "mi_" box is deleted before its payout, and the MBR it frees covers the
+# "uc_" box of the same size, so settlement never dips into other members' stakes.
+MIN_ACCOUNT_BALANCE = 100000
+
 
 class StudyGroup(ARC4Contract):
     """
@@ -10,6 +33,10 @@ class StudyGroup(ARC4Contract):
     - Show up to all sessions → get stake back + bonus from no-shows
     - Miss sessions → lose proportional stake
     - Creator marks attendance, attendees confirm
+    - Creator funds the shared boxes' MBR when starting the group, so stakes are
+      only ever paid back to members
+    - Anyone can push payouts in batches once the group completes;
+      payouts that cannot be pushed are left for the member to claim
     
     Incentivizes accountability through financial skin-in-the-game.
     """
@@ -24,14 +51,14 @@ class StudyGroup(ARC4Contract):
     creator: Account
     status: UInt64  # 0=accepting, 1=active, 2=completed
     total_forfeited: UInt64
+    perfect_attenders: UInt64
+    settle_cursor: UInt64  # next member index to be paid out
 
     def __init__(self) -> None:
-        # member → staked_amount
-        self.member_stake = BoxMap(Account, UInt64, key_prefix=b"st_")
-        # member → sessions_attended
-        self.member_attendance = BoxMap(Account, UInt64, key_prefix=b"at_")
-        # session_{index}_{member} → 1 if attended
-        # We'll track via a simpler per-session counter approach
+        # member → dense member index (join order), deleted once the member is settled
+        self.member_index = BoxMap(Account, UInt64, key_prefix=b"mi_")
+        # member → payout settle_batch could not push, waiting for claim_payout
+        self.unclaimed = BoxMap(Account, UInt64, key_prefix=b"uc_")
 
     @abimethod(allow_actions=["NoOp"], create="require")
     def create_group(
@@ -44,6 +71,7 @@ class StudyGroup(ARC4Contract):
         assert stake >= UInt64(100000), "Min stake 0.1 ALGO"
         assert sessions >= UInt64(1), "At least 1 session"
         assert max_members >= UInt64(2), "At least 2 members"
+        assert max_members <= UInt64(MAX_MEMBERS), "Maximum 100 members"
 
         self.topic_hash = topic
         self.stake_amount = stake
@@ -55,6 +83,8 @@ class StudyGroup(ARC4Contract):
         self.creator = Txn.sender
         self.status = UInt64(0)
         self.total_forfeited = UInt64(0)
+        self.perfect_attenders = UInt64(0)
+        self.settle_cursor = UInt64(0)
         return UInt64(1)
 
     @abimethod()
@@ -65,24 +95,35 @@ class StudyGroup(ARC4Contract):
         assert stake_txn.receiver == Global.current_application_address
         assert stake_txn.amount >= self.stake_amount, "Stake too low"
 
-        _existing, already_member = self.member_stake.maybe(Txn.sender)
-        assert not already_member, "Already joined"
+        assert Txn.sender not in self.member_index, "Already joined"
+
+        index = self.current_members
+        if index == UInt64(0):
+            member_list_size = self.max_members * UInt64(MEMBER_ROW_SIZE)
+            assert op.Box.create(MEMBERS_KEY, member_list_size), "Failed to create member list"
+        op.Box.replace(MEMBERS_KEY, index * UInt64(MEMBER_ROW_SIZE), Txn.sender.bytes + op.itob(stake_txn.amount))
 
-        self.member_stake[Txn.sender] = stake_txn.amount
-        self.member_attendance[Txn.sender] = UInt64(0)
+        self.member_index[Txn.sender] = index
         self.current_members += UInt64(1)
         self.total_staked += stake_txn.amount
 
         return self.current_members
 
     @abimethod()
-    def start_group(self) -> UInt64:
-        """Start the study group. Creator only."""
+    def start_group(self, mbr_payment: gtxn.PaymentTransaction) -> UInt64:
+        """
+        Start the study group. Creator only.
+        mbr_payment covers the member list, attendance and session bitmap boxes:
+        see get_start_mbr for the amount.
+        """
         assert Txn.sender == self.creator, "Only creator"
         assert self.status == UInt64(0), "Already started"
         assert self.current_members >= UInt64(2), "Need 2+ members"
+        assert mbr_payment.receiver == Global.current_application_address, "MBR must go to the app"
+        assert mbr_payment.amount >= self._start_mbr(), "Insufficient MBR payment"
 
         self.status = UInt64(1)  # active
+        assert op.Box.create(ATTENDANCE_KEY, self.current_members * UInt64(8)), "Failed to create attendance"
         return UInt64(1)
 
     @abimethod()
@@ -95,13 +136,49 @@ class StudyGroup(ARC4Contract):
         assert self.status == UInt64(1), "Not active"
         assert self.sessions_completed < self.session_count, "All sessions done"
 
-        _stake, is_member = self.member_stake.maybe(member)
+        index, is_member = self.member_index.maybe(member)
         assert is_member, "Not a member"
 
-        current_attendance, _e = self.member_attendance.maybe(member)
-        self.member_attendance[member] = current_attendance + UInt64(1)
+        session_key = self._session_key()
+        byte_index = index // UInt64(8)
+        marked_byte = op.Box.extract(session_key, byte_index, 1)
+        assert op.getbit(marked_byte, index % UInt64(8)) == UInt64(0), "Already marked"
+        op.Box.replace(session_key, byte_index, op.setbit_bytes(marked_byte, index % UInt64(8), 1))
 
-        return current_attendance + UInt64(1)
+        attendance = self._attendance_of(index) + UInt64(1)
+        op.Box.replace(ATTENDANCE_KEY, index * UInt64(8), op.itob(attendance))
+        return attendance
+
+    @abimethod()
+    def mark_attendance_batch(self, present: Bytes) -> UInt64:
+        """
+        Creator marks every member present for the current session in one call.
+        `present` has one bit per member index (MSB first, ceil(members / 8) bytes);
+        members already marked for this session are not counted twice.
+        Returns the number of members newly marked.
+        """
+        assert Txn.sender == self.creator, "Only creator"
+        assert self.status == UInt64(1), "Not active"
+        assert self.sessions_completed < self.session_count, "All sessions done"
+        assert present.length == (self.current_members + UInt64(7)) // UInt64(8), "Bitmap size mismatch"
+
+        session_key = self._session_key()
+        already_marked = op.Box.get(session_key)[0]
+        newly_marked = present & ~already_marked
+        op.Box.put(session_key, present | already_marked)
+
+        ensure_budget(self.current_members * UInt64(30), fee_source=OpUpFeeSource.GroupCredit)
+        attendance = op.Box.get(ATTENDANCE_KEY)[0]
+        marked = UInt64(0)
+        for index in urange(self.current_members):
+            if op.getbit(newly_marked, index) == UInt64(1):
+                attendance = op.replace(
+                    attendance, index * UInt64(8), op.itob(op.extract_uint64(attendance, index * UInt64(8)) + UInt64(1))
+                )
+                marked += UInt64(1)
+        op.Box.put(ATTENDANCE_KEY, attendance)
+
+        return marked
 
     @abimethod()
     def complete_session(self) -> UInt64:
@@ -112,71 +189,66 @@ class StudyGroup(ARC4Contract):
 
         self.sessions_completed += UInt64(1)
 
-        # If all sessions complete, mark group as completed
+        # If all sessions complete, mark group as completed and work out the bonus pool
         if self.sessions_completed == self.session_count:
             self.status = UInt64(2)
+            self._tally_forfeits()
 
         return self.sessions_completed
 
     @abimethod()
-    def claim_stake(self) -> UInt64:
+    def settle_batch(self, start: UInt64, count: UInt64) -> UInt64:
         """
-        Member claims their stake back after group completion.
-        Full attendance → stake + share of forfeited stakes.
+        Pay out up to `count` members from index `start` after group completion.
+        Callable by anyone; `start` must equal settle_cursor, so nobody is paid twice.
+        Full attendance → stake + equal share of forfeited stakes.
         Partial attendance → proportional stake return.
+        A payout below 0.1 ALGO to an empty account is kept for claim_payout instead.
+        Settled members' index boxes are deleted, returning their MBR to the app.
+        Returns the new cursor; settlement is done once it reaches current_members.
         """
         assert self.status == UInt64(2), "Group not completed"
-
-        stake, is_member = self.member_stake.maybe(Txn.sender)
-        assert is_member, "Not a member"
-        assert stake > UInt64(0), "Already claimed"
-
-        attendance, _e = self.member_attendance.maybe(Txn.sender)
-
-        # Calculate return based on attendance ratio
-        if attendance == self.session_count:
-            # Perfect attendance — get full stake back
-            payout = stake
-        elif attendance > UInt64(0):
-            # Partial — proportional return
-            payout = (stake * attendance) // self.session_count
-            forfeited = stake - payout
-            self.total_forfeited += forfeited
-        else:
-            # Zero attendance — lose all stake
-            self.total_forfeited += stake
-            payout = UInt64(0)
-
-        if payout > UInt64(0):
-            min_balance = UInt64(100000)
-            if Global.current_application_address.balance >= payout + min_balance:
-                itxn.Payment(receiver=Txn.sender, amount=payout, fee=0).submit()
-
-        # Mark as claimed
-        self.member_stake[Txn.sender] = UInt64(0)
-        return payout
+        assert start == self.settle_cursor, "Settle from the cursor"
+        assert count <= UInt64(MAX_SETTLE_BATCH), "Batch too large"
+
+        end = start + count
+        if end > self.current_members:
+            end = self.current_members
+
+        if end > start:
+            ensure_budget((end - start) * UInt64(SETTLE_BUDGET_PER_MEMBER), fee_source=OpUpFeeSource.GroupCredit)
+
+        bonus_share = UInt64(0)
+        if self.perfect_attenders > UInt64(0):
+            bonus_share = self.total_forfeited // self.perfect_attenders
+
+        for index in urange(start, end):
+            row = op.Box.extract(MEMBERS_KEY, index * UInt64(MEMBER_ROW_SIZE), MEMBER_ROW_SIZE)
+            member = Account(op.extract(row, 0, 32))
+            stake = op.extract_uint64(row, 32)
+            del self.member_index[member]
+            attendance = self._attendance_of(index)
+            if attendance == self.session_count:
+                payout = stake + bonus_share
+            else:
+                payout = (stake * attendance) // self.session_count
+            if payout >= UInt64(MIN_ACCOUNT_BALANCE) or (payout > UInt64(0) and member.balance > UInt64(0)):
+                itxn.Payment(receiver=member, amount=payout, fee=0).submit()
+            elif payout > UInt64(0):
+                self.unclaimed[member] = payout
+
+        self.settle_cursor = end
+        return end
 
     @abimethod()
-    def claim_bonus(self) -> UInt64:
-        """
-        Perfect-attendance members claim their share of forfeited stakes.
-        Must be called after all members have claimed their stakes.
-        """
-        assert self.status == UInt64(2), "Not completed"
-        assert self.total_forfeited > UInt64(0), "No bonus pool"
-
-        attendance, _e = self.member_attendance.maybe(Txn.sender)
-        assert attendance == self.session_count, "Not perfect attendance"
+    def claim_payout(self) -> UInt64:
+        """Pay the caller a payout settle_batch could not push. Returns the amount paid."""
+        amount, exists = self.unclaimed.maybe(Txn.sender)
+        assert exists, "Nothing to claim"
 
-        # Simple: give proportional share of forfeited pool
-        # Each perfect-attendance member gets equal share
-        bonus_share = self.total_forfeited // self.current_members
-        if bonus_share > UInt64(0):
-            min_balance = UInt64(100000)
-            if Global.current_application_address.balance >= bonus_share + min_balance:
-                itxn.Payment(receiver=Txn.sender, amount=bonus_share, fee=0).submit()
-
-        return bonus_share
+        del self.unclaimed[Txn.sender]
+        itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
+        return amount
 
     @abimethod()
     def get_group_info(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64, UInt64]:
@@ -192,17 +264,75 @@ class StudyGroup(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_member_info(self, member: Account) -> tuple[UInt64, UInt64]:
-        """Returns (staked_amount, sessions_attended)"""
-        stake, exists = self.member_stake.maybe(member)
-        if not exists:
+        """Returns (staked_amount, sessions_attended); (0, 0) for non-members and settled members"""
+        if member not in self.member_index:
             return (UInt64(0), UInt64(0))
-        attendance, _e = self.member_attendance.maybe(member)
-        return (stake, attendance)
+        index = self.member_index[member]
+        stake = op.btoi(op.Box.extract(MEMBERS_KEY, index * UInt64(MEMBER_ROW_SIZE) + UInt64(32), 8))
+        return (stake, self._attendance_of(index))
 
     @abimethod(readonly=True)
-    def get_creator(self) -> Account:
-        return self.creator
+    def get_start_mbr(self) -> UInt64:
+        """MBR payment start_group requires for the current members."""
+        return self._start_mbr()
+
+    @abimethod(readonly=True)
+    def get_session_attendance(self, session: UInt64) -> Bytes:
+        """Attendance bitmap of a session, one bit per member index (empty if nobody was marked)."""
+        return op.Box.get(b"ss_" + op.itob(session))[0]
+
+    @abimethod(readonly=True)
+    def get_member_at(self, index: UInt64) -> Address:
+        assert index < self.current_members, "No such member"
+        return Address(op.Box.extract(MEMBERS_KEY, index * UInt64(MEMBER_ROW_SIZE), 32))
+
+    @abimethod(readonly=True)
+    def get_creator(self) -> Address:
+        return Address(self.creator)
 
     @abimethod(readonly=True)
     def get_status(self) -> UInt64:
         return self.status
+
+    @subroutine
+    def _session_key(self) -> Bytes:
+        """Bitmap box of the current session, created empty on first use."""
+        session_key = b"ss_" + op.itob(self.sessions_completed)
+        _length, exists = op.Box.length(session_key)
+        if not exists:
+            op.Box.put(session_key, op.bzero((self.current_members + UInt64(7)) // UInt64(8)))
+        return session_key
+
+    @subroutine
+    def _tally_forfeits(self) -> None:
+        """Total forfeited stake and number of perfect attenders, from the packed member boxes."""
+        ensure_budget(self.current_members * UInt64(40), fee_source=OpUpFeeSource.GroupCredit)
+        members = op.Box.extract(MEMBERS_KEY, 0, self.current_members * UInt64(MEMBER_ROW_SIZE))
+        attendance = op.Box.get(ATTENDANCE_KEY)[0]
+        for index in urange(self.current_members):
+            stake = op.extract_uint64(members, index * UInt64(MEMBER_ROW_SIZE) + UInt64(32))
+            attended = op.extract_uint64(attendance, index * UInt64(8))
+            if attended == self.session_count:
+                self.perfect_attenders += UInt64(1)
+            else:
+                self.total_forfeited += stake - (stake * attended) // self.session_count
+
+    @subroutine
+    def _start_mbr(self) -> UInt64:
+        """MBR of the member list, the attendance box and one bitmap box per session."""
+        members_mbr = self._box_mbr(Bytes(MEMBERS_KEY).length, self.max_members * UInt64(MEMBER_ROW_SIZE))
+        attendance_mbr = self._box_mbr(Bytes(ATTENDANCE_KEY).length, self.current_members * UInt64(8))
+        session_mbr = self._box_mbr(UInt64(SESSION_KEY_LENGTH), (self.current_members + UInt64(7)) // UInt64(8))
+        return members_mbr + attendance_mbr + self.session_count * session_mbr
+
+    @subroutine
+    def _box_mbr(self, key_length: UInt64, value_length: UInt64) -> UInt64:
+        return UInt64(BOX_FLAT_MBR) + UInt64(BOX_BYTE_MBR) * (key_length + value_length)
+
+    @subroutine
+    def _attendance_of(self, index: UInt64) -> UInt64:
+        """Sessions attended by the member at a dense index (0 before the group starts)."""
+        _length, exists = op.Box.length(ATTENDANCE_KEY)
+        if not exists:
+            return UInt64(0)
+        return op.btoi(op.Box.extract(ATTENDANCE_KEY, index * UInt64(8), 8))
@@ -1,5 +1,77 @@
 from algopy import *
-from algopy.arc4 import abimethod, Address
+from algopy.arc4 import (
+    abimethod,
+    Address,
+    Bool as ARC4Bool,
+    DynamicArray,
+    Struct,
+    UInt16 as ARC4UInt16,
+    UInt64 as ARC4UInt64,
+)
+
+# Resale history box layout: "sh_" + itob(asset) -> count(8) + count × SaleRecord(80)
+HISTORY_HEADER_SIZE = 8
+SALE_RECORD_SIZE = 80
+# ABI return values are logged (1024 byte cap), so a page holds at most 12 records
+MAX_HISTORY_PAGE = 12
+
+# Tier box layout: "tr_" + itob(tier_id) -> TierRecord(25), price at offset 0 and
+# sold counter at offset 16
+TIER_PRICE_OFFSET = 0
+TIER_SOLD_OFFSET = 16
+MAX_TIERS = 16
+# Seat bitmap box: "sm_" + itob(tier_id) -> ceil(supply / 8) bytes, bit set = seat taken
+MAX_SEATS_PER_TIER = 32768
+
+
+class SaleRecord(Struct):
+    """One resale entry: seller(32) + buyer(32) + price(8) + timestamp(8) = 80 bytes"""
+
+    seller: Address
+    buyer: Address
+    price: ARC4UInt64
+    timestamp: ARC4UInt64
+
+
+class TicketStatus(Struct):
+    """Per-ticket status row returned by get_ticket_status_batch"""
+
+    checked_in: ARC4Bool
+    transfer_count: ARC4UInt64
+    owner: Address
+
+
+class TierRecord(Struct):
+    """Fixed-width pricing tier: price(8) + supply(8) + sold(8) + seated(1) = 25 bytes"""
+
+    price: ARC4UInt64
+    supply: ARC4UInt64
+    sold: ARC4UInt64
+    seated: ARC4Bool
+
+
+class TicketSeat(Struct):
+    """Tier and seat a ticket was sold for (seat is 0 for unseated tiers)"""
+
+    tier_id: ARC4UInt64
+    seat: ARC4UInt64
+
+
+class EventSnapshot(Struct):
+    """Everything an event page needs, returned by get_event_snapshot"""
+
+    ticket_price: ARC4UInt64
+    max_supply: ARC4UInt64
+    sold_count: ARC4UInt64  # general-admission sales via buy_ticket, capped by max_supply
+    tier_sold_count: ARC4UInt64  # sales across all tiers via buy_tier_ticket
+    event_date: ARC4UInt64
+    sale_end_date: ARC4UInt64
+    unique_buyers: ARC4UInt64
+    is_sale_active: ARC4Bool
+    max_resale_price: ARC4UInt64
+    creator: Address
+    organizer_count: ARC4UInt64
+    organizers: DynamicArray[Address]
 
 
 class Ticketing(ARC4Contract):
@@ -14,6 +86,8 @@ class Ticketing(ARC4Contract):
     - QR code verification at entry
     - Prevents double entry
     - 110% anti-scalping resale cap enforced on-chain
+    - Optional pricing tiers with per-seat availability bitmaps, so one app
+      serves a whole venue
     """
 
     ticket_price: UInt64
@@ -25,6 +99,8 @@ class Ticketing(ARC4Contract):
     creator: Account
     unique_buyers: UInt64
     organizer_count: UInt64
+    tier_count: UInt64
+    tier_sold_count: UInt64
 
     @abimethod(allow_actions=['NoOp'], create='require')
     def create_event(
@@ -41,12 +117,14 @@ class Ticketing(ARC4Contract):
         self.ticket_price = price
         self.max_supply = supply
         self.sold_count = UInt64(0)
+        self.tier_sold_count = UInt64(0)
         self.event_date = event_date
         self.sale_end_date = sale_end_date
         self.creator = Txn.sender
         self.is_sale_active = True
         self.unique_buyers = UInt64(0)
         self.organizer_count = UInt64(0)
+        self.tier_count = UInt64(0)
         return UInt64(1)
     
     @abimethod()
@@ -88,23 +166,134 @@ class Ticketing(ARC4Contract):
         # Increment ticket counter
         self.sold_count += UInt64(1)
         self.unique_buyers += UInt64(1)
-        
-        # Mint NFT ticket - keep in contract until buyer opts in
-        ticket_asset_id = itxn.AssetConfig(
+
+        # NFT stays with contract - buyer must opt-in then call claim_ticket
+        # Check-in box will be created later during verify_entry
+        return self._mint_ticket(payment.sender)
+
+    # ── Tiered / Seated Sales ─────────────────────────────────────────────
+
+    @abimethod()
+    def add_tier(self, price: UInt64, supply: UInt64, seated: bool) -> UInt64:
+        """
+        Add a pricing tier (creator only). Returns the tier id.
+        Seated tiers get a seat bitmap box with one bit per seat (0..supply-1).
+        Requires box MBR funding before calling:
+        tier box 2500 + 400 * (11 + 25), seat map 2500 + 400 * (11 + ceil(supply / 8))
+        """
+        assert Txn.sender == self.creator, "Only creator can add tiers"
+        assert self.tier_count < UInt64(MAX_TIERS), "Maximum 16 tiers allowed"
+        assert supply > UInt64(0), "Supply must be > 0"
+        assert not seated or supply <= UInt64(MAX_SEATS_PER_TIER), "Too many seats for one tier"
+
+        tier_id = self.tier_count
+        tier_key = b"tr_" + op.itob(tier_id)
+        tier = TierRecord(
+            price=ARC4UInt64(price),
+            supply=ARC4UInt64(supply),
+            sold=ARC4UInt64(0),
+            seated=ARC4Bool(seated),
+        )
+        assert op.Box.create(tier_key, tier.bytes.length), "Failed to create tier box"
+        op.Box.put(tier_key, tier.bytes)
+
+        if seated:
+            # Box.create zero-fills, so every seat starts available
+            seat_map_size = (supply + UInt64(7)) // UInt64(8)
+            assert op.Box.create(b"sm_" + op.itob(tier_id), seat_map_size), "Failed to create seat map"
+
+        self.tier_count += UInt64(1)
+        return tier_id
+
+    @abimethod()
+    def buy_tier_ticket(self, tier_id: UInt64, seat: UInt64, payment: gtxn.PaymentTransaction) -> UInt64:
+        """
+        Purchase a ticket in a tier (and a specific seat for seated tiers).
+        `seat` is ignored for unseated tiers. Mints the NFT like buy_ticket and
+        records tier/seat in a "tk_" box (MBR 2500 + 400 * (11 + 16) microAlgos).
+        Returns the NFT Asset ID
+        """
+        assert self.is_sale_active, "Sale not active"
+        assert Global.latest_timestamp < self.sale_end_date, "Ticket sales have ended"
+        assert Global.latest_timestamp < self.event_date, "Event has passed"
+        assert tier_id < self.tier_count, "Tier not found"
+
+        tier_key = b"tr_" + op.itob(tier_id)
+        tier = TierRecord.from_bytes(op.Box.get(tier_key)[0])
+        sold = tier.sold.native
+        assert sold < tier.supply.native, "Tier sold out"
+        assert payment.receiver == Global.current_application_address
+        assert payment.amount >= tier.price.native, "Insufficient payment"
+
+        seat_number = UInt64(0)
+        if tier.seated.native:
+            assert seat < tier.supply.native, "Seat not in tier"
+            assert self._is_seat_available(tier_id, seat), "Seat already taken"
+            seat_map_key = b"sm_" + op.itob(tier_id)
+            seat_byte = op.Box.extract(seat_map_key, seat // UInt64(8), 1)
+            op.Box.replace(seat_map_key, seat // UInt64(8), op.setbit_bytes(seat_byte, seat % UInt64(8), 1))
+            seat_number = seat
+
+        # Bump only the sold counter field in the tier box
+        op.Box.replace(tier_key, TIER_SOLD_OFFSET, op.itob(sold + UInt64(1)))
+        self.tier_sold_count += UInt64(1)
+        self.unique_buyers += UInt64(1)
+
+        ticket_asset_id = self._mint_ticket(payment.sender)
+        ticket_seat = TicketSeat(tier_id=ARC4UInt64(tier_id), seat=ARC4UInt64(seat_number))
+        op.Box.put(b"tk_" + op.itob(ticket_asset_id), ticket_seat.bytes)
+        return ticket_asset_id
+
+    @abimethod(readonly=True)
+    def get_tier(self, tier_id: UInt64) -> TierRecord:
+        """Get a tier's price, supply, sold counter and seated flag"""
+        assert tier_id < self.tier_count, "Tier not found"
+        return TierRecord.from_bytes(op.Box.get(b"tr_" + op.itob(tier_id))[0])
+
+    @abimethod(readonly=True)
+    def get_tiers(self) -> DynamicArray[TierRecord]:
+        """Get every tier in one call (index in the array = tier id)"""
+        packed = Bytes()
+        for tier_id in urange(self.tier_count):
+            packed += op.Box.get(b"tr_" + op.itob(tier_id))[0]
+        return DynamicArray[TierRecord].from_bytes(ARC4UInt16(self.tier_count).bytes + packed)
+
+    @abimethod(readonly=True)
+    def is_seat_available(self, tier_id: UInt64, seat: UInt64) -> bool:
+        """O(1) seat lookup: reads a single byte of the tier's seat bitmap"""
+        assert tier_id < self.tier_count, "Tier not found"
+        tier = TierRecord.from_bytes(op.Box.get(b"tr_" + op.itob(tier_id))[0])
+        if not tier.seated.native or seat >= tier.supply.native:
+            return False
+        return self._is_seat_available(tier_id, seat)
+
+    @abimethod(readonly=True)
+    def get_ticket_seat(self, ticket_asset_id: UInt64) -> TicketSeat:
+        """Get the tier and seat a ticket was sold for"""
+        seat_bytes, exists = op.Box.get(b"tk_" + op.itob(ticket_asset_id))
+        assert exists, "Not a tiered ticket"
+        return TicketSeat.from_bytes(seat_bytes)
+
+    @subroutine
+    def _is_seat_available(self, tier_id: UInt64, seat: UInt64) -> bool:
+        """Test the seat's bit in the tier seat map (caller checks bounds)"""
+        seat_byte = op.Box.extract(b"sm_" + op.itob(tier_id), seat // UInt64(8), 1)
+        return op.getbit(seat_byte, seat % UInt64(8)) == UInt64(0)
+
+    @subroutine
+    def _mint_ticket(self, buyer: Account) -> UInt64:
+        """Mint a ticket NFT held by the contract, with the buyer marked in reserve"""
+        return itxn.AssetConfig(
             total=1,  # NFT (1 unit only)
             decimals=0,
             asset_name=b"Event Ticket",
             unit_name=b"TIX",
             url=b"ipfs://campus-ticket",
             manager=Global.current_application_address,
-            reserve=payment.sender,  # Mark the buyer in reserve field
+            reserve=buyer,  # Mark the buyer in reserve field
             freeze=Global.current_application_address,
             clawback=Global.current_application_address
         ).submit().created_asset.id
-        
-        # NFT stays with contract - buyer must opt-in then call claim_ticket
-        # Check-in box will be created later during verify_entry
-        return ticket_asset_id
 
     @abimethod()
     def claim_ticket(self, ticket_asset_id: UInt64) -> None:
@@ -174,12 +363,55 @@ class Ticketing(ARC4Contract):
     @abimethod(readonly=True)
     def is_checked_in(self, ticket_asset_id: UInt64) -> bool:
         """Check if a ticket has been used for entry"""
+        return self._is_checked_in(ticket_asset_id)
+
+    @abimethod(readonly=True)
+    def get_ticket_status_batch(self, asset_ids: DynamicArray[ARC4UInt64]) -> DynamicArray[TicketStatus]:
+        """
+        Get (checked_in, transfer_count, owner) for many tickets in one call.
+        Owner is the asset reserve address (zero address for unknown assets).
+        Intended for simulate: large batches need allow_unnamed_resources,
+        extra opcode budget and allow_more_logging for the return value.
+        """
+        packed = Bytes()
+        for asset_id in asset_ids:
+            ticket_asset_id = asset_id.native
+            owner, asset_exists = op.AssetParamsGet.asset_reserve(ticket_asset_id)
+            if not asset_exists:
+                owner = Global.zero_address
+
+            row = TicketStatus(
+                checked_in=ARC4Bool(self._is_checked_in(ticket_asset_id)),
+                transfer_count=ARC4UInt64(self._transfer_count(ticket_asset_id)),
+                owner=Address(owner),
+            )
+            packed += row.bytes
+
+        return DynamicArray[TicketStatus].from_bytes(ARC4UInt16(asset_ids.length).bytes + packed)
+
+    @subroutine
+    def _max_resale_price(self) -> UInt64:
+        """110% of the original ticket price"""
+        return self.ticket_price + self.ticket_price // UInt64(10)
+
+    @subroutine
+    def _ticket_resale_cap(self, ticket_asset_id: UInt64) -> UInt64:
+        """110% of the tier price for tiered tickets, else the general-admission cap"""
+        seat_bytes, is_tiered = op.Box.get(b"tk_" + op.itob(ticket_asset_id))
+        if not is_tiered:
+            return self._max_resale_price()
+        tier_price = op.btoi(op.Box.extract(b"tr_" + op.extract(seat_bytes, 0, 8), TIER_PRICE_OFFSET, 8))
+        return tier_price + tier_price // UInt64(10)
+
+    @subroutine
+    def _is_checked_in(self, ticket_asset_id: UInt64) -> bool:
+        """Read the check-in flag box for a ticket (missing box = not checked in)"""
         box_key = op.itob(ticket_asset_id)
         ticket_status, box_exists = op.Box.get(box_key)
-        
+
         if not box_exists:
             return False
-        
+
         return op.extract_uint64(ticket_status, 0) == UInt64(1)
 
     @abimethod()
@@ -205,7 +437,7 @@ class Ticketing(ARC4Contract):
         return self.is_sale_active
 
 
-    @abimethod()
+    @abimethod(readonly=True)
     def get_event_info(self) -> tuple[UInt64, UInt64, UInt64, UInt64, UInt64, UInt64, bool]:
         """Get event information"""
         return (
@@ -219,9 +451,38 @@ class Ticketing(ARC4Contract):
         )
     
     @abimethod(readonly=True)
-    def get_organizer(self) -> Account:
+    def get_event_snapshot(self) -> EventSnapshot:
+        """
+        Get event info, resale cap and the full organizer list in one call.
+        Replaces the get_event_info + get_organizer + get_organizer_count +
+        get_organizer_by_index + get_max_resale_price round trips.
+        """
+        organizers = DynamicArray[Address]()
+        for i in urange(self.organizer_count):
+            box_key = b"org_" + op.itob(i)
+            organizer_bytes, exists = op.Box.get(box_key)
+            if exists:
+                organizers.append(Address(organizer_bytes))
+
+        return EventSnapshot(
+            ticket_price=ARC4UInt64(self.ticket_price),
+            max_supply=ARC4UInt64(self.max_supply),
+            sold_count=ARC4UInt64(self.sold_count),
+            tier_sold_count=ARC4UInt64(self.tier_sold_count),
+            event_date=ARC4UInt64(self.event_date),
+            sale_end_date=ARC4UInt64(self.sale_end_date),
+            unique_buyers=ARC4UInt64(self.unique_buyers),
+            is_sale_active=ARC4Bool(self.is_sale_active),
+            max_resale_price=ARC4UInt64(self._max_resale_price()),
+            creator=Address(self.creator),
+            organizer_count=ARC4UInt64(self.organizer_count),
+            organizers=organizers.copy(),
+        )
+
+    @abimethod(readonly=True)
+    def get_organizer(self) -> Address:
         """Get event creator address (main organizer)"""
-        return self.creator
+        return Address(self.creator)
     
     @abimethod(readonly=True)
     def get_organizer_by_index(self, index: UInt64) -> Address:
@@ -276,13 +537,13 @@ class Ticketing(ARC4Contract):
         """
         Transfer (resell) a ticket to a new owner with 110% anti-scalping cap.
         The seller calls this method; the grouped payment goes to the seller.
-        The contract enforces that sale_price <= 110% of original ticket_price.
+        The contract enforces that sale_price <= 110% of the price the ticket was
+        sold at: its tier price for tiered tickets, ticket_price otherwise.
         Uses clawback to move the NFT from seller to buyer.
         Records the transfer in box storage for provenance tracking.
         """
-        # ── Price cap: max resale = ticket_price + ticket_price / 10 (110%) ──
-        max_resale = self.ticket_price + self.ticket_price // UInt64(10)
-        assert sale_price <= max_resale, "Resale price exceeds 110% cap"
+        # ── Price cap: max resale = original price + original price / 10 (110%) ──
+        assert sale_price <= self._ticket_resale_cap(ticket_asset_id), "Resale price exceeds 110% cap"
 
         # ── Verify payment matches the sale_price and goes to seller ──
         assert payment.amount >= sale_price, "Payment less than sale price"
@@ -323,28 +584,31 @@ class Ticketing(ARC4Contract):
             clawback=Global.current_application_address,
         ).submit()
 
-        # ── Record sale in box storage for history / provenance ──
-        # Box key: "sale_" + itob(ticket_asset_id) + itob(transfer_count)
-        history_count_key = b"xfr_" + op.itob(ticket_asset_id)
-        count_bytes, count_exists = op.Box.get(history_count_key)
+        # ── Append sale to the ticket's history box for provenance ──
+        # One box per ticket: header count(8) followed by 80-byte SaleRecords.
+        # The box is grown in place with box_resize, so each resale costs one
+        # box write instead of a new box plus a separate counter box.
+        history_key = b"sh_" + op.itob(ticket_asset_id)
+        history_length, history_exists = op.Box.length(history_key)
         transfer_index = UInt64(0)
-        if count_exists:
-            transfer_index = op.extract_uint64(count_bytes, 0)
-
-        # Create the history entry box: seller(32) + buyer(32) + price(8) + timestamp(8) = 80 bytes
-        history_key = b"sh_" + op.itob(ticket_asset_id) + op.itob(transfer_index)
-        assert op.Box.create(history_key, 80), "Failed to create history box"
-        op.Box.replace(history_key, 0, Txn.sender.bytes)
-        op.Box.replace(history_key, 32, new_owner.bytes)
-        op.Box.replace(history_key, 64, op.itob(sale_price))
-        op.Box.replace(history_key, 72, op.itob(Global.latest_timestamp))
-
-        # Increment transfer counter
-        if count_exists:
-            op.Box.put(history_count_key, op.itob(transfer_index + UInt64(1)))
+        if history_exists:
+            transfer_index = op.btoi(op.Box.extract(history_key, 0, HISTORY_HEADER_SIZE))
+            op.Box.resize(history_key, history_length + SALE_RECORD_SIZE)
         else:
-            assert op.Box.create(history_count_key, 8), "Failed to create counter box"
-            op.Box.put(history_count_key, op.itob(UInt64(1)))
+            assert op.Box.create(
+                history_key, HISTORY_HEADER_SIZE + SALE_RECORD_SIZE
+            ), "Failed to create history box"
+
+        record = SaleRecord(
+            seller=Address(Txn.sender),
+            buyer=Address(new_owner),
+            price=ARC4UInt64(sale_price),
+            timestamp=ARC4UInt64(Global.latest_timestamp),
+        )
+        op.Box.replace(
+            history_key, HISTORY_HEADER_SIZE + transfer_index * SALE_RECORD_SIZE, record.bytes
+        )
+        op.Box.replace(history_key, 0, op.itob(transfer_index + UInt64(1)))
 
         return True
 
@@ -354,16 +618,17 @@ class Ticketing(ARC4Contract):
         Returns the maximum allowed resale price (110% of original ticket price).
         This is enforced on-chain in transfer_ticket.
         """
-        return self.ticket_price + self.ticket_price // UInt64(10)
+        return self._max_resale_price()
+
+    @abimethod(readonly=True)
+    def get_ticket_resale_cap(self, ticket_asset_id: UInt64) -> UInt64:
+        """Maximum resale price of one ticket (110% of its tier price, or of ticket_price)"""
+        return self._ticket_resale_cap(ticket_asset_id)
 
     @abimethod(readonly=True)
     def get_transfer_count(self, ticket_asset_id: UInt64) -> UInt64:
         """Get the number of times a ticket has been resold"""
-        history_count_key = b"xfr_" + op.itob(ticket_asset_id)
-        count_bytes, count_exists = op.Box.get(history_count_key)
-        if count_exists:
-            return op.extract_uint64(count_bytes, 0)
-        return UInt64(0)
+        return self._transfer_count(ticket_asset_id)
 
     @abimethod(readonly=True)
     def get_sale_history(
@@ -373,13 +638,46 @@ class Ticketing(ARC4Contract):
         Get a specific sale history entry for a ticket.
         Returns (seller, buyer, price, timestamp).
         """
-        history_key = b"sh_" + op.itob(ticket_asset_id) + op.itob(index)
-        history_bytes, exists = op.Box.get(history_key)
-        assert exists, "History entry not found"
+        assert index < self._transfer_count(ticket_asset_id), "History entry not found"
+
+        history_key = b"sh_" + op.itob(ticket_asset_id)
+        record = SaleRecord.from_bytes(
+            op.Box.extract(history_key, HISTORY_HEADER_SIZE + index * SALE_RECORD_SIZE, SALE_RECORD_SIZE)
+        )
+        return record.seller, record.buyer, record.price.native, record.timestamp.native
+
+    @abimethod(readonly=True)
+    def get_sale_history_range(
+        self, ticket_asset_id: UInt64, from_index: UInt64, count: UInt64
+    ) -> DynamicArray[SaleRecord]:
+        """
+        Get up to `count` consecutive sale history entries starting at `from_index`.
+        Reads the records straight out of the history box in one extract.
+        Capped at 12 records per call; page with from_index for longer histories.
+        """
+        total = self._transfer_count(ticket_asset_id)
+        if from_index >= total:
+            return DynamicArray[SaleRecord]()
 
-        seller = Address(op.extract(history_bytes, 0, 32))
-        buyer = Address(op.extract(history_bytes, 32, 32))
-        price = op.extract_uint64(history_bytes, 64)
-        timestamp = op.extract_uint64(history_bytes, 72)
+        page_size = total - from_index
+        if count < page_size:
+            page_size = count
+        if page_size > MAX_HISTORY_PAGE:
+            page_size = UInt64(MAX_HISTORY_PAGE)
 
-        return seller, buyer, price, timestamp
+        history_key = b"sh_" + op.itob(ticket_asset_id)
+        records = op.Box.extract(
+            history_key,
+            HISTORY_HEADER_SIZE + from_index * SALE_RECORD_SIZE,
+            page_size * SALE_RECORD_SIZE,
+        )
+        return DynamicArray[SaleRecord].from_bytes(ARC4UInt16(page_size).bytes + records)
+
+    @subroutine
+    def _transfer_count(self, ticket_asset_id: UInt64) -> UInt64:
+        """Read the resale count from the ticket's history box header"""
+        history_key = b"sh_" + op.itob(ticket_asset_id)
+        _length, history_exists = op.Box.length(history_key)
+        if history_exists:
+            return op.btoi(op.Box.extract(history_key, 0, HISTORY_HEADER_SIZE))
+        return UInt64(0)
@@ -0,0 +1,308 @@
+"""
+Offline-first check-in cache for Ticketing gates.
+
+Gates snapshot the event's organizer set, verification deadline and ticket
+ownership while online, validate scans locally against that snapshot (plain dict
+lookups, no network), and queue accepted check-ins. When connectivity returns,
+`reconcile()` re-reads on-chain status for the queued tickets, reports tickets
+that were checked in elsewhere (double entry), changed hands since the snapshot
+or are no longer held by their owner, and submits the rest as grouped
+`verify_entry` calls signed by the gate's organizer account. A group rejected
+on-chain is retried one check-in at a time so only the offending entries are
+reported; network errors leave the queue intact for the next call.
+
+Chain access goes through the small `TicketingGateway` protocol so the cache can
+be exercised against an in-memory algod stand-in in tests.
+"""
+
+import dataclasses
+import enum
+import logging
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple, Protocol, TypedDict, cast
+
+from algosdk.error import AlgodHTTPError
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.ticketing.ticketing_client import EventSnapshot, TicketingClient
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of transactions in an atomic group
+MAX_GROUP_SIZE = 16
+# get_ticket_status_batch rows are 41 bytes; 24 rows keep the return under the 1024 byte log cap
+STATUS_PAGE_SIZE = 24
+# verify_entry is accepted until 24 hours after the event date
+VERIFICATION_WINDOW = 86400
+
+
+@dataclasses.dataclass(frozen=True)
+class TicketState:
+    """On-chain state of one ticket as seen in a snapshot."""
+
+    owner: str
+    checked_in: bool
+    transfer_count: int
+    # Whether `owner` actually holds the ticket ASA (verify_entry checks the holding,
+    # not the reserve address, so unclaimed or plainly transferred tickets fail)
+    held: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class CheckIn:
+    """A scan accepted offline and waiting to be recorded on-chain."""
+
+    holder: str
+    asset_id: int
+    scanned_at: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Conflict:
+    """A queued check-in that could not be recorded on-chain."""
+
+    check_in: CheckIn
+    reason: str
+
+
+@dataclasses.dataclass
+class ReconcileReport:
+    confirmed: list[CheckIn] = dataclasses.field(default_factory=list)
+    conflicts: list[Conflict] = dataclasses.field(default_factory=list)
+
+
+class ScanResult(enum.Enum):
+    ACCEPTED = "accepted"
+    UNKNOWN_TICKET = "unknown_ticket"
+    WRONG_HOLDER = "wrong_holder"
+    ALREADY_CHECKED_IN = "already_checked_in"
+    DUPLICATE_SCAN = "duplicate_scan"
+    NOT_HELD = "not_held"
+    EVENT_ENDED = "event_ended"
+
+
+class TicketingGateway(Protocol):
+    """Chain access needed by the gate cache."""
+
+    def get_organizers(self) -> list[str]:
+        """Creator plus every registered organizer address."""
+        ...
+
+    def get_event_date(self) -> int:
+        """Event date as a unix timestamp."""
+        ...
+
+    def get_ticket_ids(self) -> list[int]:
+        """Asset ids of every ticket minted by the event app."""
+        ...
+
+    def get_ticket_status(self, asset_ids: Sequence[int]) -> list[TicketState]:
+        """Current state for each asset id, in input order."""
+        ...
+
+    def submit_check_ins(self, check_ins: Sequence[CheckIn]) -> None:
+        """Record the check-ins on-chain as one atomic group."""
+        ...
+
+
+# The parts of algod's JSON responses the gateway reads
+class _CreatedAsset(TypedDict):
+    index: int
+
+
+class _AssetHolding(TypedDict, total=False):
+    amount: int
+
+
+_AccountInfo = TypedDict("_AccountInfo", {"created-assets": list[_CreatedAsset]}, total=False)
+_AccountAssetInfo = TypedDict("_AccountAssetInfo", {"asset-holding": _AssetHolding}, total=False)
+
+
+class _StatusRow(NamedTuple):
+    """One get_ticket_status_batch row; the typed client returns struct array rows as plain tuples."""
+
+    checked_in: bool
+    transfer_count: int
+    owner: str
+
+
+class AlgodTicketingGateway:
+    """`TicketingGateway` backed by the generated Ticketing typed client."""
+
+    def __init__(self, client: "TicketingClient") -> None:
+        self.client = client
+
+    def get_organizers(self) -> list[str]:
+        snapshot = self._event_snapshot()
+        return [snapshot.creator, *snapshot.organizers]
+
+    def get_event_date(self) -> int:
+        return self._event_snapshot().event_date
+
+    def get_ticket_ids(self) -> list[int]:
+        response = self.client.algorand.client.algod.account_info(self.client.app_address)
+        account_info = cast(_AccountInfo, response)
+        return [asset["index"] for asset in account_info.get("created-assets", [])]
+
+    def get_ticket_status(self, asset_ids: Sequence[int]) -> list[TicketState]:
+        states: list[TicketState] = []
+        for start in range(0, len(asset_ids), STATUS_PAGE_SIZE):
+            page = list(asset_ids[start : start + STATUS_PAGE_SIZE])
+            rows = self.client.send.get_ticket_status_batch(args=(page,)).abi_return or []
+            for asset_id, row in zip(page, map(_StatusRow._make, rows), strict=True):
+                states.append(
+                    TicketState(
+                        owner=row.owner,
+                        checked_in=row.checked_in,
+                        transfer_count=row.transfer_count,
+                        held=self._holds(row.owner, asset_id),
+                    )
+                )
+        return states
+
+    def _event_snapshot(self) -> "EventSnapshot":
+        snapshot = self.client.send.get_event_snapshot().abi_return
+        if snapshot is None:
+            raise ValueError("get_event_snapshot returned no value")
+        return snapshot
+
+    def _holds(self, owner: str, asset_id: int) -> bool:
+        try:
+            response = self.client.algorand.client.algod.account_asset_info(owner, asset_id)
+        except AlgodHTTPError:  # type: ignore[misc]  # not opted in, or unknown asset
+            return False
+        holding = cast(_AccountAssetInfo, response)
+        return holding.get("asset-holding", {}).get("amount", 0) == 1
+
+    def submit_check_ins(self, check_ins: Sequence[CheckIn]) -> None:
+        group = self.client.new_group()
+        for check_in in check_ins:
+            group.verify_entry(args=(check_in.holder, check_in.asset_id))
+        group.send()
+
+
+class GateCheckInCache:
+    """
+    Local check-in index for one gate, operated by one organizer account.
+
+    Call `refresh()` while online, `scan()` for every ticket presented at the
+    gate, and `reconcile()` whenever connectivity is available.
+    """
+
+    def __init__(self, gateway: TicketingGateway, scanner: str) -> None:
+        self.gateway = gateway
+        self.scanner = scanner
+        self.tickets: dict[int, TicketState] = {}
+        self.pending: list[CheckIn] = []
+        self.verification_deadline = 0
+        self._scanned: set[int] = set()
+
+    def refresh(self) -> None:
+        """Snapshot organizer and ticket ownership state from chain."""
+        if self.scanner not in self.gateway.get_organizers():
+            raise PermissionError(f"{self.scanner} is not an organizer of this event")
+
+        self.verification_deadline = self.gateway.get_event_date() + VERIFICATION_WINDOW
+        asset_ids = self.gateway.get_ticket_ids()
+        self.tickets = dict(zip(asset_ids, self.gateway.get_ticket_status(asset_ids), strict=True))
+        logger.info(f"Gate snapshot refreshed with {len(self.tickets)} tickets")
+
+    def scan(self, holder: str, asset_id: int) -> ScanResult:
+        """Validate a scan against the snapshot and queue it if accepted."""
+        if time.time() > self.verification_deadline:
+            return ScanResult.EVENT_ENDED
+        ticket = self.tickets.get(asset_id)
+        if ticket is None:
+            return ScanResult.UNKNOWN_TICKET
+        if ticket.owner != holder:
+            return ScanResult.WRONG_HOLDER
+        if not ticket.held:
+            return ScanResult.NOT_HELD
+        if ticket.checked_in:
+            return ScanResult.ALREADY_CHECKED_IN
+        if asset_id in self._scanned:
+            return ScanResult.DUPLICATE_SCAN
+
+        self._scanned.add(asset_id)
+        self.pending.append(CheckIn(holder=holder, asset_id=asset_id, scanned_at=time.time()))
+        return ScanResult.ACCEPTED
+
+    def reconcile(self) -> ReconcileReport:
+        """
+        Push queued check-ins on-chain in atomic groups.
+        Check-ins that conflict with current chain state, or that the chain rejects,
+        are reported and dropped; if the network fails, the unsent check-ins stay
+        queued for the next call.
+        """
+        report = ReconcileReport()
+        queue = self.pending
+        self.pending = []
+
+        if queue and time.time() > self.verification_deadline:
+            report.conflicts.extend(Conflict(check_in, "event verification period ended") for check_in in queue)
+            return report
+
+        for start in range(0, len(queue), MAX_GROUP_SIZE):
+            batch = queue[start : start + MAX_GROUP_SIZE]
+            current = self.gateway.get_ticket_status([check_in.asset_id for check_in in batch])
+
+            submittable: list[CheckIn] = []
+            for check_in, state in zip(batch, current, strict=True):
+                self.tickets[check_in.asset_id] = state
+                if state.checked_in:
+                    report.conflicts.append(Conflict(check_in, "checked in at another gate"))
+                elif state.owner != check_in.holder:
+                    report.conflicts.append(Conflict(check_in, "ticket transferred since snapshot"))
+                elif not state.held:
+                    report.conflicts.append(Conflict(check_in, "ticket not held by owner"))
+                else:
+                    submittable.append(check_in)
+
+            confirmed, unsent = self._submit(submittable, report)
+            for check_in in confirmed:
+                self.tickets[check_in.asset_id] = dataclasses.replace(
+                    self.tickets[check_in.asset_id], checked_in=True
+                )
+            report.confirmed.extend(confirmed)
+
+            if unsent:
+                self.pending = unsent + queue[start + MAX_GROUP_SIZE :]
+                logger.warning(f"Reconcile stopped with {len(self.pending)} check-ins still queued")
+                return report
+
+        return report
+
+    def _submit(self, check_ins: list[CheckIn], report: ReconcileReport) -> tuple[list[CheckIn], list[CheckIn]]:
+        """
+        Submit check-ins as one group and return (confirmed, unsent).
+        If the chain rejects the group, retry the check-ins one at a time and report
+        the rejected ones as conflicts; a network error (OSError) stops submission and
+        returns the rest as unsent.
+        """
+        if not check_ins:
+            return [], []
+        try:
+            self.gateway.submit_check_ins(check_ins)
+            return check_ins, []
+        except OSError:
+            logger.exception("Check-in submission failed")
+            return [], check_ins
+        except Exception as e:
+            if len(check_ins) == 1:
+                report.conflicts.append(Conflict(check_ins[0], f"rejected on-chain: {e}"))
+                return [], []
+            logger.warning(f"Group of {len(check_ins)} check-ins rejected, retrying individually")
+
+        confirmed: list[CheckIn] = []
+        for index, check_in in enumerate(check_ins):
+            try:
+                self.gateway.submit_check_ins([check_in])
+            except OSError:
+                logger.exception("Check-in submission failed")
+                return confirmed, check_ins[index:]
+            except Exception as e:
+                report.conflicts.append(Conflict(check_in, f"rejected on-chain: {e}"))
+            else:
+                confirmed.append(check_in)
+        return confirmed, []
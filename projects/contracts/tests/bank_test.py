@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.bank.contract import Bank
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def _deposit(context: AlgopyTestContext, contract: Bank, account: algopy.Account, amount: int) -> algopy.UInt64:
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(sender=account, receiver=app.address, amount=algopy.UInt64(amount))
+    with context.txn.create_group(active_txn_overrides={"sender": account}):
+        return contract.deposit(algopy.String("deposit"), payment)
+
+
+def _withdraw(context: AlgopyTestContext, contract: Bank, account: algopy.Account, amount: int) -> algopy.UInt64:
+    with context.txn.create_group(active_txn_overrides={"sender": account}):
+        return contract.withdraw(algopy.UInt64(amount))
+
+
+def test_yield_then_full_withdrawal_leaves_no_depositor_row(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    alice = context.any.account()
+    bob = context.any.account()
+    _deposit(context, contract, alice, 1_000_000)
+    _deposit(context, contract, bob, 3_000_000)
+    app = context.ledger.get_app(contract)
+    yield_payment = context.any.txn.payment(receiver=app.address, amount=algopy.UInt64(1_000_001))
+    with context.txn.create_group(active_txn_overrides={"sender": alice}):
+        contract.distribute_yield(yield_payment)
+
+    # Act
+    [alice_balance, bob_balance] = [b.native for b in contract.get_balances(
+        algopy.arc4.DynamicArray(algopy.arc4.Address(alice), algopy.arc4.Address(bob))
+    )]
+    remaining = _withdraw(context, contract, alice, int(alice_balance))
+
+    # Assert
+    assert alice_balance == 1_250_000
+    assert bob_balance == 3_750_000
+    assert remaining == 0
+    assert alice not in contract.deposits
+    assert contract.depositor_count == 1
+    assert contract.deposits[bob].index == 0
+    assert context.ledger.get_box(contract, b"dx_" + (0).to_bytes(8, "big")) == bob.bytes
+
+
+def test_partial_withdrawals_round_shares_up(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = Bank()
+    alice = context.any.account()
+    _deposit(context, contract, alice, 3_000_000)
+    app = context.ledger.get_app(contract)
+    yield_payment = context.any.txn.payment(receiver=app.address, amount=algopy.UInt64(1_000_000))
+    with context.txn.create_group(active_txn_overrides={"sender": alice}):
+        contract.distribute_yield(yield_payment)
+
+    # Act
+    first = _withdraw(context, contract, alice, 1_000_001)
+    second = _withdraw(context, contract, alice, int(first))
+
+    # Assert
+    assert first == 2_999_998
+    assert second == 0
+    assert contract.total_shares == 0
+    assert contract.depositor_count == 0
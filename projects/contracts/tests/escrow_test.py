@@ -0,0 +1,92 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.escrow.contract import FundraiserEscrow
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=NOW)
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> FundraiserEscrow:
+    contract = FundraiserEscrow()
+    contract.create_campaign(
+        algopy.UInt64(50_000_000), algopy.UInt64(2), algopy.UInt64(NOW + 86_400), algopy.UInt64(1)
+    )
+    return contract
+
+
+def _donate(context: AlgopyTestContext, contract: FundraiserEscrow, donor: algopy.Account, amount: int) -> None:
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(sender=donor, receiver=app.address, amount=algopy.UInt64(amount))
+    with context.txn.create_group(active_txn_overrides={"sender": donor}):
+        contract.donate(payment)
+
+
+def test_refunds_split_spendable_balance_pro_rata(context: AlgopyTestContext, contract: FundraiserEscrow) -> None:
+    # Arrange: 6.1 ALGO raised, of which 0.61 ALGO is locked as box MBR
+    funded = [context.any.account(balance=algopy.UInt64(1_000_000)) for _ in range(3)]
+    closed = context.any.account(balance=algopy.UInt64(0))
+    for donor, amount in zip(funded, [1_000_000, 2_000_000, 3_000_000], strict=True):
+        _donate(context, contract, donor, amount)
+    _donate(context, contract, closed, 100_000)
+    app = context.ledger.get_app(contract)
+    context.ledger.update_account(
+        app.address, balance=algopy.UInt64(6_100_000), min_balance=algopy.UInt64(610_000)
+    )
+    contract.is_frozen = True
+
+    # Act
+    with context.txn.create_group():
+        cursor = contract.refund_batch(algopy.UInt64(0), algopy.UInt64(32))
+
+    # Assert
+    payments = [context.txn.last_group.get_itxn_group(i).payment(0) for i in range(3)]
+    paid = {payment.receiver: payment.amount for payment in payments}
+    assert cursor == 4
+    assert contract.refund_pool == 5_490_000
+    assert paid == {funded[0]: 900_000, funded[1]: 1_800_000, funded[2]: 2_700_000}
+    assert contract.pending_refunds[closed] == 90_000
+    assert contract.total_refunded + contract.pending_refunds[closed] == contract.refund_pool
+
+
+def test_refund_batch_is_capped(context: AlgopyTestContext, contract: FundraiserEscrow) -> None:
+    _donate(context, contract, context.any.account(), 1_000_000)
+    contract.is_frozen = True
+
+    with pytest.raises(AssertionError, match="Batch too large"):
+        contract.refund_batch(algopy.UInt64(0), algopy.UInt64(33))
+
+
+def test_has_voted_stays_truthful_after_voting_closes(context: AlgopyTestContext, contract: FundraiserEscrow) -> None:
+    # Arrange: the first donor holds a majority of the vote weight
+    whale, minnow = context.any.account(), context.any.account()
+    _donate(context, contract, whale, 30_000_000)
+    _donate(context, contract, minnow, 20_000_000)
+    request_id = algopy.UInt64(1)
+    with context.txn.create_group(active_txn_overrides={"sender": contract.creator}):
+        contract.submit_withdrawal_request(request_id, algopy.UInt64(1_000_000), algopy.Bytes(b"p"), algopy.Bytes(b"q"))
+    contract.record_ai_verification(request_id, algopy.UInt64(90))
+
+    # Act: one vote closes voting
+    with context.txn.create_group(active_txn_overrides={"sender": whale}):
+        contract.vote_on_request(request_id, algopy.UInt64(1))
+
+    # Assert
+    assert contract.get_request_record(request_id).status == 3
+    assert contract.has_voted(request_id, algopy.arc4.Address(whale))
+    assert not contract.has_voted(request_id, algopy.arc4.Address(minnow))
+
+    assert contract.cleanup_votes(request_id) == 2500 + 400 * (11 + 1)
+    assert not contract.has_voted(request_id, algopy.arc4.Address(whale))
+    with pytest.raises(AssertionError, match="Nothing to clean up"):
+        contract.cleanup_votes(request_id)
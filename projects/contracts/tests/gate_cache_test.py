@@ -0,0 +1,260 @@
+import time
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.artifacts.ticketing.ticketing_client import EventSnapshot, TicketingClient
+from smart_contracts.ticketing.gate_cache import (
+    MAX_GROUP_SIZE,
+    STATUS_PAGE_SIZE,
+    AlgodTicketingGateway,
+    CheckIn,
+    GateCheckInCache,
+    ScanResult,
+    TicketState,
+)
+
+CREATOR = "CREATOR"
+ORGANIZER = "ORGANIZER"
+
+
+class FakeTicketingNode:
+    """In-memory stand-in for algod + the Ticketing app."""
+
+    def __init__(self, owners: dict[int, str]) -> None:
+        self.owners = dict(owners)  # reserve address recorded by the app
+        self.holders = dict(owners)  # account actually holding the ASA
+        self.checked_in: set[int] = set()
+        self.event_date = int(time.time()) + 3600
+        self.submitted_groups: list[list[int]] = []
+        self.online = True
+
+    def get_organizers(self) -> list[str]:
+        return [CREATOR, ORGANIZER]
+
+    def get_event_date(self) -> int:
+        return self.event_date
+
+    def get_ticket_ids(self) -> list[int]:
+        return list(self.owners)
+
+    def get_ticket_status(self, asset_ids: Sequence[int]) -> list[TicketState]:
+        return [
+            TicketState(
+                owner=self.owners[asset_id],
+                checked_in=asset_id in self.checked_in,
+                transfer_count=0,
+                held=self.holders[asset_id] == self.owners[asset_id],
+            )
+            for asset_id in asset_ids
+        ]
+
+    def submit_check_ins(self, check_ins: Sequence[CheckIn]) -> None:
+        if not self.online:
+            raise ConnectionError("algod unreachable")
+        assert len(check_ins) <= MAX_GROUP_SIZE
+        for check_in in check_ins:
+            assert self.holders[check_in.asset_id] == check_in.holder, "Ticket not owned by holder"
+            assert check_in.asset_id not in self.checked_in, "Ticket already used"
+        self.checked_in.update(check_in.asset_id for check_in in check_ins)
+        self.submitted_groups.append([check_in.asset_id for check_in in check_ins])
+
+
+@pytest.fixture()
+def node() -> FakeTicketingNode:
+    return FakeTicketingNode({1000 + i: f"HOLDER{i}" for i in range(40)})
+
+
+@pytest.fixture()
+def cache(node: FakeTicketingNode) -> GateCheckInCache:
+    gate = GateCheckInCache(node, scanner=ORGANIZER)
+    gate.refresh()
+    return gate
+
+
+def test_refresh_rejects_non_organizer(node: FakeTicketingNode) -> None:
+    with pytest.raises(PermissionError):
+        GateCheckInCache(node, scanner="STRANGER").refresh()
+
+
+def test_scan_validates_against_snapshot(cache: GateCheckInCache) -> None:
+    assert cache.scan("HOLDER0", 1000) == ScanResult.ACCEPTED
+    assert cache.scan("HOLDER0", 1000) == ScanResult.DUPLICATE_SCAN
+    assert cache.scan("HOLDER2", 1001) == ScanResult.WRONG_HOLDER
+    assert cache.scan("HOLDER0", 9999) == ScanResult.UNKNOWN_TICKET
+    assert len(cache.pending) == 1
+
+
+def test_reconcile_submits_in_groups(cache: GateCheckInCache, node: FakeTicketingNode) -> None:
+    for i in range(40):
+        cache.scan(f"HOLDER{i}", 1000 + i)
+
+    report = cache.reconcile()
+
+    assert len(report.confirmed) == 40
+    assert not report.conflicts
+    assert not cache.pending
+    assert [len(group) for group in node.submitted_groups] == [16, 16, 8]
+    assert cache.scan("HOLDER0", 1000) == ScanResult.ALREADY_CHECKED_IN
+
+
+def test_reconcile_reports_double_entry_and_transfers(cache: GateCheckInCache, node: FakeTicketingNode) -> None:
+    cache.scan("HOLDER0", 1000)
+    cache.scan("HOLDER1", 1001)
+    cache.scan("HOLDER2", 1002)
+    node.checked_in.add(1000)  # another gate got there first
+    node.owners[1001] = "HOLDER99"  # resold after the snapshot
+
+    report = cache.reconcile()
+
+    assert [check_in.asset_id for check_in in report.confirmed] == [1002]
+    assert [(conflict.check_in.asset_id, conflict.reason) for conflict in report.conflicts] == [
+        (1000, "checked in at another gate"),
+        (1001, "ticket transferred since snapshot"),
+    ]
+
+
+def test_reconcile_keeps_queue_when_offline(cache: GateCheckInCache, node: FakeTicketingNode) -> None:
+    for i in range(20):
+        cache.scan(f"HOLDER{i}", 1000 + i)
+    node.online = False
+
+    report = cache.reconcile()
+
+    assert not report.confirmed
+    assert len(cache.pending) == 20
+
+    node.online = True
+    report = cache.reconcile()
+
+    assert len(report.confirmed) == 20
+    assert not cache.pending
+
+
+def test_scan_rejects_ticket_not_held_by_reserve_owner(node: FakeTicketingNode) -> None:
+    node.holders[1000] = "CREATOR_APP"  # minted but never claimed by the buyer
+    gate = GateCheckInCache(node, scanner=ORGANIZER)
+    gate.refresh()
+
+    assert gate.scan("HOLDER0", 1000) == ScanResult.NOT_HELD
+    assert not gate.pending
+
+
+def test_reconcile_reports_asa_moved_after_snapshot(cache: GateCheckInCache, node: FakeTicketingNode) -> None:
+    for i in range(20):
+        cache.scan(f"HOLDER{i}", 1000 + i)
+    node.holders[1003] = "HOLDER99"  # plain ASA transfer, reserve address unchanged
+
+    report = cache.reconcile()
+
+    assert [(conflict.check_in.asset_id, conflict.reason) for conflict in report.conflicts] == [
+        (1003, "ticket not held by owner"),
+    ]
+    assert len(report.confirmed) == 19
+    assert not cache.pending
+
+
+def test_reconcile_splits_group_rejected_on_chain(cache: GateCheckInCache, node: FakeTicketingNode) -> None:
+    for i in range(20):
+        cache.scan(f"HOLDER{i}", 1000 + i)
+    # The status read still shows the ticket as held, but the chain rejects it
+    node.get_ticket_status = lambda asset_ids: [  # type: ignore[method-assign]
+        TicketState(owner=node.owners[asset_id], checked_in=False, transfer_count=0) for asset_id in asset_ids
+    ]
+    node.holders[1005] = "HOLDER99"
+
+    report = cache.reconcile()
+
+    assert [conflict.check_in.asset_id for conflict in report.conflicts] == [1005]
+    assert report.conflicts[0].reason.startswith("rejected on-chain")
+    assert len(report.confirmed) == 19
+    assert not cache.pending
+
+
+def test_reconcile_drops_queue_after_verification_period(cache: GateCheckInCache) -> None:
+    cache.scan("HOLDER0", 1000)
+    cache.verification_deadline = int(time.time()) - 1
+
+    report = cache.reconcile()
+
+    assert [conflict.reason for conflict in report.conflicts] == ["event verification period ended"]
+    assert not cache.pending
+    assert cache.scan("HOLDER1", 1001) == ScanResult.EVENT_ENDED
+
+
+class CannedTicketingClient:
+    """Ticketing typed client stand-in replaying responses in the shapes algod and the client return."""
+
+    app_address = "APP"
+
+    def __init__(self, holdings: dict[tuple[str, int], int]) -> None:
+        self.holdings = holdings
+        self.status_pages: list[list[int]] = []
+        self.verified: list[tuple[str, int]] = []
+        self.send = SimpleNamespace(
+            get_event_snapshot=lambda: SimpleNamespace(abi_return=self.snapshot()),
+            get_ticket_status_batch=self.get_ticket_status_batch,
+        )
+        algod = SimpleNamespace(account_info=self.account_info, account_asset_info=self.account_asset_info)
+        self.algorand = SimpleNamespace(client=SimpleNamespace(algod=algod))
+
+    def snapshot(self) -> EventSnapshot:
+        return EventSnapshot(
+            ticket_price=5_000_000,
+            max_supply=100,
+            sold_count=30,
+            tier_sold_count=0,
+            event_date=1_700_000_000,
+            sale_end_date=1_699_990_000,
+            unique_buyers=30,
+            is_sale_active=True,
+            max_resale_price=5_500_000,
+            creator=CREATOR,
+            organizer_count=1,
+            organizers=[ORGANIZER],
+        )
+
+    def get_ticket_status_batch(self, args: tuple[list[int]]) -> SimpleNamespace:
+        (page,) = args
+        self.status_pages.append(page)
+        # Struct array rows come back as plain (checked_in, transfer_count, owner) sequences
+        return SimpleNamespace(abi_return=[[asset_id == 1001, 1, f"HOLDER{asset_id - 1000}"] for asset_id in page])
+
+    def account_info(self, address: str) -> dict[str, object]:
+        assert address == self.app_address
+        return {"address": address, "created-assets": [{"index": 1000 + i, "params": {}} for i in range(30)]}
+
+    def account_asset_info(self, address: str, asset_id: int) -> dict[str, object]:
+        if (address, asset_id) not in self.holdings:
+            raise AlgodHTTPError("account asset info not found", 404)
+        return {"asset-holding": {"amount": self.holdings[address, asset_id], "asset-id": asset_id}}
+
+    def new_group(self) -> SimpleNamespace:
+        def verify_entry(args: tuple[str, int]) -> None:
+            self.verified.append(args)
+
+        return SimpleNamespace(verify_entry=verify_entry, send=lambda: None)
+
+
+def test_algod_gateway_decodes_client_responses() -> None:
+    client = CannedTicketingClient({("HOLDER0", 1000): 1, ("HOLDER1", 1001): 1, ("HOLDER2", 1002): 0})
+    gateway = AlgodTicketingGateway(cast(TicketingClient, client))
+
+    asset_ids = gateway.get_ticket_ids()
+    states = gateway.get_ticket_status(asset_ids)
+    gateway.submit_check_ins([CheckIn(holder="HOLDER0", asset_id=1000, scanned_at=0.0)])
+
+    assert gateway.get_organizers() == [CREATOR, ORGANIZER]
+    assert gateway.get_event_date() == 1_700_000_000
+    assert asset_ids == [1000 + i for i in range(30)]
+    assert [len(page) for page in client.status_pages] == [STATUS_PAGE_SIZE, 30 - STATUS_PAGE_SIZE]
+    assert states[:4] == [
+        TicketState(owner="HOLDER0", checked_in=False, transfer_count=1, held=True),
+        TicketState(owner="HOLDER1", checked_in=True, transfer_count=1, held=True),
+        TicketState(owner="HOLDER2", checked_in=False, transfer_count=1, held=False),  # opted in, sold on
+        TicketState(owner="HOLDER3", checked_in=False, transfer_count=1, held=False),  # not opted in
+    ]
+    assert client.verified == [("HOLDER0", 1000)]
@@ -0,0 +1,91 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.marketplace.contract import Marketplace
+
+PRICE = 5_000_000
+MBR = 1_000_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> Marketplace:
+    return Marketplace()
+
+
+def _payment(
+    context: AlgopyTestContext, contract: Marketplace, sender: algopy.Account, amount: int
+) -> algopy.gtxn.PaymentTransaction:
+    app = context.ledger.get_app(contract)
+    return context.any.txn.payment(sender=sender, receiver=app.address, amount=algopy.UInt64(amount))
+
+
+def _add_arbitrator(context: AlgopyTestContext, contract: Marketplace) -> algopy.Account:
+    arbitrator = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": contract.admin}):
+        contract.add_arbitrator(algopy.arc4.Address(arbitrator), _payment(context, contract, contract.admin, MBR))
+    return arbitrator
+
+
+def _vote(contract: Marketplace, context: AlgopyTestContext, arbitrator: algopy.Account, resolution: int) -> None:
+    with context.txn.create_group(active_txn_overrides={"sender": arbitrator}):
+        contract.vote_dispute(algopy.UInt64(0), algopy.UInt64(resolution))
+
+
+def _disputed_listing(context: AlgopyTestContext, contract: Marketplace) -> tuple[algopy.Account, algopy.Account]:
+    seller, buyer = context.any.account(), context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": seller}):
+        contract.list_item(
+            algopy.Bytes(b"title"),
+            algopy.UInt64(PRICE),
+            algopy.Bytes(b"image"),
+            _payment(context, contract, seller, MBR),
+        )
+    with context.txn.create_group(active_txn_overrides={"sender": buyer}):
+        contract.buy_item(algopy.UInt64(0), _payment(context, contract, buyer, PRICE))
+    with context.txn.create_group(active_txn_overrides={"sender": buyer}):
+        contract.raise_dispute(algopy.UInt64(0), _payment(context, contract, buyer, MBR))
+    # Escrow holds the price on top of the app's minimum balance
+    app = context.ledger.get_app(contract)
+    context.ledger.update_account(app.address, balance=algopy.UInt64(PRICE + 4 * MBR))
+    return seller, buyer
+
+
+def test_tied_dispute_refunds_buyer_once_every_arbitrator_voted(
+    context: AlgopyTestContext, contract: Marketplace
+) -> None:
+    # Arrange: four arbitrators, every vote needed
+    arbitrators = [_add_arbitrator(context, contract) for _ in range(4)]
+    with context.txn.create_group(active_txn_overrides={"sender": contract.admin}):
+        contract.set_dispute_quorum(algopy.UInt64(4))
+    _seller, buyer = _disputed_listing(context, contract)
+
+    # Act: the quorum is reached on a 2-2 tie
+    for arbitrator, resolution in zip(arbitrators, [1, 0, 1, 0], strict=True):
+        assert contract.get_status(algopy.UInt64(0)) == 3
+        _vote(contract, context, arbitrator, resolution)
+
+    # Assert
+    refund = context.txn.last_group.get_itxn_group(0).payment(0)
+    assert contract.get_status(algopy.UInt64(0)) == 5
+    assert (refund.receiver, refund.amount) == (buyer, PRICE)
+
+
+def test_arbitrator_registered_after_dispute_cannot_vote(context: AlgopyTestContext, contract: Marketplace) -> None:
+    for _ in range(3):
+        _add_arbitrator(context, contract)
+    _disputed_listing(context, contract)
+    # Index 3 still fits in the dispute's one-byte bitmap
+    late = _add_arbitrator(context, contract)
+
+    with pytest.raises(AssertionError, match="Registered after dispute was raised"):
+        _vote(contract, context, late, 1)
+    assert not contract.has_voted(algopy.UInt64(0), algopy.arc4.Address(late))
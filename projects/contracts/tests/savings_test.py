@@ -0,0 +1,82 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.savings.contract import SavingsPool
+
+NOW = 1_700_000_000
+CONTRIBUTION = 1_000_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=NOW)
+        yield ctx
+
+
+@pytest.fixture()
+def members(context: AlgopyTestContext) -> list[algopy.Account]:
+    return [context.any.account() for _ in range(3)]
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext, members: list[algopy.Account]) -> SavingsPool:
+    contract = SavingsPool()
+    contract.create_pool(algopy.Bytes(b"rent"), algopy.UInt64(CONTRIBUTION), algopy.UInt64(3), algopy.UInt64(3))
+    for member in members:
+        _pay(context, contract, member, "join_pool")
+    contract.start_pool()
+    return contract
+
+
+def _pay(context: AlgopyTestContext, contract: SavingsPool, member: algopy.Account, method: str) -> None:
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(sender=member, receiver=app.address, amount=algopy.UInt64(CONTRIBUTION))
+    with context.txn.create_group(active_txn_overrides={"sender": member}):
+        getattr(contract, method)(payment)
+
+
+def _close_cycle(context: AlgopyTestContext, contract: SavingsPool) -> algopy.UInt64:
+    context.ledger.patch_global_fields(latest_timestamp=int(contract.cycle_deadline))
+    with context.txn.create_group():
+        return contract.advance_cycle()
+
+
+def test_rotation_skips_defaulter_and_charges_it_lazily(
+    context: AlgopyTestContext, contract: SavingsPool, members: list[algopy.Account]
+) -> None:
+    first, second, third = members
+
+    # Arrange: the first member in the rotation misses cycle 1
+    _pay(context, contract, second, "contribute")
+    _pay(context, contract, third, "contribute")
+
+    # Act
+    payout = _close_cycle(context, contract)
+
+    # Assert: the second member is paid ahead of the defaulter, whose stake covers its miss
+    assert payout == 3 * CONTRIBUTION
+    assert context.txn.last_group.get_itxn_group(0).payment(0).receiver == second
+    assert contract.get_member_info(first) == (1, 0, 0, 0)
+    assert contract.get_member_info(second) == (0, CONTRIBUTION, 1, CONTRIBUTION)
+    assert contract.rotation_cursor == 1
+    assert contract.carried_pot == 0
+
+    # The third member misses cycle 2 but is not in the cursor slot, so it is not touched
+    _pay(context, contract, first, "contribute")
+    _pay(context, contract, second, "contribute")
+    payout = _close_cycle(context, contract)
+
+    assert payout == 2 * CONTRIBUTION
+    assert context.txn.last_group.get_itxn_group(0).payment(0).receiver == first
+    assert contract.members[third].stake == CONTRIBUTION
+    assert contract.get_member_info(third)[3] == 0
+
+    # Anyone can charge it; the penalty goes into the current cycle's pot
+    with context.txn.create_group():
+        assert contract.apply_penalties(third) == 0
+    assert contract.carried_pot == CONTRIBUTION
+    assert contract.current_cycle == 3
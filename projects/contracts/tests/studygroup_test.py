@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.studygroup.contract import StudyGroup
+
+STAKE = 1_000_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def members(context: AlgopyTestContext) -> list[algopy.Account]:
+    return [context.any.account(balance=algopy.UInt64(1_000_000)) for _ in range(3)]
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext, members: list[algopy.Account]) -> StudyGroup:
+    contract = StudyGroup()
+    contract.create_group(algopy.Bytes(b"algebra"), algopy.UInt64(STAKE), algopy.UInt64(2), algopy.UInt64(4))
+    app = context.ledger.get_app(contract)
+    for member in members:
+        stake = context.any.txn.payment(sender=member, receiver=app.address, amount=algopy.UInt64(STAKE))
+        with context.txn.create_group(active_txn_overrides={"sender": member}):
+            contract.join_group(stake)
+    return contract
+
+
+def _start(context: AlgopyTestContext, contract: StudyGroup, amount: int) -> None:
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(
+        sender=contract.creator, receiver=app.address, amount=algopy.UInt64(amount)
+    )
+    with context.txn.create_group():
+        contract.start_group(payment)
+
+
+def test_start_group_requires_shared_box_mbr(context: AlgopyTestContext, contract: StudyGroup) -> None:
+    # members (7 + 160) + attendance (10 + 24) + 2 sessions × (11 + 1), at 2500 + 400 per byte
+    required = 2 * 2500 + 400 * (167 + 34) + 2 * (2500 + 400 * 12)
+    assert contract.get_start_mbr() == required
+
+    with pytest.raises(AssertionError, match="Insufficient MBR payment"):
+        _start(context, contract, required - 1)
+
+
+def test_settle_batch_pays_bonus_and_frees_member_boxes(
+    context: AlgopyTestContext, contract: StudyGroup, members: list[algopy.Account]
+) -> None:
+    # Arrange: the first two members attend both sessions, the third never shows up
+    _start(context, contract, int(contract.get_start_mbr()))
+    for _ in range(2):
+        contract.mark_attendance_batch(algopy.Bytes(bytes([0b1100_0000])))
+        contract.complete_session()
+
+    # Act
+    with context.txn.create_group():
+        cursor = contract.settle_batch(algopy.UInt64(0), algopy.UInt64(3))
+
+    # Assert
+    paid = [context.txn.last_group.get_itxn_group(i).payment(0) for i in range(2)]
+    assert cursor == 3
+    assert [(payment.receiver, payment.amount) for payment in paid] == [
+        (members[0], STAKE + STAKE // 2),
+        (members[1], STAKE + STAKE // 2),
+    ]
+    assert all(member not in contract.member_index for member in members)
+    assert contract.get_member_info(members[0]) == (0, 0)
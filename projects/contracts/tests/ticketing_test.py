@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.ticketing.contract import Ticketing
+
+NOW = 1_700_000_000
+GA_PRICE = 5_000_000
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=NOW)
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> Ticketing:
+    contract = Ticketing()
+    contract.create_event(
+        algopy.UInt64(GA_PRICE), algopy.UInt64(100), algopy.UInt64(NOW + 86_400), algopy.UInt64(NOW + 3_600)
+    )
+    return contract
+
+
+def _buy_tier_ticket(
+    context: AlgopyTestContext, contract: Ticketing, buyer: algopy.Account, tier_id: algopy.UInt64, price: int
+) -> algopy.UInt64:
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(sender=buyer, receiver=app.address, amount=algopy.UInt64(price))
+    with context.txn.create_group(active_txn_overrides={"sender": buyer}):
+        asset_id = contract.buy_tier_ticket(tier_id, algopy.UInt64(0), payment)
+    context.ledger.update_asset_holdings(asset_id, buyer, balance=1)
+    return asset_id
+
+
+def _resell(
+    context: AlgopyTestContext,
+    contract: Ticketing,
+    asset_id: algopy.UInt64,
+    seller: algopy.Account,
+    buyer: algopy.Account,
+    price: int,
+) -> bool:
+    context.ledger.update_asset_holdings(asset_id, buyer, balance=0)
+    payment = context.any.txn.payment(sender=buyer, receiver=seller, amount=algopy.UInt64(price))
+    with context.txn.create_group(active_txn_overrides={"sender": seller}):
+        return contract.transfer_ticket(asset_id, buyer, algopy.UInt64(price), payment)
+
+
+def test_tiered_resale_is_capped_at_110_percent_of_tier_price(
+    context: AlgopyTestContext, contract: Ticketing
+) -> None:
+    # Arrange
+    vip_tier = contract.add_tier(algopy.UInt64(20_000_000), algopy.UInt64(10), False)  # noqa: FBT003
+    student_tier = contract.add_tier(algopy.UInt64(1_000_000), algopy.UInt64(10), False)  # noqa: FBT003
+    seller = context.any.account()
+    buyer = context.any.account()
+    vip_ticket = _buy_tier_ticket(context, contract, seller, vip_tier, 20_000_000)
+    student_ticket = _buy_tier_ticket(context, contract, seller, student_tier, 1_000_000)
+
+    # Act
+    vip_resold = _resell(context, contract, vip_ticket, seller, buyer, 22_000_000)
+
+    # Assert
+    assert vip_resold
+    assert contract.get_ticket_resale_cap(vip_ticket) == 22_000_000
+    assert contract.get_ticket_resale_cap(student_ticket) == 1_100_000
+    assert contract.get_max_resale_price() == 5_500_000
+    with pytest.raises(AssertionError, match="Resale price exceeds 110% cap"):
+        _resell(context, contract, student_ticket, seller, buyer, 1_100_001)